@@ -26,6 +26,7 @@ from app.backend.routes import (  # noqa: E402 — after load_dotenv so imported
     api_router,
 )
 from app.backend.services.ollama_service import ollama_service  # noqa: E402
+from app.backend.services.screening_jobs import shutdown_screening_job_manager  # noqa: E402
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -95,7 +96,8 @@ async def lifespan(app: FastAPI):
     yield  # Application is running
 
     # --- Shutdown ---
-    pass
+    # 在途的一键选股后台任务在下一个阶段边界停止, 排队中的直接出队
+    shutdown_screening_job_manager()
 
 
 app = FastAPI(title="AI Hedge Fund API", description="Backend API for AI Hedge Fund", version="0.1.0", lifespan=lifespan)
@@ -120,7 +122,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers["X-Frame-Options"] = "DENY"
         response.headers["X-XSS-Protection"] = "1; mode=block"
         response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Cache-Control"] = "no-store"
+        # 报告读取路由自带 "private, no-cache" + ETag (允许条件请求 304), 其余一律 no-store
+        response.headers.setdefault("Cache-Control", "no-store")
         return response
 
 
@@ -19,6 +19,7 @@ async def cache_stats() -> dict:
 
         {
           "lru_maxsize": 128,
+          "lru_max_bytes": null,
           "redis_available": false,
           "disk_available": true,
           "disk_path": "~/.cache/ai-hedge-fund/cache.sqlite",
@@ -32,7 +33,10 @@ async def cache_stats() -> dict:
             "sets": 18,
             "total_hits": 15,
             "total_requests": 18,
-            "hit_rate": 0.8333
+            "hit_rate": 0.8333,
+            "lru_entries": 12,
+            "lru_resident_bytes": 524288,
+            "lru_evictions": 0
           }
         }
     """
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from pydantic import BaseModel, Field
 
 from app.backend.auth.dependencies import get_current_user
 from app.backend.models.user import User
 from app.backend.routes._common import safe_route
 from app.backend.services.replay_artifact_service import ReplayArtifactService
+from app.backend.services.report_reader import RenderedReport, conditional_response, get_report_read_service
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 router = APIRouter(prefix="/replay-artifacts", tags=["replay-artifacts"])
 
 
@@ -85,11 +89,22 @@ class ReplayWorkflowItemUpdateResponse(BaseModel):
     item: dict[str, Any]
 
 
+async def _run_service(call: Callable[[ReplayArtifactService], T]) -> T:
+    """在线程池中构造 service 并执行 ``call`` — 报告目录扫描 / JSON 解析 / 数据库访问都不占事件循环。"""
+    return await get_report_read_service().run(lambda: call(ReplayArtifactService()))
+
+
+def _conditional(model: BaseModel, if_none_match: str | None) -> Response:
+    # 回放产物聚合自多个文件 + 反馈数据库, 没有单一文件版本可用: ETag 取响应体摘要,
+    # 未变化时 304 省去传输与前端重新解析
+    return conditional_response(RenderedReport.from_model(model), if_none_match)
+
+
 @router.get("/", response_model=ReplayArtifactListResponse)
 @safe_route
-async def list_replay_artifacts() -> ReplayArtifactListResponse:
-    service = ReplayArtifactService()
-    return ReplayArtifactListResponse(items=service.list_replays())
+async def list_replay_artifacts(if_none_match: str | None = Header(None)) -> Response:
+    items = await _run_service(lambda service: service.list_replays())
+    return _conditional(ReplayArtifactListResponse(items=items), if_none_match)
 
 
 @router.get("/feedback-activity", response_model=ReplayFeedbackActivityResponse)
@@ -99,14 +114,14 @@ async def get_replay_feedback_activity(
     reviewer: str | None = None,
     limit: int = 20,
 ) -> ReplayFeedbackActivityResponse:
-    service = ReplayArtifactService()
-    return ReplayFeedbackActivityResponse(
-        activity=service.get_feedback_activity(
+    activity = await _run_service(
+        lambda service: service.get_feedback_activity(
             report_name=report_name,
             reviewer=reviewer,
             limit=limit,
         )
     )
+    return ReplayFeedbackActivityResponse(activity=activity)
 
 
 @router.get("/workflow-queue", response_model=ReplayWorkflowQueueResponse)
@@ -117,29 +132,30 @@ async def get_replay_workflow_queue(
     report_name: str | None = None,
     limit: int = 50,
 ) -> ReplayWorkflowQueueResponse:
-    service = ReplayArtifactService()
-    return ReplayWorkflowQueueResponse(
-        queue=service.list_workflow_queue(
+    queue = await _run_service(
+        lambda service: service.list_workflow_queue(
             assignee=assignee,
             workflow_status=workflow_status,
             report_name=report_name,
             limit=limit,
         )
     )
+    return ReplayWorkflowQueueResponse(queue=queue)
 
 
 @router.patch("/workflow-queue/item", response_model=ReplayWorkflowItemUpdateResponse)
 @safe_route
 async def update_replay_workflow_item(request: ReplayWorkflowItemUpdateRequest) -> ReplayWorkflowItemUpdateResponse:
-    service = ReplayArtifactService()
     try:
-        item = service.update_workflow_item(
-            report_name=request.report_name,
-            trade_date=request.trade_date,
-            symbol=request.symbol,
-            review_scope=request.review_scope,
-            assignee=request.assignee,
-            workflow_status=request.workflow_status,
+        item = await _run_service(
+            lambda service: service.update_workflow_item(
+                report_name=request.report_name,
+                trade_date=request.trade_date,
+                symbol=request.symbol,
+                review_scope=request.review_scope,
+                assignee=request.assignee,
+                workflow_status=request.workflow_status,
+            )
         )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -148,13 +164,12 @@ async def update_replay_workflow_item(request: ReplayWorkflowItemUpdateRequest)
 
 @router.get("/{report_name}", response_model=ReplayArtifactDetailResponse)
 @safe_route
-async def get_replay_artifact(report_name: str) -> ReplayArtifactDetailResponse:
-    service = ReplayArtifactService()
+async def get_replay_artifact(report_name: str, if_none_match: str | None = Header(None)) -> Response:
     try:
-        report = service.get_replay(report_name)
+        report = await _run_service(lambda service: service.get_replay(report_name))
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return ReplayArtifactDetailResponse(report=report)
+    return _conditional(ReplayArtifactDetailResponse(report=report), if_none_match)
 
 
 @router.get("/{report_name}/signal-trade-comparison", response_model=ReplaySignalTradeComparisonResponse)
@@ -162,29 +177,28 @@ async def get_replay_artifact(report_name: str) -> ReplayArtifactDetailResponse:
 async def get_signal_trade_comparison(
     report_name: str,
     time_window_days: int = 1,
-) -> ReplaySignalTradeComparisonResponse:
+    if_none_match: str | None = Header(None),
+) -> Response:
     """Compare strategy signals against actual executed trades for a replay run.
 
     Returns per-signal match status (filled/partial/missed), price slippage,
     and fill delay statistics.
     """
-    service = ReplayArtifactService()
     try:
-        result = service.get_signal_trade_comparison(report_name, time_window_days=time_window_days)
+        result = await _run_service(lambda service: service.get_signal_trade_comparison(report_name, time_window_days=time_window_days))
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return ReplaySignalTradeComparisonResponse(pairs=result["pairs"], summary=result["summary"])
+    return _conditional(ReplaySignalTradeComparisonResponse(pairs=result["pairs"], summary=result["summary"]), if_none_match)
 
 
 @router.get("/{report_name}/selection-artifacts/{trade_date}", response_model=ReplaySelectionArtifactResponse)
 @safe_route
-async def get_replay_selection_artifact(report_name: str, trade_date: str) -> ReplaySelectionArtifactResponse:
-    service = ReplayArtifactService()
+async def get_replay_selection_artifact(report_name: str, trade_date: str, if_none_match: str | None = Header(None)) -> Response:
     try:
-        selection_artifact = service.get_selection_artifact_day(report_name, trade_date)
+        selection_artifact = await _run_service(lambda service: service.get_selection_artifact_day(report_name, trade_date))
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return ReplaySelectionArtifactResponse(selection_artifact=selection_artifact)
+    return _conditional(ReplaySelectionArtifactResponse(selection_artifact=selection_artifact), if_none_match)
 
 
 @router.post("/{report_name}/selection-artifacts/{trade_date}/feedback", response_model=ReplayFeedbackAppendResponse)
@@ -195,21 +209,22 @@ async def append_replay_selection_feedback(
     request: ReplayFeedbackAppendRequest,
     current_user: User = Depends(get_current_user),
 ) -> ReplayFeedbackAppendResponse:
-    service = ReplayArtifactService()
     try:
-        feedback = service.append_selection_artifact_feedback(
-            report_name=report_name,
-            trade_date=trade_date,
-            reviewer=current_user.username,
-            symbol=request.symbol,
-            primary_tag=request.primary_tag,
-            research_verdict=request.research_verdict,
-            tags=request.tags,
-            review_status=request.review_status,
-            review_scope=request.review_scope,
-            confidence=request.confidence,
-            notes=request.notes,
-            created_at=request.created_at,
+        feedback = await _run_service(
+            lambda service: service.append_selection_artifact_feedback(
+                report_name=report_name,
+                trade_date=trade_date,
+                reviewer=current_user.username,
+                symbol=request.symbol,
+                primary_tag=request.primary_tag,
+                research_verdict=request.research_verdict,
+                tags=request.tags,
+                review_status=request.review_status,
+                review_scope=request.review_scope,
+                confidence=request.confidence,
+                notes=request.notes,
+                created_at=request.created_at,
+            )
         )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -226,20 +241,21 @@ async def append_replay_selection_feedback_batch(
     request: ReplayFeedbackBatchAppendRequest,
     current_user: User = Depends(get_current_user),
 ) -> ReplayFeedbackBatchAppendResponse:
-    service = ReplayArtifactService()
     try:
-        feedback = service.append_selection_artifact_feedback_batch(
-            report_name=report_name,
-            trade_date=trade_date,
-            reviewer=current_user.username,
-            symbols=request.symbols,
-            primary_tag=request.primary_tag,
-            research_verdict=request.research_verdict,
-            tags=request.tags,
-            review_status=request.review_status,
-            confidence=request.confidence,
-            notes=request.notes,
-            created_at=request.created_at,
+        feedback = await _run_service(
+            lambda service: service.append_selection_artifact_feedback_batch(
+                report_name=report_name,
+                trade_date=trade_date,
+                reviewer=current_user.username,
+                symbols=request.symbols,
+                primary_tag=request.primary_tag,
+                research_verdict=request.research_verdict,
+                tags=request.tags,
+                review_status=request.review_status,
+                confidence=request.confidence,
+                notes=request.notes,
+                created_at=request.created_at,
+            )
         )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -10,6 +10,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from app.backend.routes._common import safe_route
+from app.backend.services.report_reader import get_report_read_service
 from src.research.lookback_audit import LookbackAuditResult, run_lookback_audit
 
 router = APIRouter(prefix="/research", tags=["research"])
@@ -78,7 +79,9 @@ async def get_lookback_audit(
     """
     root = Path(artifact_root) if artifact_root else None
 
-    result: LookbackAuditResult = run_lookback_audit(
+    # 读 selection_snapshot + 拉取前向价格都是阻塞 I/O — 放到线程池, 不占事件循环
+    result: LookbackAuditResult = await get_report_read_service().run(
+        run_lookback_audit,
         audit_date=date,
         lookforward_days=days,
         top_n=top_n,
@@ -8,11 +8,20 @@ P1-5: 用户希望在 Web 端一键运行全市场自动筛选, 获得与 CLI ``
 
 P1-8: 新增 ``GET /api/screening/compare`` 端点 — 对 2-5 只标的做
 多维度对比, 复用 :func:`src.screening.compare_tool.compare_tickers`。
+
+``/latest`` / ``/compare`` / ``/winrate-dashboard`` / ``/stock-detail`` 经由
+:mod:`app.backend.services.report_reader` 读取: 文件 I/O 在线程池执行, 同一
+报告版本的响应只序列化一次, 并以 ETag 回答条件请求 (304)。
+
+``/auto`` 与 ``/jobs`` 端点经由 :mod:`app.backend.services.screening_jobs`
+执行: 同 ``(trade_date, strategies, top_n)`` 的并发请求合并为一次计算,
+成功结果在 TTL 内直接复用, 超时的请求只放弃等待而不重复启动计算。
 """
 
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import logging
 import math
@@ -21,12 +30,26 @@ import re
 import time
 from datetime import datetime
 from pathlib import Path
+from collections.abc import AsyncIterator
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.backend.models.events import CompleteEvent, ErrorEvent, ProgressUpdateEvent, StartEvent
 from app.backend.routes._common import safe_route
+from app.backend.services.report_reader import conditional_response, files_version, get_report_read_service, glob_version
+from app.backend.services.screening_jobs import (
+    STATUS_CANCELLED,
+    STATUS_SUCCEEDED,
+    ScreeningJob,
+    ScreeningJobCapacityError,
+    ScreeningJobHandle,
+    ScreeningJobKey,
+    ScreeningJobManager,
+    get_screening_job_manager,
+)
 from src.main import compute_auto_screening_results
 from src.screening.investability import build_front_door_verdict
 
@@ -41,6 +64,9 @@ router = APIRouter(prefix="/api/screening", tags=["screening"])
 #: 单次请求最长执行时间 — 防止 Web 请求挂死
 DEFAULT_TIMEOUT_SECONDS: float = 60.0
 
+#: SSE 进度推送的轮询间隔 (任务结束时立即唤醒, 不等满一个间隔)
+JOB_EVENTS_POLL_SECONDS: float = 0.5
+
 #: trade_date 格式校验 — YYYYMMDD 或 YYYY-MM-DD
 _TRADE_DATE_RE = re.compile(r"^(\d{4})(\d{2})(\d{2})$|^(\d{4})-(\d{2})-(\d{2})$")
 
@@ -97,6 +123,30 @@ class ScreeningResponse(BaseModel):
     meta: dict = Field(default_factory=dict)
 
 
+class ScreeningJobResponse(BaseModel):
+    """后台选股任务状态 (``/api/screening/jobs``)。
+
+    ``coalesced`` 表示挂到了同键在途任务上, ``cache_hit`` 表示直接复用了已完成结果;
+    ``requesters`` 是仍挂在在途任务上的请求方数, 归零前 DELETE 只摘掉调用方。
+    """
+
+    job_id: str
+    status: str
+    trade_date: str
+    strategies: list[str] | None = None
+    top_n: int
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    compute_seconds: float | None = None
+    attached: int = 0
+    requesters: int = 0
+    cancel_requested: bool = False
+    error: str | None = None
+    coalesced: bool = False
+    cache_hit: bool = False
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -223,8 +273,32 @@ def _validate_strategies(strategies: list[str] | None) -> list[str] | None:
     return strategies
 
 
+def _auto_screening_reports_dir() -> Path:
+    return Path(__file__).resolve().parents[3] / "data" / "reports"
+
+
+def _auto_screening_reports_version(reports_dir: Path, trade_date: str | None) -> str:
+    """``auto_screening`` 报告版本: 指定日期看单个文件, 否则看整个目录的报告集合。"""
+    if trade_date:
+        return files_version([reports_dir / f"auto_screening_{trade_date}.json"])
+    return glob_version(reports_dir, "auto_screening_*.json")
+
+
+def _report_history_version(reports_dir: Path) -> str:
+    """compare / stock-detail 的版本: 即使固定 trade_date, 连续推荐 / 信号衰减 / 追踪历史
+    也会读其他日期的报告, 因此看整个报告目录 + ``tracking_history.json``。"""
+    from src.screening.recommendation_tracker import HISTORY_FILENAME
+    from src.screening.tracking_store import tracking_version_paths
+
+    return glob_version(reports_dir, "auto_screening_*.json", extra=tracking_version_paths(reports_dir / HISTORY_FILENAME))
+
+
 def _load_latest_auto_screening_payload(trade_date: str | None = None) -> dict[str, Any]:
-    reports_dir = Path(__file__).resolve().parents[3] / "data" / "reports"
+    """读取最新 (或指定日期) 的 auto_screening 报告。
+
+    解析结果经 :class:`ReportReadService` 按 mtime 缓存并在请求间共享 — 调用方只读。
+    """
+    reports_dir = _auto_screening_reports_dir()
     if trade_date:
         candidates = [reports_dir / f"auto_screening_{trade_date}.json"]
     else:
@@ -233,7 +307,7 @@ def _load_latest_auto_screening_payload(trade_date: str | None = None) -> dict[s
         if not path.exists():
             continue
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            return get_report_read_service().load_json(path)
         except (OSError, json.JSONDecodeError) as exc:
             raise HTTPException(status_code=500, detail=f"读取选股报告失败: {path.name} ({exc})")
     raise HTTPException(status_code=404, detail=f"未找到 auto_screening 报告 (trade_date={trade_date or 'latest'})")
@@ -258,9 +332,11 @@ def _attach_front_door_verdicts(recs: list[dict[str, Any]], payload: dict[str, A
     market_state = payload.get("market_state") or {}
     _regime_raw = market_state.get("regime_gate_level") if isinstance(market_state, dict) else None
     market_regime = str(_regime_raw).lower() if _regime_raw else "unknown"
+    # 不原地写入: payload 可能是 ReportReadService 缓存的共享对象
+    out: list[dict[str, Any]] = []
     for rec in recs:
         try:
-            rec["verdict"] = build_front_door_verdict(rec, market_regime=market_regime)
+            verdict = build_front_door_verdict(rec, market_regime=market_regime)
         except Exception:
             logger.warning(
                 "verdict compute failed for %s (regime=%s) — falling back to AVOID",
@@ -268,13 +344,14 @@ def _attach_front_door_verdicts(recs: list[dict[str, Any]], payload: dict[str, A
                 market_regime,
                 exc_info=True,
             )
-            rec["verdict"] = {
+            verdict = {
                 "action": "AVOID",
                 "market_regime": market_regime,
                 "invalidation_reason": "verdict 计算失败 (请复核)",
                 "signal_horizon": "",
             }
-    return recs
+        out.append({**rec, "verdict": verdict})
+    return out
 
 
 def _build_screening_response(
@@ -285,6 +362,7 @@ def _build_screening_response(
     use_explain: bool,
     strategies: list[str] | None,
     execution_time_seconds: float,
+    job_meta: dict[str, Any] | None = None,
 ) -> ScreeningResponse:
     raw_recs = payload.get("recommendations", []) or []
     recs = _apply_score_threshold(raw_recs, score_threshold)
@@ -312,10 +390,78 @@ def _build_screening_response(
             "use_explain": use_explain,
             "strategies": strategies or ["trend", "mean_reversion", "fundamental", "event_sentiment"],
             "data_dir": str(Path(__file__).resolve().parents[3] / "data" / "reports"),
+            **({"job": job_meta} if job_meta else {}),
         },
     )
 
 
+def _resolve_request_trade_date(raw: str | None) -> str:
+    return _normalize_trade_date(raw) if raw else _resolve_default_trade_date()
+
+
+def _submit_screening_job(req: ScreeningRequest) -> ScreeningJobHandle:
+    """校验请求并提交 / 挂接后台任务 (同键合并, 命中结果缓存则不计算)。"""
+    _check_tushare_token()
+    strategies = _validate_strategies(req.strategies)
+    trade_date = _resolve_request_trade_date(req.trade_date)
+    key = ScreeningJobKey.build(trade_date, strategies, req.top_n)
+    try:
+        # compute 在提交时按模块全局解析 — 便于测试 patch
+        return get_screening_job_manager().submit(key, compute_auto_screening_results)
+    except ScreeningJobCapacityError as exc:
+        raise HTTPException(status_code=429, detail=f"一键选股任务已满, 请稍后重试 ({exc})")
+
+
+def _get_job_or_404(job_id: str) -> ScreeningJob:
+    job = get_screening_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"选股任务不存在或已过期: {job_id}")
+    return job
+
+
+def _job_payload_or_raise(job: ScreeningJob) -> dict[str, Any]:
+    """返回已完成任务的 payload 副本; 未完成 / 失败 / 取消映射为对应 HTTP 错误。"""
+    if job.status == STATUS_SUCCEEDED and job.payload is not None:
+        # 结果被多个请求共享, 后处理 (verdict 注入等) 必须作用在副本上
+        return copy.deepcopy(job.payload)
+    if job.status == STATUS_CANCELLED:
+        raise HTTPException(status_code=409, detail=f"选股任务已取消: {job.job_id}")
+    if job.error_kind == "empty_pool":
+        # 候选池为空 — 503 而非 500 (上游数据问题)
+        raise HTTPException(status_code=503, detail=job.error or "候选池为空")
+    if job.finished:
+        # 其他非预期异常已在任务内记日志; 对外只给脱敏信息 (NS-14)
+        raise HTTPException(status_code=500, detail="Internal server error")
+    raise HTTPException(status_code=409, detail=f"选股任务尚未完成 (status={job.status})")
+
+
+def _job_response(job: ScreeningJob, handle: ScreeningJobHandle | None = None) -> ScreeningJobResponse:
+    flags = {"coalesced": handle.coalesced, "cache_hit": handle.cache_hit} if handle else {}
+    return ScreeningJobResponse(**job.snapshot(), **flags)
+
+
+async def _stream_job_events(job: ScreeningJob) -> AsyncIterator[str]:
+    """把任务的进度事件推成 SSE; 断开连接只停止推送, 不影响任务本身。"""
+    yield StartEvent().to_sse()
+    cursor = 0
+    while True:
+        # done 在终态事件记录之后才置位: 先判断再 drain, 保证终态事件不丢
+        finished = job.done.done()
+        events, cursor = job.events_since(cursor)
+        for event in events:
+            yield ProgressUpdateEvent(**event).to_sse()
+        if finished:
+            break
+        try:
+            await ScreeningJobManager.wait(job, JOB_EVENTS_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+    if job.status == STATUS_SUCCEEDED:
+        yield CompleteEvent(data=job.snapshot()).to_sse()
+    else:
+        yield ErrorEvent(message=job.error or job.status).to_sse()
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -348,45 +494,109 @@ async def run_auto_screening(req: ScreeningRequest) -> ScreeningResponse:
         2. NaN/Inf 字段会被统一替换为 ``None`` (保证 JSON 严格合法)
         3. 复用 :func:`src.main.compute_auto_screening_results` 纯函数
     """
-    _check_tushare_token()
-    strategies = _validate_strategies(req.strategies)
-
-    # trade_date 解析
-    if req.trade_date:
-        trade_date = _normalize_trade_date(req.trade_date)
-    else:
-        trade_date = _resolve_default_trade_date()
-
-    # 复用 main 纯函数 — 顶部已 import, 便于测试 patch
     start = time.monotonic()
+    handle = _submit_screening_job(req)
     try:
-        payload = await asyncio.wait_for(
-            asyncio.to_thread(
-                compute_auto_screening_results,
-                trade_date,
-                req.top_n,
-                selected_strategies=strategies,
-            ),
-            timeout=DEFAULT_TIMEOUT_SECONDS,
-        )
+        job = await ScreeningJobManager.wait(handle.job, DEFAULT_TIMEOUT_SECONDS)
     except asyncio.TimeoutError:
-        raise HTTPException(status_code=504, detail=f"一键选股超时 (>{DEFAULT_TIMEOUT_SECONDS}s)")
-    except ValueError as exc:
-        # 候选池为空 — 503 而非 500 (上游数据问题)
-        raise HTTPException(status_code=503, detail=str(exc))
-        # 其他非预期异常不在此拼接 str(exc) — 交由 @safe_route 记日志 +
-        # 返回脱敏 "Internal server error" (NS-14: 匿名 caller 信息泄露).
+        # 只放弃本次等待: 任务继续运行, 结果进入缓存, 可凭 job_id 查询或由下一次同键请求直接取用
+        raise HTTPException(
+            status_code=504,
+            detail=f"一键选股超时 (>{DEFAULT_TIMEOUT_SECONDS}s), 任务仍在后台运行: job_id={handle.job.job_id}",
+        )
+    finally:
+        # 本请求不再等待: 不再阻止其他请求方取消该任务
+        get_screening_job_manager().release(handle.job)
 
     return _build_screening_response(
-        payload,
-        trade_date=trade_date,
+        _job_payload_or_raise(job),
+        trade_date=job.key.trade_date,
         score_threshold=req.score_threshold,
         use_explain=req.use_explain,
-        strategies=strategies,
+        strategies=list(job.key.strategies) if job.key.strategies else None,
         execution_time_seconds=time.monotonic() - start,
+        job_meta=handle.meta(),
     )
 
 
+# ---------------------------------------------------------------------------
+# 后台任务端点: 提交 / 状态 / SSE 进度 / 结果 / 取消
+# ---------------------------------------------------------------------------
+
+
+@router.post(
+    path="/jobs",
+    response_model=ScreeningJobResponse,
+    status_code=202,
+    responses={
+        202: {"description": "已提交 / 已挂接到同键在途任务 / 命中结果缓存"},
+        422: {"description": "参数校验失败"},
+        429: {"description": "在途任务已满"},
+        503: {"description": "TUSHARE_TOKEN 缺失"},
+    },
+)
+@safe_route
+async def submit_screening_job(req: ScreeningRequest) -> ScreeningJobResponse:
+    """提交一键选股后台任务并立即返回 job 状态 (不等待计算完成)。
+
+    同 ``(trade_date, strategies, top_n)`` 的在途任务会被复用; 进度见
+    ``GET /jobs/{job_id}/events`` (SSE), 结果见 ``GET /jobs/{job_id}/result``。
+    """
+    handle = _submit_screening_job(req)
+    return _job_response(handle.job, handle)
+
+
+@router.get(path="/jobs/{job_id}", response_model=ScreeningJobResponse, responses={404: {"description": "任务不存在"}})
+@safe_route
+async def get_screening_job(job_id: str) -> ScreeningJobResponse:
+    return _job_response(_get_job_or_404(job_id))
+
+
+@router.get(path="/jobs/{job_id}/events", responses={200: {"content": {"text/event-stream": {}}}, 404: {"description": "任务不存在"}})
+@safe_route
+async def stream_screening_job_events(job_id: str) -> StreamingResponse:
+    """SSE 推送任务进度 (``start`` → ``progress``* → ``complete`` / ``error``)。"""
+    job = _get_job_or_404(job_id)
+    return StreamingResponse(_stream_job_events(job), media_type="text/event-stream")
+
+
+@router.get(
+    path="/jobs/{job_id}/result",
+    response_model=ScreeningResponse,
+    responses={404: {"description": "任务不存在"}, 409: {"description": "任务未完成 / 已取消"}, 503: {"description": "候选池为空"}},
+)
+@safe_route
+async def get_screening_job_result(
+    job_id: str,
+    score_threshold: float = Query(0.0, ge=-1.0, le=1.0),
+    use_explain: bool = Query(True),
+) -> ScreeningResponse:
+    job = _get_job_or_404(job_id)
+    payload = _job_payload_or_raise(job)
+    return _build_screening_response(
+        payload,
+        trade_date=job.key.trade_date,
+        score_threshold=score_threshold,
+        use_explain=use_explain,
+        strategies=list(job.key.strategies) if job.key.strategies else None,
+        execution_time_seconds=job.compute_seconds or 0.0,
+        job_meta={"job_id": job.job_id, "coalesced": False, "cache_hit": True},
+    )
+
+
+@router.delete(path="/jobs/{job_id}", response_model=ScreeningJobResponse, responses={404: {"description": "任务不存在"}})
+@safe_route
+async def cancel_screening_job(job_id: str) -> ScreeningJobResponse:
+    """取消任务: 排队中的立即出队, 运行中的在下一个阶段边界停止 (不再消耗 Tushare 配额)。
+
+    合并任务上仍有其他请求方时只摘掉调用方, 任务继续运行 (``requesters`` 减一);
+    最后一个请求方取消时才真正停止。
+    """
+    _get_job_or_404(job_id)
+    job = get_screening_job_manager().cancel(job_id)
+    return _job_response(job)
+
+
 @router.get(
     path="/latest",
     response_model=ScreeningResponse,
@@ -399,18 +609,26 @@ async def run_auto_screening(req: ScreeningRequest) -> ScreeningResponse:
 @safe_route
 async def get_latest_screening_result(
     trade_date: str | None = Query(None, description="指定报告日期 YYYYMMDD；缺省返回最新"),
-) -> ScreeningResponse:
+    if_none_match: str | None = Header(None),
+) -> Response:
     cleaned_date = _normalize_trade_date(trade_date) if trade_date else None
-    payload = _load_latest_auto_screening_payload(trade_date=cleaned_date)
-    resolved_trade_date = str(payload.get("date") or cleaned_date or _resolve_default_trade_date())
-    return _build_screening_response(
-        payload,
-        trade_date=resolved_trade_date,
-        score_threshold=0.0,
-        use_explain=True,
-        strategies=None,
-        execution_time_seconds=0.0,
-    )
+    reads = get_report_read_service()
+    version = await reads.run(_auto_screening_reports_version, _auto_screening_reports_dir(), cleaned_date)
+
+    def _build() -> ScreeningResponse:
+        payload = _load_latest_auto_screening_payload(trade_date=cleaned_date)
+        resolved_trade_date = str(payload.get("date") or cleaned_date or _resolve_default_trade_date())
+        return _build_screening_response(
+            payload,
+            trade_date=resolved_trade_date,
+            score_threshold=0.0,
+            use_explain=True,
+            strategies=None,
+            execution_time_seconds=0.0,
+        )
+
+    rendered = await reads.render(("latest", cleaned_date), version, _build)
+    return conditional_response(rendered, if_none_match)
 
 
 # ---------------------------------------------------------------------------
@@ -447,7 +665,8 @@ async def compare_endpoint(
     tickers: str = Query(..., description="逗号分隔的 ticker, 2-5 只 (e.g. '300750,600519,000001')"),
     metrics: str | None = Query(None, description="逗号分隔的指标, 缺省全部 (e.g. 'trend_score,score_b')"),
     trade_date: str | None = Query(None, description="报告日期 YYYYMMDD, 缺省取最新"),
-) -> CompareResponse:
+    if_none_match: str | None = Header(None),
+) -> Response:
     """P1-8 Web 端标的对比 API。
 
     复用 :func:`src.screening.compare_tool.compare_tickers` 计算多维对比,
@@ -499,59 +718,68 @@ async def compare_endpoint(
     else:
         resolved_date = None
 
-    # 4. 加载推荐数据
-    recommendations = load_latest_recommendations(trade_date=resolved_date)
-    if not recommendations:
-        raise HTTPException(
-            status_code=404,
-            detail=(f"未找到有效 auto_screening 报告 " f"(trade_date={trade_date or 'latest'}), 请先运行 --auto"),
-        )
+    from src.screening.consecutive_recommendation import resolve_report_dir
 
-    # 5. 执行对比
-    try:
-        report: CompareReport = compare_tickers(
-            tickers=raw_tickers,
-            recommendations=recommendations,
-            metric_keys=metric_keys,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=422, detail=str(exc))
+    reads = get_report_read_service()
+    version = await reads.run(_report_history_version, resolve_report_dir())
 
-    # 6. NaN 清洗 (统一 None)
-    def _sanitize(value: Any) -> Any:
-        if isinstance(value, float):
-            if math.isnan(value) or math.isinf(value):
-                return None
-            return value
-        if isinstance(value, dict):
-            return {k: _sanitize(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [_sanitize(v) for v in value]
-        return value
+    def _build() -> CompareResponse:
+        # 4. 加载推荐数据
+        recommendations = load_latest_recommendations(trade_date=resolved_date)
+        if not recommendations:
+            raise HTTPException(
+                status_code=404,
+                detail=(f"未找到有效 auto_screening 报告 " f"(trade_date={trade_date or 'latest'}), 请先运行 --auto"),
+            )
 
-    sanitized_metrics = [_sanitize(m.to_dict()) for m in report.metrics]
+        # 5. 执行对比
+        try:
+            report: CompareReport = compare_tickers(
+                tickers=raw_tickers,
+                recommendations=recommendations,
+                metric_keys=metric_keys,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+
+        # 6. NaN 清洗 (统一 None)
+        def _sanitize(value: Any) -> Any:
+            if isinstance(value, float):
+                if math.isnan(value) or math.isinf(value):
+                    return None
+                return value
+            if isinstance(value, dict):
+                return {k: _sanitize(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return [_sanitize(v) for v in value]
+            return value
 
-    # 7. 从 trade_date 字段提取 (load_latest_recommendations 不返回日期,
-    #    从 recommendations 中尝试推断 — 若 report_date 不明则置 None)
-    inferred_date: str | None = resolved_date
-    if inferred_date is None and recommendations:
-        for rec in recommendations:
-            if isinstance(rec, dict) and isinstance(rec.get("date"), str):
-                inferred_date = rec["date"].replace("-", "")
-                break
+        sanitized_metrics = [_sanitize(m.to_dict()) for m in report.metrics]
+
+        # 7. 从 trade_date 字段提取 (load_latest_recommendations 不返回日期,
+        #    从 recommendations 中尝试推断 — 若 report_date 不明则置 None)
+        inferred_date: str | None = resolved_date
+        if inferred_date is None and recommendations:
+            for rec in recommendations:
+                if isinstance(rec, dict) and isinstance(rec.get("date"), str):
+                    inferred_date = rec["date"].replace("-", "")
+                    break
+
+        return CompareResponse(
+            tickers=list(report.tickers),
+            metrics=sanitized_metrics,
+            summary=dict(report.summary),
+            winner=report.winner,
+            report_date=inferred_date,
+            meta={
+                "metric_keys": metric_keys or list(DEFAULT_METRIC_KEYS),
+                "min_compare_tickers": MIN_COMPARE_TICKERS,
+                "max_compare_tickers": MAX_COMPARE_TICKERS,
+            },
+        )
 
-    return CompareResponse(
-        tickers=list(report.tickers),
-        metrics=sanitized_metrics,
-        summary=dict(report.summary),
-        winner=report.winner,
-        report_date=inferred_date,
-        meta={
-            "metric_keys": metric_keys or list(DEFAULT_METRIC_KEYS),
-            "min_compare_tickers": MIN_COMPARE_TICKERS,
-            "max_compare_tickers": MAX_COMPARE_TICKERS,
-        },
-    )
+    rendered = await reads.render(("compare", tuple(raw_tickers), tuple(metric_keys or ()), resolved_date), version, _build)
+    return conditional_response(rendered, if_none_match)
 
 
 # ---------------------------------------------------------------------------
@@ -832,7 +1060,8 @@ class WinRateDashboardResponse(BaseModel):
 @safe_route
 async def get_winrate_dashboard(
     lookback_days: int = Query(30, ge=1, le=365, description="回溯天数 (默认 30)"),
-) -> WinRateDashboardResponse:
+    if_none_match: str | None = Header(None),
+) -> Response:
     """P2-4 历史推荐胜率看板 API。
 
     从 P1-3 ``tracking_history.json`` 读取历史推荐和实际收益,
@@ -842,29 +1071,38 @@ async def get_winrate_dashboard(
         :class:`WinRateDashboardResponse` 含汇总统计和日度趋势数据。
     """
     from src.screening.consecutive_recommendation import resolve_report_dir
+    from src.screening.tracking_store import tracking_version_paths
     from src.screening.winrate_dashboard import compute_winrate_dashboard
 
     report_dir = resolve_report_dir()
     history_path = report_dir / "tracking_history.json"
 
-    summary = compute_winrate_dashboard(history_path, lookback_days=lookback_days)
-
-    # Convert DailyWinRate list to list of dicts for Pydantic serialization
-    daily_dicts = [_sanitize_nan(d.to_dict()) for d in summary.daily]
-
-    return WinRateDashboardResponse(
-        period_days=summary.period_days,
-        total_days=summary.total_days,
-        total_recommendations=summary.total_recommendations,
-        avg_t1_win_rate=_sanitize_nan(summary.avg_t1_win_rate),
-        avg_t1_return=_sanitize_nan(summary.avg_t1_return),
-        avg_t3_win_rate=_sanitize_nan(summary.avg_t3_win_rate),
-        avg_t3_return=_sanitize_nan(summary.avg_t3_return),
-        avg_t5_win_rate=_sanitize_nan(summary.avg_t5_win_rate),
-        avg_t5_return=_sanitize_nan(summary.avg_t5_return),
-        trend=summary.trend,
-        daily=daily_dicts,
-    )
+    reads = get_report_read_service()
+    # nightly 更新只写追踪库 (导出待写), 版本须同时看库文件
+    version = await reads.run(files_version, tracking_version_paths(history_path))
+
+    def _build() -> WinRateDashboardResponse:
+        summary = compute_winrate_dashboard(history_path, lookback_days=lookback_days)
+
+        # Convert DailyWinRate list to list of dicts for Pydantic serialization
+        daily_dicts = [_sanitize_nan(d.to_dict()) for d in summary.daily]
+
+        return WinRateDashboardResponse(
+            period_days=summary.period_days,
+            total_days=summary.total_days,
+            total_recommendations=summary.total_recommendations,
+            avg_t1_win_rate=_sanitize_nan(summary.avg_t1_win_rate),
+            avg_t1_return=_sanitize_nan(summary.avg_t1_return),
+            avg_t3_win_rate=_sanitize_nan(summary.avg_t3_win_rate),
+            avg_t3_return=_sanitize_nan(summary.avg_t3_return),
+            avg_t5_win_rate=_sanitize_nan(summary.avg_t5_win_rate),
+            avg_t5_return=_sanitize_nan(summary.avg_t5_return),
+            trend=summary.trend,
+            daily=daily_dicts,
+        )
+
+    rendered = await reads.render(("winrate-dashboard", str(history_path), lookback_days), version, _build)
+    return conditional_response(rendered, if_none_match)
 
 
 # ---------------------------------------------------------------------------
@@ -917,7 +1155,8 @@ class StockDetailResponse(BaseModel):
 async def get_stock_detail(
     ticker: str,
     trade_date: str | None = Query(None, description="报告日期 YYYYMMDD, 缺省取最新"),
-) -> StockDetailResponse:
+    if_none_match: str | None = Header(None),
+) -> Response:
     """P2-6 标的深度分析 API。
 
     聚合 auto_screening 报告中单只标的的全部数据: 基本面 + 技术面 + 资金流 +
@@ -942,22 +1181,31 @@ async def get_stock_detail(
             )
         resolved_date = cleaned
 
-    # 2. 加载推荐
-    recommendations = load_latest_recommendations(trade_date=resolved_date)
-    if not recommendations:
-        raise HTTPException(
-            status_code=404,
-            detail=(f"未找到有效 auto_screening 报告 " f"(trade_date={trade_date or 'latest'}), 请先运行 --auto"),
+    from src.screening.consecutive_recommendation import resolve_report_dir
+
+    reads = get_report_read_service()
+    version = await reads.run(_report_history_version, resolve_report_dir())
+
+    def _build() -> StockDetailResponse:
+        # 2. 加载推荐
+        recommendations = load_latest_recommendations(trade_date=resolved_date)
+        if not recommendations:
+            raise HTTPException(
+                status_code=404,
+                detail=(f"未找到有效 auto_screening 报告 " f"(trade_date={trade_date or 'latest'}), 请先运行 --auto"),
+            )
+
+        # 3. 计算详情
+        detail = compute_stock_detail(
+            ticker=ticker,
+            recommendations=recommendations,
+            trade_date=resolved_date,
         )
 
-    # 3. 计算详情
-    detail = compute_stock_detail(
-        ticker=ticker,
-        recommendations=recommendations,
-        trade_date=resolved_date,
-    )
+        # 4. NaN 清洗 + 响应
+        d = detail.to_dict()
+        sanitized = _sanitize_nan(d)
+        return StockDetailResponse(**sanitized)
 
-    # 4. NaN 清洗 + 响应
-    d = detail.to_dict()
-    sanitized = _sanitize_nan(d)
-    return StockDetailResponse(**sanitized)
+    rendered = await reads.render(("stock-detail", ticker, resolved_date), version, _build)
+    return conditional_response(rendered, if_none_match)
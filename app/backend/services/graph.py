@@ -10,9 +10,10 @@ from langgraph.graph import END, StateGraph
 from app.backend.services.agent_service import create_agent_function
 from src.agents.portfolio_manager import portfolio_management_agent
 from src.agents.risk_manager import risk_management_agent
+from src.data.fundamentals_dataset import FUNDAMENTALS_STATE_KEY, build_fundamentals_dataset
 from src.graph.state import AgentState
 from src.main import start
-from src.utils.analysts import ANALYST_CONFIG
+from src.utils.analysts import ANALYST_CONFIG, get_analyst_fundamentals_requests
 from src.utils.llm import build_parallel_provider_execution_plan
 
 #: NS-17: parse_hedge_fund_response 之前用 print() 吞 LLM JSON-parse 失败 —
@@ -208,6 +209,22 @@ def run_graph(
         per_provider_limit=per_provider_limit,
     )
 
+    data = {
+        "tickers": tickers,
+        "portfolio": portfolio,
+        "start_date": start_date,
+        "end_date": end_date,
+        "analyst_signals": {},
+    }
+    fundamentals = build_fundamentals_dataset(
+        tickers,
+        end_date,
+        get_analyst_fundamentals_requests(extract_base_agent_key(agent_id) for agent_id in agent_names),
+        api_key=(request_api_keys or {}).get("FINANCIAL_DATASETS_API_KEY"),
+    )
+    if fundamentals is not None:
+        data[FUNDAMENTALS_STATE_KEY] = fundamentals
+
     return graph.invoke(
         {
             "messages": [
@@ -215,13 +232,7 @@ def run_graph(
                     content="Make trading decisions based on the provided data.",
                 )
             ],
-            "data": {
-                "tickers": tickers,
-                "portfolio": portfolio,
-                "start_date": start_date,
-                "end_date": end_date,
-                "analyst_signals": {},
-            },
+            "data": data,
             "metadata": {
                 "show_reasoning": False,
                 "model_name": model_name,
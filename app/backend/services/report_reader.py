@@ -0,0 +1,192 @@
+"""后端报告读取层 — 文件 I/O 移出事件循环 + 按文件版本缓存解析结果与序列化响应。
+
+``/api/screening/latest``、``/compare``、``/winrate-dashboard``、``/stock-detail``
+以及 research / replay-artifacts 路由都是 ``async def``, 却在事件循环上同步
+``json.load`` 大报告、扫描历史目录: 一个慢看板请求会卡住同进程的所有请求。
+
+本模块提供三层:
+
+1. :meth:`ReportReadService.run` — 同步读取 / 聚合函数放到线程池执行;
+2. :meth:`ReportReadService.load_json` — 解析结果按 ``(mtime_ns, size)`` 缓存,
+   文件未变化时直接复用 (返回的对象由多个请求共享, 调用方只读);
+3. :meth:`ReportReadService.render` — 按 ``(路由键, 报告版本)`` 缓存已清洗、
+   已序列化的响应字节, 同一报告版本只构建一次; 配合 :func:`conditional_response`
+   用 ETag 回答 ``If-None-Match``, 未变化时返回 304 不再传输 body。
+
+报告版本由相关文件的 ``(name, mtime_ns, size)`` 摘要得出 (:func:`files_version` /
+:func:`glob_version`), 报告被重写或新增即换版本, 无需手动失效。
+
+Config:
+    REPORT_READ_CACHE_PAYLOADS   解析结果缓存条目上限, 默认 32
+    REPORT_READ_CACHE_RESPONSES  序列化响应缓存条目上限, 默认 256
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from src.utils.env_helpers import get_env_int
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: 报告响应的缓存策略: 允许客户端保存, 但每次都必须带 ETag 回源校验
+REPORT_CACHE_CONTROL = "private, no-cache"
+
+
+def _stat_entry(path: Path) -> tuple[str, int, int] | tuple[str, None, None]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path), None, None)
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def files_version(paths: Iterable[Path]) -> str:
+    """一组文件的版本摘要; 缺失文件也参与 (出现 / 消失都会换版本)。"""
+    digest = hashlib.sha1()
+    for entry in (_stat_entry(Path(path)) for path in paths):
+        digest.update(repr(entry).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def glob_version(directory: Path, pattern: str, *, extra: Iterable[Path] = ()) -> str:
+    """目录下匹配 ``pattern`` 的所有文件 (及 ``extra`` 附加文件) 的版本摘要 (目录不存在时也是一个稳定版本)。"""
+    directory = Path(directory)
+    paths = sorted(directory.glob(pattern)) if directory.is_dir() else []
+    return files_version([directory, *paths, *extra])
+
+
+@dataclass(frozen=True)
+class RenderedReport:
+    """清洗 + 序列化完成的响应体及其强 ETag。"""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> RenderedReport:
+        body = model.model_dump_json().encode("utf-8")
+        return cls(body=body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {item.strip().removeprefix("W/") for item in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def conditional_response(rendered: RenderedReport, if_none_match: str | None) -> Response:
+    """``If-None-Match`` 命中返回 304 (无 body), 否则返回预序列化的 JSON。"""
+    headers = {"ETag": rendered.etag, "Cache-Control": REPORT_CACHE_CONTROL}
+    if etag_matches(if_none_match, rendered.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
+
+
+class ReportReadService:
+    def __init__(self, *, max_payloads: int | None = None, max_responses: int | None = None) -> None:
+        self.max_payloads = max_payloads or get_env_int("REPORT_READ_CACHE_PAYLOADS", 32, minimum=1)
+        self.max_responses = max_responses or get_env_int("REPORT_READ_CACHE_RESPONSES", 256, minimum=1)
+        self._lock = threading.Lock()
+        self._payloads: OrderedDict[Path, tuple[tuple, Any]] = OrderedDict()
+        self._responses: OrderedDict[Hashable, tuple[str, RenderedReport]] = OrderedDict()
+        self._stats = {"payload_hits": 0, "payload_misses": 0, "render_hits": 0, "render_misses": 0}
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """在线程池中执行同步读取 / 聚合, 不阻塞事件循环。"""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    def load_json(self, path: Path) -> Any:
+        """解析 JSON 文件; ``(mtime_ns, size)`` 未变时复用上次的解析结果。
+
+        Raises:
+            OSError / json.JSONDecodeError: 与直接读取一致, 失败不写入缓存
+        """
+        path = Path(path)
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._payloads.get(path)
+            if cached is not None and cached[0] == signature:
+                self._payloads.move_to_end(path)
+                self._stats["payload_hits"] += 1
+                return cached[1]
+        payload = json.loads(path.read_bytes())
+        with self._lock:
+            self._stats["payload_misses"] += 1
+            self._payloads[path] = (signature, payload)
+            self._payloads.move_to_end(path)
+            while len(self._payloads) > self.max_payloads:
+                self._payloads.popitem(last=False)
+        return payload
+
+    async def render(self, key: Hashable, version: str, build: Callable[[], BaseModel]) -> RenderedReport:
+        """返回 ``key`` 在 ``version`` 下的序列化响应; 版本未变时不再构建。
+
+        ``build`` 在线程池中执行; 抛出的异常 (含 ``HTTPException``) 原样传播且不缓存。
+        """
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None and cached[0] == version:
+                self._responses.move_to_end(key)
+                self._stats["render_hits"] += 1
+                return cached[1]
+        rendered = await asyncio.to_thread(lambda: RenderedReport.from_model(build()))
+        with self._lock:
+            self._stats["render_misses"] += 1
+            self._responses[key] = (version, rendered)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.max_responses:
+                self._responses.popitem(last=False)
+        return rendered
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "payloads": len(self._payloads), "responses": len(self._responses)}
+
+
+_service: ReportReadService | None = None
+_service_lock = threading.Lock()
+
+
+def get_report_read_service() -> ReportReadService:
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ReportReadService()
+        return _service
+
+
+def reset_report_read_service() -> None:
+    """丢弃全局缓存 (测试隔离 / 运维手动失效); 下次访问时重建。"""
+    global _service
+    with _service_lock:
+        _service = None
+
+
+__all__ = [
+    "REPORT_CACHE_CONTROL",
+    "RenderedReport",
+    "ReportReadService",
+    "conditional_response",
+    "etag_matches",
+    "files_version",
+    "get_report_read_service",
+    "glob_version",
+    "reset_report_read_service",
+]
@@ -0,0 +1,383 @@
+"""``/api/screening`` 后台任务管理 — 请求合并 + 结果缓存 + 有界并发 + 协作式取消。
+
+此前 ``POST /api/screening/auto`` 每个请求各自 ``asyncio.to_thread`` 跑一遍
+全市场 ``compute_auto_screening_results``: 收盘时多个看板同时轮询同一
+trade_date 会并发启动多份完全相同的计算; ``wait_for`` 超时只放弃等待, 线程
+继续消耗 Tushare 配额和 CPU, 且结果无人接收。
+
+本模块把一次计算建模为 :class:`ScreeningJob`, 以
+``(trade_date, strategies, top_n)`` 为键:
+
+- 同键在途任务只跑一份, 后来的请求直接挂到已有任务上 (coalescing);
+- 成功结果按 TTL 缓存, 之后的同键请求不再触发计算;
+- 计算在有界线程池中执行, 在途 (排队 + 运行) 任务数超过上限时拒绝新键;
+- 取消通过 ``cancel_event`` 传入计算函数, 在阶段边界生效; 尚未开始的任务直接出队;
+  合并任务按请求方引用计数, 取消只摘掉一个请求方, 最后一个请求方取消时才真正停止;
+- 运行期间的 ``progress.update_status`` 事件按 job 记录, 供 SSE 推送。
+
+``score_threshold`` / ``use_explain`` 只是对 payload 的后处理, 不进入任务键。
+
+Config:
+    SCREENING_JOB_MAX_WORKERS          并发计算上限, 默认 1
+    SCREENING_JOB_MAX_INFLIGHT         排队 + 运行中任务上限, 默认 8
+    SCREENING_JOB_RESULT_TTL_SECONDS   成功结果缓存时长, 默认 900 (0 关闭)
+    SCREENING_JOB_RESULT_CACHE_MAX     结果缓存条目上限, 默认 32
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from src.main import AutoScreeningCancelled, AutoScreeningEmptyPool
+from src.utils.env_helpers import get_env_float, get_env_int
+from src.utils.progress import attach_run_id, progress
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+TERMINAL_STATUSES = frozenset({STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED})
+
+#: 每个 job 保留的进度事件上限 (SSE 只需要最近的阶段信息)
+_MAX_EVENTS_PER_JOB = 500
+#: 已结束 job 在 id 索引中的保留数量 (供 GET /jobs/{id} 查询)
+_MAX_FINISHED_JOBS = 128
+
+
+class ScreeningJobCapacityError(RuntimeError):
+    """在途任务数已达 ``SCREENING_JOB_MAX_INFLIGHT``。"""
+
+
+@dataclass(frozen=True)
+class ScreeningJobKey:
+    trade_date: str
+    strategies: tuple[str, ...] | None
+    top_n: int
+
+    @classmethod
+    def build(cls, trade_date: str, strategies: list[str] | None, top_n: int) -> ScreeningJobKey:
+        # 策略子集按等权重重排, 顺序与重复项不影响结果
+        normalized = tuple(sorted(set(strategies))) if strategies else None
+        return cls(trade_date=trade_date, strategies=normalized, top_n=int(top_n))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"trade_date": self.trade_date, "strategies": list(self.strategies) if self.strategies else None, "top_n": self.top_n}
+
+
+@dataclass(eq=False)
+class ScreeningJob:
+    job_id: str
+    key: ScreeningJobKey
+    status: str = STATUS_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    #: ``empty_pool`` (候选池为空, 对外 503) / ``internal`` (对外脱敏 500)
+    error_kind: str | None = None
+    error: str | None = None
+    payload: dict[str, Any] | None = None
+    #: 由本任务服务的请求数 (提交 + 合并 + 缓存命中)
+    attached: int = 1
+    #: 仍挂在在途任务上的请求方 (提交 + 合并 - 已取消 / 已结束等待); 归零才允许真正取消
+    requesters: int = 1
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    done: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+    _events: list[dict[str, Any]] = field(default_factory=list)
+    _event_offset: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    @property
+    def compute_seconds(self) -> float | None:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def record_event(self, agent: str, ticker: str | None, status: str, timestamp: str | None = None) -> None:
+        event = {"agent": agent, "ticker": ticker, "status": status, "timestamp": timestamp or datetime.now(UTC).isoformat()}
+        with self._lock:
+            self._events.append(event)
+            overflow = len(self._events) - _MAX_EVENTS_PER_JOB
+            if overflow > 0:
+                del self._events[:overflow]
+                self._event_offset += overflow
+
+    def events_since(self, cursor: int) -> tuple[list[dict[str, Any]], int]:
+        """返回 ``cursor`` 之后的事件与新游标 (被裁掉的旧事件直接跳过)。"""
+        with self._lock:
+            start = max(cursor - self._event_offset, 0)
+            events = list(self._events[start:])
+            return events, self._event_offset + len(self._events)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            **self.key.to_dict(),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "compute_seconds": round(self.compute_seconds, 3) if self.compute_seconds is not None else None,
+            "attached": self.attached,
+            "requesters": self.requesters,
+            "cancel_requested": self.cancel_event.is_set(),
+            "error": self.error,
+        }
+
+
+@dataclass(frozen=True)
+class ScreeningJobHandle:
+    """一次 submit 的结果: 任务本身 + 它是如何得到的。"""
+
+    job: ScreeningJob
+    #: 挂到了已有在途任务上
+    coalesced: bool = False
+    #: 直接命中已完成结果缓存
+    cache_hit: bool = False
+
+    def meta(self) -> dict[str, Any]:
+        return {"job_id": self.job.job_id, "coalesced": self.coalesced, "cache_hit": self.cache_hit}
+
+
+ComputeFn = Callable[..., dict[str, Any]]
+
+
+class ScreeningJobManager:
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        max_inflight: int | None = None,
+        result_ttl_seconds: float | None = None,
+        result_cache_max: int | None = None,
+    ) -> None:
+        self.max_workers = max_workers or get_env_int("SCREENING_JOB_MAX_WORKERS", 1, minimum=1)
+        self.max_inflight = max_inflight or get_env_int("SCREENING_JOB_MAX_INFLIGHT", 8, minimum=1)
+        self.result_ttl_seconds = get_env_float("SCREENING_JOB_RESULT_TTL_SECONDS", 900.0, minimum=0.0) if result_ttl_seconds is None else result_ttl_seconds
+        self.result_cache_max = result_cache_max or get_env_int("SCREENING_JOB_RESULT_CACHE_MAX", 32, minimum=1)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="screening-job")
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[str, ScreeningJob] = OrderedDict()
+        self._inflight: dict[ScreeningJobKey, ScreeningJob] = {}
+        self._results: OrderedDict[ScreeningJobKey, ScreeningJob] = OrderedDict()
+        self._futures: dict[str, concurrent.futures.Future] = {}
+
+    # -- submit / lookup ----------------------------------------------------
+
+    def submit(self, key: ScreeningJobKey, compute: ComputeFn) -> ScreeningJobHandle:
+        """返回 ``key`` 的缓存结果、在途任务, 或新提交的任务。
+
+        Raises:
+            ScreeningJobCapacityError: 需要新任务但在途任务已满
+        """
+        with self._lock:
+            cached = self._cached_result_locked(key)
+            if cached is not None:
+                cached.attached += 1
+                return ScreeningJobHandle(cached, cache_hit=True)
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                inflight.attached += 1
+                inflight.requesters += 1
+                return ScreeningJobHandle(inflight, coalesced=True)
+            if len(self._inflight) >= self.max_inflight:
+                raise ScreeningJobCapacityError(f"screening job capacity reached ({self.max_inflight} in flight)")
+            job = ScreeningJob(job_id=uuid.uuid4().hex, key=key)
+            job.record_event("screening_job", None, "queued")
+            self._jobs[job.job_id] = job
+            self._inflight[key] = job
+            self._futures[job.job_id] = self._executor.submit(self._run, job, compute)
+            self._trim_jobs_locked()
+        logger.info("[ScreeningJobs] submitted %s for %s", job.job_id, key)
+        return ScreeningJobHandle(job)
+
+    def get(self, job_id: str) -> ScreeningJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _cached_result_locked(self, key: ScreeningJobKey) -> ScreeningJob | None:
+        job = self._results.get(key)
+        if job is None:
+            return None
+        if self.result_ttl_seconds <= 0 or time.time() - (job.finished_at or 0.0) > self.result_ttl_seconds:
+            del self._results[key]
+            return None
+        self._results.move_to_end(key)
+        return job
+
+    def _trim_jobs_locked(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - _MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    # -- execution ----------------------------------------------------------
+
+    def _run(self, job: ScreeningJob, compute: ComputeFn) -> None:
+        if job.cancel_event.is_set():
+            self._finish(job, STATUS_CANCELLED)
+            return
+        job.status = STATUS_RUNNING
+        job.started_at = time.time()
+        job.record_event("screening_job", None, "running")
+
+        def _capture(agent_name: str, ticker: str | None, status: str, analysis: str | None, timestamp: str | None) -> None:
+            job.record_event(agent_name, ticker, status, timestamp)
+
+        # 计算线程带上 job 的 run_id, 只收本任务 (及系统广播) 的进度事件
+        progress.register_handler(_capture, run_id=job.job_id)
+        ctx = attach_run_id(contextvars.copy_context(), job.job_id)
+        try:
+            payload = ctx.run(
+                compute,
+                job.key.trade_date,
+                job.key.top_n,
+                selected_strategies=list(job.key.strategies) if job.key.strategies else None,
+                cancel_event=job.cancel_event,
+            )
+        except AutoScreeningCancelled:
+            self._finish(job, STATUS_CANCELLED)
+        except AutoScreeningEmptyPool as exc:
+            # 候选池为空 — 上游数据问题, 对外 503 并原样给出说明; 其他 ValueError 属内部错误
+            self._finish(job, STATUS_FAILED, error_kind="empty_pool", error=str(exc))
+        except Exception:
+            logger.exception("[ScreeningJobs] job %s failed", job.job_id)
+            self._finish(job, STATUS_FAILED, error_kind="internal", error="Internal server error")
+        else:
+            self._finish(job, STATUS_SUCCEEDED, payload=payload)
+        finally:
+            progress.unregister_handler(_capture)
+
+    def _finish(self, job: ScreeningJob, status: str, *, payload: dict[str, Any] | None = None, error_kind: str | None = None, error: str | None = None) -> None:
+        with self._lock:
+            job.payload = payload
+            job.error_kind = error_kind
+            job.error = error
+            job.finished_at = time.time()
+            job.status = status
+            if self._inflight.get(job.key) is job:
+                del self._inflight[job.key]
+            self._futures.pop(job.job_id, None)
+            if status == STATUS_SUCCEEDED and self.result_ttl_seconds > 0:
+                self._results[job.key] = job
+                self._results.move_to_end(job.key)
+                while len(self._results) > self.result_cache_max:
+                    self._results.popitem(last=False)
+        job.record_event("screening_job", None, status)
+        logger.info("[ScreeningJobs] job %s %s (compute=%ss)", job.job_id, status, job.snapshot()["compute_seconds"])
+        if not job.done.done():
+            job.done.set_result(job)
+
+    # -- cancellation -------------------------------------------------------
+
+    def release(self, job: ScreeningJob) -> None:
+        """请求方不再等待该任务 (``/auto`` 返回或超时); 任务本身继续运行, 结果照常进缓存。"""
+        with self._lock:
+            if not job.finished and job.requesters > 0:
+                job.requesters -= 1
+
+    def cancel(self, job_id: str, *, force: bool = False) -> ScreeningJob | None:
+        """请求方取消; 仍有其他请求方挂在任务上时只摘掉本请求方, 任务继续运行。
+
+        最后一个请求方取消 (或 ``force``) 时才真正取消: 排队中的任务立即出队,
+        运行中的任务在下一个阶段边界停止。
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+            job.requesters = max(job.requesters - 1, 0)
+            detached = job.requesters > 0 and not force
+            future = None
+            if not detached:
+                job.cancel_event.set()
+                # 已请求取消的任务不再接受合并, 同键新请求会启动新任务
+                if self._inflight.get(job.key) is job:
+                    del self._inflight[job.key]
+                future = self._futures.get(job_id)
+        if detached:
+            job.record_event("screening_job", None, "requester_detached")
+        elif future is not None and future.cancel():
+            self._finish(job, STATUS_CANCELLED)
+        else:
+            job.record_event("screening_job", None, "cancel_requested")
+        return job
+
+    # -- async waiting ------------------------------------------------------
+
+    @staticmethod
+    async def wait(job: ScreeningJob, timeout: float | None) -> ScreeningJob:
+        """等待任务结束; 超时抛 ``asyncio.TimeoutError`` 但不影响任务本身。"""
+        # shield: wait_for 超时只取消本次等待, 不会把取消传到共享的 done future
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(job.done)), timeout=timeout)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_inflight": self.max_inflight,
+                "inflight": len(self._inflight),
+                "cached_results": len(self._results),
+                "jobs": len(self._jobs),
+            }
+
+    def shutdown(self, *, cancel_running: bool = True) -> None:
+        with self._lock:
+            job_ids = [job.job_id for job in self._jobs.values() if not job.finished]
+        if cancel_running:
+            for job_id in job_ids:
+                self.cancel(job_id, force=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_manager: ScreeningJobManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_screening_job_manager() -> ScreeningJobManager:
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ScreeningJobManager()
+        return _manager
+
+
+def shutdown_screening_job_manager() -> None:
+    """取消在途任务并丢弃全局 manager (应用关闭 / 测试隔离); 下次访问时重建。"""
+    global _manager
+    with _manager_lock:
+        manager, _manager = _manager, None
+    if manager is not None:
+        manager.shutdown()
+
+
+__all__ = [
+    "STATUS_CANCELLED",
+    "STATUS_FAILED",
+    "STATUS_QUEUED",
+    "STATUS_RUNNING",
+    "STATUS_SUCCEEDED",
+    "ScreeningJob",
+    "ScreeningJobCapacityError",
+    "ScreeningJobHandle",
+    "ScreeningJobKey",
+    "ScreeningJobManager",
+    "get_screening_job_manager",
+    "shutdown_screening_job_manager",
+]
@@ -192,17 +192,20 @@ def main(max_dates: int = 0, dry_run: bool = False, top_n: int = 300) -> None:
         print("\n无 missing dates, 已全部回填")
         return
 
-    # 逐个回填
+    # 逐个回填; 每个日期两次 update 只写 SQLite 追踪库, tracking_history.json 在批次结束时导出一次
+    from src.screening.recommendation_tracker import deferred_tracking_export
+
     print(f"\n=== 开始回填 {len(missing)} dates (top_n={top_n}) ===")
     total_low_added = 0
-    for i, date in enumerate(missing, 1):
-        print(f"[{i}/{len(missing)}] {date}...", end=" ", flush=True)
-        try:
-            result = backfill_one_date(date, top_n=top_n)
-            print(f"recs={result['n_recs']}, low={result['n_low']}, updated={result['updated']}, {result['elapsed_s']}s")
-        except Exception as exc:
-            print(f"FAILED: {type(exc).__name__}: {exc}")
-            logger.exception("backfill failed for %s", date)
+    with deferred_tracking_export(resolve_report_dir()):
+        for i, date in enumerate(missing, 1):
+            print(f"[{i}/{len(missing)}] {date}...", end=" ", flush=True)
+            try:
+                result = backfill_one_date(date, top_n=top_n)
+                print(f"recs={result['n_recs']}, low={result['n_low']}, updated={result['updated']}, {result['elapsed_s']}s")
+            except Exception as exc:
+                print(f"FAILED: {type(exc).__name__}: {exc}")
+                logger.exception("backfill failed for %s", date)
 
     # 回填后统计
     records_after = load_tracking_history(resolve_report_dir())
@@ -31,6 +31,8 @@ from typing import Any
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(_PROJECT_ROOT))
 
+from src.screening.tracking_store import pending_export_records  # noqa: E402
+
 logger = logging.getLogger("within_pool_readiness")
 
 
@@ -125,8 +127,10 @@ def run(
         print(f"tracking_history 不存在: {p}")
         return
 
-    raw = json.loads(p.read_text(encoding="utf-8"))
-    records = raw.get("records", raw) if isinstance(raw, dict) else raw
+    records = pending_export_records(p)  # nightly 更新未导出时以追踪库为准
+    if records is None:
+        raw = json.loads(p.read_text(encoding="utf-8"))
+        records = raw.get("records", raw) if isinstance(raw, dict) else raw
     print(f"\nWithin-pool factor attribution 就绪检查")
     print(f"tracking_history: {p} ({len(records)} records)")
     print(f"{'=' * 80}")
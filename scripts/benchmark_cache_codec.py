@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import json
+import pickle
+import random
+import timeit
+
+from src.data.cache_codec import COMPRESSION_NONE, decode_value, encode_value
+
+
+def _price_records(count: int) -> list[dict]:
+    rng = random.Random(20261017)
+    return [
+        {
+            "open": rng.uniform(5, 50),
+            "close": rng.uniform(5, 50),
+            "high": rng.uniform(5, 50),
+            "low": rng.uniform(5, 50),
+            "volume": rng.randint(10_000, 10_000_000),
+            "time": f"2025-{index // 28 % 12 + 1:02d}-{index % 28 + 1:02d}",
+            "ticker": "000001",
+        }
+        for index in range(count)
+    ]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark cache_codec encode/decode against plain pickle on price-like records.")
+    parser.add_argument("--rows", type=int, default=500, help="Records per cached payload")
+    parser.add_argument("--repeat", type=int, default=2000, help="Timed iterations per measurement")
+    return parser
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+    records = _price_records(args.rows)
+    encoded = encode_value(records)
+    encoded_raw = encode_value(records, compression=COMPRESSION_NONE)
+    pickled = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+    assert decode_value(encoded) == records
+
+    def per_call_us(func) -> float:
+        return round(timeit.timeit(func, number=args.repeat) / args.repeat * 1e6, 1)
+
+    payload = {
+        "rows": args.rows,
+        "bytes": {"codec": len(encoded), "codec_uncompressed": len(encoded_raw), "pickle": len(pickled)},
+        "decode_us": {
+            "codec": per_call_us(lambda: decode_value(encoded)),
+            "codec_uncompressed": per_call_us(lambda: decode_value(encoded_raw)),
+            "pickle": per_call_us(lambda: pickle.loads(pickled)),
+        },
+        "encode_us": {
+            "codec": per_call_us(lambda: encode_value(records)),
+            "pickle": per_call_us(lambda: pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)),
+        },
+    }
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
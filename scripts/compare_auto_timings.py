@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""Compare ``--auto`` timing artifacts and flag per-span regressions.
+
+Usage:
+    python scripts/compare_auto_timings.py
+    python scripts/compare_auto_timings.py --depth 3 --min-delta 5
+    python scripts/compare_auto_timings.py --baseline logs/auto_timings/auto_timing_20261015T220000.json --fail-on-regression
+"""
+
+import sys
+
+from src.utils.run_profiler import main
+
+if __name__ == "__main__":
+    sys.exit(main())
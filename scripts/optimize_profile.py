@@ -6700,6 +6700,7 @@ def _build_walk_forward_evaluator(
 ) -> Callable:
     from src.backtesting.engine import BacktestEngine
     from src.backtesting.walk_forward import (
+        build_shared_walk_forward_engine_factory,
         build_walk_forward_windows,
         run_walk_forward,
         summarize_walk_forward,
@@ -6717,22 +6718,25 @@ def _build_walk_forward_evaluator(
             step_months=step_months,
             window_mode=WindowMode.ROLLING,
         )
+        engine_factory, _ = build_shared_walk_forward_engine_factory(
+            windows,
+            tickers,
+            lambda test_start, test_end, **engine_kwargs: BacktestEngine(
+                agent=run_hedge_fund,
+                tickers=tickers,
+                start_date=test_start,
+                end_date=test_end,
+                initial_capital=initial_capital,
+                model_name=model_name,
+                model_provider=model_provider,
+                selected_analysts=selected_analysts,
+                initial_margin_requirement=0.0,
+                backtest_mode="pipeline",
+                **engine_kwargs,
+            ),
+        )
         with use_short_trade_target_profile(profile_name=base_profile, overrides=params):
-            results = run_walk_forward(
-                windows,
-                lambda w: BacktestEngine(
-                    agent=run_hedge_fund,
-                    tickers=tickers,
-                    start_date=w.test_start,
-                    end_date=w.test_end,
-                    initial_capital=initial_capital,
-                    model_name=model_name,
-                    model_provider=model_provider,
-                    selected_analysts=selected_analysts,
-                    initial_margin_requirement=0.0,
-                    backtest_mode="pipeline",
-                ),
-            )
+            results = run_walk_forward(windows, engine_factory)
         summary = summarize_walk_forward(results)
         return {
             "sharpe_ratio": summary.get("avg_sharpe"),
@@ -7758,6 +7762,8 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--search-stage", choices=["full", "coarse", "focused", "staged"], default="full", help="Search stage strategy")
     parser.add_argument("--focus-json", default=None, help="JSON file with best_params for focused stage")
     parser.add_argument("--max-combinations", type=int, default=None, help="Fail fast when grid size exceeds this budget")
+    parser.add_argument("--max-workers", type=int, default=None, help="Parallel trials (default: sequential; one per CPU core with --executor process)")
+    parser.add_argument("--executor", choices=["thread", "process"], default=None, help="Trial pool backend (default: PARAM_GRID_EXECUTOR env var, else thread)")
     parser.add_argument("--next-high-hit-threshold", type=float, default=0.02)
     # Walk-forward mode args
     parser.add_argument("--tickers", default=None, help="Tickers for walk-forward mode")
@@ -7889,6 +7895,8 @@ def main(argv: list[str] | None = None) -> int:
             evaluator=evaluator,
             checkpoint_path=coarse_checkpoint,
             guardrails=guardrails or None,
+            max_workers=args.max_workers,
+            executor=args.executor,
         )
         coarse_best_params = _report_best_params(coarse_report)
 
@@ -7912,6 +7920,8 @@ def main(argv: list[str] | None = None) -> int:
             evaluator=evaluator,
             checkpoint_path=checkpoint,
             guardrails=guardrails or None,
+            max_workers=args.max_workers,
+            executor=args.executor,
         )
         stage_results = {
             "coarse": {
@@ -7933,6 +7943,8 @@ def main(argv: list[str] | None = None) -> int:
             evaluator=evaluator,
             checkpoint_path=checkpoint,
             guardrails=guardrails or None,
+            max_workers=args.max_workers,
+            executor=args.executor,
         )
 
     md_path = save_search_report(report, args.output_md)
@@ -36,6 +36,12 @@ if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
 from src.backtesting.engine import BacktestEngine  # noqa: E402
+from src.backtesting.param_executor import (  # noqa: E402
+    EXECUTOR_CHOICES,
+    EXECUTOR_ENV_VAR,
+    EXECUTOR_PROCESS,
+    resolve_executor_kind,
+)
 from src.backtesting.param_grid import (  # noqa: E402
     DEFAULT_GRID_MAX_WORKERS,
     grid_combinations,
@@ -130,7 +136,13 @@ def _add_grid_args(parser: argparse.ArgumentParser) -> None:
         "--max-workers",
         type=int,
         default=None,
-        help=f"Override the worker thread count.  Defaults to the {GRID_ENV_VAR} env var " f"({DEFAULT_GRID_MAX_WORKERS} if unset).",
+        help=f"Override the worker count.  Defaults to the {GRID_ENV_VAR} env var " f"({DEFAULT_GRID_MAX_WORKERS} if unset; one per CPU core with --executor process).",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=list(EXECUTOR_CHOICES),
+        default=None,
+        help=f"Trial pool backend.  'process' runs trials on separate cores with market data " f"prefetched once and shared with the workers.  Defaults to the {EXECUTOR_ENV_VAR} env var (thread if unset).",
     )
     parser.add_argument(
         "--sort-by",
@@ -212,6 +224,7 @@ def _summarize_walk_forward(args: argparse.Namespace, base_args: dict[str, Any])
     # Imports are deferred so unit tests can mock the engine without
     # paying for the heavy LangGraph import cost.
     from src.backtesting.walk_forward import (
+        build_shared_walk_forward_engine_factory,
         build_walk_forward_windows,
         run_walk_forward,
         summarize_walk_forward,
@@ -237,15 +250,17 @@ def _summarize_walk_forward(args: argparse.Namespace, base_args: dict[str, Any])
 
     from src.main import run_hedge_fund  # local import keeps the CLI light
 
-    def _build_engine(test_start: str, test_end: str) -> BacktestEngine:
+    def _build_engine(test_start: str, test_end: str, **engine_kwargs: Any) -> BacktestEngine:
         return BacktestEngine(
             agent=run_hedge_fund,
             start_date=test_start,
             end_date=test_end,
             **base_args,
+            **engine_kwargs,
         )
 
-    results = run_walk_forward(windows, _build_engine)
+    engine_factory, _ = build_shared_walk_forward_engine_factory(windows, base_args["tickers"], _build_engine)
+    results = run_walk_forward(windows, engine_factory)
     summary = summarize_walk_forward(results)
     return {
         "sharpe_ratio": summary.get("avg_sharpe"),
@@ -331,6 +346,35 @@ def make_evaluator(args: argparse.Namespace) -> Any:
     return _evaluator
 
 
+def make_preload(args: argparse.Namespace) -> Any:
+    """Return a callable that prefetches the sweep's market data once.
+
+    Every trial shares the same tickers and date range, so the parent warms
+    the data caches before the pool starts; thread workers then hit the same
+    in-process cache and forked process workers inherit it copy-on-write
+    instead of each one re-fetching prices / financials / news.
+    """
+    from src.backtesting.engine_market_data import MarketDataLoader
+    from src.backtesting.portfolio import Portfolio
+
+    tickers = [t.strip() for t in args.tickers.split(",") if t.strip()]
+
+    def _preload() -> None:
+        loader = MarketDataLoader(
+            tickers=tickers,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            portfolio=Portfolio(tickers=tickers, initial_cash=args.initial_capital, margin_requirement=args.margin_requirement),
+            exit_reentry_cooldowns={},
+        )
+        try:
+            loader.prefetch_data()
+        except Exception as exc:  # noqa: BLE001 - preload is an optimization; trials fetch on their own
+            logger.warning("Market data preload failed, trials will fetch individually: %s", exc)
+
+    return _preload
+
+
 # ---------------------------------------------------------------------------
 # Output side
 # ---------------------------------------------------------------------------
@@ -389,7 +433,15 @@ def main(argv: Sequence[str] | None = None) -> int:
         logger.info("Trial %d/%d: %s", index + 1, len(combinations), params)
 
     evaluator = make_evaluator(args)
-    report = run_param_grid(grid=grid, evaluator=evaluator, max_workers=args.max_workers)
+    report = run_param_grid(
+        grid=grid,
+        evaluator=evaluator,
+        max_workers=args.max_workers,
+        executor=args.executor,
+        # 只有进程池需要在 fork 前预热：线程 worker 共享同一进程缓存，首个 trial
+        # 自己就会把数据拉进来，单独预热只是多一次同步的全量拉取。
+        preload=make_preload(args) if resolve_executor_kind(args.executor) == EXECUTOR_PROCESS else None,
+    )
 
     paths = _write_reports(report, args.output, args.sort_by)
     _print_summary(report, paths, args.sort_by)
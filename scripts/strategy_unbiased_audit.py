@@ -176,7 +176,7 @@ def scan_fundamental() -> list[dict]:
     产出完整 metrics (无 API 请求). 简化重建在 2025 候选日方向分布完全颠倒
     (−1 为主 26/33), 不可用; 必须用生产链.
     """
-    import pickle
+    from src.data.cache_codec import decode_value
     import sqlite3
 
     from unittest import mock
@@ -189,7 +189,7 @@ def scan_fundamental() -> list[dict]:
     fkeys = [r[0] for r in con.execute("SELECT key FROM cache WHERE key LIKE 'tushare_df:fina_indicator:%'").fetchall()]
     fina_frames: dict[str, pd.DataFrame] = {}
     for k in fkeys:
-        df = pickle.loads(con.execute("SELECT value FROM cache WHERE key=?", (k,)).fetchone()[0])
+        df = decode_value(con.execute("SELECT value FROM cache WHERE key=?", (k,)).fetchone()[0])
         if df.empty or "end_date" not in df.columns or "ann_date" not in df.columns:
             continue
         ts = str(df["ts_code"].iloc[0])
@@ -269,14 +269,14 @@ def scan_fundamental() -> list[dict]:
 
 def scan_event() -> list[dict]:
     """Event 审计: news 缓存窗口 (2026-02-26 ~ 2026-08-11) 内的涨停候选日."""
-    import pickle
+    from src.data.cache_codec import decode_value
     import sqlite3
 
     con = sqlite3.connect("data/cache/cache.sqlite")
     nkeys = [r[0] for r in con.execute("SELECT key FROM cache WHERE key LIKE 'akshare_df:stock_news_em:%'").fetchall()]
     news_by_ticker: dict[str, list[dict]] = {}
     for k in nkeys:
-        df = pickle.loads(con.execute("SELECT value FROM cache WHERE key=?", (k,)).fetchone()[0])
+        df = decode_value(con.execute("SELECT value FROM cache WHERE key=?", (k,)).fetchone()[0])
         if df.empty or "关键词" not in df.columns:
             continue
         kw = str(df["关键词"].iloc[0])
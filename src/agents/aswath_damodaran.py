@@ -15,6 +15,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
 
 from src.agents.prompt_rules import with_fact_grounding_rules
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import (
     get_financial_metrics,
@@ -55,6 +56,25 @@ def _latest_line_item_number(line_items: list, field: str) -> float | None:
     return None
 
 
+ASWATH_DAMODARAN_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="ttm",
+    metrics_limit=5,
+    line_items=(
+        "free_cash_flow",
+        "ebit",
+        "interest_expense",
+        "capital_expenditure",
+        "depreciation_and_amortization",
+        "outstanding_shares",
+        "net_income",
+        "total_debt",
+    ),
+    line_items_period="annual",
+    line_items_limit=5,
+    market_cap=True,
+)
+
+
 def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_agent"):
     """
     Analyze US equities through Aswath Damodaran's intrinsic-value lens:
@@ -74,30 +94,22 @@ def aswath_damodaran_agent(state: AgentState, agent_id: str = "aswath_damodaran_
 
     for ticker in tickers:
         # ─── Fetch core data ────────────────────────────────────────────────────
+        shared = shared_fundamentals(state, ticker, ASWATH_DAMODARAN_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
+        metrics = shared.financial_metrics if shared else get_financial_metrics(ticker, end_date, period=ASWATH_DAMODARAN_FUNDAMENTALS.metrics_period, limit=ASWATH_DAMODARAN_FUNDAMENTALS.metrics_limit, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching financial line items")
-        line_items = search_line_items(
+        line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                "free_cash_flow",
-                "ebit",
-                "interest_expense",
-                "capital_expenditure",
-                "depreciation_and_amortization",
-                "outstanding_shares",
-                "net_income",
-                "total_debt",
-            ],
+            list(ASWATH_DAMODARAN_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
-            limit=5,
+            period=ASWATH_DAMODARAN_FUNDAMENTALS.line_items_period,
+            limit=ASWATH_DAMODARAN_FUNDAMENTALS.line_items_limit,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         # ─── Analyses ───────────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Analyzing growth and reinvestment")
@@ -18,6 +18,7 @@ from src.agents.ben_graham_helpers import (
     _score_graham_dividend_record,
 )
 from src.agents.prompt_rules import with_fact_grounding_rules
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
 from src.utils.api_key import get_api_key_from_state
@@ -33,6 +34,27 @@ class BenGrahamSignal(BaseModel):
     reasoning_cn: str
 
 
+BEN_GRAHAM_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="annual",
+    metrics_limit=10,
+    line_items=(
+        "earnings_per_share",
+        "revenue",
+        "net_income",
+        "book_value_per_share",
+        "total_assets",
+        "total_liabilities",
+        "current_assets",
+        "current_liabilities",
+        "dividends_and_other_cash_distributions",
+        "outstanding_shares",
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
     """
     Analyzes stocks using Benjamin Graham's classic value-investing principles:
@@ -50,14 +72,15 @@ def ben_graham_agent(state: AgentState, agent_id: str = "ben_graham_agent"):
     graham_analysis = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, BEN_GRAHAM_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=10, api_key=api_key)
+        metrics = shared.financial_metrics if shared else get_financial_metrics(ticker, end_date, period=BEN_GRAHAM_FUNDAMENTALS.metrics_period, limit=BEN_GRAHAM_FUNDAMENTALS.metrics_limit, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(ticker, ["earnings_per_share", "revenue", "net_income", "book_value_per_share", "total_assets", "total_liabilities", "current_assets", "current_liabilities", "dividends_and_other_cash_distributions", "outstanding_shares"], end_date, period="annual", limit=10, api_key=api_key)
+        financial_line_items = shared.line_items if shared else search_line_items(ticker, list(BEN_GRAHAM_FUNDAMENTALS.line_items), end_date, period=BEN_GRAHAM_FUNDAMENTALS.line_items_period, limit=BEN_GRAHAM_FUNDAMENTALS.line_items_limit, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         # Perform sub-analyses
         progress.update_status(agent_id, ticker, "Analyzing earnings stability")
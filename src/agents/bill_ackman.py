@@ -21,6 +21,7 @@ from src.agents.bill_ackman_helpers import (
     _score_ackman_roe,
 )
 from src.agents.prompt_rules import with_fact_grounding_rules
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
 from src.utils.api_key import get_api_key_from_state
@@ -37,6 +38,27 @@ class BillAckmanSignal(BaseModel):
     reasoning_cn: str
 
 
+BILL_ACKMAN_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="annual",
+    metrics_limit=5,
+    line_items=(
+        "revenue",
+        "operating_margin",
+        "debt_to_equity",
+        "free_cash_flow",
+        "total_assets",
+        "total_liabilities",
+        "dividends_and_other_cash_distributions",
+        "outstanding_shares",
+        # Optional: intangible_assets if available
+        # "intangible_assets"
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
     """
     Analyzes stocks using Bill Ackman's investing principles and LLM reasoning.
@@ -51,33 +73,23 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
     ackman_analysis = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, BILL_ACKMAN_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
+        metrics = shared.financial_metrics if shared else get_financial_metrics(ticker, end_date, period=BILL_ACKMAN_FUNDAMENTALS.metrics_period, limit=BILL_ACKMAN_FUNDAMENTALS.metrics_limit, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Request multiple periods of data (annual or TTM) for a more robust long-term view.
-        financial_line_items = search_line_items(
+        financial_line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                "revenue",
-                "operating_margin",
-                "debt_to_equity",
-                "free_cash_flow",
-                "total_assets",
-                "total_liabilities",
-                "dividends_and_other_cash_distributions",
-                "outstanding_shares",
-                # Optional: intangible_assets if available
-                # "intangible_assets"
-            ],
+            list(BILL_ACKMAN_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
-            limit=10,
+            period=BILL_ACKMAN_FUNDAMENTALS.line_items_period,
+            limit=BILL_ACKMAN_FUNDAMENTALS.line_items_limit,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing business quality")
         quality_analysis = analyze_business_quality(metrics, financial_line_items)
@@ -26,6 +26,7 @@ from src.agents.cathie_wood_helpers import (
     _score_cathie_rnd_trends,
 )
 from src.agents.prompt_rules import with_fact_grounding_rules
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
 from src.utils.api_key import get_api_key_from_state
@@ -51,6 +52,30 @@ _INNOVATION_MAX_SCORE = 15
 _COMBINED_MAX_SCORE = 15  # Used for signal threshold at agent level (sum of normalised sub-scores, each out of 5)
 
 
+CATHIE_WOOD_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="annual",
+    metrics_limit=5,
+    line_items=(
+        "revenue",
+        "net_income",
+        "gross_margin",
+        "operating_margin",
+        "debt_to_equity",
+        "free_cash_flow",
+        "total_assets",
+        "total_liabilities",
+        "dividends_and_other_cash_distributions",
+        "outstanding_shares",
+        "research_and_development",
+        "capital_expenditure",
+        "operating_expense",
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
     """
     Analyzes stocks using Cathie Wood's investing principles and LLM reasoning.
@@ -67,36 +92,23 @@ def cathie_wood_agent(state: AgentState, agent_id: str = "cathie_wood_agent"):
     cw_analysis = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, CATHIE_WOOD_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5, api_key=api_key)
+        metrics = shared.financial_metrics if shared else get_financial_metrics(ticker, end_date, period=CATHIE_WOOD_FUNDAMENTALS.metrics_period, limit=CATHIE_WOOD_FUNDAMENTALS.metrics_limit, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Request multiple periods of data (annual or TTM) for a more robust view.
-        financial_line_items = search_line_items(
+        financial_line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                "revenue",
-                "net_income",
-                "gross_margin",
-                "operating_margin",
-                "debt_to_equity",
-                "free_cash_flow",
-                "total_assets",
-                "total_liabilities",
-                "dividends_and_other_cash_distributions",
-                "outstanding_shares",
-                "research_and_development",
-                "capital_expenditure",
-                "operating_expense",
-            ],
+            list(CATHIE_WOOD_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
-            limit=10,
+            period=CATHIE_WOOD_FUNDAMENTALS.line_items_period,
+            limit=CATHIE_WOOD_FUNDAMENTALS.line_items_limit,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing disruptive potential")
         disruptive_analysis = analyze_disruptive_potential(metrics, financial_line_items)
@@ -33,6 +33,7 @@ from src.agents.charlie_munger_helpers import (
     _score_munger_share_count,
 )
 from src.agents.prompt_rules import with_fact_grounding_rules
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import (
     get_company_news,
@@ -57,6 +58,31 @@ class CharlieMungerSignal(BaseModel):
     reasoning_cn: str
 
 
+CHARLIE_MUNGER_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="annual",
+    metrics_limit=10,
+    line_items=(
+        "revenue",
+        "net_income",
+        "operating_income",
+        "return_on_invested_capital",
+        "gross_margin",
+        "operating_margin",
+        "free_cash_flow",
+        "capital_expenditure",
+        "cash_and_equivalents",
+        "total_liabilities",
+        "shareholders_equity",
+        "outstanding_shares",
+        "research_and_development",
+        "goodwill_and_intangible_assets",
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agent"):
     """
     Analyzes stocks using Charlie Munger's investing principles and mental models.
@@ -70,36 +96,22 @@ def charlie_munger_agent(state: AgentState, agent_id: str = "charlie_munger_agen
     munger_analysis = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, CHARLIE_MUNGER_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=10, api_key=api_key)  # Munger looks at longer periods
+        metrics = shared.financial_metrics if shared else get_financial_metrics(ticker, end_date, period=CHARLIE_MUNGER_FUNDAMENTALS.metrics_period, limit=CHARLIE_MUNGER_FUNDAMENTALS.metrics_limit, api_key=api_key)  # Munger looks at longer periods
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(
+        financial_line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                "revenue",
-                "net_income",
-                "operating_income",
-                "return_on_invested_capital",
-                "gross_margin",
-                "operating_margin",
-                "free_cash_flow",
-                "capital_expenditure",
-                "cash_and_equivalents",
-                "total_liabilities",
-                "shareholders_equity",
-                "outstanding_shares",
-                "research_and_development",
-                "goodwill_and_intangible_assets",
-            ],
+            list(CHARLIE_MUNGER_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
-            limit=10,  # Munger examines long-term trends
+            period=CHARLIE_MUNGER_FUNDAMENTALS.line_items_period,
+            limit=CHARLIE_MUNGER_FUNDAMENTALS.line_items_limit,  # Munger examines long-term trends
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
         # Munger values management with skin in the game
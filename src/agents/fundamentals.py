@@ -17,6 +17,7 @@ from src.agents.fundamentals_helpers import (
     _build_missing_fundamentals_result,
     _finalize_fundamentals_signal,
 )
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import get_financial_metrics
 from src.utils.api_key import get_api_key_from_state
@@ -24,6 +25,12 @@ from src.utils.progress import progress
 
 
 ##### Fundamental Agent #####
+FUNDAMENTALS_ANALYST_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="ttm",
+    metrics_limit=10,
+)
+
+
 def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_analyst_agent"):
     """Analyzes fundamental data and generates trading signals for multiple tickers."""
     data = state["data"]
@@ -34,14 +41,15 @@ def fundamentals_analyst_agent(state: AgentState, agent_id: str = "fundamentals_
     fundamental_analysis = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, FUNDAMENTALS_ANALYST_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
 
         # Get the financial metrics
-        financial_metrics = get_financial_metrics(
+        financial_metrics = shared.financial_metrics if shared else get_financial_metrics(
             ticker=ticker,
             end_date=end_date,
-            period="ttm",
-            limit=10,
+            period=FUNDAMENTALS_ANALYST_FUNDAMENTALS.metrics_period,
+            limit=FUNDAMENTALS_ANALYST_FUNDAMENTALS.metrics_limit,
             api_key=api_key,
         )
 
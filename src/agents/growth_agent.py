@@ -17,6 +17,7 @@ from src.agents.growth_agent_helpers import (
     _score_fcf_growth,
     _score_revenue_growth,
 )
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import (
     get_financial_metrics,
@@ -27,6 +28,12 @@ from src.utils.progress import progress
 from src.utils.ticker_utils import get_currency_symbol
 
 
+GROWTH_ANALYST_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="ttm",
+    metrics_limit=12,
+)
+
+
 def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agent"):
     """Run growth analysis across tickers and write signals back to `state`."""
 
@@ -37,14 +44,15 @@ def growth_analyst_agent(state: AgentState, agent_id: str = "growth_analyst_agen
     growth_analysis: dict[str, dict] = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, GROWTH_ANALYST_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial data")
 
         # --- Historical financial metrics ---
-        financial_metrics = get_financial_metrics(
+        financial_metrics = shared.financial_metrics if shared else get_financial_metrics(
             ticker=ticker,
             end_date=end_date,
-            period="ttm",
-            limit=12,  # 3 years of ttm data
+            period=GROWTH_ANALYST_FUNDAMENTALS.metrics_period,
+            limit=GROWTH_ANALYST_FUNDAMENTALS.metrics_limit,  # 3 years of ttm data
             api_key=api_key,
         )
         if not financial_metrics or len(financial_metrics) < 4:
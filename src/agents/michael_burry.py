@@ -16,6 +16,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
 
 from src.agents.prompt_rules import with_fact_grounding_rules
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import (
     get_company_news,
@@ -39,6 +40,25 @@ class MichaelBurrySignal(BaseModel):
     reasoning_cn: str
 
 
+MICHAEL_BURRY_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="ttm",
+    metrics_limit=5,
+    line_items=(
+        "free_cash_flow",
+        "net_income",
+        "total_debt",
+        "cash_and_equivalents",
+        "total_assets",
+        "total_liabilities",
+        "outstanding_shares",
+        "issuance_or_purchase_of_equity_shares",
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"):
     """Analyse stocks using Michael Burry's deep‑value, contrarian framework."""
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
@@ -56,24 +76,16 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
         # ------------------------------------------------------------------
         # Fetch raw data
         # ------------------------------------------------------------------
+        shared = shared_fundamentals(state, ticker, MICHAEL_BURRY_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
+        metrics = shared.financial_metrics if shared else get_financial_metrics(ticker, end_date, period=MICHAEL_BURRY_FUNDAMENTALS.metrics_period, limit=MICHAEL_BURRY_FUNDAMENTALS.metrics_limit, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching line items")
-        line_items = search_line_items(
+        line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                "free_cash_flow",
-                "net_income",
-                "total_debt",
-                "cash_and_equivalents",
-                "total_assets",
-                "total_liabilities",
-                "outstanding_shares",
-                "issuance_or_purchase_of_equity_shares",
-            ],
+            list(MICHAEL_BURRY_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
+            period=MICHAEL_BURRY_FUNDAMENTALS.line_items_period,
             api_key=api_key,
         )
 
@@ -84,7 +96,7 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
         news = get_company_news(ticker, end_date=end_date, start_date=start_date, limit=250)
 
         progress.update_status(agent_id, ticker, "Fetching market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         # ------------------------------------------------------------------
         # Run sub‑analyses
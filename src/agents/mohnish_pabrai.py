@@ -25,6 +25,7 @@ from src.agents.mohnish_pabrai_helpers import (
     _score_pabrai_revenue_trajectory,
 )
 from src.agents.prompt_rules import with_fact_grounding_rules
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import get_market_cap, search_line_items
 from src.utils.api_key import get_api_key_from_state
@@ -41,6 +42,35 @@ class MohnishPabraiSignal(BaseModel):
     reasoning_cn: str
 
 
+MOHNISH_PABRAI_FUNDAMENTALS = FundamentalsRequest(
+    line_items=(
+        # Profitability and cash generation
+        "revenue",
+        "gross_profit",
+        "gross_margin",
+        "operating_income",
+        "operating_margin",
+        "net_income",
+        "free_cash_flow",
+        # Balance sheet - debt and liquidity
+        "total_debt",
+        "cash_and_equivalents",
+        "current_assets",
+        "current_liabilities",
+        "shareholders_equity",
+        "debt_to_equity",
+        # Capital intensity
+        "capital_expenditure",
+        "depreciation_and_amortization",
+        # Shares outstanding for per-share context
+        "outstanding_shares",
+    ),
+    line_items_period="annual",
+    line_items_limit=8,
+    market_cap=True,
+)
+
+
 def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agent"):
     """Evaluate stocks using Mohnish Pabrai's checklist and 'heads I win, tails I don't lose much' approach."""
     data = state["data"]
@@ -54,39 +84,19 @@ def mohnish_pabrai_agent(state: AgentState, agent_id: str = "mohnish_pabrai_agen
     # Pabrai focuses on: downside protection, simple business, moat via unit economics, FCF yield vs alternatives,
     # and potential for doubling in 2-3 years at low risk.
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, MOHNISH_PABRAI_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Gathering financial line items")
-        line_items = search_line_items(
+        line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                # Profitability and cash generation
-                "revenue",
-                "gross_profit",
-                "gross_margin",
-                "operating_income",
-                "operating_margin",
-                "net_income",
-                "free_cash_flow",
-                # Balance sheet - debt and liquidity
-                "total_debt",
-                "cash_and_equivalents",
-                "current_assets",
-                "current_liabilities",
-                "shareholders_equity",
-                "debt_to_equity",
-                # Capital intensity
-                "capital_expenditure",
-                "depreciation_and_amortization",
-                # Shares outstanding for per-share context
-                "outstanding_shares",
-            ],
+            list(MOHNISH_PABRAI_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
-            limit=8,
+            period=MOHNISH_PABRAI_FUNDAMENTALS.line_items_period,
+            limit=MOHNISH_PABRAI_FUNDAMENTALS.line_items_limit,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing downside protection")
         downside = analyze_downside_protection(line_items, ticker)
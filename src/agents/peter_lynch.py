@@ -22,6 +22,7 @@ from src.agents.peter_lynch_helpers import (
     _score_lynch_revenue_growth,
 )
 from src.agents.prompt_rules import with_fact_grounding_rules
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import (
     get_company_news,
@@ -50,6 +51,28 @@ class PeterLynchSignal(BaseModel):
     reasoning_cn: str
 
 
+PETER_LYNCH_FUNDAMENTALS = FundamentalsRequest(
+    line_items=(
+        "revenue",
+        "earnings_per_share",
+        "net_income",
+        "operating_income",
+        "gross_margin",
+        "operating_margin",
+        "free_cash_flow",
+        "capital_expenditure",
+        "cash_and_equivalents",
+        "total_debt",
+        "shareholders_equity",
+        "outstanding_shares",
+        "debt_to_equity",
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
     """
     Analyzes stocks using Peter Lynch's investing principles:
@@ -73,33 +96,20 @@ def peter_lynch_agent(state: AgentState, agent_id: str = "peter_lynch_agent"):
     lynch_analysis = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, PETER_LYNCH_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Relevant line items for Peter Lynch's approach
-        financial_line_items = search_line_items(
+        financial_line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                "revenue",
-                "earnings_per_share",
-                "net_income",
-                "operating_income",
-                "gross_margin",
-                "operating_margin",
-                "free_cash_flow",
-                "capital_expenditure",
-                "cash_and_equivalents",
-                "total_debt",
-                "shareholders_equity",
-                "outstanding_shares",
-                "debt_to_equity",
-            ],
+            list(PETER_LYNCH_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
-            limit=10,
+            period=PETER_LYNCH_FUNDAMENTALS.line_items_period,
+            limit=PETER_LYNCH_FUNDAMENTALS.line_items_limit,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
         insider_trades = get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
@@ -24,6 +24,7 @@ from src.agents.phil_fisher_helpers import (
     _score_fisher_roe,
 )
 from src.agents.prompt_rules import with_fact_grounding_rules
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import (
     get_company_news,
@@ -48,6 +49,29 @@ class PhilFisherSignal(BaseModel):
     reasoning_cn: str
 
 
+PHIL_FISHER_FUNDAMENTALS = FundamentalsRequest(
+    line_items=(
+        "revenue",
+        "net_income",
+        "earnings_per_share",
+        "free_cash_flow",
+        "research_and_development",
+        "operating_income",
+        "operating_margin",
+        "gross_margin",
+        "total_debt",
+        "shareholders_equity",
+        "debt_to_equity",
+        "cash_and_equivalents",
+        "ebit",
+        "ebitda",
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
     """
     Analyzes stocks using Phil Fisher's investing principles:
@@ -68,38 +92,24 @@ def phil_fisher_agent(state: AgentState, agent_id: str = "phil_fisher_agent"):
     fisher_analysis = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, PHIL_FISHER_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Include relevant line items for Phil Fisher's approach:
         #   - Growth & Quality: revenue, net_income, earnings_per_share, R&D expense
         #   - Margins & Stability: operating_income, operating_margin, gross_margin
         #   - Management Efficiency & Leverage: total_debt, shareholders_equity, free_cash_flow
         #   - Valuation: net_income, free_cash_flow (for P/E, P/FCF), ebit, ebitda
-        financial_line_items = search_line_items(
+        financial_line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                "revenue",
-                "net_income",
-                "earnings_per_share",
-                "free_cash_flow",
-                "research_and_development",
-                "operating_income",
-                "operating_margin",
-                "gross_margin",
-                "total_debt",
-                "shareholders_equity",
-                "debt_to_equity",
-                "cash_and_equivalents",
-                "ebit",
-                "ebitda",
-            ],
+            list(PHIL_FISHER_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
-            limit=10,
+            period=PHIL_FISHER_FUNDAMENTALS.line_items_period,
+            limit=PHIL_FISHER_FUNDAMENTALS.line_items_limit,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
         insider_trades = get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
@@ -33,6 +33,7 @@ from src.agents.rakesh_jhunjhunwala_helpers import (
     _score_rakesh_roe,
     _score_rakesh_share_issuance,
 )
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
 from src.utils.api_key import get_api_key_from_state
@@ -52,6 +53,30 @@ class RakeshJhunjhunwalaSignal(BaseModel):
     reasoning_cn: str
 
 
+RAKESH_JHUNJHUNWALA_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="ttm",
+    metrics_limit=5,
+    line_items=(
+        "net_income",
+        "earnings_per_share",
+        "ebit",
+        "operating_income",
+        "revenue",
+        "operating_margin",
+        "total_assets",
+        "total_liabilities",
+        "current_assets",
+        "current_liabilities",
+        "free_cash_flow",
+        "dividends_and_other_cash_distributions",
+        "issuance_or_purchase_of_equity_shares",
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def rakesh_jhunjhunwala_agent(state: AgentState, agent_id: str = "rakesh_jhunjhunwala_agent"):
     """Analyzes stocks using Rakesh Jhunjhunwala's principles and LLM reasoning."""
     data = state["data"]
@@ -65,20 +90,21 @@ def rakesh_jhunjhunwala_agent(state: AgentState, agent_id: str = "rakesh_jhunjhu
     for ticker in tickers:
 
         # Core Data
+        shared = shared_fundamentals(state, ticker, RAKESH_JHUNJHUNWALA_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
+        metrics = shared.financial_metrics if shared else get_financial_metrics(ticker, end_date, period=RAKESH_JHUNJHUNWALA_FUNDAMENTALS.metrics_period, limit=RAKESH_JHUNJHUNWALA_FUNDAMENTALS.metrics_limit, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching financial line items")
-        financial_line_items = search_line_items(
+        financial_line_items = shared.line_items if shared else search_line_items(
             ticker,
-            ["net_income", "earnings_per_share", "ebit", "operating_income", "revenue", "operating_margin", "total_assets", "total_liabilities", "current_assets", "current_liabilities", "free_cash_flow", "dividends_and_other_cash_distributions", "issuance_or_purchase_of_equity_shares"],
+            list(RAKESH_JHUNJHUNWALA_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
+            period=RAKESH_JHUNJHUNWALA_FUNDAMENTALS.line_items_period,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         # ─── Analyses ───────────────────────────────────────────────────────────
         progress.update_status(agent_id, ticker, "Analyzing growth")
@@ -25,6 +25,7 @@ from src.agents.stanley_druckenmiller_helpers import (
     _score_druckenmiller_price_momentum,
     _score_druckenmiller_volatility,
 )
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import (
     get_company_news,
@@ -50,6 +51,30 @@ class StanleyDruckenmillerSignal(BaseModel):
     reasoning_cn: str
 
 
+STANLEY_DRUCKENMILLER_FUNDAMENTALS = FundamentalsRequest(
+    line_items=(
+        "revenue",
+        "earnings_per_share",
+        "net_income",
+        "operating_income",
+        "gross_margin",
+        "operating_margin",
+        "free_cash_flow",
+        "capital_expenditure",
+        "cash_and_equivalents",
+        "total_debt",
+        "shareholders_equity",
+        "outstanding_shares",
+        "debt_to_equity",
+        "ebit",
+        "ebitda",
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def stanley_druckenmiller_agent(state: AgentState, agent_id: str = "stanley_druckenmiller_agent"):
     """
     Analyzes stocks using Stanley Druckenmiller's investing principles:
@@ -69,39 +94,24 @@ def stanley_druckenmiller_agent(state: AgentState, agent_id: str = "stanley_druc
     druck_analysis = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, STANLEY_DRUCKENMILLER_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Gathering financial line items")
         # Include relevant line items for Stan Druckenmiller's approach:
         #   - Growth & momentum: revenue, EPS, operating_income, ...
         #   - Valuation: net_income, free_cash_flow, ebit, ebitda
         #   - Leverage: total_debt, shareholders_equity
         #   - Liquidity: cash_and_equivalents
-        financial_line_items = search_line_items(
+        financial_line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                "revenue",
-                "earnings_per_share",
-                "net_income",
-                "operating_income",
-                "gross_margin",
-                "operating_margin",
-                "free_cash_flow",
-                "capital_expenditure",
-                "cash_and_equivalents",
-                "total_debt",
-                "shareholders_equity",
-                "outstanding_shares",
-                "debt_to_equity",
-                "ebit",
-                "ebitda",
-            ],
+            list(STANLEY_DRUCKENMILLER_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
-            limit=10,
+            period=STANLEY_DRUCKENMILLER_FUNDAMENTALS.line_items_period,
+            limit=STANLEY_DRUCKENMILLER_FUNDAMENTALS.line_items_limit,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Fetching insider trades")
         insider_trades = get_insider_trades(ticker, end_date, limit=50, api_key=api_key)
@@ -448,11 +448,25 @@ def calculate_momentum_signals(prices_df):
     # Relative strength
     # (would compare to market/sector in real implementation)
 
+    return momentum_signal_from_values(
+        mom_1m=mom_1m.iloc[-1],
+        mom_3m=mom_3m.iloc[-1],
+        mom_6m=mom_6m.iloc[-1],
+        volume_momentum=volume_momentum.iloc[-1],
+    )
+
+
+def momentum_signal_from_values(*, mom_1m, mom_3m, mom_6m, volume_momentum):
+    """Map latest-row momentum inputs to the momentum signal dict.
+
+    Shared by ``calculate_momentum_signals`` and the cross-sectional trend
+    panel so both paths apply identical thresholds.
+    """
     # Calculate momentum score
-    momentum_score = (MOM_WEIGHT_1M * mom_1m + MOM_WEIGHT_3M * mom_3m + MOM_WEIGHT_6M * mom_6m).iloc[-1]
+    momentum_score = MOM_WEIGHT_1M * mom_1m + MOM_WEIGHT_3M * mom_3m + MOM_WEIGHT_6M * mom_6m
 
     # Volume confirmation — guard against NaN from zero volume_ma
-    vol_mom_val = volume_momentum.iloc[-1]
+    vol_mom_val = volume_momentum
     volume_confirmation = False if pd.isna(vol_mom_val) else vol_mom_val > MOM_VOLUME_CONFIRM_RATIO
 
     if momentum_score > MOM_THRESHOLD and volume_confirmation:
@@ -469,10 +483,10 @@ def calculate_momentum_signals(prices_df):
         "signal": signal,
         "confidence": safe_confidence(confidence),
         "metrics": {
-            "momentum_1m": safe_float(mom_1m.iloc[-1]),
-            "momentum_3m": safe_float(mom_3m.iloc[-1]),
-            "momentum_6m": safe_float(mom_6m.iloc[-1]),
-            "volume_momentum": safe_float(volume_momentum.iloc[-1]),
+            "momentum_1m": safe_float(mom_1m),
+            "momentum_3m": safe_float(mom_3m),
+            "momentum_6m": safe_float(mom_6m),
+            "volume_momentum": safe_float(volume_momentum),
         },
     }
 
@@ -511,11 +525,25 @@ def calculate_volatility_signals(prices_df):
     atr = calculate_atr(prices_df)
     atr_ratio = atr / prices_df["close"].replace(0, float("nan"))
 
+    return volatility_signal_from_values(
+        historical_volatility=hist_vol.iloc[-1],
+        volatility_regime=vol_regime.iloc[-1],
+        volatility_z_score=vol_z_score.iloc[-1],
+        atr_ratio=atr_ratio.iloc[-1],
+    )
+
+
+def volatility_signal_from_values(*, historical_volatility, volatility_regime, volatility_z_score, atr_ratio):
+    """Map latest-row volatility inputs to the volatility signal dict.
+
+    Shared by ``calculate_volatility_signals`` and the cross-sectional trend
+    panel so both paths apply identical thresholds.
+    """
     # Generate signal based on volatility regime.
     # safe_float already converts NaN/Inf to the default, so no separate
     # pd.isna() check is needed here.
-    current_vol_regime = safe_float(vol_regime.iloc[-1], default=1.0)
-    vol_z = safe_float(vol_z_score.iloc[-1], default=0.0)
+    current_vol_regime = safe_float(volatility_regime, default=1.0)
+    vol_z = safe_float(volatility_z_score, default=0.0)
 
     if current_vol_regime < VOL_LOW_THRESHOLD and vol_z < -VOL_Z_THRESHOLD:
         signal = "bearish"  # Low vol regime → stagnation (C224: labels were reversed vs T+1)
@@ -531,10 +559,10 @@ def calculate_volatility_signals(prices_df):
         "signal": signal,
         "confidence": safe_confidence(confidence),
         "metrics": {
-            "historical_volatility": safe_float(hist_vol.iloc[-1]),
+            "historical_volatility": safe_float(historical_volatility),
             "volatility_regime": safe_float(current_vol_regime),
             "volatility_z_score": safe_float(vol_z),
-            "atr_ratio": safe_float(atr_ratio.iloc[-1]),
+            "atr_ratio": safe_float(atr_ratio),
         },
     }
 
@@ -29,6 +29,7 @@ from src.agents.valuation_helpers import (
     _resolve_valuation_signal,
     _summarize_method_coverage,
 )
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import (
     get_financial_metrics,
@@ -43,6 +44,29 @@ from src.utils.ticker_utils import get_currency_symbol
 logger = logging.getLogger(__name__)
 
 
+VALUATION_ANALYST_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="ttm",
+    metrics_limit=8,
+    line_items=(
+        "free_cash_flow",
+        "net_income",
+        "depreciation_and_amortization",
+        "capital_expenditure",
+        "working_capital",
+        "total_debt",
+        "cash_and_equivalents",
+        "interest_expense",
+        "revenue",
+        "operating_income",
+        "ebit",
+        "ebitda",
+    ),
+    line_items_period="annual",
+    line_items_limit=8,
+    market_cap=True,
+)
+
+
 def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analyst_agent"):
     """Run valuation across tickers and write signals back to `state`."""
 
@@ -53,14 +77,15 @@ def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analys
     valuation_analysis: dict[str, dict] = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, VALUATION_ANALYST_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial data")
 
         # --- Historical financial metrics ---
-        financial_metrics = get_financial_metrics(
+        financial_metrics = shared.financial_metrics if shared else get_financial_metrics(
             ticker=ticker,
             end_date=end_date,
-            period="ttm",
-            limit=8,
+            period=VALUATION_ANALYST_FUNDAMENTALS.metrics_period,
+            limit=VALUATION_ANALYST_FUNDAMENTALS.metrics_limit,
             api_key=api_key,
         )
         if not financial_metrics:
@@ -73,12 +98,12 @@ def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analys
         # 使用 "annual" period 确保 DCF 模型获取完整年度数据
         # A股使用累计会计制度，"ttm" 返回的 Q1/H1/Q3 数据不能作为年度等间距序列
         progress.update_status(agent_id, ticker, "Gathering comprehensive line items")
-        line_items = search_line_items(
+        line_items = shared.line_items if shared else search_line_items(
             ticker=ticker,
-            line_items=["free_cash_flow", "net_income", "depreciation_and_amortization", "capital_expenditure", "working_capital", "total_debt", "cash_and_equivalents", "interest_expense", "revenue", "operating_income", "ebit", "ebitda"],
+            line_items=list(VALUATION_ANALYST_FUNDAMENTALS.line_items),
             end_date=end_date,
-            period="annual",
-            limit=8,
+            period=VALUATION_ANALYST_FUNDAMENTALS.line_items_period,
+            limit=VALUATION_ANALYST_FUNDAMENTALS.line_items_limit,
             api_key=api_key,
         )
         if len(line_items) < 2:
@@ -136,7 +161,7 @@ def valuation_analyst_agent(state: AgentState, agent_id: str = "valuation_analys
         # ------------------------------------------------------------------
         # Aggregate & signal
         # ------------------------------------------------------------------
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
         if not market_cap:
             progress.update_status(agent_id, ticker, "Failed: Market cap unavailable")
             valuation_analysis[ticker] = _build_market_cap_unavailable_result()
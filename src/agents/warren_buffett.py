@@ -36,6 +36,7 @@ from src.agents.warren_buffett_helpers import (
     _score_buffett_performance_stability,
     _score_buffett_roe_consistency,
 )
+from src.data.fundamentals_dataset import FundamentalsRequest, shared_fundamentals
 from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
 from src.utils.api_key import get_api_key_from_state
@@ -67,6 +68,29 @@ def _latest_line_item_number(line_items: list, field: str) -> float | None:
     return None
 
 
+WARREN_BUFFETT_FUNDAMENTALS = FundamentalsRequest(
+    metrics_period="ttm",
+    metrics_limit=10,
+    line_items=(
+        "capital_expenditure",
+        "depreciation_and_amortization",
+        "net_income",
+        "outstanding_shares",
+        "total_assets",
+        "total_liabilities",
+        "shareholders_equity",
+        "dividends_and_other_cash_distributions",
+        "issuance_or_purchase_of_equity_shares",
+        "gross_profit",
+        "revenue",
+        "free_cash_flow",
+    ),
+    line_items_period="annual",
+    line_items_limit=10,
+    market_cap=True,
+)
+
+
 def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agent"):
     """Analyzes stocks using Buffett's principles and LLM reasoning."""
     data = state["data"]
@@ -78,36 +102,24 @@ def warren_buffett_agent(state: AgentState, agent_id: str = "warren_buffett_agen
     buffett_analysis = {}
 
     for ticker in tickers:
+        shared = shared_fundamentals(state, ticker, WARREN_BUFFETT_FUNDAMENTALS)
         progress.update_status(agent_id, ticker, "Fetching financial metrics")
         # Fetch required data - request more periods for better trend analysis
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=10, api_key=api_key)
+        metrics = shared.financial_metrics if shared else get_financial_metrics(ticker, end_date, period=WARREN_BUFFETT_FUNDAMENTALS.metrics_period, limit=WARREN_BUFFETT_FUNDAMENTALS.metrics_limit, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(
+        financial_line_items = shared.line_items if shared else search_line_items(
             ticker,
-            [
-                "capital_expenditure",
-                "depreciation_and_amortization",
-                "net_income",
-                "outstanding_shares",
-                "total_assets",
-                "total_liabilities",
-                "shareholders_equity",
-                "dividends_and_other_cash_distributions",
-                "issuance_or_purchase_of_equity_shares",
-                "gross_profit",
-                "revenue",
-                "free_cash_flow",
-            ],
+            list(WARREN_BUFFETT_FUNDAMENTALS.line_items),
             end_date,
-            period="annual",
-            limit=10,
+            period=WARREN_BUFFETT_FUNDAMENTALS.line_items_period,
+            limit=WARREN_BUFFETT_FUNDAMENTALS.line_items_limit,
             api_key=api_key,
         )
 
         progress.update_status(agent_id, ticker, "Getting market cap")
         # Get current market cap
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+        market_cap = shared.market_cap if shared else get_market_cap(ticker, end_date, api_key=api_key)
 
         progress.update_status(agent_id, ticker, "Analyzing fundamentals")
         # Analyze fundamentals
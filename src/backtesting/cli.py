@@ -24,6 +24,7 @@ from .compare import (
 )
 from .engine import BacktestEngine
 from .walk_forward import (
+    build_shared_walk_forward_engine_factory,
     build_walk_forward_windows,
     run_walk_forward,
     summarize_walk_forward,
@@ -70,7 +71,7 @@ def _run_ab_compare(args, tickers: list[str], selected_analysts: list[str], mode
     return 0
 
 
-def _run_walk_forward_mode(args, build_engine) -> int:
+def _run_walk_forward_mode(args, build_engine, tickers: list[str] | None = None) -> int:
     preset_kwargs = {}
     if args.walk_forward_preset:
         preset_kwargs = {k: v for k, v in WALK_FORWARD_PRESETS[args.walk_forward_preset].items() if v is not None}
@@ -89,7 +90,14 @@ def _run_walk_forward_mode(args, build_engine) -> int:
         window_mode=window_mode,
         allow_overlapping_tests=overlap_ok,
     )
-    results = run_walk_forward(windows, lambda window: build_engine(window.test_start, window.test_end))
+    # 所有窗口共享一份按 data_through 截断视图的价格矩阵，逐窗口增量扩展而不是各自重载
+    engine_factory, preload = build_shared_walk_forward_engine_factory(windows, tickers or [], build_engine)
+    workers = getattr(args, "walk_forward_workers", None)
+    if workers is not None and workers > 1:
+        # 并行前在父进程一次性加载全段行情，fork 出的 worker 直接共享
+        results = run_walk_forward(windows, engine_factory, max_workers=workers, executor=getattr(args, "executor", None), preload=preload)
+    else:
+        results = run_walk_forward(windows, engine_factory)
     summary = summarize_walk_forward(results)
     print(f"Walk-Forward Windows: {summary['window_count']}")
     if summary["avg_sharpe"] is not None:
@@ -178,6 +186,8 @@ def _run_param_grid_mode(args, model_selection) -> int:
         argv.extend(["--output", str(args.output)])
     if args.max_workers is not None:
         argv.extend(["--max-workers", str(args.max_workers)])
+    if getattr(args, "executor", None):
+        argv.extend(["--executor", str(args.executor)])
     argv.extend(["--sort-by", str(args.sort_by)])
     # Surface but ignore the param-grid destination path so downstream
     # tools that read ``args`` see the choice; the grid runner owns the
@@ -204,7 +214,7 @@ def main() -> int:
     if model_selection is None:
         return 1
 
-    def _build_engine(start_date: str, end_date: str) -> BacktestEngine:
+    def _build_engine(start_date: str, end_date: str, **engine_kwargs) -> BacktestEngine:
         return BacktestEngine(
             agent=run_hedge_fund,
             tickers=tickers,
@@ -216,13 +226,14 @@ def main() -> int:
             selected_analysts=selected_analysts,
             initial_margin_requirement=args.margin_requirement,
             backtest_mode=args.mode,
+            **engine_kwargs,
         )
 
     if args.ab_compare:
         return _run_ab_compare(args, tickers, selected_analysts, model_selection)
 
     if args.walk_forward:
-        return _run_walk_forward_mode(args, _build_engine)
+        return _run_walk_forward_mode(args, _build_engine, tickers)
 
     if args.param_grid:
         return _run_param_grid_mode(args, model_selection)
@@ -75,6 +75,8 @@ def build_backtest_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--output", type=str, default=None, help="Output directory for the parameter-grid report (default: data/reports/param_grid)")
     parser.add_argument("--max-workers", type=int, default=None, help="Worker thread count for the parameter grid (default: ANALYST_CONCURRENCY_LIMIT env var)")
+    parser.add_argument("--executor", choices=["thread", "process"], default=None, help="Pool backend for --param-grid trials and parallel walk-forward windows (default: PARAM_GRID_EXECUTOR env var, else thread)")
+    parser.add_argument("--walk-forward-workers", type=int, default=None, help="Run independent walk-forward windows in parallel (default: sequential)")
     parser.add_argument("--sort-by", choices=["sharpe_ratio", "sortino_ratio", "win_rate", "total_return"], default="sharpe_ratio", help="Primary sort metric for the grid comparison table")
     parser.add_argument("--baseline-pct-threshold", type=float, default=3.0, help="Baseline daily gainers threshold")
     parser.add_argument("--baseline-top-n", type=int, default=10, help="Baseline top N gainers passed to multi-agent analysis")
@@ -96,6 +96,7 @@ from .valuation import (  # noqa: E402 — after BacktestConfig dataclass
     calculate_portfolio_value,
     compute_exposures,
 )
+from .walk_forward_cache import WalkForwardDataCache  # noqa: E402 — after BacktestConfig dataclass
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +127,7 @@ class BacktestEngine:
         pipeline_event_recorder: Callable[[dict], None] | None = None,
         selection_artifact_writer: SelectionArtifactWriter | None = None,
         data_through: str | None = None,
+        market_data_cache: WalkForwardDataCache | None = None,
     ) -> None:
         self._initialize_engine_configuration(
             agent=agent,
@@ -142,6 +144,7 @@ class BacktestEngine:
             pipeline_event_recorder=pipeline_event_recorder,
             selection_artifact_writer=selection_artifact_writer,
             data_through=data_through,
+            market_data_cache=market_data_cache,
         )
         self._initialize_engine_components(
             tickers=tickers,
@@ -168,6 +171,7 @@ class BacktestEngine:
         pipeline_event_recorder: Callable[[dict], None] | None,
         selection_artifact_writer: SelectionArtifactWriter | None,
         data_through: str | None,
+        market_data_cache: WalkForwardDataCache | None = None,
     ) -> None:
         self._agent = agent
         self._tickers = tickers
@@ -184,6 +188,7 @@ class BacktestEngine:
         self._pipeline_event_recorder = pipeline_event_recorder
         self._selection_artifact_writer = selection_artifact_writer
         self._data_through = data_through
+        self._market_data_cache = market_data_cache
 
     def _initialize_engine_components(
         self,
@@ -375,6 +380,7 @@ class BacktestEngine:
             portfolio=self._portfolio,
             exit_reentry_cooldowns=self._exit_reentry_cooldowns,
             data_through=self._data_through,
+            market_data_cache=self._market_data_cache,
         )
 
     def _prefetch_data(self) -> None:
@@ -947,6 +953,7 @@ class BacktestEngine:
     def _prefetch_with_timing_log(self) -> None:
         prefetch_started_at = perf_counter()
         self._prefetch_data()
+        prefetch_report = getattr(self._market_loader, "last_prefetch_report", None)
         self._append_timing_log(
             {
                 "event": "prefetch_complete",
@@ -954,6 +961,7 @@ class BacktestEngine:
                 "end_date": self._end_date,
                 "ticker_count": len(self._tickers),
                 "timing_seconds": {"prefetch": round(perf_counter() - prefetch_started_at, 3)},
+                "prefetch_providers": prefetch_report.as_dict()["providers"] if prefetch_report is not None else {},
             }
         )
 
@@ -10,23 +10,36 @@ from __future__ import annotations
 import logging
 import os
 from datetime import datetime
-from typing import Sequence
+from functools import partial
+from typing import Sequence, TYPE_CHECKING
 
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+from src.data.trading_index import get_trading_index
 from src.tools.akshare_api import is_ashare
 from src.tools.api import (
+    financial_metrics_from_cache_data,
+    get_ashare_unadjusted_price_data,
     get_company_news,
     get_financial_metrics,
     get_insider_trades,
     get_price_data,
     get_prices,
+    prices_from_cache_data,
+    prime_financial_metrics_cache,
+    prime_prices_cache,
 )
 from src.tools.tushare_api import get_limit_list
+from src.utils.env_helpers import get_env_enabled
 
+from .engine_prefetch import PrefetchReport, PrefetchTask, prefetch_provider_for, run_prefetch
+from .engine_price_matrix import DailyPriceMatrix
 from .portfolio import Portfolio
 
+if TYPE_CHECKING:
+    from .walk_forward_cache import WalkForwardDataCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +52,12 @@ EXIT_REENTRY_COOLDOWN_TRADING_DAYS = max(0, int(os.getenv("PIPELINE_EXIT_REENTRY
 EXIT_REENTRY_REVIEW_TRADING_DAYS = max(0, int(os.getenv("PIPELINE_EXIT_REENTRY_REVIEW_TRADING_DAYS", "5")))
 DEFAULT_US_BENCHMARK_TICKER = "SPY"
 DEFAULT_ASHARE_BENCHMARK_TICKER = "000300.SH"
+# 预取阶段构建 date × ticker 价格矩阵，逐日取价/换手/停牌检查改为矩阵行读取。
+PRICE_MATRIX_ENABLED = get_env_enabled("BACKTEST_PRICE_MATRIX_ENABLED")
+# 矩阵起点比回测起点提前的自然日数，覆盖首个交易日的 previous_date 窗口。
+PRICE_MATRIX_LEAD_DAYS = 7
+# 交易日历在回测终点之后多预取的自然日数，供冷却期顺延使用。
+CALENDAR_LOOKAHEAD_DAYS = 60
 
 
 # ---------------------------------------------------------------------------
@@ -51,6 +70,12 @@ def normalize_ticker(ticker: str) -> str:
 
 
 def shift_business_days(trade_date_compact: str, business_days: int) -> str:
+    # 交易日历索引覆盖该日期时按真实开市日顺延（跳过节假日），否则回退 Mon–Fri 工作日
+    index = get_trading_index()
+    if index is not None:
+        shifted_trade_date = index.shift_trading_days(trade_date_compact, max(0, business_days))
+        if shifted_trade_date is not None:
+            return shifted_trade_date
     shifted = pd.Timestamp(datetime.strptime(trade_date_compact, "%Y%m%d")) + pd.offsets.BDay(max(0, business_days))
     return shifted.strftime("%Y%m%d")
 
@@ -62,6 +87,18 @@ def resolve_benchmark_ticker(tickers: Sequence[str]) -> str:
     return DEFAULT_US_BENCHMARK_TICKER
 
 
+def load_matrix_frame(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Full-span bars on the same price basis as the per-day lookups.
+
+    A-share per-day windows are forward-adjusted with the window's last bar
+    as anchor, i.e. the current bar is unadjusted; a full-span qfq frame
+    would be anchored at ``end_date`` instead, so A-shares load raw bars.
+    """
+    if is_ashare(ticker):
+        return get_ashare_unadjusted_price_data(ticker, start_date, end_date)
+    return get_price_data(ticker, start_date, end_date)
+
+
 def _is_suspended_row(row) -> bool:
     """BETA-007 shared suspension guard.
 
@@ -94,6 +131,7 @@ class MarketDataLoader:
         portfolio: Portfolio,
         exit_reentry_cooldowns: dict[str, dict],
         data_through: str | None = None,
+        market_data_cache: WalkForwardDataCache | None = None,
     ) -> None:
         self._tickers = tickers
         self._start_date = start_date
@@ -108,6 +146,16 @@ class MarketDataLoader:
         # each caller to pass a correctly-truncated ``end_date``. None keeps the
         # original "fetch through end_date" behavior (single-window backtests).
         self._data_through = data_through
+        # Dense close/volume matrix built at prefetch time; None → per-ticker
+        # get_price_data path. Tickers whose full-span load came back empty
+        # stay on the per-ticker path (e.g. transient source failures).
+        self._price_matrix: DailyPriceMatrix | None = None
+        self._price_matrix_unavailable: set[str] = set()
+        # Walk-forward studies share one incrementally extended matrix across
+        # windows; None → this loader builds its own.
+        self._market_data_cache = market_data_cache
+        # Per-provider call/latency stats of the last prefetch_data run.
+        self.last_prefetch_report: PrefetchReport | None = None
 
     # ------------------------------------------------------------------
     # Data prefetch
@@ -125,14 +173,113 @@ class MarketDataLoader:
         start_date_dt = end_date_dt - relativedelta(years=1)
         start_date_str = start_date_dt.strftime("%Y-%m-%d")
 
+        # 共享 walk-forward 矩阵时跳过逐窗口的一年价格预热：引擎自身的取价全部
+        # 走矩阵视图，而 (fetch_end-1y, fetch_end) 这个缓存键换一个窗口就不再命中。
+        warm_prices = not (PRICE_MATRIX_ENABLED and self._market_data_cache is not None)
+
+        # 先用 get_many 批量读出已缓存的价格/财务指标：Redis/SQLite 每层一次往返，
+        # 而不是逐 ticker 一次。读出的 payload 直接交给对应的预取任务 —— 不再逐只
+        # 回读缓存 (LRU 容量远小于整个股票池, 预热条目会在回读前被自己挤掉)。
+        # 预热只是优化，失败时回退到原来的逐只读取路径。
+        cached_prices: dict[str, list[dict]] = {}
+        cached_metrics: dict[str, list[dict]] = {}
+        try:
+            if warm_prices:
+                cached_prices = prime_prices_cache(list(self._tickers), start_date_str, fetch_end)
+            cached_metrics = prime_financial_metrics_cache(list(self._tickers), fetch_end, limit=10)
+        except Exception as exc:
+            logger.debug("prefetch_data: batch cache priming skipped: %s", exc)
+
+        # 逐 ticker 的网络调用交给 engine_prefetch 线程池，按 provider 限并发/限速；
+        # 已由上面批量预热命中的调用不占令牌。
+        tasks: list[PrefetchTask] = []
         for ticker in self._tickers:
-            get_prices(ticker, start_date_str, fetch_end)
-            get_financial_metrics(ticker, fetch_end, limit=10)
-            get_insider_trades(ticker, fetch_end, start_date=self._start_date, limit=1000)
-            get_company_news(ticker, fetch_end, start_date=self._start_date, limit=1000)
+            data_provider = prefetch_provider_for(ticker)
+            if warm_prices:
+                if ticker in cached_prices:
+                    tasks.append(PrefetchTask(data_provider, "prices", ticker, partial(prices_from_cache_data, ticker, fetch_end, cached_prices[ticker]), cached=True))
+                else:
+                    tasks.append(PrefetchTask(data_provider, "prices", ticker, partial(get_prices, ticker, start_date_str, fetch_end)))
+            if ticker in cached_metrics:
+                tasks.append(PrefetchTask(data_provider, "financial_metrics", ticker, partial(financial_metrics_from_cache_data, ticker, fetch_end, cached_metrics[ticker]), cached=True))
+            else:
+                tasks.append(PrefetchTask(data_provider, "financial_metrics", ticker, partial(get_financial_metrics, ticker, fetch_end, limit=10)))
+            tasks.append(PrefetchTask(data_provider, "insider_trades", ticker, partial(get_insider_trades, ticker, fetch_end, start_date=self._start_date, limit=1000)))
+            tasks.append(PrefetchTask(prefetch_provider_for(ticker, news=True), "company_news", ticker, partial(get_company_news, ticker, fetch_end, start_date=self._start_date, limit=1000)))
 
         benchmark_ticker = resolve_benchmark_ticker(self._tickers)
-        get_prices(benchmark_ticker, self._start_date, fetch_end)
+        tasks.append(PrefetchTask(prefetch_provider_for(benchmark_ticker), "benchmark_prices", benchmark_ticker, partial(get_prices, benchmark_ticker, self._start_date, fetch_end)))
+        self.last_prefetch_report = run_prefetch(tasks, label="prefetch_data")
+
+        if PRICE_MATRIX_ENABLED:
+            self.build_price_matrix(fetch_end)
+
+    # ------------------------------------------------------------------
+    # Price matrix
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load_matrix_frame(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        return load_matrix_frame(ticker, start_date, end_date)
+
+    def _load_matrix_frames(self, tickers: Sequence[str], start_date: str, end_date: str) -> dict[str, pd.DataFrame]:
+        frames: dict[str, pd.DataFrame] = {}
+        for ticker in tickers:
+            try:
+                frame = self._load_matrix_frame(ticker, start_date, end_date)
+            except Exception as exc:
+                logger.debug("price matrix: load failed for ticker=%s (%s ~ %s): %s", ticker, start_date, end_date, exc)
+                frame = None
+            if frame is None or frame.empty:
+                self._price_matrix_unavailable.add(ticker)
+                continue
+            frames[ticker] = frame
+        return frames
+
+    def build_price_matrix(self, end_date: str | None = None) -> DailyPriceMatrix:
+        """Load every universe ticker once over the backtest span into a matrix.
+
+        ``end_date`` defaults to the prefetch horizon (``data_through`` clamp);
+        lookups past it fall back to per-ticker ``get_price_data`` calls.
+        """
+        matrix_end = end_date or self._end_date
+        matrix_start = (datetime.strptime(self._start_date, "%Y-%m-%d") - relativedelta(days=PRICE_MATRIX_LEAD_DAYS)).strftime("%Y-%m-%d")
+        if self._market_data_cache is not None:
+            # walk-forward 共享矩阵：只取本窗口 [matrix_start, matrix_end] 的视图，
+            # matrix_end 已按 data_through 截断，之后的行不会进入本窗口。
+            self._price_matrix, self._price_matrix_unavailable = self._market_data_cache.matrix_view(list(dict.fromkeys(self._tickers)), matrix_start, matrix_end)
+            return self._price_matrix
+        self._price_matrix_unavailable = set()
+        frames = self._load_matrix_frames(list(dict.fromkeys(self._tickers)), matrix_start, matrix_end)
+        self._price_matrix = DailyPriceMatrix.from_frames(frames, start_date=matrix_start, end_date=matrix_end)
+        return self._price_matrix
+
+    def _matrix_rows(self, tickers: Sequence[str], previous_date_str: str, current_date_str: str) -> dict[str, dict[str, float] | None]:
+        """Matrix-served last bars: ``{ticker: row}`` with ``None`` for "no bar in window".
+
+        Tickers absent from the result take the per-ticker path. Tickers that
+        join the universe later (pipeline positions / pending plans) are loaded
+        into the matrix on first sight.
+        """
+        matrix = self._price_matrix
+        if matrix is None or not (matrix.start_date <= previous_date_str and current_date_str <= matrix.end_date):
+            return {}
+        missing = [ticker for ticker in dict.fromkeys(tickers) if ticker not in self._price_matrix_unavailable and not matrix.covers(ticker, previous_date_str, current_date_str)]
+        if missing:
+            matrix = self._price_matrix = matrix.with_frames(self._load_matrix_frames(missing, matrix.start_date, matrix.end_date))
+        covered = [ticker for ticker in tickers if matrix.covers(ticker, previous_date_str, current_date_str)]
+        rows = matrix.latest_rows(covered, previous_date_str, current_date_str)
+        return {ticker: rows.get(ticker) for ticker in covered}
+
+    @staticmethod
+    def _last_price_row(ticker: str, previous_date_str: str, current_date_str: str, matrix_rows: dict[str, dict[str, float] | None]):
+        """Last bar in ``[previous, current]`` from the matrix or ``get_price_data``; None when empty."""
+        if ticker in matrix_rows:
+            return matrix_rows[ticker]
+        price_data = get_price_data(ticker, previous_date_str, current_date_str)
+        if price_data is None or price_data.empty:
+            return None
+        return price_data.iloc[-1]
 
     # ------------------------------------------------------------------
     # Date iteration
@@ -148,14 +295,25 @@ class MarketDataLoader:
         bars that dilute Sharpe/annualization (extra zero-return days). Now
         prefer the real A-share trading calendar via ``get_open_trade_dates``
         (trade_cal); on any failure (no token, network, empty) fall back to
-        ``freq="B"`` so the backtest still runs.
+        ``freq="B"`` so the backtest still runs. The calendar is served from
+        the process-wide trading index (``src.data.trading_index``) once any
+        run has fetched the span.
         """
         try:
             from src.tools.tushare_api import get_open_trade_dates
 
             start_compact = self._start_date.replace("-", "")
             end_compact = self._end_date.replace("-", "")
-            open_dates = get_open_trade_dates(start_compact, end_compact)
+            open_dates = None
+            index = get_trading_index()
+            if index is not None:
+                if not index.covers(start_compact, end_compact):
+                    # 多取 CALENDAR_LOOKAHEAD_DAYS：回测末尾登记的再入场冷却也能按真实日历顺延
+                    lookahead_end = (datetime.strptime(end_compact, "%Y%m%d") + relativedelta(days=CALENDAR_LOOKAHEAD_DAYS)).strftime("%Y%m%d")
+                    index.ensure_calendar(start_compact, lookahead_end, get_open_trade_dates)
+                open_dates = index.open_dates(start_compact, end_compact)
+            if open_dates is None:
+                open_dates = get_open_trade_dates(start_compact, end_compact)
             if open_dates:
                 return pd.DatetimeIndex([pd.Timestamp(d) for d in open_dates])
             # Empty result (no token / API failure) → fall back to business-day cal.
@@ -197,6 +355,10 @@ class MarketDataLoader:
     # ------------------------------------------------------------------
 
     def get_limit_state(self, trade_date_compact: str) -> tuple[set[str], set[str]]:
+        index = get_trading_index()
+        if index is not None:
+            limit_up, limit_down = index.get_limit_state(trade_date_compact, get_limit_list)
+            return set(limit_up), set(limit_down)
         limit_df = get_limit_list(trade_date_compact)
         if limit_df is None or limit_df.empty:
             return set(), set()
@@ -210,12 +372,12 @@ class MarketDataLoader:
 
     def get_daily_turnovers(self, active_tickers: Sequence[str], previous_date_str: str, current_date_str: str) -> dict[str, float]:
         turnovers: dict[str, float] = {}
+        matrix_rows = self._matrix_rows(active_tickers, previous_date_str, current_date_str)
         for ticker in active_tickers:
             try:
-                price_data = get_price_data(ticker, previous_date_str, current_date_str)
-                if price_data.empty:
+                row = self._last_price_row(ticker, previous_date_str, current_date_str, matrix_rows)
+                if row is None:
                     continue
-                row = price_data.iloc[-1]
                 # R83 same-class drain: guard NaN close/volume (partial feed /
                 # corrupt cache with volume>0 but NaN close) — NaN would make
                 # turnover NaN, poisoning the market-size classification in
@@ -253,13 +415,13 @@ class MarketDataLoader:
         if not tickers:
             return {}
         current_prices: dict[str, float] = {}
+        matrix_rows = self._matrix_rows(tickers, previous_date_str, current_date_str)
         for ticker in tickers:
             try:
-                price_data = get_price_data(ticker, previous_date_str, current_date_str)
-                if price_data.empty:
+                row = self._last_price_row(ticker, previous_date_str, current_date_str, matrix_rows)
+                if row is None:
                     logger.warning("load_current_prices: no price data for ticker=%s (%s ~ %s)", ticker, previous_date_str, current_date_str)
                     continue
-                row = price_data.iloc[-1]
                 # BETA-007: 停牌检测 — volume=0 表示当日未成交 (停牌), 不可交易。
                 # 若包含则回测会在停牌日按 carry-forward 价格"虚拟成交"导致结果失真。
                 if _is_suspended_row(row):
@@ -298,7 +460,9 @@ class MarketDataLoader:
 
     def hydrate_position_prices(self, current_prices: dict[str, float], previous_date_str: str, current_date_str: str) -> dict[str, float]:
         hydrated_prices = dict(current_prices)
-        for ticker, position in self._portfolio.get_positions().items():
+        positions = self._portfolio.get_positions()
+        matrix_rows = self._matrix_rows([ticker for ticker in positions if ticker not in hydrated_prices], previous_date_str, current_date_str)
+        for ticker, position in positions.items():
             if ticker in hydrated_prices:
                 continue
             fallback_price = 0.0
@@ -307,9 +471,8 @@ class MarketDataLoader:
             elif int(position.get("short", 0)) > 0:
                 fallback_price = float(position.get("short_cost_basis", 0.0) or 0.0)
             try:
-                price_data = get_price_data(ticker, previous_date_str, current_date_str)
-                if price_data is not None and not price_data.empty:
-                    row = price_data.iloc[-1]
+                row = self._last_price_row(ticker, previous_date_str, current_date_str, matrix_rows)
+                if row is not None:
                     # BETA-007-drain: apply the SAME suspension guard as
                     # load_current_prices. A held position that suspends
                     # (volume=0) must NOT be marked-to-market at the phantom
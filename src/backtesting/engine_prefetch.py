@@ -0,0 +1,323 @@
+"""Concurrent prefetch stage for :meth:`MarketDataLoader.prefetch_data`.
+
+``prefetch_data`` warms the per-ticker caches (prices, financial metrics,
+insider trades, company news) before the day loop. It used to issue these
+calls one after another, so a 300-ticker backtest spent minutes waiting on
+serial network I/O. This module runs the same calls on a thread pool:
+
+- each call is tagged with its upstream provider (``tushare`` /
+  ``akshare`` / ``financial_datasets``);
+- every provider has its own task queue drained by at most
+  ``max_concurrency`` threads, plus an optional token bucket sized to the provider quota — Tushare defaults to the same
+  200 calls/minute budget ``candidate_pool`` paces itself to;
+- calls the batch cache priming already found in cache skip the token
+  bucket, since they never reach the network;
+- per-provider call counts, errors and latency are collected into a
+  :class:`PrefetchReport`, and progress is logged while the stage runs.
+
+``BACKTEST_PREFETCH_MAX_WORKERS=1`` keeps the historical serial order.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.tools.akshare_api import is_ashare
+from src.tools.tushare_client import TushareLane, tushare_lane
+from src.utils.env_helpers import get_env_int
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_TUSHARE = "tushare"
+PROVIDER_AKSHARE = "akshare"
+PROVIDER_FINANCIAL_DATASETS = "financial_datasets"
+
+DEFAULT_PREFETCH_MAX_WORKERS = 8
+# 进度日志的步长：约每完成 10% 打一行
+_PROGRESS_STEPS = 10
+
+
+@dataclass(frozen=True)
+class ProviderLimit:
+    """Concurrency cap and quota for one upstream provider.
+
+    ``calls_per_minute <= 0`` disables the token bucket; ``burst`` defaults
+    to ``max_concurrency``.
+    """
+
+    max_concurrency: int
+    calls_per_minute: int = 0
+    burst: int | None = None
+
+
+DEFAULT_PROVIDER_LIMITS: dict[str, ProviderLimit] = {
+    # Tushare 配额由 src.tools.tushare_client 的共享令牌桶统一扣减 (TUSHARE_CALLS_PER_MINUTE)，
+    # 这里只限并发，避免两层令牌桶叠加限速
+    PROVIDER_TUSHARE: ProviderLimit(max_concurrency=4),
+    # akshare 抓取公开网页，并发过高容易被限流/封 IP
+    PROVIDER_AKSHARE: ProviderLimit(max_concurrency=2, calls_per_minute=60),
+    PROVIDER_FINANCIAL_DATASETS: ProviderLimit(max_concurrency=8),
+}
+
+
+def prefetch_provider_for(ticker: str, *, news: bool = False) -> str:
+    """Upstream provider a warm-up call for *ticker* hits (see ``src.tools.api``)."""
+    if not is_ashare(ticker):
+        return PROVIDER_FINANCIAL_DATASETS
+    return PROVIDER_AKSHARE if news else PROVIDER_TUSHARE
+
+
+def resolve_prefetch_max_workers() -> int:
+    """Pool size from ``BACKTEST_PREFETCH_MAX_WORKERS`` (``1`` = serial)."""
+    return get_env_int("BACKTEST_PREFETCH_MAX_WORKERS", DEFAULT_PREFETCH_MAX_WORKERS, minimum=1)
+
+
+def resolve_provider_limits() -> dict[str, ProviderLimit]:
+    """Default limits overridden by ``BACKTEST_PREFETCH_<PROVIDER>_CONCURRENCY`` /
+    ``BACKTEST_PREFETCH_<PROVIDER>_CALLS_PER_MINUTE``."""
+    limits: dict[str, ProviderLimit] = {}
+    for provider, default in DEFAULT_PROVIDER_LIMITS.items():
+        prefix = f"BACKTEST_PREFETCH_{provider.upper()}"
+        limits[provider] = ProviderLimit(
+            max_concurrency=get_env_int(f"{prefix}_CONCURRENCY", default.max_concurrency, minimum=1),
+            calls_per_minute=get_env_int(f"{prefix}_CALLS_PER_MINUTE", default.calls_per_minute, minimum=0),
+            burst=default.burst,
+        )
+    return limits
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate_per_second`` refill, ``capacity`` burst.
+
+    ``acquire`` blocks (outside the lock) until a token is available and
+    returns the seconds spent waiting. ``clock`` / ``sleep`` are injectable
+    for tests.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self._rate = float(rate_per_second)
+        self._capacity = max(1.0, float(capacity))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, calls_per_minute: int, *, burst: int = 1, **kwargs: Any) -> TokenBucket:
+        return cls(calls_per_minute / 60.0, burst, **kwargs)
+
+    def acquire(self) -> float:
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self._rate
+            self._sleep(delay)
+            waited += delay
+
+
+@dataclass
+class PrefetchTask:
+    """One warm-up call. ``cached=True`` marks calls known to hit the cache."""
+
+    provider: str
+    kind: str
+    ticker: str
+    call: Callable[[], Any]
+    cached: bool = False
+
+
+@dataclass
+class ProviderStats:
+    calls: int = 0
+    cached_calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+
+    def record(self, elapsed: float, *, cached: bool, failed: bool, throttled: float) -> None:
+        self.calls += 1
+        self.cached_calls += int(cached)
+        self.errors += int(failed)
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        self.throttled_seconds += throttled
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "cached_calls": self.cached_calls,
+            "errors": self.errors,
+            "avg_seconds": round(self.total_seconds / self.calls, 4) if self.calls else 0.0,
+            "max_seconds": round(self.max_seconds, 4),
+            "total_seconds": round(self.total_seconds, 3),
+            "throttled_seconds": round(self.throttled_seconds, 3),
+        }
+
+
+@dataclass
+class PrefetchReport:
+    total: int
+    completed: int = 0
+    max_workers: int = 1
+    elapsed_seconds: float = 0.0
+    providers: dict[str, ProviderStats] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "max_workers": self.max_workers,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "providers": {provider: stats.as_dict() for provider, stats in sorted(self.providers.items())},
+        }
+
+
+def _drainer_slots(queues: Mapping[str, Sequence[int]], limits: Mapping[str, ProviderLimit], workers: int) -> list[str]:
+    """One entry per drainer thread, providers interleaved round-robin.
+
+    Each provider gets at most ``max_concurrency`` drainers; interleaving makes
+    sure every provider has a thread early even when ``workers`` is smaller
+    than the sum of the caps.
+    """
+    remaining = {provider: min(len(indices), max(1, limits[provider].max_concurrency)) for provider, indices in queues.items()}
+    slots: list[str] = []
+    while any(remaining.values()) and len(slots) < workers:
+        for provider in queues:
+            if remaining[provider] and len(slots) < workers:
+                slots.append(provider)
+                remaining[provider] -= 1
+    return slots
+
+
+def run_prefetch(
+    tasks: Sequence[PrefetchTask],
+    *,
+    max_workers: int | None = None,
+    limits: Mapping[str, ProviderLimit] | None = None,
+    label: str = "prefetch",
+) -> PrefetchReport:
+    """Run *tasks* under per-provider limits and return a :class:`PrefetchReport`.
+
+    Tasks are queued per provider and drained by up to ``max_concurrency``
+    threads each, so a throttled provider never parks threads another
+    provider could use. Every task runs even if another fails; the first
+    failure (in task order) is re-raised afterwards, matching the serial
+    loop, which let provider exceptions propagate out of ``prefetch_data``.
+    """
+    workers = resolve_prefetch_max_workers() if max_workers is None else max(1, int(max_workers))
+    limits = resolve_provider_limits() if limits is None else dict(limits)
+    report = PrefetchReport(total=len(tasks), max_workers=workers)
+    queues: dict[str, deque[int]] = {}
+    for index, task in enumerate(tasks):
+        queues.setdefault(task.provider, deque()).append(index)
+        report.providers.setdefault(task.provider, ProviderStats())
+        limits.setdefault(task.provider, ProviderLimit(max_concurrency=workers))
+    buckets = {
+        provider: TokenBucket.per_minute(limit.calls_per_minute, burst=limit.burst or limit.max_concurrency)
+        for provider, limit in limits.items()
+        if limit.calls_per_minute > 0 and provider in queues
+    }
+
+    lock = threading.Lock()
+    progress_step = max(1, len(tasks) // _PROGRESS_STEPS)
+    errors: list[BaseException | None] = [None] * len(tasks)
+    started_at = time.perf_counter()
+
+    def _run(index: int) -> None:
+        task = tasks[index]
+        bucket = buckets.get(task.provider)
+        throttled = bucket.acquire() if bucket is not None and not task.cached else 0.0
+        failed = False
+        call_started = time.perf_counter()
+        try:
+            # 预取是批量刷新：Tushare 客户端层让交互式调用优先取配额
+            with tushare_lane(TushareLane.BULK):
+                task.call()
+        except Exception as exc:
+            failed = True
+            errors[index] = exc
+            logger.warning("%s: %s %s failed: %s", label, task.kind, task.ticker, exc)
+        elapsed = time.perf_counter() - call_started
+        with lock:
+            report.providers[task.provider].record(elapsed, cached=task.cached, failed=failed, throttled=throttled)
+            report.completed += 1
+            completed = report.completed
+        if completed % progress_step == 0 or completed == report.total:
+            logger.info("%s: %d/%d calls done (%.1fs)", label, completed, report.total, time.perf_counter() - started_at)
+
+    def _drain(provider: str) -> None:
+        queue = queues[provider]
+        while True:
+            try:
+                index = queue.popleft()
+            except IndexError:
+                return
+            _run(index)
+
+    if workers == 1 or len(tasks) <= 1:
+        for index in range(len(tasks)):
+            _run(index)
+    else:
+        slots = _drainer_slots(queues, limits, workers)
+        with ThreadPoolExecutor(max_workers=len(slots), thread_name_prefix=label) as pool:
+            for future in [pool.submit(_drain, provider) for provider in slots]:
+                future.result()
+
+    report.elapsed_seconds = time.perf_counter() - started_at
+    for provider, stats in sorted(report.providers.items()):
+        logger.info(
+            "%s: provider=%s calls=%d cached=%d errors=%d avg=%.3fs max=%.3fs throttled=%.1fs",
+            label,
+            provider,
+            stats.calls,
+            stats.cached_calls,
+            stats.errors,
+            stats.total_seconds / stats.calls if stats.calls else 0.0,
+            stats.max_seconds,
+            stats.throttled_seconds,
+        )
+    first_error = next((error for error in errors if error is not None), None)
+    if first_error is not None:
+        raise first_error
+    return report
+
+
+__all__ = [
+    "DEFAULT_PROVIDER_LIMITS",
+    "PROVIDER_AKSHARE",
+    "PROVIDER_FINANCIAL_DATASETS",
+    "PROVIDER_TUSHARE",
+    "PrefetchReport",
+    "PrefetchTask",
+    "ProviderLimit",
+    "ProviderStats",
+    "TokenBucket",
+    "prefetch_provider_for",
+    "resolve_prefetch_max_workers",
+    "resolve_provider_limits",
+    "run_prefetch",
+]
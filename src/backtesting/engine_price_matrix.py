@@ -0,0 +1,238 @@
+"""Dense date × ticker price matrix for the backtest market-data loader.
+
+``MarketDataLoader`` used to call ``get_price_data(ticker, previous, current)``
+for every ticker on every simulated day and read ``iloc[-1]`` from the
+resulting DataFrame. ``DailyPriceMatrix`` holds the same bars for the whole
+backtest span as NumPy arrays so a day's close / volume / suspension lookup
+for N tickers is a single fancy-indexed row read.
+
+Lookup semantics mirror the per-day path exactly: for a window
+``[previous_date, current_date]`` the result is the *last* bar whose date
+falls inside the window; a ticker with no bar in the window is absent.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+_NO_BAR = -1
+
+
+@dataclass
+class DailyPriceMatrix:
+    """Close / volume matrix over the union of bar dates of all tickers.
+
+    ``last_bar[i, j]`` is the row index of ticker *j*'s latest bar on or before
+    ``dates[i]`` (``-1`` when none), which turns "last bar in window" into two
+    array reads. ``has_volume[j]`` records whether ticker *j*'s source frame
+    had a ``volume`` column; rows for tickers without one omit the key, exactly
+    like ``iloc[-1]`` on such a frame (``_is_suspended_row`` treats a missing
+    volume as tradable, turnover treats it as 0).
+    """
+
+    start_date: str
+    end_date: str
+    dates: np.ndarray  # datetime64[D], sorted, unique
+    tickers: list[str]
+    close: np.ndarray  # (n_dates, n_tickers) float64
+    volume: np.ndarray  # (n_dates, n_tickers) float64
+    last_bar: np.ndarray  # (n_dates, n_tickers) int32
+    has_volume: np.ndarray  # (n_tickers,) bool
+    _column: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self._column = {ticker: index for index, ticker in enumerate(self.tickers)}
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame], *, start_date: str, end_date: str) -> "DailyPriceMatrix":
+        """Build from ``prices_to_df``-shaped frames (DatetimeIndex + close/volume).
+
+        Duplicate dates keep the last row, as ``iloc[-1]`` on a sorted frame
+        would. Frames without a ``close`` column contribute an empty column.
+        """
+        tickers = list(frames)
+        normalized: list[pd.DataFrame | None] = []
+        all_dates: list[np.ndarray] = []
+        has_volume = np.zeros(len(tickers), dtype=bool)
+        for column, ticker in enumerate(tickers):
+            frame = frames[ticker]
+            if frame is None or frame.empty or "close" not in frame.columns:
+                normalized.append(None)
+                continue
+            has_volume[column] = "volume" in frame.columns
+            index = pd.DatetimeIndex(pd.to_datetime(frame.index)).normalize()
+            data = pd.DataFrame(
+                {
+                    "close": pd.to_numeric(frame["close"], errors="coerce").to_numpy(dtype=np.float64),
+                    "volume": pd.to_numeric(frame["volume"], errors="coerce").to_numpy(dtype=np.float64) if "volume" in frame.columns else np.full(len(frame), np.nan),
+                },
+                index=index,
+            )
+            # stable sort keeps the original order of same-day rows; keep="last"
+            # then picks what ``sort_index(); iloc[-1]`` would have returned.
+            data = data.sort_index(kind="stable")
+            data = data[~data.index.duplicated(keep="last")]
+            normalized.append(data)
+            all_dates.append(data.index.values.astype("datetime64[D]"))
+
+        dates = np.unique(np.concatenate(all_dates)) if all_dates else np.array([], dtype="datetime64[D]")
+        shape = (len(dates), len(tickers))
+        close = np.full(shape, np.nan)
+        volume = np.full(shape, np.nan)
+        present = np.zeros(shape, dtype=bool)
+        for column, data in enumerate(normalized):
+            if data is None:
+                continue
+            rows = np.searchsorted(dates, data.index.values.astype("datetime64[D]"))
+            close[rows, column] = data["close"].to_numpy()
+            volume[rows, column] = data["volume"].to_numpy()
+            present[rows, column] = True
+
+        row_ids = np.arange(len(dates), dtype=np.int32)[:, None]
+        last_bar = np.where(present, row_ids, _NO_BAR).astype(np.int32)
+        if len(dates):
+            last_bar = np.maximum.accumulate(last_bar, axis=0)
+        return cls(
+            start_date=start_date,
+            end_date=end_date,
+            dates=dates,
+            tickers=tickers,
+            close=close,
+            volume=volume,
+            last_bar=last_bar,
+            has_volume=has_volume,
+        )
+
+    def covers(self, ticker: str, previous_date: str, current_date: str) -> bool:
+        """Whether a ``[previous_date, current_date]`` lookup can be served."""
+        return ticker in self._column and self.start_date <= previous_date and current_date <= self.end_date
+
+    def latest_rows(self, tickers: Sequence[str], previous_date: str, current_date: str) -> dict[str, dict[str, float]]:
+        """Last bar within ``[previous_date, current_date]`` for each ticker in the matrix.
+
+        Rows are ``{"close": ..., "volume": ...}`` dicts (``volume`` omitted for
+        tickers whose source had no volume column; values may be NaN). Tickers
+        without a bar in the window are omitted; callers use ``covers`` to tell
+        "no bar" apart from "not in the matrix".
+        """
+        columns = [self._column[ticker] for ticker in tickers if ticker in self._column]
+        if not columns or not len(self.dates):
+            return {}
+        cur_row = int(np.searchsorted(self.dates, np.datetime64(current_date, "D"), side="right")) - 1
+        if cur_row < 0:
+            return {}
+        column_ids = np.asarray(columns, dtype=np.intp)
+        rows = self.last_bar[cur_row, column_ids]
+        valid = rows >= 0
+        valid[valid] = self.dates[rows[valid]] >= np.datetime64(previous_date, "D")
+        rows, column_ids = rows[valid], column_ids[valid]
+        closes = self.close[rows, column_ids].tolist()
+        volumes = self.volume[rows, column_ids].tolist()
+        with_volume = self.has_volume[column_ids].tolist()
+        result: dict[str, dict[str, float]] = {}
+        for column, close, volume, keep_volume in zip(column_ids.tolist(), closes, volumes, with_volume):
+            result[self.tickers[column]] = {"close": close, "volume": volume} if keep_volume else {"close": close}
+        return result
+
+    def with_frames(self, frames: Mapping[str, pd.DataFrame]) -> "DailyPriceMatrix":
+        """Return a matrix that also contains *frames* (same coverage window).
+
+        A ticker already in the matrix is replaced by its frame. Only *frames*
+        are normalized; existing columns are copied over as array blocks.
+        """
+        if not frames:
+            return self
+        return self._merged(frames, end_date=self.end_date, replace=True)
+
+    def extended(self, frames: Mapping[str, pd.DataFrame], *, end_date: str) -> "DailyPriceMatrix":
+        """Return a matrix whose coverage runs to *end_date*, appending *frames*.
+
+        *frames* hold bars after ``self.end_date`` for existing tickers (and full
+        coverage for new ones); existing bars are kept as-is, so advancing a
+        walk-forward study only loads — and normalizes — the new dates.
+        """
+        return self._merged(frames, end_date=end_date, replace=False)
+
+    def _merged(self, frames: Mapping[str, pd.DataFrame], *, end_date: str, replace: bool) -> "DailyPriceMatrix":
+        """Scatter a matrix built from *frames* alone into this one.
+
+        ``replace=True`` drops existing columns for tickers in *frames*;
+        otherwise their bars are overlaid on the existing column (a bar on an
+        existing date wins, like ``keep="last"`` in ``from_frames``). The
+        result equals ``from_frames`` over the combined per-ticker frames.
+        """
+        added = DailyPriceMatrix.from_frames(frames, start_date=self.start_date, end_date=end_date)
+        keep = [ticker for ticker in self.tickers if not (replace and ticker in added._column)]
+        new = [ticker for ticker in added.tickers if replace or ticker not in self._column]
+        tickers = keep + new
+        column_of = {ticker: index for index, ticker in enumerate(tickers)}
+        dates = np.union1d(self.dates, added.dates) if len(added.dates) else self.dates
+
+        shape = (len(dates), len(tickers))
+        close = np.full(shape, np.nan)
+        volume = np.full(shape, np.nan)
+        present = np.zeros(shape, dtype=bool)
+        has_volume = np.zeros(len(tickers), dtype=bool)
+        if keep:
+            source = np.asarray([self._column[ticker] for ticker in keep], dtype=np.intp)
+            target = np.arange(len(keep))
+            rows = np.searchsorted(dates, self.dates)
+            close[np.ix_(rows, target)] = self.close[:, source]
+            volume[np.ix_(rows, target)] = self.volume[:, source]
+            present[np.ix_(rows, target)] = self._present()[:, source]
+            has_volume[target] = self.has_volume[source]
+        if added.tickers:
+            target = np.asarray([column_of[ticker] for ticker in added.tickers], dtype=np.intp)
+            bar_rows, bar_columns = np.nonzero(added._present())
+            rows = np.searchsorted(dates, added.dates)[bar_rows]
+            columns = target[bar_columns]
+            close[rows, columns] = added.close[bar_rows, bar_columns]
+            volume[rows, columns] = added.volume[bar_rows, bar_columns]
+            present[rows, columns] = True
+            has_volume[target] |= added.has_volume
+
+        row_ids = np.arange(len(dates), dtype=np.int32)[:, None]
+        last_bar = np.where(present, row_ids, _NO_BAR).astype(np.int32)
+        if len(dates):
+            last_bar = np.maximum.accumulate(last_bar, axis=0)
+        return DailyPriceMatrix(
+            start_date=self.start_date,
+            end_date=end_date,
+            dates=dates,
+            tickers=tickers,
+            close=close,
+            volume=volume,
+            last_bar=last_bar,
+            has_volume=has_volume,
+        )
+
+    def _present(self) -> np.ndarray:
+        """``(n_dates, n_tickers)`` mask of cells that hold a ticker's own bar."""
+        return self.last_bar == np.arange(len(self.dates), dtype=np.int32)[:, None]
+
+    def window(self, start_date: str, end_date: str) -> "DailyPriceMatrix":
+        """Row slice covering ``[start_date, end_date]`` without reloading.
+
+        Bars after *end_date* are dropped, so a view capped at a window's
+        ``data_through`` cannot serve post-embargo prices. ``last_bar`` entries
+        pointing before the slice become ``-1`` — the same matrix
+        ``from_frames`` would build from frames starting at *start_date*.
+        """
+        lo = int(np.searchsorted(self.dates, np.datetime64(start_date, "D"), side="left"))
+        hi = int(np.searchsorted(self.dates, np.datetime64(end_date, "D"), side="right"))
+        last_bar = self.last_bar[lo:hi] - lo
+        last_bar[last_bar < 0] = _NO_BAR
+        return DailyPriceMatrix(
+            start_date=start_date,
+            end_date=end_date,
+            dates=self.dates[lo:hi],
+            tickers=list(self.tickers),
+            close=self.close[lo:hi],
+            volume=self.volume[lo:hi],
+            last_bar=last_bar,
+            has_volume=self.has_volume.copy(),
+        )
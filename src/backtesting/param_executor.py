@@ -0,0 +1,143 @@
+"""Trial executor shared by :mod:`param_grid` and :mod:`param_search`.
+
+Backtest evaluators are CPU-bound pandas / pure-Python code, so the
+historical :class:`~concurrent.futures.ThreadPoolExecutor` runner tops out
+at roughly one core regardless of ``max_workers``.  :class:`TrialExecutor`
+keeps that thread backend as the default and adds a ``"process"`` backend:
+
+- The evaluator is installed into each worker once, via the pool
+  initializer, instead of being pickled per trial.  Under the ``fork``
+  start method (Linux default) nothing is pickled at all — the worker
+  inherits the evaluator closure and every in-process cache the parent
+  already warmed (``EnhancedCache`` LRU, price matrices, ...) as
+  copy-on-write pages.  Callers pass ``preload`` to load market data once
+  in the parent before the pool forks.  Only in-memory data is meant to be
+  inherited: ``DiskCache`` sqlite connections, Redis sockets and cache locks
+  are dropped in the child by the ``os.register_at_fork`` hook in
+  :mod:`src.data.enhanced_cache` and reopened lazily on first use.
+- Where ``fork`` is unavailable (macOS / Windows ``spawn``) the evaluator
+  must be picklable; it is still shipped once per worker, not per trial.
+
+Only the trial callable and its ``(index, params)`` arguments cross the
+process boundary per submission; result ordering is the caller's job
+(both runners sort by ``trial_index``).
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+EXECUTOR_ENV_VAR = "PARAM_GRID_EXECUTOR"
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTOR_CHOICES: tuple[str, ...] = (EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
+# Evaluator installed in a process-pool worker by ``_install_worker_evaluator``.
+_worker_evaluator: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+
+
+def resolve_executor_kind(explicit: str | None) -> str:
+    """Return ``"thread"`` / ``"process"``; ``None`` reads :data:`EXECUTOR_ENV_VAR`.
+
+    Raises:
+        ValueError: when the explicit or env value is not a known backend.
+    """
+    raw = explicit if explicit is not None else os.getenv(EXECUTOR_ENV_VAR, EXECUTOR_THREAD)
+    kind = str(raw).strip().lower() or EXECUTOR_THREAD
+    if kind not in EXECUTOR_CHOICES:
+        raise ValueError(f"unknown trial executor {raw!r}; expected one of {list(EXECUTOR_CHOICES)}")
+    return kind
+
+
+def default_process_workers() -> int:
+    """Worker count for the process backend when none is configured: one per core."""
+    return max(1, os.cpu_count() or 1)
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    # fork 让子进程直接继承父进程已加载的行情缓存（写时复制），不必逐 worker 重新拉取；
+    # 不支持 fork 的平台退回默认 start method，此时 evaluator 需可 pickle。
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _install_worker_evaluator(evaluator: Callable[[dict[str, Any]], dict[str, Any]]) -> None:
+    global _worker_evaluator
+    _worker_evaluator = evaluator
+
+
+def _call_with_worker_evaluator(fn: Callable[..., Any], *args: Any) -> Any:
+    if _worker_evaluator is None:
+        raise RuntimeError("trial worker started without an evaluator")
+    return fn(_worker_evaluator, *args)
+
+
+class TrialExecutor:
+    """Context manager running ``fn(evaluator, *args)`` on a thread or process pool.
+
+    ``fn`` must be a module-level function for the process backend (it is
+    pickled per submission); the evaluator itself never is under ``fork``.
+    """
+
+    def __init__(
+        self,
+        evaluator: Callable[[dict[str, Any]], dict[str, Any]],
+        *,
+        max_workers: int,
+        kind: str = EXECUTOR_THREAD,
+        preload: Callable[[], Any] | None = None,
+    ) -> None:
+        self.kind = resolve_executor_kind(kind)
+        self.max_workers = max(1, int(max_workers))
+        self._evaluator = evaluator
+        self._preload = preload
+        self._pool: Executor | None = None
+
+    def __enter__(self) -> TrialExecutor:
+        if self._preload is not None:
+            # 在父进程里一次性加载行情：thread 后端共享同一进程内存，process 后端
+            # 在下面 fork 时把已加载的缓存写时复制给所有 worker。
+            self._preload()
+        if self.kind == EXECUTOR_PROCESS:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=_process_context(),
+                initializer=_install_worker_evaluator,
+                initargs=(self._evaluator,),
+            )
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        _logger.debug("Trial executor started: kind=%s workers=%d", self.kind, self.max_workers)
+        return self
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        if self._pool is None:
+            raise RuntimeError("TrialExecutor.submit() called outside its context")
+        if self.kind == EXECUTOR_PROCESS:
+            return self._pool.submit(_call_with_worker_evaluator, fn, *args)
+        return self._pool.submit(fn, self._evaluator, *args)
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            # 异常退出（含 Ctrl-C）时取消排队中的 trial，已完成的结果已由调用方落盘。
+            pool.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+
+__all__ = [
+    "EXECUTOR_CHOICES",
+    "EXECUTOR_ENV_VAR",
+    "EXECUTOR_PROCESS",
+    "EXECUTOR_THREAD",
+    "TrialExecutor",
+    "default_process_workers",
+    "resolve_executor_kind",
+]
@@ -1,9 +1,10 @@
 """Parameter grid comparison for backtest runs.
 
 Parses a compact ``"key=v1,v2;key2=v3,v4"`` grid spec, expands it into the
-cartesian product, runs each combination in parallel via
-:class:`concurrent.futures.ThreadPoolExecutor`, and renders a side-by-side
-comparison table (Sharpe / win-rate / max drawdown / total return).
+cartesian product, runs each combination in parallel on a thread or process
+pool (:class:`src.backtesting.param_executor.TrialExecutor`), and renders a
+side-by-side comparison table (Sharpe / win-rate / max drawdown / total
+return).
 
 The module is intentionally decoupled from :class:`BacktestEngine`: callers
 provide an *evaluator* callable (params -> metrics dict).  This keeps the
@@ -20,11 +21,19 @@ import logging
 import math
 import os
 from collections.abc import Callable, Sequence
-from concurrent.futures import as_completed, ThreadPoolExecutor
+from concurrent.futures import as_completed
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+from src.backtesting.param_executor import (
+    default_process_workers,
+    EXECUTOR_ENV_VAR,
+    EXECUTOR_PROCESS,
+    resolve_executor_kind,
+    TrialExecutor,
+)
+
 _logger = logging.getLogger(__name__)
 
 
@@ -258,7 +267,7 @@ class ParamGridReport:
 # ---------------------------------------------------------------------------
 
 
-def _resolve_max_workers(explicit: int | None) -> int:
+def _resolve_max_workers(explicit: int | None, executor: str = "thread") -> int:
     # Explicit 0/negative is a programming error / convenience typo; clamp
     # to 1 instead of falling through to the env-var default so the call
     # site (e.g. ``--max-workers 0``) behaves predictably.
@@ -266,6 +275,10 @@ def _resolve_max_workers(explicit: int | None) -> int:
         if explicit <= 0:
             return 1
         return int(explicit)
+    if executor == EXECUTOR_PROCESS and os.getenv(GRID_ENV_VAR) is None:
+        # GRID_ENV_VAR 的默认值是为 LLM 并发预算设的；进程池跑 CPU 密集的
+        # 回测时，未显式配置就按核数铺满。
+        return default_process_workers()
     try:
         env_value = int(os.getenv(GRID_ENV_VAR, str(DEFAULT_GRID_MAX_WORKERS)))
     except (TypeError, ValueError):
@@ -320,17 +333,27 @@ def run_param_grid(
     grid: dict[str, list[Any]],
     evaluator: Callable[[dict[str, Any]], dict[str, Any]],
     max_workers: int | None = None,
+    executor: str | None = None,
+    preload: Callable[[], Any] | None = None,
 ) -> ParamGridReport:
     """Run the grid's cartesian product through *evaluator* in parallel.
 
     Args:
         grid: Output of :func:`parse_param_grid` (param name -> value list).
         evaluator: Callable taking a params dict and returning a flat
-            metrics dict.  Must be thread-safe — it will be invoked from
-            worker threads.
+            metrics dict.  Must be thread-safe — with the thread backend it
+            is invoked from worker threads.
         max_workers: Concurrency cap.  ``None`` reads
             :data:`GRID_ENV_VAR` and falls back to
-            :data:`DEFAULT_GRID_MAX_WORKERS`.  Values <= 0 are clamped to 1.
+            :data:`DEFAULT_GRID_MAX_WORKERS` (one worker per core for the
+            process backend).  Values <= 0 are clamped to 1.
+        executor: ``"thread"`` (default) or ``"process"``; ``None`` reads
+            :data:`~src.backtesting.param_executor.EXECUTOR_ENV_VAR`.  The
+            process backend runs trials on separate cores; under ``fork``
+            the evaluator and everything the parent already loaded are
+            shared copy-on-write, otherwise the evaluator must be picklable.
+        preload: Optional callable run once in the parent before the pool
+            starts (e.g. prefetch market data so workers inherit it).
 
     Returns:
         :class:`ParamGridReport` with one :class:`ParamGridTrial` per
@@ -338,7 +361,8 @@ def run_param_grid(
         (which is :func:`grid_combinations` order, i.e. sorted keys).
     """
     combinations = grid_combinations(grid)
-    workers = _resolve_max_workers(max_workers)
+    kind = resolve_executor_kind(executor)
+    workers = _resolve_max_workers(max_workers, kind)
     report = ParamGridReport(trials=[], total_combinations=len(combinations), max_workers=workers)
 
     if not combinations:
@@ -347,9 +371,9 @@ def run_param_grid(
     # Submit all trials, then drain in completion order so a slow trial
     # can't stall the others' results from appearing in the report.
     futures = {}
-    with ThreadPoolExecutor(max_workers=workers) as pool:
+    with TrialExecutor(evaluator, max_workers=workers, kind=kind, preload=preload) as pool:
         for index, params in enumerate(combinations):
-            future = pool.submit(_run_single_trial, evaluator, index, params)
+            future = pool.submit(_run_single_trial, index, params)
             futures[future] = index
         for future in as_completed(futures):
             report.trials.append(future.result())
@@ -358,10 +382,11 @@ def run_param_grid(
     # regardless of which thread finished first.
     report.trials.sort(key=lambda t: t.trial_index)
     _logger.info(
-        "Param grid complete: %d/%d trials succeeded (workers=%d)",
+        "Param grid complete: %d/%d trials succeeded (workers=%d, executor=%s)",
         report.completed,
         report.total_combinations,
         workers,
+        kind,
     )
     return report
 
@@ -557,6 +582,7 @@ def save_markdown_report(
 __all__ = [
     "COMPARISON_METRICS",
     "DEFAULT_GRID_MAX_WORKERS",
+    "EXECUTOR_ENV_VAR",
     "GRID_ENV_VAR",
     "ParamGridError",
     "ParamGridReport",
@@ -12,6 +12,7 @@ import logging
 import os
 import tempfile
 from collections.abc import Callable
+from concurrent.futures import as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import StrEnum
@@ -22,6 +23,12 @@ from src.backtesting.evaluation_bundle import (
     build_canonical_btst_evaluation_bundle,
     coerce_numeric_metric_value,
 )
+from src.backtesting.param_executor import (
+    default_process_workers,
+    EXECUTOR_PROCESS,
+    resolve_executor_kind,
+    TrialExecutor,
+)
 from src.utils.numeric import clip
 
 _logger = logging.getLogger(__name__)
@@ -285,6 +292,31 @@ def _trial_key(params: dict[str, Any]) -> str:
     return json.dumps(params, sort_keys=True, default=str)
 
 
+def _checkpoint_payload(completed_map: dict[str, TrialResult]) -> dict[str, Any]:
+    # 按 trial_index 排序写出，并行完成顺序不同也得到相同的 checkpoint 文件
+    return {
+        "completed_trials": [
+            {
+                "trial_index": r.trial_index,
+                "params": r.params,
+                "metrics": r.metrics,
+                "window_count": r.window_count,
+                "score": r.score,
+                "failed_guardrails": list(r.failed_guardrails),
+            }
+            for r in sorted(completed_map.values(), key=lambda r: r.trial_index)
+        ]
+    }
+
+
+def _evaluate_trial(
+    evaluator: Callable[[dict[str, Any]], dict[str, float | None]],
+    params: dict[str, Any],
+) -> dict[str, float | None]:
+    """Pool entry point; module-level so the process backend can pickle it."""
+    return evaluator(params)
+
+
 def run_param_search(
     *,
     space: ParamSpace,
@@ -292,6 +324,9 @@ def run_param_search(
     evaluator: Callable[[dict[str, Any]], dict[str, float | None]],
     checkpoint_path: str | Path | None = None,
     guardrails: dict[str, GuardrailSpec] | None = None,
+    max_workers: int | None = None,
+    executor: str | None = None,
+    preload: Callable[[], Any] | None = None,
 ) -> SearchReport:
     """Run grid search over profile parameters.
 
@@ -308,6 +343,15 @@ def run_param_search(
             enforce hard floors/caps on win rate, downside tail, exposure, or
             other protected metrics so the search never silently promotes a
             candidate that regresses on quality gates.
+        max_workers: Parallel trial count.  ``None`` keeps the historical
+            sequential loop for the thread backend and uses one worker per
+            core for the process backend.
+        executor: ``"thread"`` or ``"process"``; ``None`` reads
+            ``PARAM_GRID_EXECUTOR`` (see :mod:`src.backtesting.param_executor`).
+            Only trials missing from the checkpoint are submitted, and the
+            checkpoint is rewritten as each one completes.
+        preload: Optional callable run once before the pool starts so
+            workers inherit already-loaded market data.
 
     Returns:
         SearchReport with ranked results.  Guardrail-failing trials appear at
@@ -337,18 +381,9 @@ def run_param_search(
             )
             completed_map[_trial_key(tr.params)] = tr
 
-    for i, params in enumerate(combos):
-        key = _trial_key(params)
-        if key in completed_map:
-            report.results.append(completed_map[key])
-            report.completed_trials += 1
-            continue
-
-        _logger.info("Trial %d/%d: %s", i + 1, len(combos), _params_summary(params))
-        metrics = evaluator(params)
+    def _record(i: int, params: dict[str, Any], metrics: dict[str, float | None]) -> TrialResult:
         score = compute_objective_score(metrics, objective)
         violations = check_guardrails(metrics, guardrails) if guardrails else []
-
         result = TrialResult(
             trial_index=i,
             params=params,
@@ -357,27 +392,43 @@ def run_param_search(
             score=score,
             failed_guardrails=tuple(violations),
         )
-        report.results.append(result)
-        report.completed_trials += 1
-
         if cp_path:
-            completed_map[key] = result
-            _save_checkpoint(
-                cp_path,
-                {
-                    "completed_trials": [
-                        {
-                            "trial_index": r.trial_index,
-                            "params": r.params,
-                            "metrics": r.metrics,
-                            "window_count": r.window_count,
-                            "score": r.score,
-                            "failed_guardrails": list(r.failed_guardrails),
-                        }
-                        for r in completed_map.values()
-                    ]
-                },
-            )
+            completed_map[_trial_key(params)] = result
+            _save_checkpoint(cp_path, _checkpoint_payload(completed_map))
+        return result
+
+    by_index: dict[int, TrialResult] = {}
+    pending: list[tuple[int, dict[str, Any]]] = []
+    for i, params in enumerate(combos):
+        key = _trial_key(params)
+        if key in completed_map:
+            by_index[i] = completed_map[key]
+        else:
+            pending.append((i, params))
+
+    kind = resolve_executor_kind(executor)
+    if max_workers is not None:
+        workers = max(1, int(max_workers))
+    else:
+        workers = default_process_workers() if kind == EXECUTOR_PROCESS else 1
+    if kind != EXECUTOR_PROCESS and workers == 1:
+        for i, params in pending:
+            _logger.info("Trial %d/%d: %s", i + 1, len(combos), _params_summary(params))
+            by_index[i] = _record(i, params, evaluator(params))
+    elif pending:
+        # 并行执行：checkpoint 仍只由父进程写（每完成一个 trial 写一次），中断后
+        # 重跑只补算缺失的 trial；结果按 trial_index 归并，与串行路径顺序一致。
+        with TrialExecutor(evaluator, max_workers=workers, kind=kind, preload=preload) as pool:
+            futures = {}
+            for i, params in pending:
+                _logger.info("Trial %d/%d: %s", i + 1, len(combos), _params_summary(params))
+                futures[pool.submit(_evaluate_trial, params)] = (i, params)
+            for future in as_completed(futures):
+                i, params = futures[future]
+                by_index[i] = _record(i, params, future.result())
+
+    report.results = [by_index[i] for i in sorted(by_index)]
+    report.completed_trials = len(report.results)
 
     # Guardrail-failing trials are always ranked after passing ones regardless
     # of their objective score.  Within each tier, rank by score descending.
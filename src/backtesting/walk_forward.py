@@ -17,8 +17,10 @@ from .evaluation_bundle import (
     build_btst_quality_floor_blockers,
     build_canonical_btst_evaluation_bundle,
 )
+from .param_executor import resolve_executor_kind, TrialExecutor
 from .promotion_gate import build_promotion_gate_summary
 from .types import PerformanceMetrics
+from .walk_forward_cache import WalkForwardDataCache
 
 
 class WindowMode(StrEnum):
@@ -253,23 +255,75 @@ def _compute_walk_forward_recency_weight(
     return max(WALK_FORWARD_RECENCY_DECAY_MIN_FACTOR, round(decay, 6))
 
 
+def _run_walk_forward_window(
+    engine_factory: Callable[[WalkForwardWindow], object],
+    window: WalkForwardWindow,
+) -> WalkForwardResult:
+    engine = engine_factory(window)
+    metrics = engine.run_backtest()
+    if metrics.get("test_trading_days") is None:
+        calendar_test_trading_days = _resolve_calendar_test_trading_days(window.test_start, window.test_end)
+        if calendar_test_trading_days is not None:
+            metrics = {
+                **metrics,
+                "test_trading_days": calendar_test_trading_days,
+            }
+    return WalkForwardResult(window=window, metrics=metrics)
+
+
 def run_walk_forward(
     windows: Sequence[WalkForwardWindow],
     engine_factory: Callable[[WalkForwardWindow], object],
+    *,
+    max_workers: int | None = None,
+    executor: str | None = None,
+    preload: Callable[[], Any] | None = None,
 ) -> list[WalkForwardResult]:
-    results: list[WalkForwardResult] = []
-    for window in windows:
-        engine = engine_factory(window)
-        metrics = engine.run_backtest()
-        if metrics.get("test_trading_days") is None:
-            calendar_test_trading_days = _resolve_calendar_test_trading_days(window.test_start, window.test_end)
-            if calendar_test_trading_days is not None:
-                metrics = {
-                    **metrics,
-                    "test_trading_days": calendar_test_trading_days,
-                }
-        results.append(WalkForwardResult(window=window, metrics=metrics))
-    return results
+    """Run every window's backtest and return results in window order.
+
+    Windows are independent once their data is loaded, so ``max_workers > 1``
+    runs them on a :class:`~src.backtesting.param_executor.TrialExecutor`
+    (``executor="process"`` for one core per window; under ``fork`` the
+    factory closure and anything ``preload`` loaded — typically
+    :meth:`WalkForwardDataCache.warm_windows` — are inherited copy-on-write;
+    open sqlite/Redis cache handles are dropped in each child by the shared
+    at-fork hook in :mod:`src.data.enhanced_cache` and reopen on first use).
+    The default (``max_workers=None``) keeps the sequential loop.
+    """
+    if max_workers is None or max_workers <= 1 or len(windows) <= 1:
+        if preload is not None:
+            preload()
+        return [_run_walk_forward_window(engine_factory, window) for window in windows]
+
+    kind = resolve_executor_kind(executor)
+    with TrialExecutor(engine_factory, max_workers=min(max_workers, len(windows)), kind=kind, preload=preload) as pool:
+        futures = [pool.submit(_run_walk_forward_window, window) for window in windows]
+        # 按提交顺序收集，结果顺序与串行路径一致
+        return [future.result() for future in futures]
+
+
+def build_shared_walk_forward_engine_factory(
+    windows: Sequence[WalkForwardWindow],
+    tickers: Sequence[str],
+    build_engine: Callable[..., object],
+) -> tuple[Callable[[WalkForwardWindow], object], Callable[[], None]]:
+    """Return ``(engine_factory, preload)`` sharing one :class:`WalkForwardDataCache`.
+
+    ``build_engine(test_start, test_end, **engine_kwargs)`` must forward
+    ``engine_kwargs`` to :class:`BacktestEngine`; each window gets
+    ``data_through=test_end`` (GAMMA-007 embargo) and the shared cache, so
+    consecutive windows reuse the already loaded bars instead of rebuilding
+    their price matrix from scratch.
+    """
+    cache = WalkForwardDataCache()
+
+    def _factory(window: WalkForwardWindow) -> object:
+        return build_engine(window.test_start, window.test_end, data_through=window.test_end, market_data_cache=cache)
+
+    def _preload() -> None:
+        cache.warm_windows(tickers, windows)
+
+    return _factory, _preload
 
 
 def assess_profile_stability(verdicts: list[tuple[str, dict]]) -> dict[str, Any]:
@@ -0,0 +1,133 @@
+"""Study-wide market data shared by the windows of one walk-forward run.
+
+``run_walk_forward`` builds a fresh :class:`BacktestEngine` per window, and
+every engine's ``prefetch_data`` used to reload each ticker's bars over its
+own span into a private price matrix. Rolling windows overlap almost
+entirely, so a 24-window study loaded nearly the same bars 24 times.
+
+:class:`WalkForwardDataCache` keeps one :class:`DailyPriceMatrix` for the
+whole study and grows it incrementally: advancing to a later window only
+loads the dates after the current coverage end (and full coverage for
+tickers seen for the first time). Each engine receives a
+:meth:`DailyPriceMatrix.window` view capped at its own prefetch horizon,
+which is already clamped to ``data_through``. Bars after that horizon are
+sliced off before the engine sees the matrix, so the shared cache cannot
+leak post-embargo prices into an earlier window.
+
+Process-parallel runs call :meth:`WalkForwardDataCache.warm` in the parent
+before the pool forks. Workers then inherit the fully loaded matrix
+copy-on-write and only take views of it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from .engine_market_data import load_matrix_frame, PRICE_MATRIX_LEAD_DAYS
+from .engine_price_matrix import DailyPriceMatrix
+
+if TYPE_CHECKING:
+    from .walk_forward import WalkForwardWindow
+
+logger = logging.getLogger(__name__)
+
+
+def _next_day(date_str: str) -> str:
+    return (datetime.strptime(date_str, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+class WalkForwardDataCache:
+    """Incrementally extended price matrix shared across walk-forward windows.
+
+    Thread-safe. Passed to ``BacktestEngine(market_data_cache=...)``; engines
+    built without one keep loading their own matrix.
+    """
+
+    def __init__(self) -> None:
+        self._matrix: DailyPriceMatrix | None = None
+        self._unavailable: set[str] = set()
+        self._lock = threading.Lock()
+        self._frame_loads = 0
+
+    @property
+    def frame_loads(self) -> int:
+        """Number of per-ticker frame loads issued so far (diagnostics / tests)."""
+        return self._frame_loads
+
+    def _load_frames(self, tickers: Sequence[str], start_date: str, end_date: str) -> dict[str, pd.DataFrame]:
+        frames: dict[str, pd.DataFrame] = {}
+        for ticker in tickers:
+            self._frame_loads += 1
+            try:
+                frame = load_matrix_frame(ticker, start_date, end_date)
+            except Exception as exc:
+                logger.debug("walk-forward cache: load failed for ticker=%s (%s ~ %s): %s", ticker, start_date, end_date, exc)
+                frame = None
+            if frame is not None and not frame.empty:
+                frames[ticker] = frame
+        return frames
+
+    def _ensure(self, tickers: Sequence[str], start_date: str, end_date: str) -> DailyPriceMatrix:
+        matrix = self._matrix
+        if matrix is None or start_date < matrix.start_date:
+            # 首个窗口，或出现更早的起点（窗口非递增顺序）：整段重建一次
+            known = list(matrix.tickers) if matrix is not None else []
+            wanted = list(dict.fromkeys([*known, *tickers]))
+            coverage_end = max(end_date, matrix.end_date) if matrix is not None else end_date
+            frames = self._load_frames(wanted, start_date, coverage_end)
+            self._unavailable = set(wanted) - set(frames)
+            self._matrix = DailyPriceMatrix.from_frames(frames, start_date=start_date, end_date=coverage_end)
+            return self._matrix
+
+        if end_date > matrix.end_date:
+            # 只加载新增日期段：已有 ticker 追加 (end, end_date]，新 ticker 取整段
+            appended = self._load_frames(matrix.tickers, _next_day(matrix.end_date), end_date)
+            matrix = matrix.extended(appended, end_date=end_date)
+
+        known = set(matrix.tickers)
+        missing = [ticker for ticker in dict.fromkeys(tickers) if ticker not in known and ticker not in self._unavailable]
+        if missing:
+            frames = self._load_frames(missing, matrix.start_date, matrix.end_date)
+            self._unavailable.update(set(missing) - set(frames))
+            matrix = matrix.with_frames(frames)
+        self._matrix = matrix
+        return matrix
+
+    def matrix_view(self, tickers: Sequence[str], start_date: str, end_date: str) -> tuple[DailyPriceMatrix, set[str]]:
+        """Return ``(view, unavailable)`` for one engine's ``[start_date, end_date]`` span.
+
+        ``unavailable`` lists the requested tickers whose loads came back
+        empty; the loader serves them through its per-ticker fallback.
+        """
+        with self._lock:
+            matrix = self._ensure(tickers, start_date, end_date)
+            unavailable = self._unavailable & set(tickers)
+        return matrix.window(start_date, end_date), unavailable
+
+    def warm(self, tickers: Sequence[str], start_date: str, end_date: str) -> None:
+        """Load ``[start_date, end_date]`` up front (before forking process workers)."""
+        with self._lock:
+            self._ensure(tickers, start_date, end_date)
+
+    def warm_windows(self, tickers: Sequence[str], windows: Sequence[WalkForwardWindow]) -> None:
+        """Load the span every window's engine will ask for, in one pass.
+
+        Engines request ``[test_start - PRICE_MATRIX_LEAD_DAYS, test_end]``
+        (``test_end`` being their ``data_through``), so the union is bounded by
+        the first window's lead-in and the last window's test end.
+        """
+        if not windows:
+            return
+        first_start = min(window.test_start for window in windows)
+        last_end = max(window.test_end for window in windows)
+        start = (datetime.strptime(first_start, "%Y-%m-%d") - timedelta(days=PRICE_MATRIX_LEAD_DAYS)).strftime("%Y-%m-%d")
+        self.warm(tickers, start, last_end)
+
+
+__all__ = ["WalkForwardDataCache"]
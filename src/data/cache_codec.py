@@ -0,0 +1,276 @@
+"""
+缓存值编解码
+
+DiskCache / RedisCache 的序列化层，取代直接 pickle 整个 ``list[dict]``：
+
+- 形如 ``[Price.model_dump(), ...]`` 的同构记录列表（价格、财务指标、新闻）
+  按列编码：数值列打包为 float64/int64 原始字节（带 None 掩码），其余列存 JSON；
+- 其他任意值回退 pickle；
+- 可选 zstd 压缩（未安装 ``zstandard`` 时回退 zlib/不压缩）；
+- 固定头 ``MAGIC + version + layout + compression``，旧版本直接 pickle 的
+  缓存条目（不带 MAGIC）仍可读取。
+
+性能目标的实际结果（``Price.model_dump()`` 列表, 250 / 1000 行）:
+
+- 体积: 目标达成。pickle 17.5KB / 70KB → 列式 13.7KB / 54KB → 列式 + zstd 9KB / 37KB（约 -48%）。
+- 解码速度: 未达到"比 pickle 快数倍"的目标。不压缩时与 pickle 持平
+  （pickle vs 列式: 250 行 161µs vs 183µs，1000 行 589µs vs 490µs），zstd 再加 15~35%。原因是
+  调用方要的是 ``list[dict]``：pickle 与列式解码最终都要逐行新建同样多的
+  dict 与 float/str 对象，这部分占列式解码的 70% 以上，编码格式省不掉。
+  零拷贝（直接返回 numpy 列视图、不重建逐行对象）要求调用方改吃列式数据，
+  而缓存命中后紧接着的 ``Price(**row)`` 重建（250 行约 700µs）本身就是解码的
+  3~4 倍，只换编解码层收益有限，因此未做。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import pickle
+import struct
+import threading
+import zlib
+from typing import Any
+
+import numpy as np
+
+from src.utils.env_helpers import get_env_mode
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CODEC_MAGIC = b"AHFC"
+CODEC_VERSION = 1
+
+LAYOUT_PICKLE = 0
+LAYOUT_RECORDS = 1
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+
+_HEADER = struct.Struct("<4sBBB")
+_META_LEN = struct.Struct("<I")
+
+# 小于该字节数的负载不压缩：压缩头开销与 CPU 时间都不划算
+_COMPRESS_MIN_BYTES = 512
+
+# 列式编码只接受这些精确类型（bool 是 int 的子类，单独处理）
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# zstandard 的压缩/解压对象不是线程安全的，按线程各持一份
+_zstd_local = threading.local()
+
+
+class CacheCodecError(ValueError):
+    """缓存负载无法解码（头部损坏、未知版本或缺少解压依赖）。"""
+
+
+def _zstd_compress(body: bytes) -> bytes:
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor.compress(body)
+
+
+def _zstd_decompress(body: bytes) -> bytes:
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(body)
+
+
+def _default_compression() -> int:
+    choice = get_env_mode("CACHE_CODEC_COMPRESSION", "zstd")
+    if choice == "none":
+        return COMPRESSION_NONE
+    if choice == "zlib":
+        return COMPRESSION_ZLIB
+    return COMPRESSION_ZSTD if ZSTD_AVAILABLE else COMPRESSION_ZLIB
+
+
+# ---------------------------------------------------------------------------
+# 列式记录编码
+# ---------------------------------------------------------------------------
+
+
+def _column_kind(values: list[Any]) -> str:
+    """推断列类型：f8/f8n（float，可含 None）、i8/i8n（int，可含 None）、json。"""
+    has_none = False
+    all_float = True
+    all_int = True
+    for value in values:
+        value_type = type(value)
+        if value is None:
+            has_none = True
+        elif value_type is float:
+            all_int = False
+        elif value_type is int:
+            all_float = False
+            if not -(2**63) <= value < 2**63:
+                return "json"
+        else:
+            return "json"
+    if all_float and not all_int:
+        return "f8n" if has_none else "f8"
+    if all_int and not all_float:
+        return "i8n" if has_none else "i8"
+    return "json"
+
+
+def _encode_column(kind: str, values: list[Any]) -> bytes:
+    if kind == "f8":
+        return np.asarray(values, dtype=np.float64).tobytes()
+    if kind == "i8":
+        return np.asarray(values, dtype=np.int64).tobytes()
+    if kind in ("f8n", "i8n"):
+        mask = np.fromiter((value is None for value in values), dtype=np.bool_, count=len(values))
+        fill = 0.0 if kind == "f8n" else 0
+        data = np.asarray([fill if value is None else value for value in values], dtype=np.float64 if kind == "f8n" else np.int64)
+        return data.tobytes() + mask.tobytes()
+    return json.dumps(values, ensure_ascii=False, allow_nan=True).encode("utf-8")
+
+
+def _decode_column(kind: str, buffer: memoryview, count: int) -> list[Any]:
+    if kind == "f8":
+        return np.frombuffer(buffer, dtype=np.float64, count=count).tolist()
+    if kind == "i8":
+        return np.frombuffer(buffer, dtype=np.int64, count=count).tolist()
+    if kind in ("f8n", "i8n"):
+        dtype = np.float64 if kind == "f8n" else np.int64
+        values = np.frombuffer(buffer, dtype=dtype, count=count).tolist()
+        mask = np.frombuffer(buffer, dtype=np.bool_, count=count, offset=count * 8)
+        for index in np.flatnonzero(mask).tolist():
+            values[index] = None
+        return values
+    if kind == "json":
+        return json.loads(bytes(buffer).decode("utf-8"))
+    raise CacheCodecError(f"unknown column kind {kind!r}")
+
+
+def _records_fields(value: Any) -> tuple[str, ...] | None:
+    """返回同构记录列表的字段元组；不满足列式编码条件时返回 None。"""
+    if type(value) is not list or not value:
+        return None
+    first = value[0]
+    if type(first) is not dict:
+        return None
+    fields = tuple(first)
+    if not all(type(field) is str for field in fields):
+        return None
+    for record in value:
+        if type(record) is not dict or tuple(record) != fields:
+            return None
+        for item in record.values():
+            if type(item) not in _SCALAR_TYPES:
+                return None
+    return fields
+
+
+def _encode_records(records: list[dict[str, Any]], fields: tuple[str, ...]) -> bytes:
+    columns = [[record[field] for record in records] for field in fields]
+    kinds = [_column_kind(column) for column in columns]
+    buffers = [_encode_column(kind, column) for kind, column in zip(kinds, columns)]
+    meta = json.dumps(
+        {"n": len(records), "fields": [[field, kind, len(buffer)] for field, kind, buffer in zip(fields, kinds, buffers)]},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    return _META_LEN.pack(len(meta)) + meta + b"".join(buffers)
+
+
+def _decode_records(body: bytes) -> list[dict[str, Any]]:
+    (meta_len,) = _META_LEN.unpack_from(body, 0)
+    offset = _META_LEN.size
+    meta = json.loads(body[offset : offset + meta_len].decode("utf-8"))
+    offset += meta_len
+    count = int(meta["n"])
+    view = memoryview(body)
+    names: list[str] = []
+    columns: list[list[Any]] = []
+    if count == 0:
+        return []
+    for name, kind, length in meta["fields"]:
+        if offset + length > len(body):
+            raise CacheCodecError("truncated columnar payload")
+        names.append(name)
+        columns.append(_decode_column(kind, view[offset : offset + length], count))
+        offset += length
+    if len(set(names)) != len(names):
+        raise CacheCodecError("duplicate field names in columnar payload")
+    # 按列填充预建的空 dict: 无代码生成, 比逐行 dict(zip(names, row)) 快约一倍
+    records: list[dict[str, Any]] = [{} for _ in range(count)]
+    for name, column in zip(names, columns):
+        for record, item in zip(records, column):
+            record[name] = item
+    return records
+
+
+# ---------------------------------------------------------------------------
+# 公共接口
+# ---------------------------------------------------------------------------
+
+
+def encode_value(value: Any, *, compression: int | None = None) -> bytes:
+    """把缓存值编码为带版本头的字节串。"""
+    fields = _records_fields(value)
+    if fields is not None:
+        layout = LAYOUT_RECORDS
+        body = _encode_records(value, fields)
+    else:
+        layout = LAYOUT_PICKLE
+        body = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    compression = _default_compression() if compression is None else compression
+    if len(body) < _COMPRESS_MIN_BYTES:
+        compression = COMPRESSION_NONE
+    if compression == COMPRESSION_ZSTD and ZSTD_AVAILABLE:
+        body = _zstd_compress(body)
+    elif compression in (COMPRESSION_ZSTD, COMPRESSION_ZLIB):
+        compression = COMPRESSION_ZLIB
+        body = zlib.compress(body, 1)
+    else:
+        compression = COMPRESSION_NONE
+    return _HEADER.pack(CODEC_MAGIC, CODEC_VERSION, layout, compression) + body
+
+
+def decode_value(data: bytes) -> Any:
+    """解码 ``encode_value`` 的输出；不带 MAGIC 的旧条目按 pickle 读取。
+
+    Raises:
+        CacheCodecError: 头部合法但负载无法解码
+        Exception: 旧 pickle 条目损坏时 pickle 抛出的原始异常
+    """
+    data = bytes(data)
+    if not data.startswith(CODEC_MAGIC):
+        return pickle.loads(data)
+    if len(data) < _HEADER.size:
+        raise CacheCodecError("truncated codec header")
+    _, version, layout, compression = _HEADER.unpack_from(data, 0)
+    if version != CODEC_VERSION:
+        raise CacheCodecError(f"unsupported codec version {version}")
+    body = data[_HEADER.size :]
+    try:
+        if compression == COMPRESSION_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise CacheCodecError("zstd-compressed entry but zstandard is not installed")
+            body = _zstd_decompress(body)
+        elif compression == COMPRESSION_ZLIB:
+            body = zlib.decompress(body)
+        elif compression != COMPRESSION_NONE:
+            raise CacheCodecError(f"unknown compression id {compression}")
+
+        if layout == LAYOUT_RECORDS:
+            return _decode_records(body)
+        if layout == LAYOUT_PICKLE:
+            return pickle.loads(body)
+    except CacheCodecError:
+        raise
+    except Exception as exc:
+        raise CacheCodecError(f"corrupt cache payload: {exc}") from exc
+    raise CacheCodecError(f"unknown layout id {layout}")
@@ -65,6 +65,14 @@ def _execute_preheat_task(task_id: str, trade_date: str, force: bool) -> dict:
         return {"task": task_id, "status": "failed", "elapsed": round(elapsed, 2), "error": str(exc)}
 
 
+def _execute_preheat_task_in_bulk_lane(task_id: str, trade_date: str, force: bool) -> dict:
+    """预热属于批量刷新：在 bulk 通道执行，交互式 CLI 调用优先拿 Tushare 配额。"""
+    from src.tools.tushare_client import TushareLane, tushare_lane
+
+    with tushare_lane(TushareLane.BULK):
+        return _execute_preheat_task(task_id, trade_date, force)
+
+
 def _fetch_task_data(task_id: str, trade_date: str, force: bool) -> pd.DataFrame | None:
     """实际拉取数据并写入缓存。
 
@@ -265,7 +273,7 @@ def preheat_cache(
 
     # 并发执行
     with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        futures = {executor.submit(_execute_preheat_task, tid, trade_date, force): tid for tid in selected_tasks}
+        futures = {executor.submit(_execute_preheat_task_in_bulk_lane, tid, trade_date, force): tid for tid in selected_tasks}
 
         for future in as_completed(futures):
             try:
@@ -6,13 +6,19 @@
 
 import logging
 import os
-import pickle
 import sqlite3
+import sys
 import threading
 import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Any
 
+from src.data.cache_codec import decode_value, encode_value
+from src.utils.env_helpers import get_env_int
+
 try:
     import redis
 
@@ -23,28 +29,113 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# 字节估算时容器最多抽样的元素数：价格列表动辄上千条，逐条 getsizeof 本身就会
+# 成为热点；抽样后按长度外推即可满足“近似字节预算”的精度要求。
+_SIZE_SAMPLE_LIMIT = 16
+_SIZE_MAX_DEPTH = 4
+
+
+def estimate_value_bytes(value: Any, _depth: int = 0) -> int:
+    """近似估算缓存值的常驻内存字节数。
+
+    不追求精确（共享对象会被重复计入），只需让 ``LRUCache`` 的字节预算
+    与真实占用处于同一数量级。DataFrame/ndarray 走各自的 nbytes 统计；
+    list/tuple/dict 抽样前 ``_SIZE_SAMPLE_LIMIT`` 个元素后按长度外推。
+    """
+    try:
+        if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+            return sys.getsizeof(value)
+        memory_usage = getattr(value, "memory_usage", None)
+        if callable(memory_usage):
+            # pandas DataFrame / Series
+            usage = memory_usage(deep=True)
+            total = getattr(usage, "sum", None)
+            return int(total() if callable(total) else usage)
+        nbytes = getattr(value, "nbytes", None)
+        if isinstance(nbytes, int):
+            # numpy ndarray
+            return max(sys.getsizeof(value), nbytes)
+        size = sys.getsizeof(value)
+        if _depth >= _SIZE_MAX_DEPTH:
+            return size
+        if isinstance(value, dict):
+            items = list(islice(value.items(), _SIZE_SAMPLE_LIMIT))
+            if not items:
+                return size
+            sampled = sum(estimate_value_bytes(k, _depth + 1) + estimate_value_bytes(v, _depth + 1) for k, v in items)
+            return size + sampled * len(value) // len(items)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            items = list(islice(value, _SIZE_SAMPLE_LIMIT))
+            if not items:
+                return size
+            sampled = sum(estimate_value_bytes(item, _depth + 1) for item in items)
+            return size + sampled * len(value) // len(items)
+        attrs = getattr(value, "__dict__", None)
+        if isinstance(attrs, dict):
+            # pydantic 模型 / 普通对象：按实例字段估算
+            return size + estimate_value_bytes(attrs, _depth + 1)
+        return size
+    except Exception as exc:
+        logger.debug("estimate_value_bytes fallback for %s: %s", type(value).__name__, exc)
+        return sys.getsizeof(value)
+
+
+# fork 安全: 子进程不能沿用父进程的 sqlite 连接 / Redis socket (SQLite 明确禁止跨
+# fork 使用同一连接, 共享 socket 会交错回包), 父进程其他线程持有的锁在子进程里也
+# 永远不会释放。各缓存实例登记于此, 由 os.register_at_fork 的 after_in_child
+# 钩子统一丢弃继承的句柄并换新锁; 首次使用时惰性重连。LRU 中的数据本身是普通
+# 内存对象, 写时复制继承即可。
+_fork_reset_targets: weakref.WeakSet = weakref.WeakSet()
+# 子进程里被丢弃的旧连接对象: 保持引用, 避免 GC 触发 sqlite3_close (关闭时可能
+# checkpoint / 删除父进程仍在使用的 WAL)
+_abandoned_after_fork: list[Any] = []
+
+
+def reset_cache_after_fork() -> None:
+    """子进程入口: 丢弃所有缓存实例从父进程继承的连接与锁。
+
+    已通过 ``os.register_at_fork(after_in_child=...)`` 注册, 任何 fork (包括
+    ``TrialExecutor`` 的 process 后端) 都会自动调用; 显式调用也是幂等的。
+    """
+    for target in list(_fork_reset_targets):
+        try:
+            target._reset_after_fork()
+        except Exception as exc:
+            logger.debug("cache reset after fork failed for %r: %s", target, exc)
+
+
 class LRUCache:
     """
     内存 LRU 缓存
 
-    使用 functools.lru_cache 实现热点数据快速访问
+    基于 ``OrderedDict`` 的 O(1) LRU：命中时 ``move_to_end``，淘汰时
+    ``popitem(last=False)``。容量同时受条目数 ``maxsize`` 与可选的近似字节
+    预算 ``max_bytes`` 约束——价格列表大小差异很大，仅按条目数限制要么浪费
+    内存要么频繁抖动。
 
     Thread-safe (R20.9 ALPHA): 所有读写通过 ``self._lock`` 保护。
     ``EnhancedCache`` 在多线程并发 ``get``/``set`` 时, disk hit 会回填 LRU
-    触发 ``_evict_lru()``, 其 ``min() + delete()`` 的非原子组合可能让
-    ``_cache`` 和 ``_access_time`` 不同步。加锁消除该竞争。
+    触发淘汰，加锁保证 ``_cache`` 与字节计数保持同步。
     """
 
-    def __init__(self, maxsize: int = 128):
+    def __init__(self, maxsize: int = 128, max_bytes: int | None = None):
         """
         初始化 LRU 缓存
 
         Args:
             maxsize: 最大缓存条目数
+            max_bytes: 近似字节预算；None 或 <=0 表示不限制
         """
         self.maxsize = maxsize
-        self._cache: dict[str, Any] = {}
-        self._access_time: dict[str, datetime] = {}
+        self.max_bytes = max_bytes if max_bytes and max_bytes > 0 else None
+        # key -> (value, estimated_bytes)；顺序即访问顺序，队首为最久未使用
+        self._cache: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._resident_bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        _fork_reset_targets.add(self)
+
+    def _reset_after_fork(self) -> None:
         self._lock = threading.Lock()
 
     # Sentinel for cache miss — distinguishes "key not present" from "cached None".
@@ -64,27 +155,62 @@ class LRUCache:
             缓存值, _sentinel on miss, or None on miss (default)
         """
         with self._lock:
-            if key in self._cache:
-                # 更新访问时间
-                self._access_time[key] = datetime.now()
-                return self._cache[key]
-            return _sentinel
+            entry = self._cache.get(key)
+            if entry is None:
+                return _sentinel
+            self._cache.move_to_end(key)
+            return entry[0]
 
     def set(self, key: str, value: Any):
         """
         设置缓存值
 
+        单个值超过字节预算时不进入内存层（仍由 Redis/Disk 层保存），
+        避免为一个超大值清空整个 LRU。
+
         Args:
             key: 缓存键
             value: 缓存值
         """
+        size = estimate_value_bytes(value)
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._resident_bytes -= previous[1]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._cache[key] = (value, size)
+            self._resident_bytes += size
+            self._evict_lru()
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        批量获取缓存值（单次加锁）
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            仅包含命中键的 {key: value} 字典
+        """
+        found: dict[str, Any] = {}
         with self._lock:
-            # 如果缓存已满，淘汰最久未使用的
-            if len(self._cache) >= self.maxsize and key not in self._cache:
-                self._evict_lru()
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = entry[0]
+        return found
+
+    def set_many(self, items: dict[str, Any]):
+        """
+        批量设置缓存值
 
-            self._cache[key] = value
-            self._access_time[key] = datetime.now()
+        Args:
+            items: {key: value} 字典
+        """
+        for key, value in items.items():
+            self.set(key, value)
 
     def delete(self, key: str):
         """
@@ -94,30 +220,37 @@ class LRUCache:
             key: 缓存键
         """
         with self._lock:
-            self._cache.pop(key, None)
-            self._access_time.pop(key, None)
+            entry = self._cache.pop(key, None)
+            if entry is not None:
+                self._resident_bytes -= entry[1]
 
     def clear(self):
         """清空缓存"""
         with self._lock:
             self._cache.clear()
-            self._access_time.clear()
+            self._resident_bytes = 0
 
     def _evict_lru(self):
-        """淘汰最久未使用的条目（调用方必须持有 self._lock）"""
-        if not self._access_time:
-            return
-
-        # 找到最久未使用的键
-        lru_key = min(self._access_time, key=self._access_time.get)
-        self._cache.pop(lru_key, None)
-        self._access_time.pop(lru_key, None)
+        """淘汰最久未使用的条目直至满足条目数与字节预算（调用方必须持有 self._lock）"""
+        while self._cache and (len(self._cache) > self.maxsize or (self.max_bytes is not None and self._resident_bytes > self.max_bytes)):
+            _, (_, size) = self._cache.popitem(last=False)
+            self._resident_bytes -= size
+            self._evictions += 1
 
     def keys(self) -> list[str]:
         """获取所有缓存键"""
         with self._lock:
             return list(self._cache.keys())
 
+    def get_stats(self) -> dict[str, int]:
+        """返回内存层统计：条目数、近似常驻字节、累计淘汰次数。"""
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "resident_bytes": self._resident_bytes,
+                "evictions": self._evictions,
+            }
+
 
 class RedisCache:
     """
@@ -140,6 +273,7 @@ class RedisCache:
         self.default_ttl = default_ttl
         self._available = False
         self._client = None
+        _fork_reset_targets.add(self)
 
         if not REDIS_AVAILABLE:
             logger.warning("Redis not available, install with: pip install redis")
@@ -153,6 +287,12 @@ class RedisCache:
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}")
 
+    def _reset_after_fork(self) -> None:
+        """丢弃继承的连接池 socket (不关闭, 父进程仍在用), 子进程按需新建连接。"""
+        pool = getattr(self._client, "connection_pool", None)
+        if pool is not None:
+            pool.reset()
+
     def is_available(self) -> bool:
         """
         检查 Redis 是否可用
@@ -196,7 +336,7 @@ class RedisCache:
             data = self._client.get(self._make_key(key))
             if data is None:
                 return _sentinel
-            return pickle.loads(data)
+            return decode_value(data)
         except Exception as e:
             logger.warning(f"Redis get error: {e}")
             return _sentinel
@@ -214,11 +354,57 @@ class RedisCache:
             return
         try:
             ttl_seconds = self.default_ttl if ttl is None else ttl
-            data = pickle.dumps(value)
+            data = encode_value(value)
             self._client.setex(self._make_key(key), timedelta(seconds=ttl_seconds), data)
         except Exception as e:
             logger.warning(f"Redis set error: {e}")
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        批量获取缓存值（单次 MGET 往返）
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            仅包含命中键的 {key: value} 字典
+        """
+        if not self.is_available() or not keys:
+            return {}
+        try:
+            payloads = self._client.mget([self._make_key(key) for key in keys])
+        except Exception as e:
+            logger.warning(f"Redis mget error: {e}")
+            return {}
+        found: dict[str, Any] = {}
+        for key, data in zip(keys, payloads):
+            if data is None:
+                continue
+            try:
+                found[key] = decode_value(data)
+            except Exception as e:
+                logger.debug(f"Redis get_many: undecodable value for key={key!r}: {e}")
+        return found
+
+    def set_many(self, items: dict[str, Any], ttl: int | None = None):
+        """
+        批量设置缓存值（非事务 pipeline，单次往返）
+
+        Args:
+            items: {key: value} 字典
+            ttl: 过期时间（秒）
+        """
+        if not self.is_available() or not items:
+            return
+        try:
+            expires = timedelta(seconds=self.default_ttl if ttl is None else ttl)
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(self._make_key(key), expires, encode_value(value))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis set_many error: {e}")
+
     def delete(self, key: str):
         """
         删除缓存值
@@ -287,6 +473,7 @@ class DiskCache:
         self._conn: sqlite3.Connection | None = None
         self._conn_lock = threading.RLock()
         self._journal_mode: str | None = None
+        _fork_reset_targets.add(self)
         try:
             os.makedirs(os.path.dirname(self._path), exist_ok=True)
             self._conn = self._open_connection()
@@ -390,6 +577,14 @@ class DiskCache:
                 self._conn = None
                 return None
 
+    def _reset_after_fork(self) -> None:
+        """丢弃继承的连接 (不 close), 下次访问时由 ``_ensure_conn`` 重新打开。"""
+        self._conn_lock = threading.RLock()
+        if self._conn is not None:
+            _abandoned_after_fork.append(self._conn)
+            self._conn = None
+        self._last_alive_check = 0.0
+
     def _get_conn(self):
         """获取底层 sqlite 连接。
 
@@ -443,6 +638,9 @@ class DiskCache:
     # Sentinel for cache miss — distinguishes "key not present" from "cached None".
     _MISSING = object()
 
+    # get_many 每条 IN 查询的键数上限（低于 SQLite 旧版本 999 个绑定参数限制）
+    _BATCH_CHUNK_SIZE = 500
+
     def get(self, key: str, *, _sentinel: Any = None) -> Any | None:
         """
         获取缓存值
@@ -500,9 +698,9 @@ class DiskCache:
                 return _sentinel
 
             try:
-                return pickle.loads(value)
+                return decode_value(value)
             except Exception as e:
-                # BLOB 被截断/污染，pickle 反序列化失败 → 清理脏行避免重复报错
+                # BLOB 被截断/污染，解码（codec 或旧 pickle）失败 → 清理脏行避免重复报错
                 logger.debug(f"Disk cache get: unpicklable value for key={key!r}, purging corrupted row: {e}")
                 try:
                     conn.execute("DELETE FROM cache WHERE key = ?", (key,))
@@ -528,11 +726,97 @@ class DiskCache:
             try:
                 ttl_seconds = self.default_ttl if ttl is None else ttl
                 expires_at = 0 if ttl_seconds == 0 else self._now_ts() + ttl_seconds
-                data = pickle.dumps(value)
+                data = encode_value(value)
                 conn.execute("INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)", (key, data, expires_at))
             except Exception as e:
                 logger.warning(f"Disk cache set error: {e}")
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        批量获取缓存值
+
+        每 ``_BATCH_CHUNK_SIZE`` 个键一条 ``SELECT ... WHERE key IN (...)``，
+        3000 只股票的预取只需少量往返。过期/NULL/损坏行的清理语义与 ``get`` 一致。
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            仅包含命中键的 {key: value} 字典
+        """
+        if not self.is_available() or not keys:
+            return {}
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, Any] = {}
+        with self._conn_lock:
+            conn = self._ensure_conn()
+            if conn is None:
+                return {}
+            now_ts = self._now_ts()
+            expired: list[str] = []
+            corrupted: list[str] = []
+            for start in range(0, len(unique_keys), self._BATCH_CHUNK_SIZE):
+                chunk = unique_keys[start : start + self._BATCH_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                try:
+                    rows = conn.execute(f"SELECT key, value, expires_at FROM cache WHERE key IN ({placeholders})", chunk).fetchall()
+                except Exception as e:
+                    logger.warning(f"Disk cache get_many error: {e}")
+                    return found
+                for key, value, expires_at in rows:
+                    if expires_at and expires_at < now_ts:
+                        expired.append(key)
+                        continue
+                    if value is None:
+                        corrupted.append(key)
+                        continue
+                    try:
+                        found[key] = decode_value(value)
+                    except Exception as e:
+                        logger.debug(f"Disk cache get_many: unpicklable value for key={key!r}, purging corrupted row: {e}")
+                        corrupted.append(key)
+            # 条件 DELETE 与 get 的 R20.32 语义一致：只清理仍处于过期状态的记录
+            try:
+                if expired:
+                    conn.executemany("DELETE FROM cache WHERE key = ? AND expires_at <= ?", [(key, now_ts) for key in expired])
+                if corrupted:
+                    conn.executemany("DELETE FROM cache WHERE key = ?", [(key,) for key in corrupted])
+            except Exception as cleanup_err:
+                logger.debug(f"Disk cache get_many cleanup error (non-fatal): {cleanup_err}")
+        return found
+
+    def set_many(self, items: dict[str, Any], ttl: int | None = None):
+        """
+        批量设置缓存值（单个事务）
+
+        Args:
+            items: {key: value} 字典
+            ttl: 过期时间（秒）
+        """
+        if not self.is_available() or not items:
+            return
+        with self._conn_lock:
+            conn = self._ensure_conn()
+            if conn is None:
+                return
+            try:
+                ttl_seconds = self.default_ttl if ttl is None else ttl
+                expires_at = 0 if ttl_seconds == 0 else self._now_ts() + ttl_seconds
+                rows = [(key, encode_value(value), expires_at) for key, value in items.items()]
+            except Exception as e:
+                logger.warning(f"Disk cache set_many error: {e}")
+                return
+            try:
+                conn.execute("BEGIN")
+                conn.executemany("INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)", rows)
+                conn.execute("COMMIT")
+            except Exception as e:
+                logger.warning(f"Disk cache set_many error: {e}")
+                try:
+                    conn.execute("ROLLBACK")
+                except Exception as rollback_err:
+                    logger.debug(f"Disk cache set_many rollback error (non-fatal): {rollback_err}")
+
     def delete(self, key: str):
         """
         删除缓存值
@@ -609,7 +893,15 @@ class EnhancedCache:
     3. 写入时同时更新两级缓存
     """
 
-    def __init__(self, lru_size: int = 128, redis_host: str = "localhost", redis_port: int = 6379, redis_ttl: int = 3600, disk_path: str | None = None):
+    def __init__(
+        self,
+        lru_size: int = 128,
+        redis_host: str = "localhost",
+        redis_port: int = 6379,
+        redis_ttl: int = 3600,
+        disk_path: str | None = None,
+        lru_max_bytes: int | None = None,
+    ):
         """
         初始化增强缓存
 
@@ -619,14 +911,24 @@ class EnhancedCache:
             redis_port: Redis 端口
             redis_ttl: Redis 默认过期时间
             disk_path: 磁盘缓存路径
+            lru_max_bytes: LRU 近似字节预算；None 时读取环境变量
+                ``ENHANCED_CACHE_LRU_MAX_BYTES``（未设置或 0 表示不限制）
         """
-        self.lru = LRUCache(maxsize=lru_size)
+        if lru_max_bytes is None:
+            lru_max_bytes = get_env_int("ENHANCED_CACHE_LRU_MAX_BYTES", 0)
+        self.lru = LRUCache(maxsize=lru_size, max_bytes=lru_max_bytes)
         self.redis = RedisCache(host=redis_host, port=redis_port, default_ttl=redis_ttl)
         self.disk = DiskCache(path=disk_path, default_ttl=redis_ttl)
 
         # 统计信息
         # R20.8 BETA: 多线程并发 get/set 时计数器用 _bump_stat 加锁以保证原子性。
-        self._stats = {"lru_hits": 0, "redis_hits": 0, "disk_hits": 0, "misses": 0, "sets": 0}
+        # prime_*: 预热 (get_many(prime=True)) 单独计数, 不计入命中率
+        self._stats = {"lru_hits": 0, "redis_hits": 0, "disk_hits": 0, "misses": 0, "sets": 0, "prime_lookups": 0, "prime_loaded": 0}
+        self._stats_lock = threading.Lock()
+        _fork_reset_targets.add(self)
+
+    def _reset_after_fork(self) -> None:
+        # 各层自行登记重置; 这里只换统计锁
         self._stats_lock = threading.Lock()
 
     def _bump_stat(self, key: str, delta: int = 1) -> None:
@@ -691,6 +993,71 @@ class EnhancedCache:
         self.disk.set(key, value, ttl)
         self._bump_stat("sets")
 
+    def get_many(self, keys: list[str], *, prime: bool = False) -> dict[str, Any]:
+        """
+        批量获取缓存值
+
+        查询顺序与 ``get`` 相同（LRU -> Redis -> Disk），但每层只对上一层
+        未命中的键发起一次批量请求，下层命中后批量回填上层。
+
+        Args:
+            keys: 缓存键列表
+            prime: 预热模式 — 只把下层数据装进 LRU，不计入各层命中 / miss，
+                改记 ``prime_lookups`` / ``prime_loaded``。随后的正常读取才是
+                真正的请求，避免同一个键被统计两次而扭曲命中率。
+
+        Returns:
+            仅包含命中键的 {key: value} 字典；未命中的键不出现在结果中
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found = self.lru.get_many(unique_keys)
+        if found and not prime:
+            self._bump_stat("lru_hits", len(found))
+
+        pending = [key for key in unique_keys if key not in found]
+        if pending:
+            redis_found = self.redis.get_many(pending)
+            if redis_found:
+                if not prime:
+                    self._bump_stat("redis_hits", len(redis_found))
+                self.lru.set_many(redis_found)
+                found.update(redis_found)
+                pending = [key for key in pending if key not in redis_found]
+
+        if pending:
+            disk_found = self.disk.get_many(pending)
+            if disk_found:
+                if not prime:
+                    self._bump_stat("disk_hits", len(disk_found))
+                self.redis.set_many(disk_found)
+                self.lru.set_many(disk_found)
+                found.update(disk_found)
+                pending = [key for key in pending if key not in disk_found]
+
+        if prime:
+            self._bump_stat("prime_lookups", len(unique_keys))
+            self._bump_stat("prime_loaded", len(found))
+        elif pending:
+            self._bump_stat("misses", len(pending))
+        return found
+
+    def set_many(self, items: dict[str, Any], ttl: int | None = None):
+        """
+        批量设置缓存值
+
+        同时写入 LRU、Redis（pipeline）和 Disk（单事务）
+
+        Args:
+            items: {key: value} 字典
+            ttl: 过期时间（秒）
+        """
+        if not items:
+            return
+        self.lru.set_many(items)
+        self.redis.set_many(items, ttl)
+        self.disk.set_many(items, ttl)
+        self._bump_stat("sets", len(items))
+
     def delete(self, key: str):
         """
         删除缓存值
@@ -718,7 +1085,8 @@ class EnhancedCache:
         获取缓存统计信息
 
         Returns:
-            统计字典，包含各层命中数、miss、set、total_hits、total_requests、hit_rate
+            统计字典，包含各层命中数、miss、set、total_hits、total_requests、hit_rate，
+            以及内存层的 lru_entries、lru_resident_bytes、lru_evictions
         """
         with self._stats_lock:
             snapshot = dict(self._stats)
@@ -726,11 +1094,16 @@ class EnhancedCache:
         total_requests = total_hits + snapshot["misses"]
         hit_rate = total_hits / total_requests if total_requests > 0 else 0.0
 
+        lru_stats = self.lru.get_stats()
+
         return {
             **snapshot,
             "total_hits": total_hits,
             "total_requests": total_requests,
             "hit_rate": round(hit_rate, 4),
+            "lru_entries": lru_stats["entries"],
+            "lru_resident_bytes": lru_stats["resident_bytes"],
+            "lru_evictions": lru_stats["evictions"],
         }
 
     def summary(self) -> dict[str, Any]:
@@ -801,6 +1174,43 @@ class CacheAdapter:
             return f"{prefix}:{provider}:{identifier}"
         return f"{prefix}:{identifier}"
 
+    # 各前缀的默认过期时间（秒），与对应的 set_* 方法保持一致
+    _PREFIX_TTLS = {
+        "prices": 86400,
+        "metrics": 604800,
+        "line_items": 604800,
+        "insider": 86400,
+        "news": 10800,
+    }
+
+    def get_many(self, prefix: str, identifiers: list[str], provider: str = "", *, prime: bool = False) -> dict[str, Any]:
+        """批量获取同一前缀下的多条数据
+
+        Args:
+            prefix: 缓存前缀（如 "prices", "metrics"）
+            identifiers: 标识符列表（ticker 或复合缓存键）
+            provider: 数据源（如 "akshare", "tushare"）
+            prime: 预热模式，统计单独计数（见 ``EnhancedCache.get_many``）
+
+        Returns:
+            {identifier: data}，仅包含命中项
+        """
+        key_map = {self._make_key(prefix, identifier, provider): identifier for identifier in identifiers}
+        found = self._cache.get_many(list(key_map), prime=prime)
+        return {key_map[key]: value for key, value in found.items()}
+
+    def set_many(self, prefix: str, items: dict[str, Any], provider: str = "", ttl: int | None = None):
+        """批量写入同一前缀下的多条数据
+
+        Args:
+            prefix: 缓存前缀（如 "prices", "metrics"）
+            items: {identifier: data}
+            provider: 数据源（如 "akshare", "tushare"）
+            ttl: 过期时间（秒），为空时使用该前缀的默认值
+        """
+        ttl_seconds = self._PREFIX_TTLS.get(prefix) if ttl is None else ttl
+        self._cache.set_many({self._make_key(prefix, identifier, provider): data for identifier, data in items.items()}, ttl=ttl_seconds)
+
     def get_prices(self, ticker: str, provider: str = "") -> list[dict] | None:
         """获取价格数据
 
@@ -913,6 +1323,16 @@ _cache_adapter: CacheAdapter | None = None
 _singleton_lock = threading.Lock()
 
 
+def _reset_module_after_fork() -> None:
+    global _singleton_lock
+    _singleton_lock = threading.Lock()
+    reset_cache_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_module_after_fork)
+
+
 def get_enhanced_cache() -> EnhancedCache:
     """获取全局增强缓存实例（线程安全）"""
     global _enhanced_cache
@@ -976,6 +1396,7 @@ def get_cache_runtime_info() -> dict[str, Any]:
     cache = get_enhanced_cache()
     return {
         "lru_maxsize": cache.lru.maxsize,
+        "lru_max_bytes": cache.lru.max_bytes,
         "redis_available": cache.redis.is_available(),
         "disk_available": cache.disk.is_available(),
         "disk_path": getattr(cache.disk, "_path", None),
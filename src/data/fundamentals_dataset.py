@@ -0,0 +1,266 @@
+"""运行级共享基本面数据集
+
+每个分析师 agent 以前各自调用 ``get_financial_metrics`` / ``search_line_items`` /
+``get_market_cap``：同一 ticker 在一次运行里被十几个 agent 重复查缓存、反序列化
+``list[dict]`` 并重建 Pydantic 模型，只是字段列表和 limit 略有不同。
+
+本模块在图运行前按 (ticker, end_date) 只取一次数据：
+
+- 各 agent 在模块级声明 :class:`FundamentalsRequest` (period / limit / 字段);
+- :func:`build_fundamentals_dataset` 按 period 合并所有选中 agent 的需求
+  (limit 取最大、line item 字段取并集)，每个 ticker 各调用一次 api 函数;
+- 结果以只读 (frozen) 模型存入 ``state["data"]["fundamentals"]``，agent 通过
+  :func:`shared_fundamentals` 取得按自身请求裁剪后的视图 (前 ``limit`` 期、
+  仅含请求字段)。数据集缺失或未覆盖该请求时返回 None，agent 回退到直接调用。
+- 已声明请求的视图在构建时一次算好；数据集内部只存普通 dict / tuple，
+  构建后不再修改，随图状态 deepcopy / pickle 不受影响 (只读映射仅在访问时包装)。
+
+环境变量：
+    SHARED_FUNDAMENTALS_DATASET: 是否在运行前构建共享数据集（默认 true）
+    SHARED_FUNDAMENTALS_WORKERS: 按 ticker 并发预取的线程数（默认 4）
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any
+
+from pydantic import ConfigDict
+
+from src.data.models import FinancialMetrics, LineItem
+from src.utils.env_helpers import get_env_enabled, get_env_int
+
+logger = logging.getLogger(__name__)
+
+FUNDAMENTALS_STATE_KEY = "fundamentals"
+_LINE_ITEM_BASE_FIELDS = ("ticker", "report_period", "period", "currency")
+
+
+class SharedFinancialMetrics(FinancialMetrics):
+    """Read-only FinancialMetrics shared by every agent of a run."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class SharedLineItem(LineItem):
+    """Read-only LineItem shared by every agent of a run."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+@dataclass(frozen=True)
+class FundamentalsRequest:
+    """Fundamentals one agent reads per ticker (mirrors its api.py calls)."""
+
+    metrics_period: str | None = None
+    metrics_limit: int = 10
+    line_items: tuple[str, ...] = ()
+    line_items_period: str = "annual"
+    line_items_limit: int = 10
+    market_cap: bool = False
+
+
+@dataclass(frozen=True)
+class FundamentalsView:
+    """One agent's slice of a ticker's shared fundamentals."""
+
+    financial_metrics: list[FinancialMetrics]
+    line_items: list[LineItem]
+    market_cap: float | None
+
+
+def _freeze_metrics(records: Iterable[FinancialMetrics]) -> tuple[SharedFinancialMetrics, ...]:
+    return tuple(SharedFinancialMetrics.model_construct(_fields_set=record.model_fields_set, **dict(record)) for record in records)
+
+
+def _project_line_item(record: LineItem, fields: Iterable[str]) -> SharedLineItem:
+    values = dict(record)
+    projected = {name: values[name] for name in _LINE_ITEM_BASE_FIELDS if name in values}
+    projected.update({name: values[name] for name in fields if name in values})
+    return SharedLineItem.model_construct(**projected)
+
+
+@dataclass(frozen=True)
+class TickerFundamentals:
+    """Union of the fundamentals every selected agent needs for one ticker."""
+
+    ticker: str
+    end_date: str
+    financial_metrics: Mapping[str, tuple[SharedFinancialMetrics, ...]]
+    metrics_limits: Mapping[str, int]
+    line_items: Mapping[str, tuple[SharedLineItem, ...]]
+    line_item_fields: Mapping[str, frozenset[str]]
+    line_item_limits: Mapping[str, int]
+    market_cap: float | None = None
+    has_market_cap: bool = False
+    # 构建时为已声明的请求预先算好的视图；之后只读
+    views: Mapping[FundamentalsRequest, FundamentalsView] = field(default_factory=dict, repr=False, compare=False)
+
+    def covers(self, request: FundamentalsRequest) -> bool:
+        if request.metrics_period is not None and self.metrics_limits.get(request.metrics_period, 0) < request.metrics_limit:
+            return False
+        if request.line_items:
+            if self.line_item_limits.get(request.line_items_period, 0) < request.line_items_limit:
+                return False
+            if not self.line_item_fields.get(request.line_items_period, frozenset()).issuperset(request.line_items):
+                return False
+        return self.has_market_cap or not request.market_cap
+
+    def view(self, request: FundamentalsRequest) -> FundamentalsView | None:
+        """Slice for *request*, or None when the dataset was not built for it."""
+        prebuilt = self.views.get(request)
+        if prebuilt is not None:
+            return prebuilt
+        if not self.covers(request):
+            return None
+        return self._build_view(request)
+
+    def _build_view(self, request: FundamentalsRequest) -> FundamentalsView:
+        metrics: list[FinancialMetrics] = []
+        if request.metrics_period is not None:
+            metrics = list(self.financial_metrics[request.metrics_period][: request.metrics_limit])
+        line_items: list[LineItem] = []
+        if request.line_items:
+            records = self.line_items[request.line_items_period][: request.line_items_limit]
+            line_items = [_project_line_item(record, request.line_items) for record in records]
+        return FundamentalsView(financial_metrics=metrics, line_items=line_items, market_cap=self.market_cap if request.market_cap else None)
+
+    def with_views(self, requests: Iterable[FundamentalsRequest]) -> TickerFundamentals:
+        """Copy with the views of the covered *requests* prebuilt."""
+        return replace(self, views={request: self._build_view(request) for request in dict.fromkeys(requests) if self.covers(request)})
+
+
+@dataclass(frozen=True)
+class FundamentalsDataset:
+    """Per-run, read-only fundamentals keyed by ticker for one end_date.
+
+    Holds a plain dict so the dataset deep-copies and pickles with the graph
+    state; :attr:`tickers` wraps it read-only on access.
+    """
+
+    end_date: str
+    by_ticker: dict[str, TickerFundamentals] = field(default_factory=dict)
+
+    @property
+    def tickers(self) -> Mapping[str, TickerFundamentals]:
+        return MappingProxyType(self.by_ticker)
+
+    def get(self, ticker: str) -> TickerFundamentals | None:
+        return self.by_ticker.get(ticker)
+
+
+@dataclass
+class _MergedRequest:
+    metrics_limits: dict[str, int] = field(default_factory=dict)
+    line_item_limits: dict[str, int] = field(default_factory=dict)
+    line_item_fields: dict[str, set[str]] = field(default_factory=dict)
+    market_cap: bool = False
+
+
+def merge_fundamentals_requests(requests: Iterable[FundamentalsRequest]) -> _MergedRequest:
+    merged = _MergedRequest()
+    for request in requests:
+        if request.metrics_period is not None:
+            period = request.metrics_period
+            merged.metrics_limits[period] = max(merged.metrics_limits.get(period, 0), request.metrics_limit)
+        if request.line_items:
+            period = request.line_items_period
+            merged.line_item_limits[period] = max(merged.line_item_limits.get(period, 0), request.line_items_limit)
+            merged.line_item_fields.setdefault(period, set()).update(request.line_items)
+        merged.market_cap = merged.market_cap or request.market_cap
+    return merged
+
+
+def _fetch_ticker_fundamentals(ticker: str, end_date: str, merged: _MergedRequest, api_key: str | None) -> TickerFundamentals:
+    # 延迟导入：src.tools.api 在导入时即初始化缓存
+    from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
+
+    metrics = {period: _freeze_metrics(get_financial_metrics(ticker, end_date, period=period, limit=limit, api_key=api_key)) for period, limit in merged.metrics_limits.items()}
+    line_items = {}
+    for period, limit in merged.line_item_limits.items():
+        fields = sorted(merged.line_item_fields[period])
+        line_items[period] = tuple(_project_line_item(record, fields) for record in search_line_items(ticker, fields, end_date, period=period, limit=limit, api_key=api_key))
+    market_cap = get_market_cap(ticker, end_date, api_key=api_key) if merged.market_cap else None
+    return TickerFundamentals(
+        ticker=ticker,
+        end_date=end_date,
+        financial_metrics=metrics,
+        metrics_limits=dict(merged.metrics_limits),
+        line_items=line_items,
+        line_item_fields={period: frozenset(fields) for period, fields in merged.line_item_fields.items()},
+        line_item_limits=dict(merged.line_item_limits),
+        market_cap=market_cap,
+        has_market_cap=merged.market_cap,
+    )
+
+
+def shared_fundamentals_enabled() -> bool:
+    return get_env_enabled("SHARED_FUNDAMENTALS_DATASET")
+
+
+def _resolve_workers(ticker_count: int) -> int:
+    return max(1, min(get_env_int("SHARED_FUNDAMENTALS_WORKERS", 4), ticker_count))
+
+
+def build_fundamentals_dataset(
+    tickers: list[str],
+    end_date: str,
+    requests: Iterable[FundamentalsRequest],
+    api_key: str | None = None,
+) -> FundamentalsDataset | None:
+    """Fetch the merged fundamentals of *requests* once per ticker.
+
+    Returns None when disabled or when no request needs fundamentals. A
+    ticker whose fetch raises is left out so its agents fall back to the
+    direct api calls.
+    """
+    requests = list(requests)
+    merged = merge_fundamentals_requests(requests)
+    if not shared_fundamentals_enabled() or not tickers:
+        return None
+    if not (merged.metrics_limits or merged.line_item_limits or merged.market_cap):
+        return None
+
+    def _fetch(ticker: str) -> tuple[str, TickerFundamentals | None]:
+        try:
+            return ticker, _fetch_ticker_fundamentals(ticker, end_date, merged, api_key).with_views(requests)
+        except Exception as exc:
+            logger.warning("shared fundamentals prefetch failed for %s, agents fall back to direct calls: %s", ticker, exc)
+            return ticker, None
+
+    unique_tickers = list(dict.fromkeys(tickers))
+    with ThreadPoolExecutor(max_workers=_resolve_workers(len(unique_tickers)), thread_name_prefix="fundamentals") as executor:
+        results = dict(executor.map(_fetch, unique_tickers))
+    return FundamentalsDataset(
+        end_date=end_date,
+        by_ticker={ticker: fundamentals for ticker, fundamentals in results.items() if fundamentals is not None},
+    )
+
+
+def shared_fundamentals(state: Mapping[str, Any], ticker: str, request: FundamentalsRequest) -> FundamentalsView | None:
+    """The agent's view of the run dataset, or None to fetch directly."""
+    data = state.get("data") or {}
+    dataset = data.get(FUNDAMENTALS_STATE_KEY)
+    if not isinstance(dataset, FundamentalsDataset) or dataset.end_date != data.get("end_date"):
+        return None
+    fundamentals = dataset.get(ticker)
+    return fundamentals.view(request) if fundamentals is not None else None
+
+
+__all__ = [
+    "FUNDAMENTALS_STATE_KEY",
+    "FundamentalsDataset",
+    "FundamentalsRequest",
+    "FundamentalsView",
+    "SharedFinancialMetrics",
+    "SharedLineItem",
+    "TickerFundamentals",
+    "build_fundamentals_dataset",
+    "merge_fundamentals_requests",
+    "shared_fundamentals",
+    "shared_fundamentals_enabled",
+]
@@ -0,0 +1,353 @@
+"""
+交易日历 + 涨跌停索引
+
+回测和日常流程反复做三类查询：
+
+- ``iter_backtest_dates`` 每次回测都调 ``get_open_trade_dates``；
+- ``get_limit_state`` 每个模拟交易日调一次 ``get_limit_list`` 并从 DataFrame
+  重建涨停/跌停集合；
+- ``shift_business_days`` / 冷却登记表用 ``BDay`` 或 ``days * 1.5`` 近似交易日，
+  节假日附近会偏。
+
+``TradingIndex`` 把 SSE 开市日和每日涨跌停代码存成一张紧凑的 ``.npz`` 表
+（int32 日期 + 代码/标记数组），每个进程只加载一次：
+
+- 日历：开市日 → 位置 的字典，"是否开市" / "N 个交易日后" / "区间交易日数" 都是
+  O(1) 查表（非开市日多一次 ``searchsorted``）；
+- 涨跌停：交易日 → ``(frozenset 涨停, frozenset 跌停)``，命中后不再访问 Tushare 或
+  重建集合。
+
+只有数据源成功返回的结果才写入；当天及未来日期的涨跌停列表可能尚未收盘定稿，只留在
+内存，不落盘。``TRADING_INDEX_ENABLED=false`` 时所有调用方回退原有路径。
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import secrets
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.utils.env_helpers import get_env_enabled
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+DEFAULT_INDEX_DIR = Path("data/trading_index")
+_INDEX_FILE = "trading_index.npz"
+_LIMIT_UP = 1
+_LIMIT_DOWN = -1
+# 新增多少个交易日的涨跌停后落盘一次；其余在进程退出时写出
+_FLUSH_EVERY = 64
+# 最长的 A 股休市（春节/国庆连同周末）不超过 10 个自然日
+_UNPUBLISHED_GAP_DAYS = 14
+
+
+def trading_index_enabled() -> bool:
+    return get_env_enabled("TRADING_INDEX_ENABLED")
+
+
+def _resolve_index_dir() -> Path:
+    return Path(os.getenv("TRADING_INDEX_DIR", "").strip() or DEFAULT_INDEX_DIR)
+
+
+def _compact(value: str) -> int:
+    return int(str(value).replace("-", "")[:8])
+
+
+def _text(value: int) -> str:
+    return f"{int(value):08d}"
+
+
+def _span_days(start: int, end: int) -> int:
+    return (datetime.strptime(_text(end), "%Y%m%d") - datetime.strptime(_text(start), "%Y%m%d")).days
+
+
+def _normalize_code(ts_code: object) -> str:
+    return str(ts_code).split(".")[0].upper()
+
+
+class TradingIndex:
+    """进程内的日历 + 涨跌停索引，``path`` 为 ``None`` 时只在内存中维护。线程安全。"""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+        self._lock = threading.RLock()
+        # (开市日列表, 开市日 → 位置, 覆盖区间) 整体替换，读路径无需加锁
+        self._calendar: tuple[list[int], dict[int, int], tuple[int, int] | None] = ([], {}, None)
+        self._limits: dict[int, tuple[frozenset[str], frozenset[str]]] = {}
+        self._volatile_limit_dates: set[int] = set()
+        self._dirty = False
+        self._pending_limit_dates = 0
+        if path is not None:
+            self._load()
+
+    # ------------------------------------------------------------------
+    # 持久化
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        assert self._path is not None
+        if not self._path.exists():
+            return
+        try:
+            with np.load(self._path, allow_pickle=False) as data:
+                if int(data["version"]) != INDEX_FORMAT_VERSION:
+                    logger.info("trading index %s has format %s, rebuilding", self._path, int(data["version"]))
+                    return
+                cal_range = data["cal_range"].tolist()
+                self._set_calendar([int(value) for value in data["cal_dates"].tolist()], (cal_range[0], cal_range[1]) if cal_range else None)
+                offsets = data["limit_offsets"].tolist()
+                codes = data["limit_codes"].tolist()
+                flags = data["limit_flags"].tolist()
+                for index, trade_date in enumerate(data["limit_dates"].tolist()):
+                    start, end = offsets[index], offsets[index + 1]
+                    self._limits[int(trade_date)] = (
+                        frozenset(code for code, flag in zip(codes[start:end], flags[start:end]) if flag == _LIMIT_UP),
+                        frozenset(code for code, flag in zip(codes[start:end], flags[start:end]) if flag == _LIMIT_DOWN),
+                    )
+        except Exception as exc:  # noqa: BLE001 — 索引只是加速层，损坏时从数据源重建
+            logger.warning("trading index %s unreadable, rebuilding: %s", self._path, exc)
+            self._calendar, self._limits = ([], {}, None), {}
+
+    def flush(self) -> None:
+        """把未落盘的变更原子写出（临时文件 + ``os.replace``）。"""
+        with self._lock:
+            if self._path is None or not self._dirty:
+                return
+            open_dates, _, covered = self._calendar
+            limit_dates = sorted(date for date in self._limits if date not in self._volatile_limit_dates)
+            offsets = [0]
+            codes: list[str] = []
+            flags: list[int] = []
+            for trade_date in limit_dates:
+                limit_up, limit_down = self._limits[trade_date]
+                for code in sorted(limit_up):
+                    codes.append(code)
+                    flags.append(_LIMIT_UP)
+                for code in sorted(limit_down):
+                    codes.append(code)
+                    flags.append(_LIMIT_DOWN)
+                offsets.append(len(codes))
+            arrays = {
+                "version": np.asarray(INDEX_FORMAT_VERSION, dtype=np.int32),
+                "cal_dates": np.asarray(open_dates, dtype=np.int32),
+                "cal_range": np.asarray(covered or (), dtype=np.int32),
+                "limit_dates": np.asarray(limit_dates, dtype=np.int32),
+                "limit_offsets": np.asarray(offsets, dtype=np.int64),
+                "limit_codes": np.asarray(codes, dtype="<U12"),
+                "limit_flags": np.asarray(flags, dtype=np.int8),
+            }
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._path.with_name(f".{self._path.name}.{secrets.token_hex(4)}.tmp")
+            try:
+                with open(temp_path, "wb") as handle:
+                    np.savez(handle, **arrays)
+                os.replace(temp_path, self._path)
+            except OSError as exc:
+                logger.warning("trading index flush to %s failed: %s", self._path, exc)
+                temp_path.unlink(missing_ok=True)
+                return
+            self._dirty = False
+            self._pending_limit_dates = 0
+
+    # ------------------------------------------------------------------
+    # 交易日历
+    # ------------------------------------------------------------------
+
+    def _set_calendar(self, open_dates: Iterable[int], covered: tuple[int, int] | None) -> None:
+        ordered = sorted(set(open_dates))
+        self._calendar = (ordered, {trade_date: index for index, trade_date in enumerate(ordered)}, covered)
+
+    def covers(self, start_date: str, end_date: str) -> bool:
+        """``[start_date, end_date]`` 内每个自然日是否开市都已知。"""
+        covered = self._calendar[2]
+        return covered is not None and covered[0] <= _compact(start_date) and _compact(end_date) <= covered[1]
+
+    def record_calendar(self, start_date: str, end_date: str, open_dates: Iterable[str]) -> None:
+        """记录数据源返回的 ``[start_date, end_date]`` 开市日；与已有覆盖相交或相邻时合并。
+
+        请求区间末尾若有超过 ``_UNPUBLISHED_GAP_DAYS`` 个自然日没有开市日，视为
+        交易所尚未发布的日历，覆盖范围截到最后一个开市日，而不是记成长假。
+        """
+        start, end = _compact(start_date), _compact(end_date)
+        dates = {_compact(value) for value in open_dates if start <= _compact(value) <= end}
+        if not dates:
+            return
+        last_open = datetime.strptime(_text(max(dates)), "%Y%m%d")
+        if datetime.strptime(_text(end), "%Y%m%d") - last_open > timedelta(days=_UNPUBLISHED_GAP_DAYS):
+            end = max(dates)
+        with self._lock:
+            open_before, _, covered = self._calendar
+            day_before = _compact((datetime.strptime(_text(start), "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d"))
+            day_after = _compact((datetime.strptime(_text(end), "%Y%m%d") + timedelta(days=1)).strftime("%Y%m%d"))
+            if covered is None or covered[1] < day_before or day_after < covered[0]:
+                # 不相交的新区间替换旧区间：覆盖范围必须连续，"区间内没有即休市" 才成立
+                if covered is not None and _span_days(covered[0], covered[1]) > _span_days(start, end):
+                    return
+                self._set_calendar(dates, (start, end))
+            else:
+                kept = [value for value in open_before if not start <= value <= end]
+                self._set_calendar([*kept, *dates], (min(start, covered[0]), max(end, covered[1])))
+            self._dirty = True
+        self.flush()
+
+    def ensure_calendar(self, start_date: str, end_date: str, fetch: Callable[[str, str], list[str]]) -> bool:
+        """覆盖不足时用 ``fetch(start, end)``（YYYYMMDD）补齐，返回是否已覆盖。
+
+        缺口与已有覆盖合并成一次请求；``fetch`` 的异常原样抛出。
+        """
+        if self.covers(start_date, end_date):
+            return True
+        start, end = _compact(start_date), _compact(end_date)
+        covered = self._calendar[2]
+        if covered is not None:
+            start, end = min(start, covered[0]), max(end, covered[1])
+        self.record_calendar(_text(start), _text(end), fetch(_text(start), _text(end)))
+        return self.covers(start_date, end_date)
+
+    def is_open(self, trade_date: str) -> bool | None:
+        """开市返回 True，休市 False，未覆盖 None。"""
+        if not self.covers(trade_date, trade_date):
+            return None
+        return _compact(trade_date) in self._calendar[1]
+
+    def open_dates(self, start_date: str, end_date: str) -> list[str] | None:
+        """``[start_date, end_date]`` 内的开市日（YYYYMMDD）；未覆盖返回 None。"""
+        if not self.covers(start_date, end_date):
+            return None
+        dates = self._calendar[0]
+        lo = bisect_left(dates, _compact(start_date))
+        hi = bisect_right(dates, _compact(end_date))
+        return [_text(value) for value in dates[lo:hi]]
+
+    def shift_trading_days(self, trade_date: str, trading_days: int) -> str | None:
+        """``trade_date`` 之后第 ``trading_days`` 个开市日；结果超出覆盖范围时返回 None。
+
+        ``trading_days <= 0`` 时返回 ``trade_date`` 本身（与 ``BDay(0)`` 一致）。
+        """
+        if trading_days <= 0:
+            return str(trade_date).replace("-", "")
+        if not self.covers(trade_date, trade_date):
+            return None
+        dates, position, _ = self._calendar
+        value = _compact(trade_date)
+        base = position.get(value)
+        if base is None:
+            base = bisect_right(dates, value) - 1
+        target = base + trading_days
+        if target >= len(dates):
+            return None
+        return _text(dates[target])
+
+    def trading_days_between(self, start_date: str, end_date: str) -> int | None:
+        """``(start_date, end_date]`` 内的开市日数（``end < start`` 时为负）；未覆盖返回 None。"""
+        if not self.covers(min(start_date, end_date), max(start_date, end_date)):
+            return None
+        dates = self._calendar[0]
+        return bisect_right(dates, _compact(end_date)) - bisect_right(dates, _compact(start_date))
+
+    # ------------------------------------------------------------------
+    # 涨跌停
+    # ------------------------------------------------------------------
+
+    def limit_state(self, trade_date: str) -> tuple[frozenset[str], frozenset[str]] | None:
+        return self._limits.get(_compact(trade_date))
+
+    def record_limit_frame(self, trade_date: str, limit_df: pd.DataFrame | None) -> tuple[frozenset[str], frozenset[str]]:
+        """把 ``get_limit_list`` 的结果转成涨停/跌停代码集合并记录。"""
+        if limit_df is None or limit_df.empty:
+            state: tuple[frozenset[str], frozenset[str]] = (frozenset(), frozenset())
+        else:
+            flags = limit_df["limit"].to_numpy()
+            codes = limit_df["ts_code"].to_numpy()
+            state = (
+                frozenset(_normalize_code(code) for code in codes[flags == "U"]),
+                frozenset(_normalize_code(code) for code in codes[flags == "D"]),
+            )
+        key = _compact(trade_date)
+        should_flush = False
+        with self._lock:
+            self._limits[key] = state
+            if key >= _compact(datetime.now().strftime("%Y%m%d")):
+                self._volatile_limit_dates.add(key)
+            else:
+                self._volatile_limit_dates.discard(key)
+                self._dirty = True
+                self._pending_limit_dates += 1
+                should_flush = self._pending_limit_dates >= _FLUSH_EVERY
+        if should_flush:
+            self.flush()
+        return state
+
+    def get_limit_state(self, trade_date: str, fetch: Callable[[str], pd.DataFrame | None]) -> tuple[frozenset[str], frozenset[str]]:
+        """命中索引直接返回；否则 ``fetch(trade_date)``，成功的结果写入索引。
+
+        ``fetch`` 返回 None（数据源失败）时返回空集合且不记录，下次仍会重试。
+        """
+        cached = self.limit_state(trade_date)
+        if cached is not None:
+            return cached
+        limit_df = fetch(trade_date)
+        if limit_df is None:
+            return frozenset(), frozenset()
+        return self.record_limit_frame(trade_date, limit_df)
+
+
+_index: TradingIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_trading_index() -> TradingIndex | None:
+    """进程级单例；``TRADING_INDEX_ENABLED=false`` 时返回 None。
+
+    ``TRADING_INDEX_DIR`` 变化时（测试隔离）重新加载。
+    """
+    global _index
+    if not trading_index_enabled():
+        return None
+    path = _resolve_index_dir() / _INDEX_FILE
+    index = _index
+    if index is not None and index._path == path:
+        return index
+    with _index_lock:
+        if _index is None or _index._path != path:
+            if _index is not None:
+                _index.flush()
+            _index = TradingIndex(path)
+        return _index
+
+
+def reset_trading_index() -> None:
+    """丢弃进程内单例（先落盘），下次 ``get_trading_index`` 重新加载。"""
+    global _index
+    with _index_lock:
+        if _index is not None:
+            _index.flush()
+        _index = None
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    index = _index
+    if index is not None:
+        try:
+            index.flush()
+        except Exception:  # noqa: BLE001 — 进程退出时不因索引写盘失败报错
+            pass
+
+
+__all__ = [
+    "TradingIndex",
+    "get_trading_index",
+    "reset_trading_index",
+    "trading_index_enabled",
+]
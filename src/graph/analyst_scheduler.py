@@ -0,0 +1,201 @@
+"""Analyst 动态调度节点 — 有界 worker 池 + 按 provider 并发上限。
+
+``create_workflow`` 以前把选中的 analyst 按 ``concurrency_limit`` 切成固定批次，
+一批全部结束才开始下一批：批内一个慢 LLM agent 会拖住整批，即使 provider 还有
+空闲配额。本模块把所有选中的 analyst 放进一个调度节点：
+
+- 全局并发不超过执行计划的 ``effective_concurrency_limit``;
+- 每个 agent 归属执行计划为其分配的 provider (``agent_llm_overrides``)，同一
+  provider 同时运行的 agent 数不超过 ``provider_lane_limits``;
+- 任一 agent 结束即从待运行队列里挑第一个所属 provider 有空位的 agent 启动
+  (被占满的 provider 不阻塞其他 provider 的 agent);
+- 记录每个 agent 的排队时间与运行时间，写入 ``metadata["analyst_schedule"]``。
+
+每个 agent 拿到独立的 ``analyst_signals`` 字典，结束后按选中顺序合并，消息顺序
+与批次模式一致 (按选中顺序，而非完成顺序)。
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from src.graph.state import AgentState, merge_dicts
+
+logger = logging.getLogger(__name__)
+
+ANALYST_SCHEDULE_METADATA_KEY = "analyst_schedule"
+
+
+@dataclass(frozen=True)
+class AnalystTask:
+    node_name: str
+    func: Callable[[AgentState], dict[str, Any]]
+    provider: str
+
+
+@dataclass
+class AnalystTiming:
+    node_name: str
+    provider: str
+    queued_seconds: float = 0.0
+    run_seconds: float = 0.0
+    status: str = "pending"
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "queued_seconds": round(self.queued_seconds, 3),
+            "run_seconds": round(self.run_seconds, 3),
+            "status": self.status,
+        }
+
+
+def resolve_analyst_provider(state: AgentState, node_name: str) -> str:
+    metadata = state.get("metadata", {})
+    override = (metadata.get("agent_llm_overrides") or {}).get(node_name)
+    if isinstance(override, dict) and override.get("model_provider"):
+        return str(override["model_provider"])
+    return str(metadata.get("model_provider") or "default")
+
+
+def _isolated_state(state: AgentState) -> AgentState:
+    # 各 agent 原地写 state["data"]["analyst_signals"][agent_id]；给每个 agent 一份
+    # 独立的 signals 字典，避免共享可变状态，结束后再统一合并
+    return {**state, "data": {**state["data"], "analyst_signals": {}}}
+
+
+def run_analyst_pool(
+    state: AgentState,
+    tasks: list[AnalystTask],
+    *,
+    max_workers: int,
+    provider_limits: dict[str, int] | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> tuple[list[dict[str, Any]], dict[str, AnalystTiming]]:
+    """Run *tasks* as slots free up; return per-task results and timings.
+
+    Results are in task order. The first agent error stops scheduling new
+    agents and is re-raised once the running ones finish.
+    """
+    provider_limits = provider_limits or {}
+    max_workers = max(1, int(max_workers))
+    pending = deque(range(len(tasks)))
+    running: dict[Future, int] = {}
+    in_use: dict[str, int] = {}
+    results: list[dict[str, Any] | None] = [None] * len(tasks)
+    timings = {task.node_name: AnalystTiming(task.node_name, task.provider) for task in tasks}
+    submitted_at = clock()
+    first_error: BaseException | None = None
+
+    def _capacity(provider: str) -> int:
+        return max(1, int(provider_limits.get(provider, max_workers)))
+
+    def _run(index: int) -> dict[str, Any]:
+        task = tasks[index]
+        timing = timings[task.node_name]
+        started = clock()
+        timing.queued_seconds = started - submitted_at
+        timing.status = "running"
+        try:
+            return task.func(_isolated_state(state))
+        finally:
+            timing.run_seconds = clock() - started
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analyst") as executor:
+        while pending or running:
+            if first_error is None:
+                for index in list(pending):
+                    if len(running) >= max_workers:
+                        break
+                    provider = tasks[index].provider
+                    if in_use.get(provider, 0) >= _capacity(provider):
+                        continue
+                    pending.remove(index)
+                    in_use[provider] = in_use.get(provider, 0) + 1
+                    # worker 线程不继承 contextvars (progress run_id 等)，显式拷贝
+                    running[executor.submit(contextvars.copy_context().run, _run, index)] = index
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                task = tasks[index]
+                in_use[task.provider] -= 1
+                try:
+                    results[index] = future.result()
+                    timings[task.node_name].status = "done"
+                except BaseException as exc:
+                    timings[task.node_name].status = "failed"
+                    if first_error is None:
+                        first_error = exc
+
+    for index in pending:
+        timings[tasks[index].node_name].status = "skipped"
+    if first_error is not None:
+        raise first_error
+    return [result or {} for result in results], timings
+
+
+def merge_analyst_results(state: AgentState, results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Fold per-agent node outputs into one state update (task order)."""
+    messages: list = []
+    data: dict[str, Any] = {}
+    signals = dict(state["data"].get("analyst_signals") or {})
+    for result in results:
+        messages.extend(result.get("messages") or [])
+        result_data = dict(result.get("data") or {})
+        signals.update(result_data.pop("analyst_signals", None) or {})
+        data = merge_dicts(data, result_data)
+    data["analyst_signals"] = signals
+    return {"messages": messages, "data": data}
+
+
+def create_analyst_scheduler_node(analysts: list[tuple[str, Callable[[AgentState], dict[str, Any]]]], concurrency_limit: int):
+    """Graph node running *analysts* ``(node_name, func)`` through the pool.
+
+    Provider assignment and per-provider caps come from the run's execution
+    plan in ``state["metadata"]`` (``agent_llm_overrides`` /
+    ``analyst_provider_limits``); ``concurrency_limit`` bounds the pool.
+    """
+
+    def analyst_scheduler(state: AgentState) -> dict[str, Any]:
+        metadata = state.get("metadata", {})
+        tasks = [AnalystTask(node_name, func, resolve_analyst_provider(state, node_name)) for node_name, func in analysts]
+        started = time.perf_counter()
+        results, timings = run_analyst_pool(
+            state,
+            tasks,
+            max_workers=int(metadata.get("analyst_concurrency_limit") or concurrency_limit),
+            provider_limits=metadata.get("analyst_provider_limits"),
+        )
+        wall_seconds = time.perf_counter() - started
+        schedule = {
+            "wall_seconds": round(wall_seconds, 3),
+            "max_workers": int(metadata.get("analyst_concurrency_limit") or concurrency_limit),
+            "agents": {name: timing.as_dict() for name, timing in timings.items()},
+        }
+        slowest = max((timing.run_seconds for timing in timings.values()), default=0.0)
+        logger.info("analyst pool finished %d agents in %.2fs (slowest agent %.2fs)", len(tasks), wall_seconds, slowest)
+        update = merge_analyst_results(state, results)
+        update["metadata"] = {ANALYST_SCHEDULE_METADATA_KEY: schedule}
+        return update
+
+    return analyst_scheduler
+
+
+__all__ = [
+    "ANALYST_SCHEDULE_METADATA_KEY",
+    "AnalystTask",
+    "AnalystTiming",
+    "create_analyst_scheduler_node",
+    "merge_analyst_results",
+    "resolve_analyst_provider",
+    "run_analyst_pool",
+]
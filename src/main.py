@@ -7,6 +7,7 @@ import math
 import os
 import sys
 import tempfile
+import threading
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
@@ -71,12 +72,24 @@ from src.screening.recommendation_tracker import (
 from src.screening.signal_fusion import fuse_batch
 from src.screening.strategy_scorer import score_batch
 from src.tools.tushare_api import get_ashare_daily_gainers_with_tushare
+from src.utils.env_helpers import get_env_enabled, get_env_mode
 from src.utils.llm import build_parallel_provider_execution_plan
 from src.utils.logging import get_logger, setup_logging
 from src.utils.numeric import is_finite_number as _is_finite_number
 from src.utils.numeric import safe_float as _safe_float
 from src.utils.numeric import safe_int as _safe_int
 from src.utils.progress import progress
+from src.utils.run_profiler import (
+    RunProfile,
+    compare_timing_artifacts,
+    format_timing_summary,
+    load_timing_artifact,
+    previous_timing_artifact,
+    profile_from_env,
+    span,
+    timing_dir_from_env,
+    write_timing_artifact,
+)
 
 if TYPE_CHECKING:
     # 仅用于 _build_selected_strategy_weights 的字符串注解; 运行时由函数体内 import 提供。
@@ -182,7 +195,8 @@ def run_hedge_fund(
 
     # Deferred imports — loop 120 import isolation: these are pipeline-only.
     from langchain_core.messages import HumanMessage
-    from src.utils.analysts import get_analyst_nodes
+    from src.data.fundamentals_dataset import FUNDAMENTALS_STATE_KEY, build_fundamentals_dataset
+    from src.utils.analysts import get_analyst_fundamentals_requests, get_analyst_nodes
 
     # Start progress tracking
     progress.start()
@@ -200,7 +214,19 @@ def run_hedge_fund(
             per_provider_limit=base_concurrency_limit,
         )
         logger.info("LLM execution plan: %s", json.dumps(execution_plan["execution_provenance"], ensure_ascii=False, sort_keys=True))
-        agent = _get_compiled_workflow(selected_analysts_key, int(execution_plan["effective_concurrency_limit"]))
+        agent = _get_compiled_workflow(selected_analysts_key, int(execution_plan["effective_concurrency_limit"]), _get_analyst_scheduler_mode())
+
+        data = {
+            "tickers": tickers,
+            "portfolio": portfolio,
+            "start_date": start_date,
+            "end_date": end_date,
+            "analyst_signals": {},
+        }
+        # 一次取齐所有选中 agent 需要的基本面 (并集)，各 agent 从 state 读取只读视图
+        fundamentals = build_fundamentals_dataset(tickers, end_date, get_analyst_fundamentals_requests(selected_analyst_keys))
+        if fundamentals is not None:
+            data[FUNDAMENTALS_STATE_KEY] = fundamentals
 
         final_state = agent.invoke(
             {
@@ -209,18 +235,14 @@ def run_hedge_fund(
                         content="Make trading decisions based on the provided data.",
                     )
                 ],
-                "data": {
-                    "tickers": tickers,
-                    "portfolio": portfolio,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "analyst_signals": {},
-                },
+                "data": data,
                 "metadata": {
                     "show_reasoning": show_reasoning,
                     "model_name": resolved_model_name,
                     "model_provider": resolved_model_provider,
                     "agent_llm_overrides": execution_plan["agent_llm_overrides"],
+                    "analyst_concurrency_limit": int(execution_plan["effective_concurrency_limit"]),
+                    "analyst_provider_limits": dict(execution_plan["execution_provenance"].get("provider_lane_limits") or {}),
                     "llm_observability": dict(llm_observability or {}),
                 },
             },
@@ -230,6 +252,7 @@ def run_hedge_fund(
             "decisions": parse_hedge_fund_response(final_state["messages"][-1].content),
             "analyst_signals": final_state["data"]["analyst_signals"],
             "execution_plan_provenance": execution_plan["execution_provenance"],
+            "analyst_schedule": final_state.get("metadata", {}).get("analyst_schedule"),
         }
     finally:
         # Stop progress tracking
@@ -242,12 +265,12 @@ def start(state: AgentState):
 
 
 @lru_cache(maxsize=16)
-def _get_compiled_workflow(selected_analysts_key: tuple[str, ...] | None, concurrency_limit: int):
-    workflow = create_workflow(list(selected_analysts_key) if selected_analysts_key else None, concurrency_limit=concurrency_limit)
+def _get_compiled_workflow(selected_analysts_key: tuple[str, ...] | None, concurrency_limit: int, scheduler_mode: str = "pool"):
+    workflow = create_workflow(list(selected_analysts_key) if selected_analysts_key else None, concurrency_limit=concurrency_limit, scheduler_mode=scheduler_mode)
     return workflow.compile()
 
 
-def create_workflow(selected_analysts=None, concurrency_limit: int | None = None):
+def create_workflow(selected_analysts=None, concurrency_limit: int | None = None, scheduler_mode: str | None = None):
     """Create the workflow with selected analysts."""
     # Deferred imports — loop 120 import isolation: pipeline-only deps.
     from langgraph.graph import END, StateGraph
@@ -267,17 +290,32 @@ def create_workflow(selected_analysts=None, concurrency_limit: int | None = None
         selected_analysts = list(analyst_nodes.keys())
 
     selected_analysts = _order_selected_analysts(selected_analysts)
-    analyst_batches = _build_analyst_batches(selected_analysts, concurrency_limit or _get_analyst_concurrency_limit())
+    concurrency_limit = concurrency_limit or _get_analyst_concurrency_limit()
+
+    # Always add risk and portfolio management
+    workflow.add_node("risk_management_agent", risk_management_agent)
+    workflow.add_node("portfolio_manager", portfolio_management_agent)
+
+    if selected_analysts and (scheduler_mode or _get_analyst_scheduler_mode()) == "pool":
+        # 单个调度节点：有界 worker 池 + 按 provider 并发上限，空出槽位即启动下一个 agent
+        from src.graph.analyst_scheduler import create_analyst_scheduler_node
+
+        analysts = [analyst_nodes[analyst_key] for analyst_key in selected_analysts]
+        workflow.add_node("analyst_scheduler", create_analyst_scheduler_node(analysts, concurrency_limit))
+        workflow.add_edge("start_node", "analyst_scheduler")
+        workflow.add_edge("analyst_scheduler", "risk_management_agent")
+        workflow.add_edge("risk_management_agent", "portfolio_manager")
+        workflow.add_edge("portfolio_manager", END)
+        workflow.set_entry_point("start_node")
+        return workflow
+
+    analyst_batches = _build_analyst_batches(selected_analysts, concurrency_limit)
 
     # Add selected analyst nodes
     for analyst_key in selected_analysts:
         node_name, node_func = analyst_nodes[analyst_key]
         workflow.add_node(node_name, node_func)
 
-    # Always add risk and portfolio management
-    workflow.add_node("risk_management_agent", risk_management_agent)
-    workflow.add_node("portfolio_manager", portfolio_management_agent)
-
     if analyst_batches:
         for analyst_key in analyst_batches[0]:
             workflow.add_edge("start_node", analyst_nodes[analyst_key][0])
@@ -308,6 +346,12 @@ def _get_analyst_concurrency_limit() -> int:
         return 2
 
 
+def _get_analyst_scheduler_mode() -> str:
+    """``pool`` (default): dynamic worker pool; ``batch``: legacy fixed batches."""
+    mode = get_env_mode("ANALYST_SCHEDULER_MODE", "pool")
+    return mode if mode in {"pool", "batch"} else "pool"
+
+
 def _order_selected_analysts(selected_analysts: list[str]) -> list[str]:
     from src.utils.analysts import ANALYST_ORDER, get_analyst_nodes  # deferred — loop 120
 
@@ -898,7 +942,26 @@ def _inject_score_decomposition(
     return injected
 
 
-def compute_auto_screening_results(trade_date: str, top_n: int = 10, selected_strategies: list[str] | None = None) -> dict:
+class AutoScreeningCancelled(RuntimeError):
+    """``compute_auto_screening_results`` 在阶段边界检测到取消请求。"""
+
+
+class AutoScreeningEmptyPool(ValueError):
+    """Layer A 候选池为空 — 上游数据问题 (Web 端映射为 503)。"""
+
+
+def _raise_if_auto_cancelled(cancel_event: threading.Event | None, stage: str) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise AutoScreeningCancelled(f"auto screening cancelled before {stage}")
+
+
+def compute_auto_screening_results(
+    trade_date: str,
+    top_n: int = 10,
+    selected_strategies: list[str] | None = None,
+    *,
+    cancel_event: threading.Event | None = None,
+) -> dict:
     """Run the full --auto pipeline and return a JSON-serializable payload (no IO side effects).
 
     这是 ``run_auto_screening`` 的纯函数版本 — 不打印表格, 不保存文件,
@@ -913,13 +976,16 @@ def compute_auto_screening_results(trade_date: str, top_n: int = 10, selected_st
         trade_date: 交易日期, 格式 YYYYMMDD
         top_n: 返回 Top N 推荐 (默认 10)
         selected_strategies: 可选策略子集; 若提供, 在 Top N 截断前按该子集等权重重排
+        cancel_event: 可选取消信号 (Web 后台任务); 每个阶段开始前检查, 已置位则
+            抛 :class:`AutoScreeningCancelled`, 不再消耗后续 Tushare 配额与 CPU
 
     Returns:
         dict 包含所有 auto_screening 输出字段, 可直接 ``json.dumps`` 序列化。
 
     Raises:
-        ValueError: 候选池为空 (供 Web 端返回 503)
+        AutoScreeningEmptyPool: 候选池为空 (``ValueError`` 子类, 供 Web 端返回 503)
         RuntimeError: 数据获取失败 (e.g. tushare token 缺失)
+        AutoScreeningCancelled: ``cancel_event`` 已置位
     """
     # P0-1: 创建批量数据获取器 (默认开启, 可通过 USE_BATCH_FETCHER=false 关闭)
     from src.screening.batch_data_fetcher import (
@@ -935,23 +1001,37 @@ def compute_auto_screening_results(trade_date: str, top_n: int = 10, selected_st
     )
 
     # Step 1: Layer A 候选池快筛
+    _raise_if_auto_cancelled(cancel_event, "candidate pool")
     progress.update_status("auto_screening", None, "Step 1/4: 全市场快筛 (Layer A)")
     logger.debug("[Auto] Step 1/4: trade_date=%s", trade_date)
-    candidates = build_candidate_pool(trade_date)
+    with span("candidate_pool"):
+        candidates = build_candidate_pool(trade_date)
     logger.info("[Auto] 候选池: %d 只", len(candidates))
     if not candidates:
-        raise ValueError(f"候选池为空 (trade_date={trade_date}), 请检查市场数据源是否可用")
+        raise AutoScreeningEmptyPool(f"候选池为空 (trade_date={trade_date}), 请检查市场数据源是否可用")
 
     from src.screening.scoring_feature_refresh import refresh_scoring_features
     from src.screening.scoring_feature_store import ScoringFeatureStore
 
     candidate_tickers = [candidate.ticker for candidate in candidates]
-    refresh_summary = refresh_scoring_features(
-        trade_date,
-        candidate_tickers,
-        timeout_seconds=float(os.environ.get("AUTO_OPTIONAL_FEATURE_REFRESH_TIMEOUT_SECONDS", "180")),
-    )
+    _raise_if_auto_cancelled(cancel_event, "feature refresh")
+    with span("feature_refresh"):
+        refresh_summary = refresh_scoring_features(
+            trade_date,
+            candidate_tickers,
+            timeout_seconds=float(os.environ.get("AUTO_OPTIONAL_FEATURE_REFRESH_TIMEOUT_SECONDS", "180")),
+        )
     optional_feature_quality = None
+    if get_env_enabled("SCORING_PRICE_PANEL_ENABLED"):
+        # 列式价格面板: 只解析并写入自上次构建后变化的 price_cache CSV, score_batch
+        # 随后走内存映射窗口而不是逐 ticker read_csv. 构建失败时回退 CSV 读取.
+        try:
+            from src.screening.price_panel_store import build_price_panel
+
+            with span("price_panel"):
+                build_price_panel(tickers=candidate_tickers)
+        except Exception:
+            logger.warning("[Auto] price panel build failed; score_batch will parse price_cache CSVs", exc_info=True)
     # allow_stale: when today's snapshot is missing (e.g. tushare rate-limited),
     # fall back to the most recent snapshot within 7 days. Financial data is
     # quarterly and event inputs are relatively stable, so a few days of staleness
@@ -965,23 +1045,30 @@ def compute_auto_screening_results(trade_date: str, top_n: int = 10, selected_st
         )
 
     # Step 2: 四策略评分
+    _raise_if_auto_cancelled(cancel_event, "score_batch")
     progress.update_status("auto_screening", None, f"Step 2/4: 四策略评分 ({len(candidates)} 只)")
 
-    scored = score_batch(candidates, trade_date, feature_store=scoring_feature_store)
+    with span("score_batch"):
+        scored = score_batch(candidates, trade_date, feature_store=scoring_feature_store)
     # Backward-compatible payload key: this summary now contains both
     # data_quality.scoring_features and data_quality.optional_features.
-    optional_feature_quality = scoring_feature_store.build_quality_summary(
-        trade_date,
-        candidate_tickers,
-        scored,
-    )
+    with span("feature_quality"):
+        optional_feature_quality = scoring_feature_store.build_quality_summary(
+            trade_date,
+            candidate_tickers,
+            scored,
+        )
 
     # Step 3: 信号融合
+    _raise_if_auto_cancelled(cancel_event, "fuse_batch")
     progress.update_status("auto_screening", None, "Step 3/4: 信号融合 + 冲突仲裁")
-    market_state = detect_market_state(trade_date)
-    fused = fuse_batch(scored, market_state, trade_date, candidates=candidates)
+    with span("market_state"):
+        market_state = detect_market_state(trade_date)
+    with span("fuse_batch"):
+        fused = fuse_batch(scored, market_state, trade_date, candidates=candidates)
 
     # Step 4: 排序输出 Top N
+    _raise_if_auto_cancelled(cancel_event, "ranking")
     progress.update_status("auto_screening", None, f"Step 4/4: 输出 Top {top_n} 推荐")
     logger.debug("[Auto] Step 4/4: 排序 Top %d", top_n)
     ranking_pool_size = max(top_n * 3, top_n)
@@ -1029,16 +1116,18 @@ def compute_auto_screening_results(trade_date: str, top_n: int = 10, selected_st
     # applying them here would let unselected strategies re-enter the ranking.
     # Keep the existing attention/sector eligibility constraints below, but do
     # not consume cross-policy composite or score-bucket evidence.
-    ranked_pool = (
-        ranking_pool
-        if selected_strategies
-        else _rank_pool_by_investability(ranking_pool, trade_date)
-    )
+    with span("investability_ranking"):
+        ranked_pool = (
+            ranking_pool
+            if selected_strategies
+            else _rank_pool_by_investability(ranking_pool, trade_date)
+        )
 
     # Keep the Top-30 production preselection intact.  The full-pool result is
     # an independently computed research challenger and cannot feed selection,
     # sizing, ledger plans, or recommendation order.
-    shadow_ranking = _rank_full_pool_shadow(full_shadow_pool, trade_date)
+    with span("shadow_ranking"):
+        shadow_ranking = _rank_full_pool_shadow(full_shadow_pool, trade_date)
 
     top_results_serializable = _select_top_n_with_constraints(
         ranked_pool,
@@ -1052,12 +1141,13 @@ def compute_auto_screening_results(trade_date: str, top_n: int = 10, selected_st
 
     # P0-6 多日推荐聚合 — 附加连续推荐标记
     consecutive_report_dir = _resolve_consecutive_report_dir()
-    top_results_serializable = enrich_recommendations_with_history(
-        recommendations=top_results_serializable,
-        lookback_days=DEFAULT_LOOKBACK_DAYS,
-        report_dir=consecutive_report_dir,
-        end_date=trade_date,
-    )
+    with span("history_enrichment"):
+        top_results_serializable = enrich_recommendations_with_history(
+            recommendations=top_results_serializable,
+            lookback_days=DEFAULT_LOOKBACK_DAYS,
+            report_dir=consecutive_report_dir,
+            end_date=trade_date,
+        )
     # 重新注入 score_decomposition 到 Top-N (此时 stability_bonus 已被 enrichment
     # 写入), 确保存盘 JSON 的 decomposition 与 _print_score_waterfall 打印的
     # 一致 (此前存盘用 stability_bonus=0 而打印用真实值, 造成 other_adjustments
@@ -1076,17 +1166,19 @@ def compute_auto_screening_results(trade_date: str, top_n: int = 10, selected_st
     consecutive_highlight = sum(1 for rec in top_results_serializable if rec.get("consecutive_days", 0) >= 3)
 
     # P0-3 信号衰减检测 — 对比当前与历史 score_b
-    decay_summary = _attach_signal_decay(top_results_serializable, consecutive_report_dir, trade_date)
+    with span("signal_decay"):
+        decay_summary = _attach_signal_decay(top_results_serializable, consecutive_report_dir, trade_date)
 
     # P1-2 行业轮动信号 — 申万一级行业动量 + 强度排名。
     # 用全市场快筛 fused (~300 只) 而非仅 Top-10: 行业轮动的本质是全市场
     # 横截面动量比较, 只看 Top-10 会导致强势/弱势行业列表坍缩为同一批
     # (10 只集中在 1-2 个行业, min_candidates=2 过滤后无分化)。
-    fused_serializable = [item.model_dump(mode="json") for item in fused]
-    industry_signals = calculate_industry_rotation(
-        recommendations=fused_serializable,
-        trade_date=trade_date,
-    )
+    with span("industry_rotation"):
+        fused_serializable = [item.model_dump(mode="json") for item in fused]
+        industry_signals = calculate_industry_rotation(
+            recommendations=fused_serializable,
+            trade_date=trade_date,
+        )
     industry_rotation_payload = [sig.to_dict() for sig in industry_signals]
 
     # Compute is deliberately publication-free. ``auto_pipeline`` is the only
@@ -1686,6 +1778,44 @@ def _attach_freshness_check(trade_date: str, report_payload: dict) -> None:
 AUTO_BUSY_EXIT_CODE = 75
 
 
+def _start_auto_timing(trade_date: str, top_n: int) -> RunProfile | None:
+    """开启本次 --auto 的 span 计时 (``AUTO_TIMING_ENABLED``, 默认开启)。
+
+    剖析只是观测手段: 任何异常都降级为不计时, 绝不影响 --auto 本身。
+    """
+    try:
+        profile = profile_from_env("auto", {"trade_date": trade_date, "top_n": top_n})
+        return profile.start() if profile is not None else None
+    except Exception:
+        logger.warning("[Auto] run profiler 启动失败, 本次不写计时产物", exc_info=True)
+        return None
+
+
+def _finish_auto_timing(profile: RunProfile | None, exit_code: int | None) -> None:
+    """停止计时, 写计时产物, 并与上一份成功运行的产物逐 span 对比、以 warning 标记回归。
+
+    ``exit_code`` 为 ``None`` 表示运行以异常结束; 非 0 / ``None`` 的运行记为 ``failed``,
+    不会成为之后运行的对比基线。
+    """
+    if profile is None:
+        return
+    try:
+        profile.stop()
+        profile.exit_code = exit_code
+        profile.status = "ok" if exit_code == 0 else "failed"
+        timing_dir = timing_dir_from_env()
+        artifact_path = write_timing_artifact(profile, timing_dir)
+        payload = profile.to_dict()
+        logger.info("[Auto] 计时产物已写入 %s\n%s", artifact_path, format_timing_summary(payload))
+        baseline_path = previous_timing_artifact(timing_dir, artifact_path, prefix=profile.label)
+        if baseline_path is None:
+            return
+        for regression in compare_timing_artifacts(load_timing_artifact(baseline_path), payload):
+            logger.warning("[Auto] 计时回归 (基线 %s): %s", baseline_path.name, regression.describe())
+    except Exception:
+        logger.warning("[Auto] 计时产物写入 / 对比失败", exc_info=True)
+
+
 def run_auto_screening(
     trade_date: str,
     top_n: int = 10,
@@ -1730,6 +1860,8 @@ def run_auto_screening(
         return AUTO_BUSY_EXIT_CODE
 
     _lock_closed = False
+    run_profile = _start_auto_timing(trade_date, top_n)
+    exit_code: int | None = None
 
     def _close_auto_lock() -> None:
         nonlocal _lock_closed
@@ -1752,14 +1884,15 @@ def run_auto_screening(
             # run_auto_pipeline reconciles any durable pending state before its
             # default prepare_inputs performs preheat/cache work for a new run.
             auto_reports_dir = _resolve_consecutive_report_dir()
-            result = run_auto_pipeline(
-                trade_date,
-                top_n,
-                strict_quality=strict_quality,
-                reports_dir=auto_reports_dir,
-                data_dir=auto_reports_dir.parent,
-                preheat_fn=_run_optional_auto_preheat,
-            )
+            with span("pipeline"):
+                result = run_auto_pipeline(
+                    trade_date,
+                    top_n,
+                    strict_quality=strict_quality,
+                    reports_dir=auto_reports_dir,
+                    data_dir=auto_reports_dir.parent,
+                    preheat_fn=_run_optional_auto_preheat,
+                )
             for diagnostic in result.recovery_diagnostics:
                 logger.warning("[Auto] recovery diagnostic: %s", diagnostic)
         finally:
@@ -1770,7 +1903,8 @@ def run_auto_screening(
                 f"{Fore.RED}[Auto] 运行失败；诊断已保存到 "
                 f"{result.artifact_path or '不可用'}{Style.RESET_ALL}"
             )
-            return result.exit_code
+            exit_code = result.exit_code
+            return exit_code
 
         report_payload = result.payload
         payload_trade_date = report_payload.get("date")
@@ -1786,7 +1920,8 @@ def run_auto_screening(
         except (TypeError, ValueError) as exc:
             logger.error("[Auto] 无效的 pipeline 有效日期: %s", exc)
             print(f"{Fore.RED}[Auto] pipeline 返回的有效交易日无效，停止下游处理。{Style.RESET_ALL}")
-            return 1
+            exit_code = 1
+            return exit_code
 
         if result.recovered and effective_trade_date != trade_date:
             print(
@@ -1805,7 +1940,8 @@ def run_auto_screening(
 
         report_path = result.artifact_path
         if report_path is None:  # defensive: successful publication always returns a path
-            return 1
+            exit_code = 1
+            return exit_code
 
         # H1 (briefing): 简报事实只计算一次 — push/PDF/CLI 卡片消费同一 payload。
         # 触发器⑤直接读 tracking_history.json (世代过滤在 briefing 模块内), 不依赖
@@ -1814,12 +1950,13 @@ def run_auto_screening(
         try:
             from src.reporting.auto_briefing import build_auto_briefing
 
-            briefing_payload = build_auto_briefing(
-                trade_date=trade_date,
-                market_state=market_state,
-                report_payload=report_payload,
-                reports_dir=report_path.parent,
-            )
+            with span("briefing"):
+                briefing_payload = build_auto_briefing(
+                    trade_date=trade_date,
+                    market_state=market_state,
+                    report_payload=report_payload,
+                    reports_dir=report_path.parent,
+                )
             report_payload["auto_briefing"] = briefing_payload
         except Exception as exc:  # noqa: BLE001
             logger.warning("[Auto] auto briefing 构建失败, 回退 legacy header: %s", exc)
@@ -1827,17 +1964,19 @@ def run_auto_screening(
         if result.status is AutoRunStatus.HEALTHY:
             # Only canonical healthy output may feed watchlists, PDFs, rebalance,
             # or external push channels. A degraded attempt remains diagnostic.
-            pdf_path = _enrich_recommendations_with_history(
-                report_payload=report_payload,
-                trade_date=trade_date,
-                tracking_dir=report_path.parent,
-            )
-            _handle_post_screening_tasks(
-                report_payload=report_payload,
-                trade_date=trade_date,
-                report_path=report_path,
-                pdf_path=pdf_path,
-            )
+            with span("watchlist_and_pdf"):
+                pdf_path = _enrich_recommendations_with_history(
+                    report_payload=report_payload,
+                    trade_date=trade_date,
+                    tracking_dir=report_path.parent,
+                )
+            with span("post_screening_tasks"):
+                _handle_post_screening_tasks(
+                    report_payload=report_payload,
+                    trade_date=trade_date,
+                    report_path=report_path,
+                    pdf_path=pdf_path,
+                )
         else:
             logger.warning(
                 "[Auto] degraded attempt %s is display-only; downstream side effects skipped",
@@ -1845,31 +1984,34 @@ def run_auto_screening(
             )
 
         # P0-1 + O-1: output batch fetcher stats + formatted table
-        _print_table_block(
-            report_payload=report_payload,
-            trade_date=trade_date,
-            top_results=top_results,
-            market_state=market_state,
-            top_n=top_n,
-            report_path=report_path,
-            decay_map=decay_map,
-            industry_signals=industry_signals,
-            composite_by_ticker=composite_by_ticker,
-            briefing=briefing_payload,
-        )
+        with span("render_table"):
+            _print_table_block(
+                report_payload=report_payload,
+                trade_date=trade_date,
+                top_results=top_results,
+                market_state=market_state,
+                top_n=top_n,
+                report_path=report_path,
+                decay_map=decay_map,
+                industry_signals=industry_signals,
+                composite_by_ticker=composite_by_ticker,
+                briefing=briefing_payload,
+            )
 
         # Plan 05 Task 9: v3 shadow 编排 hook (v2 渲染后; 库层编排 + rc 保护)。
         # trade_date 是 YYYYMMDD string (effective); auto_reports_dir 在作用域。
         # run_v3_shadow_auto 内部吞掉一切 v3 异常, 绝不改写本函数 return 的 v2 rc。
         from src.cli.v3_shadow import run_v3_shadow_auto
 
-        run_v3_shadow_auto(
-            signal_date=datetime.strptime(trade_date, "%Y%m%d").date(),
-            reports_dir=auto_reports_dir,
-            data_dir=auto_reports_dir.parent,
-        )
+        with span("v3_shadow"):
+            run_v3_shadow_auto(
+                signal_date=datetime.strptime(trade_date, "%Y%m%d").date(),
+                reports_dir=auto_reports_dir,
+                data_dir=auto_reports_dir.parent,
+            )
 
-        return result.exit_code
+        exit_code = result.exit_code
+        return exit_code
     finally:
         try:
             progress.stop()
@@ -1879,6 +2021,7 @@ def run_auto_screening(
                 print()
         finally:
             _close_auto_lock()
+            _finish_auto_timing(run_profile, exit_code)
 
 
 def _enrich_recommendations_with_history(
@@ -4300,7 +4443,7 @@ def run_performance_report_cli(period: str = "weekly", end_date: str | None = No
         generate_performance_report,
         render_performance_report,
     )
-    from src.screening.consecutive_recommendation import resolve_report_dir
+    from src.screening.consecutive_recommendation import load_tracking_history, resolve_report_dir
 
     # 1. 加载持仓历史 — 从 data/positions.json 读取当前持仓作为单一快照
     positions_path = _resolve_positions_path()
@@ -4315,17 +4458,7 @@ def run_performance_report_cli(period: str = "weekly", end_date: str | None = No
 
     # 2. 加载追踪历史 (P1-3)
     report_dir = resolve_report_dir()
-    tracking_history: list[dict] = []
-    tracking_path = report_dir / "tracking_history.json"
-    if tracking_path.exists():
-        try:
-            with open(tracking_path, encoding="utf-8") as f:
-                payload = json.load(f)
-            records = payload.get("records") if isinstance(payload, dict) else payload
-            if isinstance(records, list):
-                tracking_history = records
-        except (OSError, json.JSONDecodeError):
-            pass
+    tracking_history: list[dict] = load_tracking_history(report_dir)
 
     # 3. 从追踪历史中构建交易记录 (每条有 next_day_return 的视为一笔已结算交易)
     trades: list[dict] = []
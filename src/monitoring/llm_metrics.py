@@ -25,6 +25,7 @@ _SUMMARY: dict[str, Any] = {
     "trade_dates": {},
     "pipeline_stages": {},
     "model_tiers": {},
+    "response_cache": {},
 }
 
 
@@ -43,7 +44,12 @@ def _bucket_template() -> dict[str, Any]:
     }
 
 
+def _cache_bucket_template() -> dict[str, int]:
+    return {"hits": 0, "misses": 0, "stores": 0, "replay_misses": 0}
+
+
 _SUMMARY["totals"] = _bucket_template()
+_SUMMARY["response_cache"] = {"totals": _cache_bucket_template(), "agents": {}, "models": {}}
 
 
 def _ensure_output_dir() -> None:
@@ -191,6 +197,26 @@ def record_llm_attempt(
         _write_summary()
 
 
+def record_llm_cache_event(*, event: str, agent_name: str | None, model_provider: str, model_name: str) -> None:
+    """Counts a response-cache ``hit`` / ``miss`` / ``store`` / ``replay_miss``."""
+    field = {"hit": "hits", "miss": "misses", "store": "stores", "replay_miss": "replay_misses"}[event]
+    with _LOCK:
+        cache_summary = _SUMMARY.setdefault("response_cache", {"totals": _cache_bucket_template(), "agents": {}, "models": {}})
+        buckets = (
+            cache_summary.setdefault("totals", _cache_bucket_template()),
+            cache_summary.setdefault("agents", {}).setdefault(agent_name or "unknown", _cache_bucket_template()),
+            cache_summary.setdefault("models", {}).setdefault(f"{model_provider}:{model_name}", _cache_bucket_template()),
+        )
+        for bucket in buckets:
+            bucket[field] += 1
+        _write_summary()
+
+
+def get_llm_cache_summary() -> dict[str, Any]:
+    with _LOCK:
+        return json.loads(json.dumps(_SUMMARY.get("response_cache") or {}))
+
+
 def reset_llm_metrics_for_testing() -> None:
     with _LOCK:
         _SUMMARY["started_at"] = datetime.now().isoformat(timespec="seconds")
@@ -204,6 +230,7 @@ def reset_llm_metrics_for_testing() -> None:
         _SUMMARY["trade_dates"] = {}
         _SUMMARY["pipeline_stages"] = {}
         _SUMMARY["model_tiers"] = {}
+        _SUMMARY["response_cache"] = {"totals": _cache_bucket_template(), "agents": {}, "models": {}}
         if _JSONL_PATH.exists():
             _JSONL_PATH.unlink()
         if _SUMMARY_PATH.exists():
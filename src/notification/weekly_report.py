@@ -29,6 +29,7 @@ from src.notification.push import (
     PushResult,
     send_push,
 )
+from src.screening.tracking_store import pending_export_records
 from src.utils.date_utils import format_date
 
 logger = logging.getLogger(__name__)
@@ -174,20 +175,22 @@ def _block_exit_rebalance_summary(start: str, end: str, report_dir: Path | None
         if not history_path.exists():
             return "### 退出调仓\n\n> 本周无交易记录\n"
 
-        try:
-            with open(history_path, encoding="utf-8") as f:
-                payload = json.load(f)
-        except (json.JSONDecodeError, OSError) as exc:
-            # R94: 文件损坏 (R88/BH-017 同族) 单独诊断 — 区分"数据损坏"(用户可修)
-            # vs"退出调仓计算异常"(代码 bug)。此前宽 except 笼统吞成"退出调仓异常"。
-            logger.warning(
-                "[WeeklyReport] 交易历史文件 %s 损坏或不可读 (%s); 降级为'本周无交易记录'",
-                history_path,
-                exc,
-            )
-            return "### 退出调仓\n\n> 本周无交易记录\n"
-
-        records = payload.get("records", [])
+        # nightly 更新未导出时以追踪库为准
+        records = pending_export_records(history_path)
+        if records is None:
+            try:
+                with open(history_path, encoding="utf-8") as f:
+                    payload = json.load(f)
+            except (json.JSONDecodeError, OSError) as exc:
+                # R94: 文件损坏 (R88/BH-017 同族) 单独诊断 — 区分"数据损坏"(用户可修)
+                # vs"退出调仓计算异常"(代码 bug)。此前宽 except 笼统吞成"退出调仓异常"。
+                logger.warning(
+                    "[WeeklyReport] 交易历史文件 %s 损坏或不可读 (%s); 降级为'本周无交易记录'",
+                    history_path,
+                    exc,
+                )
+                return "### 退出调仓\n\n> 本周无交易记录\n"
+            records = payload.get("records", [])
         if not isinstance(records, list):
             return "### 退出调仓\n\n> 本周无交易记录\n"
 
@@ -7,6 +7,7 @@ from typing import Iterable, Literal
 
 import pandas as pd
 
+from src.data.trading_index import get_trading_index
 from src.tools.tushare_api import _cached_tushare_dataframe_call, _get_pro
 
 CalendarSource = Literal["tushare_trade_cal", "akshare_sina"]
@@ -119,6 +120,13 @@ def _extract_open_dates_from_frame(
 def _load_open_trade_dates_cn_sse(
     start_compact: str, end_compact: str
 ) -> tuple[list[str], CalendarSource]:
+    # Local trading index: calendars already fetched by backtests / earlier runs
+    index = get_trading_index()
+    if index is not None:
+        cached_dates = index.open_dates(start_compact, end_compact)
+        if cached_dates:
+            return cached_dates, "tushare_trade_cal"
+
     # Primary: tushare trade_cal (SSE open days)
     pro = _get_pro()
     if pro is not None:
@@ -134,6 +142,8 @@ def _load_open_trade_dates_cn_sse(
             )
             dates = _extract_open_dates_from_frame(df, start_compact, end_compact)
             if dates:
+                if index is not None:
+                    index.record_calendar(start_compact, end_compact, dates)
                 return dates, "tushare_trade_cal"
         except Exception as exc:
             import logging
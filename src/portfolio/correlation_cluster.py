@@ -1,13 +1,18 @@
-"""相关性聚类合并。"""
+"""相关性聚类合并。
+
+阈值邻接 + 连通分量在 :mod:`src.portfolio.risk_engine` 中以数组运算完成,
+不再逐对 ``.loc`` 读取相关矩阵。
+"""
 
 from __future__ import annotations
 
 import pandas as pd
 
-from src.portfolio.correlation_cluster_helpers import (
-    build_cluster_groups,
-    build_union_find_parent,
-    merge_correlated_pairs,
+from src.portfolio.risk_engine import (
+    connected_component_labels,
+    correlated_pairs,
+    group_by_labels,
+    median_upper_triangle,
 )
 
 
@@ -26,26 +31,12 @@ def build_correlation_clusters(correlation_matrix: pd.DataFrame, threshold: floa
     if correlation_matrix.empty:
         return []
     tickers = list(correlation_matrix.index)
-    parent = build_union_find_parent(tickers)
-    merge_correlated_pairs(correlation_matrix=correlation_matrix, tickers=tickers, threshold=threshold, parent=parent)
-    return build_cluster_groups(tickers=tickers, parent=parent)
+    values = correlation_matrix.loc[tickers, tickers].to_numpy(dtype=float)
+    rows, cols = correlated_pairs(values, tickers, threshold)
+    return group_by_labels(tickers, connected_component_labels(len(tickers), rows, cols))
 
 
 def market_median_correlation(correlation_matrix: pd.DataFrame) -> float:
     if correlation_matrix.empty:
         return 0.0
-    values = []
-    for row in correlation_matrix.index:
-        for col in correlation_matrix.columns:
-            if row >= col:
-                continue
-            value = correlation_matrix.loc[row, col]
-            if pd.notna(value):
-                values.append(float(value))
-    if not values:
-        return 0.0
-    values.sort()
-    mid = len(values) // 2
-    if len(values) % 2 == 1:
-        return values[mid]
-    return (values[mid - 1] + values[mid]) / 2
+    return median_upper_triangle(correlation_matrix.to_numpy(dtype=float), correlation_matrix.index, correlation_matrix.columns)
@@ -4,6 +4,8 @@ from collections import defaultdict
 
 import pandas as pd
 
+from src.portfolio.risk_engine import correlated_pairs
+
 
 def build_union_find_parent(tickers: list[str]) -> dict[str, str]:
     return {ticker: ticker for ticker in tickers}
@@ -24,13 +26,10 @@ def union_parent(parent: dict[str, str], left: str, right: str) -> None:
 
 
 def merge_correlated_pairs(*, correlation_matrix: pd.DataFrame, tickers: list[str], threshold: float, parent: dict[str, str]) -> None:
-    for row_ticker in tickers:
-        for col_ticker in tickers:
-            if row_ticker >= col_ticker:
-                continue
-            value = correlation_matrix.loc[row_ticker, col_ticker]
-            if pd.notna(value) and value > threshold:
-                union_parent(parent, row_ticker, col_ticker)
+    values = correlation_matrix.loc[tickers, tickers].to_numpy(dtype=float)
+    rows, cols = correlated_pairs(values, tickers, threshold)
+    for row, col in zip(rows.tolist(), cols.tolist()):
+        union_parent(parent, tickers[row], tickers[col])
 
 
 def build_cluster_groups(*, tickers: list[str], parent: dict[str, str]) -> list[set[str]]:
@@ -0,0 +1,232 @@
+"""NumPy 组合风险内核 — 滚动协方差 / 相关性聚类 / 历史模拟 VaR·CVaR / beta。
+
+``correlation_cluster`` 与 ``risk_metrics`` 原先逐格 ``.loc`` 读取相关矩阵、
+用列表推导式算协方差, 持仓 / 候选超过 100 只时 O(n²) 次 Python 调用明显可感。
+本模块把这些计算收敛为数组运算:
+
+- :class:`RollingCovariance`: 固定窗口的成对 (pairwise-complete) 协方差 /
+  相关系数, 每来一行收益只做 O(n²) 的外积增减, 不重算整个窗口;
+- :func:`correlated_pairs` + :func:`connected_component_labels`: 阈值邻接矩阵 +
+  ``scipy.sparse.csgraph`` 连通分量, 替代逐对 union-find;
+- :func:`historical_var` / :func:`historical_cvar`: ``np.partition`` 取尾部分位;
+- :func:`ols_beta`: 向量化样本协方差 / 方差。
+
+所有函数只接收已清洗的 float 数组 (NaN/Inf 处理由调用方按各自语义完成),
+纯函数 + 无 I/O, 与 ``risk_metrics`` 的设计原则一致。
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+_RELATIVE_VARIANCE_FLOOR = 1e-10
+
+# ---------------------------------------------------------------------------
+# 相关性聚类
+# ---------------------------------------------------------------------------
+
+
+def correlated_pairs(values: np.ndarray, keys: Sequence[object], threshold: float) -> tuple[np.ndarray, np.ndarray]:
+    """返回 ``keys[i] < keys[j]`` 且 ``values[i, j] > threshold`` 的 ``(i, j)`` 下标对。
+
+    只读取按 key 排序的上三角 (与逐对遍历 ``row < col`` 的旧实现一致, 非对称矩阵
+    也得到相同结果); NaN 不连边, 阈值为严格大于。下标按行优先顺序返回。
+    """
+    matrix = np.asarray(values, dtype=float)
+    key_array = np.asarray(list(keys))
+    upper = key_array[:, None] < key_array[None, :]
+    with np.errstate(invalid="ignore"):
+        edges = upper & (matrix > threshold)
+    return np.nonzero(edges)
+
+
+def connected_component_labels(size: int, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """无向图 ``(rows[k], cols[k])`` 边集的连通分量标签 (长度 ``size``)。"""
+    if size == 0:
+        return np.zeros(0, dtype=np.int64)
+    adjacency = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(size, size))
+    _, labels = connected_components(adjacency, directed=False)
+    return labels
+
+
+def group_by_labels(tickers: Sequence[str], labels: np.ndarray) -> list[set[str]]:
+    """按分量标签分组; 组的顺序按各组首个成员在 ``tickers`` 中出现的位置。"""
+    _, first_index, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    groups: list[set[str]] = [set() for _ in first_index]
+    rank = np.empty(len(first_index), dtype=np.int64)
+    rank[np.argsort(first_index)] = np.arange(len(first_index))
+    for ticker, group in zip(tickers, rank[inverse]):
+        groups[group].add(ticker)
+    return groups
+
+
+def median_upper_triangle(values: np.ndarray, row_keys: Sequence[object], col_keys: Sequence[object]) -> float:
+    """``row_key < col_key`` 位置上非 NaN 值的中位数; 无可用值返回 0.0。"""
+    matrix = np.asarray(values, dtype=float)
+    rows = np.asarray(list(row_keys))
+    cols = np.asarray(list(col_keys))
+    selected = matrix[rows[:, None] < cols[None, :]]
+    selected = selected[~np.isnan(selected)]
+    if selected.size == 0:
+        return 0.0
+    return float(np.median(selected))
+
+
+# ---------------------------------------------------------------------------
+# VaR / CVaR / beta
+# ---------------------------------------------------------------------------
+
+
+def tail_index(count: int, confidence: float) -> int:
+    """历史模拟法的尾部下标: ``floor((1 - confidence) * n)``, 夹在 ``[0, n-1]``。"""
+    return max(0, min(count - 1, int(math.floor((1.0 - confidence) * count))))
+
+
+def historical_var(returns: np.ndarray, confidence: float) -> float:
+    """历史模拟 VaR (正数表示损失); 空序列或全零序列返回 0.0。"""
+    if returns.size == 0 or not np.any(returns):
+        return 0.0
+    index = tail_index(returns.size, confidence)
+    return max(0.0, -float(np.partition(returns, index)[index]))
+
+
+def historical_cvar(returns: np.ndarray, confidence: float) -> float:
+    """历史模拟 CVaR: VaR 分位之外 (不含边界) 的 ``tail_index`` 个最差观测的平均损失。"""
+    if returns.size == 0:
+        return 0.0
+    index = tail_index(returns.size, confidence)
+    if index == 0:
+        return max(0.0, -float(returns.min()))
+    tail = np.partition(returns, index - 1)[:index]
+    return max(0.0, -float(tail.mean()))
+
+
+def ols_beta(portfolio: np.ndarray, benchmark: np.ndarray) -> float | None:
+    """等长序列的样本 beta ``cov(p, b) / var(b)``; 基准方差退化或结果非有限时返回 None。"""
+    n = portfolio.size
+    if n < 2 or benchmark.size != n:
+        return None
+    bench_dev = benchmark - benchmark.mean()
+    bench_var = float(bench_dev @ bench_dev) / (n - 1)
+    if bench_var < 1e-12:
+        return None
+    cov = float((portfolio - portfolio.mean()) @ bench_dev) / (n - 1)
+    beta = cov / bench_var
+    return beta if math.isfinite(beta) else None
+
+
+# ---------------------------------------------------------------------------
+# 滚动协方差
+# ---------------------------------------------------------------------------
+
+
+class RollingCovariance:
+    """固定窗口的成对滚动协方差 / 相关系数, 逐行增量更新。
+
+    维护四个 ``n×n`` 累加矩阵 (成对有效计数、Σx、Σx²、Σxy), 新行加入、
+    出窗行扣除各是一次外积, 单行更新 O(n²) 且全部在 NumPy 内完成。缺失值
+    (NaN/Inf) 只让相关的那几对跳过该行, 结果与 ``DataFrame.cov()`` /
+    ``DataFrame.corr()`` 在同一窗口上的成对口径一致。
+
+    增减累加会积累浮点误差, 每淘汰 ``window`` 行从缓冲区重建一次累加矩阵。
+    """
+
+    def __init__(self, tickers: Sequence[str], window: int, *, min_periods: int = 2) -> None:
+        if window < 2:
+            raise ValueError(f"window must be >= 2, got {window}")
+        self.tickers = list(tickers)
+        self.window = int(window)
+        self.min_periods = max(2, int(min_periods))
+        size = len(self.tickers)
+        self._rows: deque[np.ndarray] = deque()
+        self._count = np.zeros((size, size))
+        self._sum = np.zeros((size, size))
+        self._sumsq = np.zeros((size, size))
+        self._cross = np.zeros((size, size))
+        self._evictions = 0
+
+    @classmethod
+    def from_frame(cls, returns: pd.DataFrame, window: int, *, min_periods: int = 2) -> RollingCovariance:
+        """用 ``returns`` (行=日期, 列=标的) 的最后 ``window`` 行初始化。"""
+        engine = cls([str(col) for col in returns.columns], window, min_periods=min_periods)
+        for row in returns.to_numpy(dtype=float)[-engine.window :]:
+            engine.update(row)
+        return engine
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def update(self, row: Sequence[float] | np.ndarray) -> None:
+        """追加一行收益 (顺序与 ``tickers`` 一致), 窗口满时淘汰最旧一行。"""
+        values = np.asarray(row, dtype=float)
+        if values.shape != (len(self.tickers),):
+            raise ValueError(f"expected {len(self.tickers)} returns, got shape {values.shape}")
+        self._accumulate(values, 1.0)
+        self._rows.append(values)
+        if len(self._rows) > self.window:
+            self._accumulate(self._rows.popleft(), -1.0)
+            self._evictions += 1
+            if self._evictions >= self.window:
+                self._rebuild()
+
+    def _accumulate(self, values: np.ndarray, sign: float) -> None:
+        valid = np.isfinite(values)
+        mask = valid.astype(float)
+        filled = np.where(valid, values, 0.0)
+        self._count += sign * np.outer(mask, mask)
+        self._sum += sign * np.outer(filled, mask)
+        self._sumsq += sign * np.outer(filled * filled, mask)
+        self._cross += sign * np.outer(filled, filled)
+
+    def _rebuild(self) -> None:
+        for matrix in (self._count, self._sum, self._sumsq, self._cross):
+            matrix.fill(0.0)
+        for values in self._rows:
+            self._accumulate(values, 1.0)
+        self._evictions = 0
+
+    def covariance(self) -> np.ndarray:
+        """成对样本协方差矩阵; 成对观测不足 ``min_periods`` 的位置为 NaN。"""
+        count = np.rint(self._count)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = (self._cross - self._sum * self._sum.T / count) / (count - 1)
+        cov[count < self.min_periods] = np.nan
+        return cov
+
+    def correlation(self) -> np.ndarray:
+        """成对 Pearson 相关系数矩阵; 任一侧零方差或观测不足为 NaN。"""
+        count = np.rint(self._count)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # var_pair[i, j]: 标的 i 在 (i, j) 同时有效的那些行上的方差
+            var_pair = np.clip((self._sumsq - self._sum * self._sum / count) / (count - 1), 0.0, None)
+            # 原始矩公式在常数列上只剩舍入残差 — 相对二阶矩可忽略的方差按 0 处理
+            var_pair[var_pair <= _RELATIVE_VARIANCE_FLOOR * self._sumsq / count] = 0.0
+            corr = self.covariance() / np.sqrt(var_pair * var_pair.T)
+        corr[~np.isfinite(corr)] = np.nan
+        return np.clip(corr, -1.0, 1.0)
+
+    def covariance_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.covariance(), index=self.tickers, columns=self.tickers)
+
+    def correlation_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.correlation(), index=self.tickers, columns=self.tickers)
+
+
+__all__ = [
+    "RollingCovariance",
+    "connected_component_labels",
+    "correlated_pairs",
+    "group_by_labels",
+    "historical_cvar",
+    "historical_var",
+    "median_upper_triangle",
+    "ols_beta",
+    "tail_index",
+]
@@ -6,6 +6,8 @@
 - 纯函数 + dataclass: 无 I/O、无全局状态、可独立单测
 - 数值安全: NaN/Inf 输入视为 0,避免污染下游告警
 - 历史模拟法: 直接排序 lookback 收益,不依赖参数分布假设
+- 数组运算: 收益序列 / 加权聚合 / 分位 / beta 经 NumPy 计算
+  (:mod:`src.portfolio.risk_engine`), 100+ 持仓 × 长回溯也无逐元素 Python 循环
 - 行宽 420 字符
 """
 
@@ -16,6 +18,10 @@ import math
 from dataclasses import asdict, dataclass, field
 from typing import Iterable, Mapping, Sequence
 
+import numpy as np
+
+from src.portfolio.risk_engine import historical_cvar, historical_var, ols_beta
+
 logger = logging.getLogger(__name__)
 
 # 行业 / 单一标的 / 回撤预警阈值 (与产业文档保持一致)
@@ -46,38 +52,35 @@ def _normalise_weights(weights: Mapping[str, float]) -> dict[str, float]:
     return {k: v / total for k, v in cleaned.items()}
 
 
-def _histogram_var(returns: Sequence[float], confidence: float) -> float:
+def _as_return_array(returns: Iterable[float] | np.ndarray) -> np.ndarray:
+    """Clean returns into a float array with ``_safe_float`` semantics (non-finite → 0).
+
+    Float ndarrays (the internal portfolio series) skip the per-element check.
+    """
+    if isinstance(returns, np.ndarray) and returns.dtype.kind == "f":
+        return np.where(np.isfinite(returns), returns, 0.0)
+    return np.fromiter((_safe_float(r) for r in returns), dtype=float)
+
+
+def _histogram_var(returns: Sequence[float] | np.ndarray, confidence: float) -> float:
     """Historical-simulation VaR (loss expressed as a positive number).
 
     ``returns`` are decimal returns (e.g. -0.02 means -2%). Returns the
     *positive* loss number (e.g. 0.03 = 3% loss at 95% confidence). An
     empty / all-zero series returns 0.0 (no measurable risk).
     """
-    cleaned = sorted(_safe_float(r) for r in returns)
-    if not cleaned:
-        return 0.0
-    if not any(cleaned):
-        return 0.0
     # loss = -return; pick the (1-confidence) lower-tail loss
-    tail_index = max(0, min(len(cleaned) - 1, int(math.floor((1.0 - confidence) * len(cleaned)))))
-    return max(0.0, -cleaned[tail_index])
+    return historical_var(_as_return_array(returns), confidence)
 
 
-def _histogram_cvar(returns: Sequence[float], confidence: float) -> float:
+def _histogram_cvar(returns: Sequence[float] | np.ndarray, confidence: float) -> float:
     """Historical-simulation CVaR / Expected Shortfall (positive loss number).
 
     CVaR averages the losses strictly *beyond* the VaR quantile — i.e. the
     ``tail_index`` worst observations (not including the VaR boundary itself).
     This matches the standard definition of Expected Shortfall (Acerbi 2002).
     """
-    cleaned = sorted(_safe_float(r) for r in returns)
-    if not cleaned:
-        return 0.0
-    tail_index = max(0, min(len(cleaned) - 1, int(math.floor((1.0 - confidence) * len(cleaned)))))
-    if tail_index == 0:
-        return max(0.0, -cleaned[0])
-    tail = cleaned[:tail_index]
-    return max(0.0, -sum(tail) / len(tail))
+    return historical_cvar(_as_return_array(returns), confidence)
 
 
 def _max_drawdown_from_equity(equity: Sequence[float]) -> float:
@@ -189,7 +192,7 @@ def _portfolio_equity_curve(
 def _weighted_portfolio_daily_returns(
     portfolio_positions: Sequence[Mapping[str, object]],
     lookback_returns: Sequence[Mapping[str, object]],
-) -> list[float]:
+) -> np.ndarray:
     """Aggregate per-ticker lookback returns into portfolio-level daily returns.
 
     Each ``lookback_returns`` row contains ``{date, ticker, return_pct}``. The
@@ -201,6 +204,10 @@ def _weighted_portfolio_daily_returns(
 
     Days with no observations at all are dropped (not zero-filled) to avoid
     contaminating the historical tail with spurious zero-returns.
+
+    The rows are scattered into a ``date × ticker`` return matrix plus an
+    observation mask; the weighted numerator / denominator are two
+    matrix-vector products. Returns the series in date order as an ndarray.
     """
     weights: dict[str, float] = {}
     for position in portfolio_positions:
@@ -210,33 +217,37 @@ def _weighted_portfolio_daily_returns(
         weights[ticker] = _position_market_value(position)
     weight_total = sum(weights.values())
     if weight_total <= 0.0:
-        return []
-    norm_weights = {t: w / weight_total for t, w in weights.items()}
+        return np.zeros(0)
+    column_of = {ticker: column for column, ticker in enumerate(weights)}
+    norm_weights = np.fromiter(weights.values(), dtype=float, count=len(weights)) / weight_total
 
-    by_date: dict[str, dict[str, float]] = {}
+    # 同一 (date, ticker) 多条记录时以最后一条为准; 非持仓标的不参与聚合
+    cells: dict[tuple[str, int], float] = {}
     for row in lookback_returns:
         date = str(row.get("date", "")).strip()
         ticker = str(row.get("ticker", "")).strip()
-        if not date or not ticker:
+        if not date or not ticker or ticker not in column_of:
             continue
-        by_date.setdefault(date, {})[ticker] = _safe_float(row.get("return_pct", 0.0))
-
-    portfolio_returns: list[float] = []
-    for date in sorted(by_date.keys()):
-        per_day = by_date[date]
-        numerator = 0.0
-        denominator = 0.0
-        for ticker, w in norm_weights.items():
-            if ticker in per_day:
-                numerator += w * per_day[ticker]
-                denominator += w
-        if denominator > 0.0:
-            portfolio_returns.append(numerator / denominator)
-    return portfolio_returns
+        cells[(date, column_of[ticker])] = _safe_float(row.get("return_pct", 0.0))
+    if not cells:
+        return np.zeros(0)
+
+    row_of = {date: index for index, date in enumerate(sorted({date for date, _ in cells}))}
+    rows = np.fromiter((row_of[date] for date, _ in cells), dtype=np.intp, count=len(cells))
+    columns = np.fromiter((column for _, column in cells), dtype=np.intp, count=len(cells))
+    returns = np.zeros((len(row_of), len(column_of)))
+    observed = np.zeros_like(returns)
+    returns[rows, columns] = np.fromiter(cells.values(), dtype=float, count=len(cells))
+    observed[rows, columns] = 1.0
+
+    numerator = returns @ norm_weights
+    denominator = observed @ norm_weights
+    has_weight = denominator > 0.0
+    return numerator[has_weight] / denominator[has_weight]
 
 
 def _portfolio_var_amount(
-    per_ticker_returns: Sequence[float],
+    per_ticker_returns: Sequence[float] | np.ndarray,
     portfolio_value: float,
     confidence: float,
 ) -> float:
@@ -246,7 +257,7 @@ def _portfolio_var_amount(
 
 
 def _portfolio_cvar_amount(
-    per_ticker_returns: Sequence[float],
+    per_ticker_returns: Sequence[float] | np.ndarray,
     portfolio_value: float,
     confidence: float,
 ) -> float:
@@ -271,7 +282,7 @@ def _resolve_beta(
     """
     if not benchmark_returns or len(benchmark_returns) < 10:
         return 1.0
-    portfolio = [_safe_float(r) for r in portfolio_returns]
+    portfolio = _as_return_array(portfolio_returns)
     if len(portfolio) < 10:
         return 1.0
     n = min(len(portfolio), len(benchmark_returns))
@@ -289,16 +300,8 @@ def _resolve_beta(
             len(benchmark_returns),
         )
         return 1.0
-    port_arr = portfolio[:n]
-    bench_arr = [(_safe_float(b)) for b in benchmark_returns[:n]]
-    bench_mean = sum(bench_arr) / n
-    bench_var = sum((b - bench_mean) ** 2 for b in bench_arr) / max(1, n - 1)
-    if bench_var < 1e-12:
-        return 1.0
-    port_mean = sum(port_arr) / n
-    cov = sum((port_arr[i] - port_mean) * (bench_arr[i] - bench_mean) for i in range(n)) / max(1, n - 1)
-    beta = cov / bench_var
-    if not math.isfinite(beta):
+    beta = ols_beta(portfolio[:n], _as_return_array(benchmark_returns[:n]))
+    if beta is None:
         return 1.0
     return float(beta)
 
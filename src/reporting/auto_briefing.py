@@ -328,6 +328,20 @@ def _health_facts(report_payload: Mapping[str, Any] | None) -> dict:
     return facts
 
 
+def _read_tracking_records(path: Path) -> list | None:
+    """追踪记录 (nightly 更新未导出时取 SQLite 追踪库); JSON 不可读返回 None。"""
+    from src.screening.tracking_store import pending_export_records
+
+    pending = pending_export_records(path)
+    if pending is not None:
+        return pending
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+    return raw if isinstance(raw, list) else raw.get("records", [])
+
+
 def _scorecard_facts(tracking_history_path: Path | None) -> dict:
     """排序记分牌事实 (v3 展示层 2026-08-16): --auto Top10 切片自评, 绝不抛出.
 
@@ -342,11 +356,10 @@ def _scorecard_facts(tracking_history_path: Path | None) -> dict:
     path = Path(tracking_history_path)
     if not path.exists():
         return {"available": False, "reason": "tracking_missing"}
-    try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+    raw_records = _read_tracking_records(path)
+    if raw_records is None:
         return {"available": False, "reason": "tracking_unreadable"}
-    records = [r for r in (raw if isinstance(raw, list) else raw.get("records", [])) if isinstance(r, Mapping)]
+    records = [r for r in raw_records if isinstance(r, Mapping)]
     try:
         from src.screening.scorecard import compute_scorecard, format_scorecard_lines
 
@@ -381,11 +394,9 @@ def _auto_forward_facts(tracking_history_path: Path | None) -> dict:
     path = Path(tracking_history_path)
     if not path.exists():
         return {"available": False, "reason": "tracking_missing"}
-    try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+    records = _read_tracking_records(path)
+    if records is None:
         return {"available": False, "reason": "tracking_unreadable"}
-    records = raw if isinstance(raw, list) else raw.get("records", [])
     n = 0
     wins = 0
     for rec in records:
@@ -23,12 +23,14 @@ from __future__ import annotations
 import json
 import logging
 import math
-import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Sequence
 
+from src.screening.report_warehouse import get_report_warehouse
+from src.screening.tracking_store import pending_export_records
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,9 +38,6 @@ logger = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 
-# Filename pattern reused from signal_decay_detector (避免 import 循环)
-_REPORT_FILENAME_PATTERN = re.compile(r"^auto_screening_(\d{8})\_.*\.json$|^auto_screening_(\d{8})\.json$")
-
 # 显著性分级阈值
 # - high:           abs(IC) >= 0.10 AND IR >= 1.0
 # - medium:         abs(IC) >= 0.05 AND IR >= 0.5
@@ -444,6 +443,14 @@ def _load_report_panel(
     except (OSError, json.JSONDecodeError) as exc:
         logger.warning("[FactorIC] 跳过损坏报告 %s: %s", report_path.name, exc)
         return None
+    return _report_panel_from_payload(payload, known_factors=known_factors)
+
+
+def _report_panel_from_payload(
+    payload: Any,
+    known_factors: set[str] | None = None,
+) -> dict[str, Any] | None:
+    """:func:`_load_report_panel` 的解析部分 — 作用于已读出的报告 payload (如报告仓库的历史投影)。"""
     if not isinstance(payload, dict):
         return None
 
@@ -494,41 +501,37 @@ def _load_report_panel(
     }
 
 
-def _load_tracking_returns(
-    report_dir: Path,
-    trade_date: str,
-) -> dict[str, float]:
-    """从 ``tracking_history.json`` 加载 ``{ticker: t+1_return}`` (按 trade_date 筛选)。"""
+def _load_tracking_returns_by_date(report_dir: Path) -> dict[str, dict[str, float]]:
+    """从 ``tracking_history.json`` 一次性加载 ``{trade_date: {ticker: t+1_return}}``。"""
     tracking_path = report_dir / "tracking_history.json"
-    if not tracking_path.exists():
-        return {}
-    try:
-        raw = tracking_path.read_text(encoding="utf-8")
-        payload = json.loads(raw)
-    except (OSError, json.JSONDecodeError) as exc:
-        logger.warning("[FactorIC] tracking_history 读取失败: %s", exc)
-        return {}
-    if not isinstance(payload, dict):
-        return {}
-    records = payload.get("records") or payload.get("history") or []
-    if not isinstance(records, list):
-        return {}
-    target_date = trade_date
-    returns_map: dict[str, float] = {}
+    records = pending_export_records(tracking_path)  # nightly 更新未导出时以追踪库为准
+    if records is None:
+        if not tracking_path.exists():
+            return {}
+        try:
+            raw = tracking_path.read_text(encoding="utf-8")
+            payload = json.loads(raw)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("[FactorIC] tracking_history 读取失败: %s", exc)
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        records = payload.get("records") or payload.get("history") or []
+        if not isinstance(records, list):
+            return {}
+    by_date: dict[str, dict[str, float]] = {}
     for rec in records:
         if not isinstance(rec, dict):
             continue
         rec_date = str(rec.get("trade_date", ""))
-        if rec_date != target_date:
-            continue
         ticker = str(rec.get("ticker", "")).strip()
         if not ticker:
             continue
         # 优先 t+1, 缺失则退回 0
         t1 = _to_finite(rec.get("t1_return"))
         if t1 is not None:
-            returns_map[ticker] = t1
-    return returns_map
+            by_date.setdefault(rec_date, {})[ticker] = t1
+    return by_date
 
 
 def extract_factor_panel_from_history(
@@ -541,8 +544,9 @@ def extract_factor_panel_from_history(
     """从最近 ``lookback_days`` 天的 ``auto_screening_*.json`` 报告提取因子面板 + 下期收益。
 
     算法:
-      1. 找到 reports_dir 下所有 auto_screening_*.json, 按日期升序
-      2. 取 end_date 当天及之前 ``lookback_days`` 天内的报告
+      1. 经报告仓库 (:func:`get_report_warehouse`) 取 end_date 当天及之前
+         ``lookback_days`` 天内的规范报告, 按日期升序
+      2. ``tracking_history.json`` 只读一次, 按 trade_date 分组 T+1 收益
       3. 对每份报告, 抽取 ``{ticker: {factor: confidence}}``
       4. **对齐**: 每个因子在每天的"截面均值" → 一天一个值 (cross-section average)
          下期收益 T+1 同样取当天所有 ticker 的均值 — 这是当前最稳定的"市场级"代理
@@ -561,44 +565,34 @@ def extract_factor_panel_from_history(
     if not reports_dir.exists():
         return {}, []
 
-    # 1. 找到所有匹配的报告
-    report_files: list[tuple[datetime, Path]] = []
-    for path in reports_dir.glob("auto_screening_*.json"):
-        match = _REPORT_FILENAME_PATTERN.match(path.name)
-        if not match:
-            continue
-        date_raw = match.group(1) or match.group(2)
-        if not date_raw:
-            continue
-        parsed = _parse_date(date_raw)
-        if parsed is None:
-            continue
-        report_files.append((parsed, path))
-
-    if not report_files:
-        return {}, []
+    # 1. 报告仓库 (增量同步的 SQLite 索引) 代替逐份 glob + json.load 全部历史报告
+    warehouse = get_report_warehouse(reports_dir)
 
     # 2. 推断 end_date
     if end_date is None:
-        end_date = max(dt for dt, _ in report_files).strftime("%Y%m%d")
+        end_date = warehouse.latest_report_date()
+        if end_date is None:
+            return {}, []
     end_dt = _parse_date(end_date)
     if end_dt is None:
         return {}, []
 
-    # 3. 过滤窗口
+    # 3. 只取窗口内的报告 (历史投影, 不含 candidate_pool_run 等发布专用大块)
     start_dt = end_dt - timedelta(days=lookback_days - 1)
-    in_window = [(dt, p) for dt, p in report_files if start_dt <= dt <= end_dt]
-    in_window.sort(key=lambda pair: pair[0])
-    if not in_window:
+    entries = warehouse.reports(start_dt.strftime("%Y%m%d"), end_dt.strftime("%Y%m%d"))
+    if not entries:
         return {}, []
 
-    # 4. 加载每份报告, 收集 cross-section 均值
+    # 4. 逐份报告收集 cross-section 均值; T+1 收益表只读一次
     daily_factor_means: dict[str, list[float]] = {}  # factor -> [mean_t0, mean_t1, ...]
     daily_returns: list[float] = []  # [mean_t0_return, mean_t1_return, ...]
+    tracking_returns = _load_tracking_returns_by_date(reports_dir)
 
-    for idx, (dt, path) in enumerate(in_window):
-        date_str = dt.strftime("%Y%m%d")
-        panel = _load_report_panel(path, known_factors=known_factors)
+    for entry in entries:
+        if entry.payload is None:
+            logger.warning("[FactorIC] 跳过损坏报告 %s: %s", entry.path.name, entry.error)
+            continue
+        panel = _report_panel_from_payload(entry.payload, known_factors=known_factors)
         if panel is None:
             continue
         factor_panel = panel["factor_panel"]
@@ -611,36 +605,24 @@ def extract_factor_panel_from_history(
                     continue
                 daily_factor_means.setdefault(f, []).append(float(v))
         # T+1 收益: 从 tracking_history 拉 (若有)
-        t1_returns = _load_tracking_returns(reports_dir, date_str)
+        t1_returns = tracking_returns.get(entry.trade_date)
         if t1_returns:
             r_values = [v for v in t1_returns.values() if _is_finite(v)]
             daily_returns.append(sum(r_values) / len(r_values) if r_values else float("nan"))
         else:
-            # 无追踪数据 — 用 score_b 的截面均值作为代理 (粗略, 但能产生可计算序列)
-            # c357/autodev-3 (NS-17 drain): 此前 ``except (OSError, ...): pass``
-            # 会静默吞掉报告损坏 → daily_returns 注入 0.0 → 真实 IC 信号被压成噪声.
-            # 同文件 _load_report_panel (line 444) 和 _load_tracking_returns (line 508)
-            # 对同一异常对都 ``logger.warning``; 此处是漏网的 odd-one-out.
-            # 选 debug 而非 warning: score_b 是 best-effort 代理, 正常路径是
-            # _load_report_panel 已先 parse OK 再二次 read — 损坏罕见; 但留迹可追溯.
+            # 无追踪数据 — 用 score_b 的截面均值作为代理 (粗略, 但能产生可计算序列);
+            # 报告已由仓库解析, 不再二次读文件
             score_b_values: list[float] = []
-            try:
-                recs = json.loads(path.read_text(encoding="utf-8")).get("recommendations", [])
-                for rec in recs:
-                    if not isinstance(rec, dict):
-                        continue
-                    sb = _to_finite(rec.get("score_b"))
-                    if sb is not None:
-                        score_b_values.append(sb)
-            except (OSError, json.JSONDecodeError) as exc:
-                logger.debug(
-                    "[FactorIC] score_b 代理读取失败 (将用 0.0 占位, 可能压低 IC) %s: %s",
-                    path.name,
-                    exc,
-                )
+            for rec in entry.payload.get("recommendations") or []:
+                if not isinstance(rec, dict):
+                    continue
+                sb = _to_finite(rec.get("score_b"))
+                if sb is not None:
+                    score_b_values.append(sb)
             if score_b_values:
                 daily_returns.append(sum(score_b_values) / len(score_b_values))
             else:
+                logger.debug("[FactorIC] %s 无 score_b 可作收益代理, 用 0.0 占位 (可能压低 IC)", entry.path.name)
                 daily_returns.append(0.0)
 
     # 5. 对齐 — daily_factor_means 可能与 daily_returns 长度不同 (部分日期无数据); 截到最短
@@ -767,15 +749,7 @@ def run_factor_ic(lookback_days: int = 30, method: str = "spearman") -> int:
         return 1
 
     # 推断报告日期
-    end_date = datetime.now().strftime("%Y%m%d")
-    report_files = sorted(report_dir.glob("auto_screening_*.json"), reverse=True)
-    if report_files:
-        match = _REPORT_FILENAME_PATTERN.match(report_files[0].name)
-        if match:
-            date_raw = match.group(1) or match.group(2)
-            parsed = _parse_date(date_raw)
-            if parsed is not None:
-                end_date = parsed.strftime("%Y%m%d")
+    end_date = get_report_warehouse(report_dir).latest_report_date() or datetime.now().strftime("%Y%m%d")
 
     output = render_factor_ic_ranking(results, end_date=end_date, lookback_days=lookback_days)
     print(f"\n{Fore.CYAN}{Style.BRIGHT}{'=' * 70}{Style.RESET_ALL}")
@@ -26,10 +26,12 @@ from src.screening.data_quality_manifest import (
     TickerReadiness,
     validate_ticker_readiness,
 )
+from src.screening.report_warehouse import get_report_warehouse
 from src.utils.atomic_files import (
     _sanitize_nonfinite,
     atomic_write_json,
 )
+from src.utils.run_profiler import span
 
 logger = logging.getLogger(__name__)
 
@@ -979,6 +981,8 @@ def _default_dependencies(
             target,
             _publication_payload(payload, manifest, status=AutoRunStatus.HEALTHY),
         )
+        # 发布即入库：后续历史查询无需再扫描目录
+        get_report_warehouse(reports_dir).publish(target)
         return target
 
     def publish_attempt(payload: dict[str, Any], manifest: object) -> Path:
@@ -1804,11 +1808,13 @@ def run_auto_pipeline(
         if reports_dir is not None
         else Path(__file__).resolve().parents[2] / "data" / "reports"
     )
-    recovered = _reconcile_pending_run(resolved_reports_dir, trade_date)
+    with span("reconcile_pending"):
+        recovered = _reconcile_pending_run(resolved_reports_dir, trade_date)
     if recovered is not None:
         return recovered
     if preheat_fn is not None:
-        preheat_fn(trade_date)
+        with span("preheat"):
+            preheat_fn(trade_date)
     run_id = _new_run_id(trade_date)
     if dependencies is None:
         if data_dir is None:
@@ -1828,9 +1834,11 @@ def run_auto_pipeline(
     pending_attempt: Path | None = None
     stage = "prepare_inputs"
     try:
-        inputs = resolved_dependencies.prepare_inputs(trade_date)
+        with span("prepare_inputs"):
+            inputs = resolved_dependencies.prepare_inputs(trade_date)
         stage = "compute_report"
-        payload = resolved_dependencies.compute_report(inputs, top_n)
+        with span("compute_report"):
+            payload = resolved_dependencies.compute_report(inputs, top_n)
         stage = "validate_payload"
         if not isinstance(payload, dict):
             raise TypeError("auto report payload must be a dict")
@@ -1853,7 +1861,8 @@ def run_auto_pipeline(
             stage = "finalize_inputs"
             inputs = _finalize_inputs_after_compute(inputs, payload, run_id=run_id)
         stage = "build_manifest"
-        manifest = resolved_dependencies.build_manifest(inputs, payload)
+        with span("build_manifest"):
+            manifest = resolved_dependencies.build_manifest(inputs, payload)
         manifest_run_id = _validate_run_id(getattr(manifest, "run_id", ""))
         if getattr(manifest, "is_healthy", None) is True:
             _publication_payload(payload, manifest, status=AutoRunStatus.HEALTHY)
@@ -1874,16 +1883,17 @@ def run_auto_pipeline(
                 pending_state,
             )
             stage = "advance_pending"
-            canonical, _final_state, pending_removed = _advance_pending_state(
-                pending_handle,
-                pending_state,
-                update_tracking=resolved_dependencies.update_tracking,
-                publish_canonical=lambda exact_payload: resolved_dependencies.publish_canonical(
-                    exact_payload, manifest
-                ),
-                state_hook=resolved_dependencies.state_hook,
-                runtime_payload=payload,
-            )
+            with span("publish_canonical"):
+                canonical, _final_state, pending_removed = _advance_pending_state(
+                    pending_handle,
+                    pending_state,
+                    update_tracking=resolved_dependencies.update_tracking,
+                    publish_canonical=lambda exact_payload: resolved_dependencies.publish_canonical(
+                        exact_payload, manifest
+                    ),
+                    state_hook=resolved_dependencies.state_hook,
+                    runtime_payload=payload,
+                )
             return AutoRunResult(
                 AutoRunStatus.HEALTHY,
                 0,
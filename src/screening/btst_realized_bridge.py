@@ -25,6 +25,7 @@ from src.screening.recommendation_tracker import (
     _optional_date_string,
     _record_key,
     fetch_actual_returns,
+    flush_tracking_history,
     HISTORY_FILENAME,
 )
 
@@ -99,6 +100,8 @@ def backfill_btst_realized(
         return 0
 
     history_path = search_dir / HISTORY_FILENAME
+    # 本桥直接重写 JSON: 先补齐 nightly 待写的追踪库导出, 否则库中新记录会被覆盖
+    flush_tracking_history(history_path)
     history = _load_history(history_path)
     index: dict[tuple[str, str], dict[str, Any]] = {_record_key(r): r for r in history}
 
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from src.data.trading_index import get_trading_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -156,6 +158,16 @@ def save_cooldown_registry(registry: dict[str, str], *, cooldown_file: Path, sna
     _atomic_write_json(cooldown_file, registry)
 
 
+def _cooldown_expire_date(trade_date: str, days: int) -> str:
+    # 本地交易日历索引已覆盖时按真实交易日顺延；否则用 days * 1.5 个自然日近似
+    index = get_trading_index()
+    if index is not None:
+        expire_date = index.shift_trading_days(trade_date, days)
+        if expire_date is not None:
+            return expire_date
+    return (datetime.strptime(trade_date, "%Y%m%d") + timedelta(days=int(days * 1.5))).strftime("%Y%m%d")
+
+
 def add_cooldown(
     ticker: str,
     trade_date: str,
@@ -165,9 +177,7 @@ def add_cooldown(
     save_cooldown_registry_fn: Callable[[dict[str, str]], None],
 ) -> None:
     registry = load_cooldown_registry_fn()
-    dt = datetime.strptime(trade_date, "%Y%m%d")
-    expire_dt = dt + timedelta(days=int(days * 1.5))
-    registry[ticker] = expire_dt.strftime("%Y%m%d")
+    registry[ticker] = _cooldown_expire_date(trade_date, days)
     save_cooldown_registry_fn(registry)
 
 
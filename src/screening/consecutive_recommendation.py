@@ -22,6 +22,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from src.screening.report_warehouse import get_report_warehouse
+from src.screening.tracking_store import pending_export_records
 from src.utils.numeric import safe_float as _coerce_score_b
 
 logger = logging.getLogger(__name__)
@@ -106,6 +108,10 @@ def load_tracking_history(report_dir: Path) -> list[dict[str, Any]]:
     daily_brief / winrate_dashboard 共享, 消除 4 处重复代码。
     """
     path = report_dir / "tracking_history.json"
+    # nightly 更新只写 SQLite 追踪库, 导出待写时库中才是最新记录
+    pending = pending_export_records(path)
+    if pending is not None:
+        return pending
     if not path.exists():
         return []
     try:
@@ -264,43 +270,28 @@ def load_auto_screening_history(
             return []
     start_dt = end_dt - timedelta(days=lookback_days - 1)
 
-    collected: list[tuple[datetime, dict[str, Any]]] = []
-    for path in report_dir.glob("auto_screening_*.json"):
-        match = _REPORT_FILENAME_PATTERN.match(path.name)
-        if not match:
-            continue
-        date_str = match.group(1)
+    collected: list[dict[str, Any]] = []
+    warehouse = get_report_warehouse(report_dir)
+    for entry in warehouse.reports(start_dt.strftime("%Y%m%d"), end_dt.strftime("%Y%m%d"), descending=True):
         try:
-            report_dt = _parse_date(date_str)
+            _parse_date(entry.trade_date)
         except ValueError:
             continue
-        if report_dt < start_dt or report_dt > end_dt:
-            continue
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as exc:
-            logger.warning("[ConsecutiveRec] 跳过损坏报告 %s: %s", path.name, exc)
+        if entry.payload is None:
+            logger.warning("[ConsecutiveRec] 跳过损坏报告 %s: %s", entry.path.name, entry.error)
             continue
-        collected.append((report_dt, {"date": date_str, "payload": payload, "path": str(path)}))
-
-    collected.sort(key=lambda pair: pair[0], reverse=True)
-    return [item for _, item in collected]
+        collected.append({"date": entry.trade_date, "payload": entry.payload, "path": str(report_dir / entry.path.name)})
+    return collected
 
 
 def _latest_report_date(report_dir: Path) -> datetime | None:
     """返回 ``report_dir`` 下最新报告的日期。"""
-    latest: datetime | None = None
-    for path in report_dir.glob("auto_screening_*.json"):
-        match = _REPORT_FILENAME_PATTERN.match(path.name)
-        if not match:
-            continue
+    for date_str in reversed(get_report_warehouse(report_dir).report_dates()):
         try:
-            dt = _parse_date(match.group(1))
+            return _parse_date(date_str)
         except ValueError:
             continue
-        if latest is None or dt > latest:
-            latest = dt
-    return latest
+    return None
 
 
 # ---------------------------------------------------------------------------
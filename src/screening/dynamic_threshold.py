@@ -29,6 +29,7 @@ from src.screening.recommendation_tracker import (
     _latest_recommended_date,
     _parse_date,
 )
+from src.screening.tracking_store import pending_export_records
 from colorama import Fore, Style
 
 # ---------------------------------------------------------------------------
@@ -156,15 +157,17 @@ def _load_recent_hit_rate(
     Returns (hit_rate, sample_size) or (None, 0) if no data.
     """
     history_path = reports_dir / "tracking_history.json"
-    if not history_path.exists():
-        return None, 0
+    records = pending_export_records(history_path)  # nightly 更新未导出时以追踪库为准
+    if records is None:
+        if not history_path.exists():
+            return None, 0
 
-    try:
-        history = json.loads(history_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return None, 0
+        try:
+            history = json.loads(history_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None, 0
 
-    records = history.get("records") if history.get("records") else (history if isinstance(history, list) else [])
+        records = history.get("records") if history.get("records") else (history if isinstance(history, list) else [])
     if not records:
         return None, 0
 
@@ -20,6 +20,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from src.screening.report_warehouse import get_report_warehouse
 from src.screening.state_type_calibration import _score_bucket
 from colorama import Fore, Style
 
@@ -247,26 +248,20 @@ def load_factor_attribution_by_state_records(
 
     NS-6 数据源 (用户方法论: 不等 score_decomposition 持久化成熟):
       - tracking_history.records: (ticker, recommended_date, next_5day/10day return)
-      - auto_screening_*.json recommendations: (ticker, date → score_decomposition
-        + market_state.state_type)
+      - auto_screening_*.json recommendations (经报告仓库, 限 tracking 覆盖的日期窗口):
+        (ticker, date → score_decomposition + market_state.state_type)
       - join on (ticker, date) → records with (state_type, score_decomposition, returns)
 
     Returns:
         list of records, 每条含 state_type + score_decomposition + next_5day_return
         + next_10day_return. 缺字段的不含该字段 (消费侧 _finite_float 跳过).
     """
-    import json
+    from src.screening.consecutive_recommendation import load_tracking_history
 
     reports_dir = Path(reports_dir)
-    # 1. tracking_history → {(ticker, date): returns}
-    th_path = reports_dir / "tracking_history.json"
+    # 1. tracking_history (含 nightly 未导出的追踪库记录) → {(ticker, date): returns}
     return_map: dict[tuple[str, str], dict[str, Any]] = {}
-    try:
-        th_payload = json.loads(th_path.read_text(encoding="utf-8"))
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
-        th_payload = {"records": []}
-    th_records = th_payload.get("records", th_payload) if isinstance(th_payload, dict) else th_payload
-    for rec in th_records:
+    for rec in load_tracking_history(reports_dir):
         if not isinstance(rec, dict):
             continue
         tk = str(rec.get("ticker", "") or "").strip()
@@ -278,13 +273,16 @@ def load_factor_attribution_by_state_records(
             "next_10day_return": rec.get("next_10day_return"),
         }
 
-    # 2. 历史报告 recommendations → join
+    if not return_map:
+        return []  # 无 realized return, 无可 join 的报告
+
+    # 2. 历史报告 recommendations → join; 报告仓库按 tracking 覆盖的日期窗口取历史投影,
+    # 不再 glob + json.load 全部报告
+    tracked_dates = sorted(d for d in (dt.replace("-", "") for _, dt in return_map) if len(d) == 8 and d.isdigit())
+    start, end = (tracked_dates[0], tracked_dates[-1]) if tracked_dates else (None, None)
     out: list[dict[str, Any]] = []
-    for report_path in sorted(reports_dir.glob("auto_screening_*.json")):
-        try:
-            payload = json.loads(report_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            continue
+    for entry in get_report_warehouse(reports_dir).reports(start, end):
+        payload = entry.payload
         if not isinstance(payload, dict):
             continue
         date = str(payload.get("date", "") or "").strip()
@@ -140,10 +140,12 @@ def assess_tracking_history(report_dir: Optional[Path] = None) -> dict:
         load_tracking_history,
         resolve_report_dir,
     )
+    from src.screening.tracking_store import tracking_mtime
 
     rd = Path(report_dir) if report_dir else resolve_report_dir()
     th = rd / "tracking_history.json"
-    mtime = th.stat().st_mtime if th.exists() else None
+    # nightly 更新只写 SQLite 追踪库 (JSON 导出待写) — 新鲜度取 JSON 与库文件中最新的 mtime
+    mtime = tracking_mtime(th)
     latest_date: Optional[str] = None
     try:
         recs = load_tracking_history(rd)
@@ -39,8 +39,17 @@ from src.screening.offensive.pit_evidence import (
     canonical_price_row_fingerprint,
     validate_price_artifact,
 )
+from src.screening.offensive.price_partitions import (
+    append_writes_enabled,
+    compact_price_partitions,
+    file_ends_with_newline,
+    pending_price_partitions,
+    price_file_lock,
+    schedule_price_partition_compaction,
+    write_price_partition,
+)
 from src.tools.ashare_board_utils import is_excluded_ticker
-from src.utils.atomic_files import atomic_write_csv, atomic_write_json
+from src.utils.atomic_files import append_csv_rows, atomic_write_csv, atomic_write_json
 from src.utils.date_utils import latest_open_trade_date_on_or_before
 
 logger = logging.getLogger(__name__)
@@ -370,6 +379,41 @@ def _price_frame_unchanged(combined: pd.DataFrame, old: pd.DataFrame) -> bool:
     return bool(aligned.equals(old_normalized))
 
 
+def _can_append_price_row(path: Path, old: pd.DataFrame, row: dict) -> bool:
+    """新行可直接追加到文件末尾 → True (结果与全量合并重写逐位一致)。
+
+    前提: 既有帧日期已归一化、严格递增且唯一 (即上次由本模块写出), 新行日期
+    晚于末行, 新行字段都在表头内, 磁盘文件以换行结尾。任一不满足 → 回落全量重写。
+    """
+    if not append_writes_enabled() or old is None or old.empty or "date" not in old.columns:
+        return False
+    if not set(row) <= set(old.columns) or not path.exists():
+        return False
+    raw_dates = old["date"].astype(str)
+    dates = _price_dates(old["date"])
+    if not (dates.equals(raw_dates) and dates.is_monotonic_increasing and dates.is_unique):
+        return False
+    return str(row["date"]) > dates.iloc[-1] and file_ends_with_newline(path)
+
+
+def _append_price_cache_row(
+    path: Path,
+    old: pd.DataFrame,
+    row: dict,
+    artifact_sink: Callable[[pd.DataFrame], None] | None,
+) -> pd.DataFrame:
+    # 只校验新行: 既有行在写入时已逐行校验过; 证据仍是完整历史 (下游指纹不变),
+    # 既有行若被外部损坏, canonical_price_fingerprint 照样 fail-closed。
+    new_row = pd.DataFrame([row])
+    validate_price_artifact(new_row, path.stem)
+    combined = pd.concat([old, new_row], ignore_index=True)
+    combined["date"] = _price_dates(combined["date"])
+    if artifact_sink is not None:
+        artifact_sink(combined.copy(deep=True))
+    append_csv_rows(path, new_row.reindex(columns=list(old.columns)))
+    return combined
+
+
 def _write_price_cache_row(
     path: Path,
     row: dict,
@@ -379,12 +423,26 @@ def _write_price_cache_row(
 ) -> tuple[pd.DataFrame, bool]:
     """Append-or-replace one daily row. Returns (written_frame, wrote_to_disk).
 
+    追加快路径: 新交易日晚于既有末行时只校验新行并追加一行 (O(1) 写盘),
+    见 ``price_partitions``; 替换 / 乱序 / 非规范文件才走下面的全量路径。
     幂等快路径: 合并结果与既有缓存一致 (当日行已写入且值未变) 时跳过
     全量校验 + 原子重写 — 1583 行 x 794 票的全历史重写实测 ~90s/轮,
     重复运行时这些写盘全是空转。证据经 artifact_sink 照采, 下游指纹不受影响;
     只有真实变化才走 validate_price_artifact 全量校验 + 写盘 (fail-closed 不变)。
     existing_frame 只被 concat 读取, 不做原地修改, 调用方无需再先深拷贝。
+    整个读-判-写持有该文件的 ``price_file_lock``, 与后台分区压实互斥。
     """
+    with price_file_lock(path):
+        return _write_price_cache_row_locked(path, row, existing_frame=existing_frame, artifact_sink=artifact_sink)
+
+
+def _write_price_cache_row_locked(
+    path: Path,
+    row: dict,
+    *,
+    existing_frame: pd.DataFrame | None,
+    artifact_sink: Callable[[pd.DataFrame], None] | None,
+) -> tuple[pd.DataFrame, bool]:
     old = (
         existing_frame
         if existing_frame is not None
@@ -394,6 +452,8 @@ def _write_price_cache_row(
             else pd.DataFrame()
         )
     )
+    if _can_append_price_row(path, old, row):
+        return _append_price_cache_row(path, old, row, artifact_sink), True
     combined = pd.concat([old, pd.DataFrame([row])], ignore_index=True)
     combined["date"] = _price_dates(combined["date"])
     combined = combined.drop_duplicates(subset=["date"], keep="last")
@@ -600,6 +660,21 @@ def _fetch_price_history_with_tushare(ticker: str, start_date: str, end_date: st
     return pd.DataFrame(rows)
 
 
+def _daily_rows_by_ticker(daily_prices_df: pd.DataFrame, trade_date: str) -> dict[str, dict]:
+    """当日 batch 按 6 位代码索引 (向量化过滤交易日, 免 iterrows; 同码取最后一行)。"""
+    if "ts_code" not in daily_prices_df.columns:
+        return {}
+    frame = daily_prices_df
+    if "trade_date" in frame.columns:
+        frame = frame[_fund_flow_dates(frame["trade_date"]) == _fund_flow_date(trade_date)]
+    by_ticker: dict[str, dict] = {}
+    for record in frame.to_dict("records"):
+        ticker = _code6(record.get("ts_code", ""))
+        if ticker:
+            by_ticker[ticker] = record
+    return by_ticker
+
+
 def refresh_price_cache_from_daily_batch(
     trade_date: str,
     *,
@@ -637,15 +712,20 @@ def refresh_price_cache_from_daily_batch(
         stats.price_missing = len(tickers)
         return stats
 
-    by_ticker: dict[str, pd.Series] = {}
-    requested_trade_date = _fund_flow_date(trade_date)
-    for _, row in daily_prices_df.iterrows():
-        row_trade_date = _fund_flow_date(row.get("trade_date", requested_trade_date))
-        if row_trade_date != requested_trade_date:
-            continue
-        ticker = _code6(row.get("ts_code", ""))
-        if ticker:
-            by_ticker[ticker] = row
+    by_ticker = _daily_rows_by_ticker(daily_prices_df, trade_date)
+    day_rows = {
+        ticker: _build_price_row(by_ticker[ticker], trade_date)
+        for ticker in tickers
+        if ticker in by_ticker and ticker not in unreadable_tickers
+    }
+    partition = None
+    if append_writes_enabled() and day_rows:
+        # 先落当日分区 (全部 ticker 一个文件, O(tickers)) 再逐票追加:
+        # 分区即恢复日志, 中途崩溃由下次压实补齐
+        try:
+            partition, _rejected = write_price_partition(cache_dir, trade_date, day_rows)
+        except OSError as exc:
+            logger.warning("[cache_refresh] price partition write failed, per-ticker writes continue: %s", exc)
 
     for ticker in tickers:
         if ticker in unreadable_tickers:
@@ -689,7 +769,7 @@ def refresh_price_cache_from_daily_batch(
             captured: list[pd.DataFrame] = []
             _frame, wrote = _write_price_cache_row(
                 path,
-                _build_price_row(row, trade_date),
+                day_rows[ticker],
                 existing_frame=base_frame,
                 artifact_sink=lambda frame: captured.append(frame),
             )
@@ -707,6 +787,8 @@ def refresh_price_cache_from_daily_batch(
             stats.failed_tickers.append(ticker)
             if evidence_collector is not None:
                 evidence_collector.pop(ticker, None)
+    if partition is not None:
+        schedule_price_partition_compaction(cache_dir)
     return stats
 
 
@@ -1353,6 +1435,10 @@ def refresh_daily_action_caches(
     # the result and by refresh writers in this run.
     price_dir = Path(price_cache_dir)
     flow_dir = Path(fund_flow_cache_dir)
+    if pending_price_partitions(price_dir):
+        # 上次运行留下未压实的当日分区 (进程在后台压实完成前退出 / 追加中途崩溃):
+        # 先同步补齐, 基线必须读到已完整落盘的缓存
+        compact_price_partitions(price_dir)
     price_frames: dict[str, pd.DataFrame] = {}
     flow_frames: dict[str, pd.DataFrame] = {}
     price_full_frames: dict[str, pd.DataFrame] = {}
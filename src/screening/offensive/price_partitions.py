@@ -0,0 +1,301 @@
+"""Append-only daily partitions for ``data/price_cache``.
+
+``refresh_price_cache_from_daily_batch`` used to read, concat, dedupe, sort,
+validate and atomically rewrite every ticker's full-history CSV to add one
+day (~90s per round for ~800 tickers x ~1600 rows). The daily write path is
+now:
+
+1. the day's rows for every refreshed ticker are validated once and
+   published as one partition, ``<price_cache>/_partitions/price_<YYYYMMDD>.csv``
+   (O(tickers), written before any ticker file is touched);
+2. each ticker CSV whose history ends before the trade date gets the new row
+   appended in place (:func:`src.utils.atomic_files.append_csv_rows`);
+   replacements, out-of-order rows and backfills keep the full rewrite;
+3. :func:`compact_price_partitions` later folds each partition into the
+   per-ticker files (which stay the read format for every consumer) and
+   retires it. It only looks at each file's last line unless the tail
+   disagrees with the partition, so a clean day costs O(tickers).
+
+The partition doubles as the recovery log: a crash between steps 1 and 2, or
+a torn appended line, is repaired by the next compaction. Compaction runs in
+a background thread after the refresh and inline, before the baseline
+capture, when a previous run left partitions behind. Every write to a ticker
+CSV — foreground append / rewrite and compaction alike — holds that file's
+:func:`price_file_lock`, so a background merge-rewrite can never interleave
+with a foreground append to the same file.
+
+Config:
+    PRICE_CACHE_APPEND_WRITES   append-only daily path, default true
+                                (false: legacy full rewrite, no partitions)
+    PRICE_CACHE_COMPACTION      background (default) / inline / off
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import re
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from src.screening.offensive.pit_evidence import PITEvidenceError, validate_price_artifact
+from src.utils.atomic_files import append_csv_rows, atomic_write_csv
+from src.utils.env_helpers import get_env_enabled, get_env_mode
+
+logger = logging.getLogger(__name__)
+
+PARTITION_DIRNAME = "_partitions"
+PRICE_ROW_COLUMNS = ("date", "close", "open", "high", "low", "pct_change", "volume")
+_PARTITION_FILENAME = re.compile(r"^price_(\d{8})\.csv$")
+_TAIL_READ_BYTES = 4096
+
+COMPACTION_BACKGROUND = "background"
+COMPACTION_INLINE = "inline"
+COMPACTION_OFF = "off"
+
+
+def append_writes_enabled() -> bool:
+    return get_env_enabled("PRICE_CACHE_APPEND_WRITES")
+
+
+def compaction_mode() -> str:
+    raw = get_env_mode("PRICE_CACHE_COMPACTION", COMPACTION_BACKGROUND)
+    if raw in {COMPACTION_INLINE, COMPACTION_OFF}:
+        return raw
+    return COMPACTION_BACKGROUND
+
+
+_file_locks: dict[str, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+
+@contextmanager
+def price_file_lock(path: Path | str) -> Iterator[None]:
+    """Hold the per-file write lock of one ticker CSV (shared with compaction)."""
+    key = os.path.abspath(path)
+    with _file_locks_guard:
+        lock = _file_locks.setdefault(key, threading.Lock())
+    with lock:
+        yield
+
+
+def partition_dir(price_cache_dir: Path | str) -> Path:
+    return Path(price_cache_dir) / PARTITION_DIRNAME
+
+
+def partition_path(price_cache_dir: Path | str, trade_date: str) -> Path:
+    compact = str(trade_date).replace("-", "")[:8]
+    return partition_dir(price_cache_dir) / f"price_{compact}.csv"
+
+
+def pending_price_partitions(price_cache_dir: Path | str) -> list[Path]:
+    directory = partition_dir(price_cache_dir)
+    if not directory.is_dir():
+        return []
+    return sorted(path for path in directory.iterdir() if _PARTITION_FILENAME.match(path.name))
+
+
+def write_price_partition(price_cache_dir: Path | str, trade_date: str, rows: Mapping[str, dict]) -> tuple[Path | None, set[str]]:
+    """Validate the day's rows once and publish them as one partition file.
+
+    Each row gets the per-row PIT check ``validate_price_artifact`` applies
+    to a full history. Rejected tickers are left out and returned so their
+    own write fails exactly as before; returns ``(path, rejected)``.
+    """
+    accepted: list[dict] = []
+    rejected: set[str] = set()
+    for ticker, row in sorted(rows.items()):
+        record = {column: row.get(column) for column in PRICE_ROW_COLUMNS}
+        try:
+            validate_price_artifact(pd.DataFrame([record]), ticker)
+        except PITEvidenceError as exc:
+            logger.warning("[price_partitions] %s row rejected from partition: %s", ticker, exc)
+            rejected.add(ticker)
+            continue
+        accepted.append({"ticker": ticker, **record})
+    if not accepted:
+        return None, rejected
+    path = partition_path(price_cache_dir, trade_date)
+    atomic_write_csv(path, pd.DataFrame(accepted))
+    return path, rejected
+
+
+def file_ends_with_newline(path: Path) -> bool:
+    with path.open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        if handle.tell() == 0:
+            return False
+        handle.seek(-1, os.SEEK_END)
+        return handle.read(1) == b"\n"
+
+
+def read_price_partition(path: Path) -> pd.DataFrame:
+    return pd.read_csv(path, dtype={"ticker": str, "date": str})
+
+
+def _read_tail_line(path: Path) -> tuple[str | None, bool]:
+    """Return ``(last complete line, ends_with_newline)`` of *path*."""
+    with path.open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        size = handle.tell()
+        if size == 0:
+            return None, False
+        handle.seek(max(0, size - _TAIL_READ_BYTES))
+        tail = handle.read()
+    ends_with_newline = tail.endswith(b"\n")
+    lines = tail.rstrip(b"\r\n").split(b"\n")
+    if not ends_with_newline:
+        # 最后一行可能是崩溃留下的半截追加，不可信
+        return None, False
+    return lines[-1].decode("utf-8", errors="replace").rstrip("\r"), True
+
+
+def _header_columns(path: Path) -> list[str]:
+    with path.open("r", encoding="utf-8") as handle:
+        return handle.readline().strip().split(",")
+
+
+def _rows_match(line: str, columns: list[str], row: Mapping[str, object]) -> bool:
+    values = line.split(",")
+    if len(values) != len(columns):
+        return False
+    for column, value in zip(columns, values):
+        expected = row.get(column)
+        if column == "date":
+            if value != str(expected):
+                return False
+            continue
+        if expected is None or pd.isna(expected):
+            if value != "":
+                return False
+            continue
+        try:
+            if float(value) != float(expected):
+                return False
+        except ValueError:
+            return False
+    return True
+
+
+@dataclass
+class PriceCompactionStats:
+    partitions: int = 0
+    rows: int = 0
+    verified: int = 0
+    appended: int = 0
+    rewritten: int = 0
+    missing: int = 0
+    failed: int = 0
+    failed_tickers: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _merge_row(path: Path, row: dict) -> None:
+    text = path.read_text(encoding="utf-8")
+    # 丢弃崩溃留下的半截尾行 (无换行结尾)，其值以分区为准
+    old = pd.read_csv(io.StringIO(text[: text.rfind("\n") + 1]), dtype={"date": str})
+    combined = pd.concat([old, pd.DataFrame([row])], ignore_index=True)
+    combined = combined.drop_duplicates(subset=["date"], keep="last").sort_values("date").reset_index(drop=True)
+    validate_price_artifact(combined, path.stem)
+    atomic_write_csv(path, combined)
+
+
+def _compact_row(path: Path, row: dict, stats: PriceCompactionStats) -> None:
+    if not path.exists():
+        # 分区里有、缓存里没有：新票回填历史不足未落盘，或写入前崩溃 — 单行不足以建缓存，跳过
+        stats.missing += 1
+        return
+    last_line, clean_tail = _read_tail_line(path)
+    columns = _header_columns(path)
+    if clean_tail and last_line is not None and _rows_match(last_line, columns, row):
+        stats.verified += 1
+        return
+    last_date = last_line.split(",")[columns.index("date")] if clean_tail and last_line and "date" in columns else None
+    if clean_tail and last_date is not None and last_date < row["date"] and set(row) <= set(columns):
+        append_csv_rows(path, pd.DataFrame([row]).reindex(columns=columns))
+        stats.appended += 1
+        return
+    # 尾行被截断、分区日期不在末尾或值不一致：按分区值全量合并重写
+    _merge_row(path, row)
+    stats.rewritten += 1
+
+
+_compaction_lock = threading.Lock()
+
+
+def compact_price_partitions(price_cache_dir: Path | str) -> PriceCompactionStats:
+    """Fold every pending partition into the per-ticker CSVs, oldest first.
+
+    A partition is deleted only after all of its rows are reflected in the
+    ticker files; tickers that fail are logged and the partition is retired
+    anyway so one bad file cannot pin it forever (the next daily refresh
+    rewrites that ticker through the normal path).
+    """
+    cache_dir = Path(price_cache_dir)
+    stats = PriceCompactionStats()
+    with _compaction_lock:
+        for partition in pending_price_partitions(cache_dir):
+            try:
+                frame = read_price_partition(partition)
+            except Exception as exc:  # noqa: BLE001 - unreadable partition is dropped, cache keeps its rows
+                logger.warning("[price_partitions] unreadable partition %s dropped: %s", partition.name, exc)
+                partition.unlink(missing_ok=True)
+                continue
+            stats.partitions += 1
+            for record in frame.to_dict("records"):
+                ticker = str(record.pop("ticker")).zfill(6)
+                row = {column: record.get(column) for column in PRICE_ROW_COLUMNS}
+                stats.rows += 1
+                try:
+                    path = cache_dir / f"{ticker}.csv"
+                    with price_file_lock(path):
+                        _compact_row(path, row, stats)
+                except Exception as exc:  # noqa: BLE001 - one bad CSV must not stop compaction
+                    logger.warning("[price_partitions] compaction failed for %s (%s): %s", ticker, partition.name, exc)
+                    stats.failed += 1
+                    stats.failed_tickers.append(ticker)
+            partition.unlink(missing_ok=True)
+    if stats.partitions:
+        logger.info("[price_partitions] compacted %d partitions: %s", stats.partitions, stats.to_dict())
+    return stats
+
+
+def schedule_price_partition_compaction(price_cache_dir: Path | str) -> threading.Thread | None:
+    """Run compaction per ``PRICE_CACHE_COMPACTION``; returns the background thread, if any."""
+    mode = compaction_mode()
+    if mode == COMPACTION_OFF or not pending_price_partitions(price_cache_dir):
+        return None
+    if mode == COMPACTION_INLINE:
+        compact_price_partitions(price_cache_dir)
+        return None
+    thread = threading.Thread(target=compact_price_partitions, args=(Path(price_cache_dir),), name="price-partition-compaction", daemon=True)
+    thread.start()
+    return thread
+
+
+__all__ = [
+    "COMPACTION_BACKGROUND",
+    "COMPACTION_INLINE",
+    "COMPACTION_OFF",
+    "PARTITION_DIRNAME",
+    "PRICE_ROW_COLUMNS",
+    "PriceCompactionStats",
+    "append_writes_enabled",
+    "compact_price_partitions",
+    "compaction_mode",
+    "file_ends_with_newline",
+    "partition_path",
+    "pending_price_partitions",
+    "price_file_lock",
+    "read_price_partition",
+    "schedule_price_partition_compaction",
+    "write_price_partition",
+]
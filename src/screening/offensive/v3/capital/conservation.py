@@ -34,6 +34,7 @@ log-growth sentinels, and append-only restatement links).
 
 from __future__ import annotations
 
+import hashlib
 import json
 from dataclasses import dataclass
 from math import gcd
@@ -177,10 +178,167 @@ def _empty_report() -> ConservationReport:
     )
 
 
+# Raw left-fold state of the economic walk before any event; checkpoints
+# carry the same shape (lot keys encoded as ``[lineage, lot]`` pairs) so a
+# resumed walk starts from exactly what the full walk would hold.
+_EMPTY_ECONOMIC_WALK_STATE: dict[str, object] = {
+    "cash_credit_total": 0,
+    "cash_debit_total": 0,
+    "entry_gross": 0,
+    "exit_gross": 0,
+    "fee_total": 0,
+    "dividend_income": 0,
+    "quantity_by_lot": [],
+    "basis_by_lot": [],
+    "consumed_basis_total": 0,
+    "consumed_basis_by_lot": [],
+    "lots_with_revisions": [],
+    "receivable_by_id": {},
+    "share_receivable_by_id": {},
+    "share_receivable_by_lot": [],
+    "receivable_origin_dividend": {},
+    "trade_event_hashes": [],
+    "fee_event_hashes": [],
+}
+
+_EMPTY_FLOW_WALK_STATE: dict[str, object] = {
+    "flow_event_count": 0,
+    "opening_capital": 0,
+    "external_flows": 0,
+    "cash_delta": 0,
+    "issued_units": 0,
+    "pending_units": 0,
+    "sub_suspense": 0,
+    "red_suspense": 0,
+    "payables": {},
+}
+
+_GENESIS_CHAIN_HASH = "0" * 64
+
+
+def _lot_sort_key(key: object) -> tuple[str, ...]:
+    # Lot identities may be None (cash-only events); order them first.
+    return tuple("" if part is None else f"~{part}" for part in key)  # type: ignore[union-attr]
+
+
+def _lot_items(by_lot: dict[tuple[str, str], int]) -> list[list[object]]:
+    return [
+        [key[0], key[1], value]
+        for key, value in sorted(
+            by_lot.items(), key=lambda item: _lot_sort_key(item[0])
+        )
+    ]
+
+
+def _lot_map(items: object) -> dict[tuple[str, str], int]:
+    return {
+        (lineage, lot): int(value)
+        for lineage, lot, value in items  # type: ignore[union-attr]
+    }
+
+
+def _economic_link(row: object) -> str:
+    """Chain input of one economic event: identity plus content hash."""
+
+    return f"{row.economic_event_id}:{row.payload_content_hash}"  # type: ignore[attr-defined]
+
+
+def _flow_link(row: object) -> str:
+    """Chain input of one flow event: its full canonical column set."""
+
+    mapping = dict(row._mapping)  # type: ignore[attr-defined]
+    return hashlib.sha256(
+        json.dumps(mapping, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _extend_chain(chain_hash: str, link: str) -> str:
+    return hashlib.sha256(f"{chain_hash}|{link}".encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ConservationCheckpoint:
+    """Verified replay state at one (stream_version, flow_version) pair.
+
+    ``economic_chain`` / ``flow_chain`` are hash chains over every event up
+    to the checkpoint (h_i = sha256(h_{i-1} | link_i)); the anchor links
+    pin the last event of each stream. The walk states are the raw left
+    folds (canonical JSON) the next verification resumes from, and
+    ``previous_checkpoint_hash`` links successive checkpoints.
+    """
+
+    stream_version: int
+    flow_version: int
+    economic_chain: str
+    flow_chain: str
+    economic_anchor: str | None
+    flow_anchor: str | None
+    economic_leg_count: int
+    economic_state: str
+    flow_state: str
+    previous_checkpoint_hash: str | None
+    checkpoint_hash: str
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        stream_version: int,
+        flow_version: int,
+        economic_chain: str,
+        flow_chain: str,
+        economic_anchor: str | None,
+        flow_anchor: str | None,
+        economic_leg_count: int,
+        economic_state: dict[str, object],
+        flow_state: dict[str, object],
+        previous_checkpoint_hash: str | None,
+    ) -> "ConservationCheckpoint":
+        economic_json = json.dumps(economic_state, sort_keys=True)
+        flow_json = json.dumps(flow_state, sort_keys=True)
+        digest = hashlib.sha256(
+            json.dumps(
+                [
+                    stream_version,
+                    flow_version,
+                    economic_chain,
+                    flow_chain,
+                    economic_anchor,
+                    flow_anchor,
+                    economic_leg_count,
+                    economic_json,
+                    flow_json,
+                    previous_checkpoint_hash,
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+        return cls(
+            stream_version=stream_version,
+            flow_version=flow_version,
+            economic_chain=economic_chain,
+            flow_chain=flow_chain,
+            economic_anchor=economic_anchor,
+            flow_anchor=flow_anchor,
+            economic_leg_count=economic_leg_count,
+            economic_state=economic_json,
+            flow_state=flow_json,
+            previous_checkpoint_hash=previous_checkpoint_hash,
+            checkpoint_hash=digest,
+        )
+
+
 def _replay_economic_events(
     connection: "sqlalchemy.engine.Connection",
+    resume: dict[str, object] | None = None,
+    after_version: int = 0,
 ) -> dict[str, object]:
-    """Replay the economic event legs exactly as Task 2 did."""
+    """Replay the economic event legs exactly as Task 2 did.
+
+    ``resume`` is the raw walk state a checkpoint captured after
+    ``after_version``; only the events past it are read and walked. The
+    returned ``walk_state`` is the state before the revision-lot
+    recomputation, i.e. what the next checkpoint resumes from.
+    """
 
     rows = connection.execute(
         sa.text(
@@ -199,36 +357,59 @@ def _replay_economic_events(
             " FROM economic_events e"
             " JOIN economic_event_legs l"
             " ON l.economic_event_id = e.economic_event_id"
+            " WHERE e.stream_version > :after_version"
             " ORDER BY e.stream_version, l.sequence"
-        )
+        ),
+        {"after_version": after_version},
+    ).all()
+    version_rows = connection.execute(
+        sa.text(
+            "SELECT stream_version, economic_event_id, payload_content_hash"
+            " FROM economic_events WHERE stream_version > :after_version"
+            " ORDER BY stream_version"
+        ),
+        {"after_version": after_version},
     ).all()
-    versions = connection.execute(
-        sa.text("SELECT stream_version FROM economic_events ORDER BY stream_version")
-    ).scalars().all()
-    if list(versions) != list(range(1, len(versions) + 1)):
+    versions = [int(row.stream_version) for row in version_rows]
+    if versions != list(
+        range(after_version + 1, after_version + len(versions) + 1)
+    ):
         _fail("economic event stream is not contiguous", versions=versions)
 
-    cash_credit_total = 0
-    cash_debit_total = 0
-    entry_gross = 0
-    exit_gross = 0
-    fee_total = 0
-    dividend_income = 0
-    quantity_by_lot: dict[tuple[str, str], int] = {}
-    basis_by_lot: dict[tuple[str, str], int] = {}
-    consumed_basis_total = 0
+    state = resume if resume is not None else _EMPTY_ECONOMIC_WALK_STATE
+    cash_credit_total = int(state["cash_credit_total"])
+    cash_debit_total = int(state["cash_debit_total"])
+    entry_gross = int(state["entry_gross"])
+    exit_gross = int(state["exit_gross"])
+    fee_total = int(state["fee_total"])
+    dividend_income = int(state["dividend_income"])
+    quantity_by_lot: dict[tuple[str, str], int] = _lot_map(
+        state["quantity_by_lot"]
+    )
+    basis_by_lot: dict[tuple[str, str], int] = _lot_map(state["basis_by_lot"])
+    consumed_basis_total = int(state["consumed_basis_total"])
     # Plan 02 Task 6: per-lot consumed basis. Lots touched by execution
     # revisions are recomputed from their final active fact set below
     # (retroactive re-projection makes incremental attribution
     # order-dependent).
-    consumed_basis_by_lot: dict[tuple[str, str], int] = {}
-    lots_with_revisions: set[tuple[str, str]] = set()
-    receivable_by_id: dict[str, int] = {}
-    share_receivable_by_id: dict[str, int] = {}
-    share_receivable_by_lot: dict[tuple[str, str], int] = {}
-    receivable_origin_dividend: dict[str, bool] = {}
-    trade_event_hashes: set[str] = set()
-    fee_event_hashes: set[str] = set()
+    consumed_basis_by_lot: dict[tuple[str, str], int] = _lot_map(
+        state["consumed_basis_by_lot"]
+    )
+    lots_with_revisions: set[tuple[str, str]] = {
+        (lineage, lot) for lineage, lot in state["lots_with_revisions"]
+    }
+    receivable_by_id: dict[str, int] = dict(state["receivable_by_id"])
+    share_receivable_by_id: dict[str, int] = dict(
+        state["share_receivable_by_id"]
+    )
+    share_receivable_by_lot: dict[tuple[str, str], int] = _lot_map(
+        state["share_receivable_by_lot"]
+    )
+    receivable_origin_dividend: dict[str, bool] = dict(
+        state["receivable_origin_dividend"]
+    )
+    trade_event_hashes: set[str] = set(state["trade_event_hashes"])
+    fee_event_hashes: set[str] = set(state["fee_event_hashes"])
 
     # Entry cost basis is the cash debit of the same TRADE_EXECUTED event;
     # precompute it per stream version so the replay stays linear.
@@ -817,6 +998,30 @@ def _replay_economic_events(
                         key, row.receivable_id, quantity
                     )
 
+    # The checkpointable walk state: everything above is a pure left fold
+    # over the stream, so resuming it at the next event is exact.
+    walk_state: dict[str, object] = {
+        "cash_credit_total": cash_credit_total,
+        "cash_debit_total": cash_debit_total,
+        "entry_gross": entry_gross,
+        "exit_gross": exit_gross,
+        "fee_total": fee_total,
+        "dividend_income": dividend_income,
+        "quantity_by_lot": _lot_items(quantity_by_lot),
+        "basis_by_lot": _lot_items(basis_by_lot),
+        "consumed_basis_total": consumed_basis_total,
+        "consumed_basis_by_lot": _lot_items(consumed_basis_by_lot),
+        "lots_with_revisions": sorted(
+            [list(key) for key in lots_with_revisions], key=_lot_sort_key
+        ),
+        "receivable_by_id": dict(receivable_by_id),
+        "share_receivable_by_id": dict(share_receivable_by_id),
+        "share_receivable_by_lot": _lot_items(share_receivable_by_lot),
+        "receivable_origin_dividend": dict(receivable_origin_dividend),
+        "trade_event_hashes": sorted(trade_event_hashes),
+        "fee_event_hashes": sorted(fee_event_hashes),
+    }
+
     # Plan 02 Task 6: the committed truth of a revision-touched lot is its
     # final active fact set replayed in original stream order (shared with
     # the kernel projection); the incremental attribution above is exact
@@ -844,11 +1049,19 @@ def _replay_economic_events(
         "share_receivable_by_lot": share_receivable_by_lot,
         "trade_event_hashes": trade_event_hashes,
         "fee_event_hashes": fee_event_hashes,
+        "walk_state": walk_state,
+        "stream_version": after_version + len(versions),
+        "chain_links": [
+            (int(row.stream_version), _economic_link(row))
+            for row in version_rows
+        ],
     }
 
 
 def _replay_flow_events(
     connection: "sqlalchemy.engine.Connection",
+    resume: dict[str, object] | None = None,
+    after_version: int = 0,
 ) -> dict[str, object]:
     """Replay the append-only financing flow stream.
 
@@ -856,23 +1069,34 @@ def _replay_flow_events(
     refunds/cancellations and redemption payments remove cash. Unit quanta
     and payables replay from the same rows, and the redemption-suspense
     bucket follows the deterministic pay-from-suspense-first rule.
+    ``resume``/``after_version`` continue a checkpointed walk.
     """
 
     rows = connection.execute(
-        sa.text("SELECT * FROM capital_flow_events ORDER BY flow_version")
+        sa.text(
+            "SELECT * FROM capital_flow_events"
+            " WHERE flow_version > :after_version ORDER BY flow_version"
+        ),
+        {"after_version": after_version},
     ).all()
     versions = [int(row.flow_version) for row in rows]
-    if versions != list(range(1, len(versions) + 1)):
+    if versions != list(
+        range(after_version + 1, after_version + len(versions) + 1)
+    ):
         _fail("flow event stream is not contiguous", versions=versions)
 
-    opening_capital = 0
-    external_flows = 0
-    cash_delta = 0
-    issued_units = 0
-    pending_units = 0
-    sub_suspense = 0
-    red_suspense = 0
-    payables: dict[str, dict[str, object]] = {}
+    state = resume if resume is not None else _EMPTY_FLOW_WALK_STATE
+    opening_capital = int(state["opening_capital"])
+    external_flows = int(state["external_flows"])
+    cash_delta = int(state["cash_delta"])
+    issued_units = int(state["issued_units"])
+    pending_units = int(state["pending_units"])
+    sub_suspense = int(state["sub_suspense"])
+    red_suspense = int(state["red_suspense"])
+    payables: dict[str, dict[str, object]] = {
+        payable_id: dict(payable)
+        for payable_id, payable in state["payables"].items()  # type: ignore[union-attr]
+    }
 
     for row in rows:
         kind = FlowKind(row.flow_kind)
@@ -979,7 +1203,11 @@ def _replay_flow_events(
             )
 
     return {
-        "flow_event_count": len(rows),
+        "flow_event_count": int(state["flow_event_count"]) + len(rows),
+        "flow_version": after_version + len(rows),
+        "chain_links": [
+            (int(row.flow_version), _flow_link(row)) for row in rows
+        ],
         "opening_capital": opening_capital,
         "external_flows": external_flows,
         "cash_delta": cash_delta,
@@ -1152,25 +1380,161 @@ def _verify_nav_observations(
             )
 
 
+_CHECKPOINT_GUARD_TABLES: tuple[str, ...] = (
+    "capital_flow_events",
+    "economic_event_legs",
+    "economic_events",
+)
+
+
+def _checkpoint_is_trusted(
+    connection: "sqlalchemy.engine.Connection",
+    checkpoint: ConservationCheckpoint,
+) -> bool:
+    """Whether the history below ``checkpoint`` is provably unchanged.
+
+    The immutability triggers must still guard every replayed table (a
+    dropped trigger means rows may have been rewritten in place), both
+    streams must still hold exactly the checkpointed prefix with the same
+    anchor events, and no leg may have been appended to a checkpointed
+    event. Anything else falls back to a full replay.
+    """
+
+    expected_triggers = {
+        f"no_{verb}_{table}"
+        for table in _CHECKPOINT_GUARD_TABLES
+        for verb in ("update", "delete")
+    }
+    present = set(
+        connection.execute(
+            sa.text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        ).scalars()
+    )
+    if not expected_triggers <= present:
+        return False
+
+    n_events = int(checkpoint.stream_version)
+    prefix_count = connection.execute(
+        sa.text(
+            "SELECT COUNT(*) FROM economic_events WHERE stream_version <= :n"
+        ),
+        {"n": n_events},
+    ).scalar()
+    if int(prefix_count) != n_events:
+        return False
+    if n_events:
+        anchor = connection.execute(
+            sa.text(
+                "SELECT economic_event_id, payload_content_hash"
+                " FROM economic_events WHERE stream_version = :n"
+            ),
+            {"n": n_events},
+        ).first()
+        if anchor is None or _economic_link(anchor) != checkpoint.economic_anchor:
+            return False
+    leg_count = connection.execute(
+        sa.text(
+            "SELECT COUNT(*) FROM economic_event_legs l"
+            " JOIN economic_events e"
+            " ON l.economic_event_id = e.economic_event_id"
+            " WHERE e.stream_version <= :n"
+        ),
+        {"n": n_events},
+    ).scalar()
+    if int(leg_count) != int(checkpoint.economic_leg_count):
+        return False
+
+    n_flows = int(checkpoint.flow_version)
+    flow_prefix = connection.execute(
+        sa.text(
+            "SELECT COUNT(*) FROM capital_flow_events WHERE flow_version <= :n"
+        ),
+        {"n": n_flows},
+    ).scalar()
+    if int(flow_prefix) != n_flows:
+        return False
+    if n_flows:
+        anchor = connection.execute(
+            sa.text("SELECT * FROM capital_flow_events WHERE flow_version = :n"),
+            {"n": n_flows},
+        ).first()
+        if anchor is None or _flow_link(anchor) != checkpoint.flow_anchor:
+            return False
+    return True
+
+
+def _chain_at(
+    start: str,
+    links: list[tuple[int, str]],
+    version: int,
+) -> tuple[str, str | None]:
+    """(chain hash, anchor link) after folding links up to ``version``."""
+
+    chain = start
+    anchor: str | None = None
+    for link_version, link in links:
+        if link_version > version:
+            break
+        chain = _extend_chain(chain, link)
+        anchor = link
+    return chain, anchor
+
+
 def verify_conservation(
     connection: "sqlalchemy.engine.Connection",
     metadata: sa.MetaData,
 ) -> ConservationReport:
     """Recompute all identities on one connection; raise on any mismatch."""
 
+    report, _ = verify_conservation_from(connection, metadata, None)
+    return report
+
+
+def verify_conservation_from(
+    connection: "sqlalchemy.engine.Connection",
+    metadata: sa.MetaData,
+    checkpoint: ConservationCheckpoint | None,
+    *,
+    full_replay: bool = False,
+) -> tuple[ConservationReport, ConservationCheckpoint | None]:
+    """Verify conservation, resuming the event replay from ``checkpoint``.
+
+    Only the economic and flow events past a trusted checkpoint are walked;
+    the projection, registry and NAV cross-checks always run in full. A
+    full replay (forced, or because the checkpoint is not trusted) still
+    compares its hash chains against the checkpoint and fails on any
+    divergence of the already-verified prefix. Returns the report and the
+    checkpoint at the verified head (None for an unbound ledger).
+    """
+
     binding_row = connection.execute(
         metadata.tables["account_capital_truth"].select()
     ).first()
     if binding_row is None:
         # An unbound ledger holds no economic facts: conservation is void.
-        return _empty_report()
+        return _empty_report(), None
+
+    resume = (
+        checkpoint
+        if checkpoint is not None
+        and not full_replay
+        and _checkpoint_is_trusted(connection, checkpoint)
+        else None
+    )
+    after_events = resume.stream_version if resume is not None else 0
+    after_flows = resume.flow_version if resume is not None else 0
 
     # Every committed event must carry a frozen economic kind; the replay
     # consumes only typed facts, so an unknown kind fails closed here even
-    # when the event carries no legs.
+    # when the event carries no legs. Kinds below a trusted checkpoint
+    # were already checked.
     known_kinds = {kind.value for kind in EconomicEventKind}
     distinct_kinds = connection.execute(
-        sa.text("SELECT DISTINCT event_kind FROM economic_events")
+        sa.text(
+            "SELECT DISTINCT event_kind FROM economic_events"
+            " WHERE stream_version > :after_version"
+        ),
+        {"after_version": after_events},
     ).all()
     for row in distinct_kinds:
         if row.event_kind not in known_kinds:
@@ -1181,8 +1545,60 @@ def verify_conservation(
 
     # -- replay inputs ---------------------------------------------------------
 
-    economic = _replay_economic_events(connection)
-    flows = _replay_flow_events(connection)
+    economic = _replay_economic_events(
+        connection,
+        json.loads(resume.economic_state) if resume is not None else None,
+        after_events,
+    )
+    flows = _replay_flow_events(
+        connection,
+        json.loads(resume.flow_state) if resume is not None else None,
+        after_flows,
+    )
+
+    economic_links = economic["chain_links"]
+    flow_links = flows["chain_links"]
+    if resume is not None:
+        economic_chain, economic_anchor = _chain_at(
+            resume.economic_chain, economic_links, int(economic["stream_version"])
+        )
+        flow_chain, flow_anchor = _chain_at(
+            resume.flow_chain, flow_links, int(flows["flow_version"])
+        )
+        economic_anchor = economic_anchor or resume.economic_anchor
+        flow_anchor = flow_anchor or resume.flow_anchor
+    else:
+        if checkpoint is not None:
+            # The verified prefix is append-only history: a full replay
+            # must reproduce the checkpoint's chains exactly.
+            prefix_chain, _ = _chain_at(
+                _GENESIS_CHAIN_HASH, economic_links, checkpoint.stream_version
+            )
+            prefix_flow_chain, _ = _chain_at(
+                _GENESIS_CHAIN_HASH, flow_links, checkpoint.flow_version
+            )
+            if (
+                int(economic["stream_version"]) < checkpoint.stream_version
+                or prefix_chain != checkpoint.economic_chain
+            ):
+                _fail(
+                    "economic history diverged from the verified checkpoint",
+                    checkpoint_stream_version=checkpoint.stream_version,
+                )
+            if (
+                int(flows["flow_version"]) < checkpoint.flow_version
+                or prefix_flow_chain != checkpoint.flow_chain
+            ):
+                _fail(
+                    "flow history diverged from the verified checkpoint",
+                    checkpoint_flow_version=checkpoint.flow_version,
+                )
+        economic_chain, economic_anchor = _chain_at(
+            _GENESIS_CHAIN_HASH, economic_links, int(economic["stream_version"])
+        )
+        flow_chain, flow_anchor = _chain_at(
+            _GENESIS_CHAIN_HASH, flow_links, int(flows["flow_version"])
+        )
 
     event_count = connection.execute(
         sa.text("SELECT COUNT(*) AS n FROM economic_events")
@@ -1505,7 +1921,25 @@ def verify_conservation(
             liabilities_cents=liabilities,
         )
 
-    return ConservationReport(
+    leg_count = connection.execute(
+        sa.text("SELECT COUNT(*) FROM economic_event_legs")
+    ).scalar()
+    next_checkpoint = ConservationCheckpoint.build(
+        stream_version=int(economic["stream_version"]),
+        flow_version=int(flows["flow_version"]),
+        economic_chain=economic_chain,
+        flow_chain=flow_chain,
+        economic_anchor=economic_anchor,
+        flow_anchor=flow_anchor,
+        economic_leg_count=int(leg_count),
+        economic_state=economic["walk_state"],  # type: ignore[arg-type]
+        flow_state={key: flows[key] for key in _EMPTY_FLOW_WALK_STATE},
+        previous_checkpoint_hash=(
+            checkpoint.checkpoint_hash if checkpoint is not None else None
+        ),
+    )
+
+    report = ConservationReport(
         event_count=int(event_count),
         flow_event_count=int(flows["flow_event_count"]),
         opening_capital_cents=opening_capital,
@@ -1530,6 +1964,12 @@ def verify_conservation(
         issued_unit_quanta=int(flows["issued_units"]),
         pending_redeemed_unit_quanta=int(flows["pending_units"]),
     )
+    return report, next_checkpoint
 
 
-__all__ = ["ConservationReport", "verify_conservation"]
+__all__ = [
+    "ConservationCheckpoint",
+    "ConservationReport",
+    "verify_conservation",
+    "verify_conservation_from",
+]
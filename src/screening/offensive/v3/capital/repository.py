@@ -45,8 +45,9 @@ from src.screening.offensive.v3.orchestration.path_guards import (
 )
 
 from src.screening.offensive.v3.capital.conservation import (
+    ConservationCheckpoint,
     ConservationReport,
-    verify_conservation,
+    verify_conservation_from,
 )
 from src.screening.offensive.v3.capital.execution_revisions import (
     EVENT_REVISION_LINK_KIND,
@@ -3401,6 +3402,10 @@ class CapitalRepository:
         self._engine = engine
         self._database_path = database_path
         self._metadata = build_metadata()
+        # Last verified conservation state; in-memory because the v6 ledger
+        # table set is frozen. A fresh repository replays once, then only
+        # the events appended since.
+        self._conservation_checkpoint: ConservationCheckpoint | None = None
 
     @property
     def engine(self) -> sa.engine.Engine:
@@ -5736,12 +5741,31 @@ class CapitalRepository:
 
         return self._run_write_transaction(operation)
 
-    def assert_conservation(self) -> ConservationReport:
-        """Recompute every projection from history; fail loudly on drift."""
+    def assert_conservation(self, *, full_replay: bool = False) -> ConservationReport:
+        """Recompute every projection from history; fail loudly on drift.
+
+        The event replay resumes from the last verified checkpoint when the
+        checkpointed prefix is provably unchanged; ``full_replay=True``
+        walks the whole history (and still checks it against the
+        checkpoint's hash chains).
+        """
 
         with self._engine.connect() as conn:
             with conn.begin():
-                return verify_conservation(conn, self._metadata)
+                report, checkpoint = verify_conservation_from(
+                    conn,
+                    self._metadata,
+                    self._conservation_checkpoint,
+                    full_replay=full_replay,
+                )
+        self._conservation_checkpoint = checkpoint
+        return report
+
+    @property
+    def conservation_checkpoint(self) -> ConservationCheckpoint | None:
+        """The last verified conservation checkpoint (None before any)."""
+
+        return self._conservation_checkpoint
 
     # -- Plan 02 Task 7: backup, rebuild, verification ---------------------
 
@@ -1,6 +1,7 @@
 """PIT evidence store package (Plan 03)."""
 
 from src.screening.offensive.v3.evidence.paired_statistics import (
+    BOOTSTRAP_CHUNK_ELEMENTS,
     BOOTSTRAP_METHODS,
     CDAR_QUANTILE,
     FrozenPairedEvaluation,
@@ -15,6 +16,7 @@ from src.screening.offensive.v3.evidence.paired_statistics import (
 )
 
 __all__ = [
+    "BOOTSTRAP_CHUNK_ELEMENTS",
     "BOOTSTRAP_METHODS",
     "CDAR_QUANTILE",
     "FrozenPairedEvaluation",
@@ -178,41 +178,61 @@ def paired_daily_log_growth(
     )
 
 
-def _block_indices(
+#: Index-matrix element budget per bootstrap chunk (int64 indices plus the
+#: gathered float64 sample: ~64 MiB at the default).
+BOOTSTRAP_CHUNK_ELEMENTS: Final[int] = 1 << 22
+
+
+def _block_index_matrix(
     method: str,
     n: int,
     block_length: int,
     rng: np.random.Generator,
+    repetitions: int,
 ) -> np.ndarray:
-    """Pre-registered block bootstrap resampling schemes.
+    """Pre-registered block bootstrap resampling schemes, one row per resample.
 
     - ``moving``: fixed-length blocks with uniformly drawn starts.
     - ``circular``: fixed-length blocks wrapped around the series end.
     - ``stationary``: Politis-Romano geometric block lengths, wrapped.
+
+    The seed contract is the exact draw sequence of one resample after
+    another: ``Generator.integers`` does not carry its 32-bit buffer across
+    calls and stationary interleaves start/length draws, so the draws keep
+    their per-resample calls and only the index assembly is batched.
     """
 
-    if method == "moving":
-        starts = rng.integers(0, n - block_length + 1, size=(n // block_length + 1))
-    elif method == "circular":
-        starts = rng.integers(0, n, size=(n // block_length + 1))
-    elif method == "stationary":
-        indices: list[int] = []
-        while len(indices) < n:
-            start = int(rng.integers(0, n))
-            length = min(int(rng.geometric(1.0 / block_length)), n)
-            for offset in range(length):
-                indices.append((start + offset) % n)
-                if len(indices) == n:
-                    break
-        return np.asarray(indices, dtype=np.int64)
-    else:
-        raise PairedStatisticsError(
-            "unregistered_method",
-            f"bootstrap method {method!r} is not pre-registered",
-        )
-    return np.concatenate(
-        [np.arange(start, start + block_length) % n for start in starts]
-    )[:n]
+    if method in ("moving", "circular"):
+        blocks = n // block_length + 1
+        high = n - block_length + 1 if method == "moving" else n
+        starts = np.empty((repetitions, blocks), dtype=np.int64)
+        for row in range(repetitions):
+            starts[row] = rng.integers(0, high, size=blocks)
+        indices = starts[:, :, np.newaxis] + np.arange(block_length)
+        return indices.reshape(repetitions, blocks * block_length)[:, :n] % n
+    if method == "stationary":
+        probability = 1.0 / block_length
+        block_starts: list[int] = []
+        block_lengths: list[int] = []
+        for _ in range(repetitions):
+            filled = 0
+            while filled < n:
+                start = int(rng.integers(0, n))
+                length = min(int(rng.geometric(probability)), n)
+                # The last block of a resample is truncated at n.
+                length = min(length, n - filled)
+                block_starts.append(start)
+                block_lengths.append(length)
+                filled += length
+        lengths = np.asarray(block_lengths, dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+        shift = np.repeat(np.asarray(block_starts, dtype=np.int64) - offsets, lengths)
+        flat = (shift + np.arange(repetitions * n, dtype=np.int64)) % n
+        return flat.reshape(repetitions, n)
+    raise PairedStatisticsError(
+        "unregistered_method",
+        f"bootstrap method {method!r} is not pre-registered",
+    )
 
 
 def block_bootstrap_lcb(
@@ -223,6 +243,7 @@ def block_bootstrap_lcb(
     repetitions: int,
     seed: int,
     confidence: float,
+    chunk_size: int | None = None,
 ) -> float:
     """One-sided block-bootstrap LCB of the mean of the continuous deltas.
 
@@ -230,7 +251,9 @@ def block_bootstrap_lcb(
     is plan drift and fails closed. ``repetitions``/``seed``/``confidence``
     come from the SAP. The sample must be long enough to form at least one
     full block; anything shorter is ``NOT_ELIGIBLE`` and is never silently
-    downgraded to an IID t-test.
+    downgraded to an IID t-test. Resamples are evaluated as
+    ``(chunk_size, n)`` index matrices (default: bounded by
+    ``BOOTSTRAP_CHUNK_ELEMENTS``); the chunking never changes the result.
     """
 
     if method not in BOOTSTRAP_METHODS:
@@ -256,12 +279,22 @@ def block_bootstrap_lcb(
             n=n,
             block_length=block_length,
         )
+    if chunk_size is None:
+        chunk_size = max(1, BOOTSTRAP_CHUNK_ELEMENTS // n)
+    if chunk_size < 1:
+        raise PairedStatisticsError(
+            "invalid_chunk_size", "bootstrap chunk size must be positive"
+        )
     rng = np.random.default_rng(seed)
     mean = float(sample.mean())
     means = np.empty(repetitions, dtype=np.float64)
-    for index in range(repetitions):
-        indices = _block_indices(method, n, block_length, rng)
-        means[index] = float(sample[indices].mean())
+    # Chunks are drawn in order from the one generator, so any chunk size
+    # reproduces the same resamples; row means reduce over the contiguous
+    # axis with the same pairwise summation as the 1-D mean.
+    for first in range(0, repetitions, chunk_size):
+        rows = min(chunk_size, repetitions - first)
+        indices = _block_index_matrix(method, n, block_length, rng, rows)
+        means[first : first + rows] = sample[indices].mean(axis=1)
     # One-sided lower bound: the (1 - confidence) percentile of the
     # resampled mean distribution, never above the sample mean.
     lower = float(np.quantile(means, 1.0 - confidence))
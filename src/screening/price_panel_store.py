@@ -0,0 +1,456 @@
+"""Columnar, memory-mapped price panel for Layer B scoring.
+
+The per-ticker ``data/price_cache/{ticker6}.csv`` snapshots remain the import
+format.  ``build_price_panel`` converts them into append-only *segments* — one
+``.npy`` column per field (rows grouped by ticker, sorted by date, already
+back-adjusted) — plus an ``index.json`` mapping ticker → (segment, row range).
+A rebuild writes a new segment holding only the tickers whose CSV changed;
+unchanged tickers keep pointing at their old segment, and segments are
+compacted into one once dead rows dominate.  ``PricePanelStore`` memory-maps
+the segments and hands out lookback windows as NumPy views, so ``score_batch``
+no longer re-parses thousands of CSV files per run.
+
+Only numeric columns are stored.  Non-numeric extras (e.g. a ``ts_code`` or
+``name`` column) are dropped at import with a warning and listed under the
+ticker's ``dropped_columns``; Layer B scoring only consumes numeric fields.
+
+Back-adjustment parity with ``scoring_feature_store._back_adjust_ohlcv``: that
+function anchors the factor chain at the *window's* last row.  The panel stores
+prices anchored at the ticker's latest row together with the cumulative factor,
+so a window ending at row ``b`` is ``adjusted / adj_factor[b]`` — a zero-copy
+view whenever ``adj_factor[b] == 1`` (no corporate action after ``b``).  Rows
+where the pct_change chain is broken are counted in ``adj_break`` so windows
+straddling a break fall back to raw prices exactly like the CSV path.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import secrets
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import RLock
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.utils.atomic_files import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+PANEL_FORMAT_VERSION = 2
+_INDEX_NAME = "index.json"
+_OHLCV_COLUMNS = ("open", "close", "high", "low", "volume")
+_ADJUSTED_COLUMNS = ("open", "close", "high", "low")
+_INTERNAL_COLUMNS = ("date", "adj_factor", "adj_break")
+# 引用中的段里失效行 (已被新段取代的旧版本) 占比超过该值, 或引用的段数超过上限时,
+# 整体压实为单段
+_COMPACT_DEAD_RATIO = 0.3
+_COMPACT_MAX_SEGMENTS = 16
+
+
+def _ticker6(ticker: str) -> str:
+    return str(ticker).split(".")[0].zfill(6)
+
+
+def _source_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return int(stat_result.st_mtime_ns), int(stat_result.st_size)
+
+
+@dataclass(frozen=True)
+class PriceWindow:
+    """Zero-copy OHLCV lookback window for one ticker.
+
+    ``columns`` maps field name → 1-D array aligned with ``dates``.  Arrays are
+    read-only views into the memory-mapped panel unless a rescale was needed;
+    callers that mutate must copy explicitly (``to_frame`` does).
+    """
+
+    ticker: str
+    dates: np.ndarray
+    columns: dict[str, np.ndarray]
+    column_order: tuple[str, ...]
+
+    @property
+    def empty(self) -> bool:
+        return len(self.dates) == 0
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Materialize the window in ``ScoringFeatureStore.load_price_frame`` shape."""
+
+        index = pd.DatetimeIndex(np.array(self.dates, copy=True), name="Date")
+        return pd.DataFrame(
+            {name: np.array(self.columns[name], copy=True) for name in self.column_order},
+            index=index,
+        )
+
+
+def _adjustment_arrays(closes: np.ndarray, pcts: np.ndarray | None) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(adj_factor, adj_break)`` for one ticker's rows.
+
+    ``adj_factor[i]`` is the back-adjust factor anchored at the last row with
+    broken steps treated as neutral.  ``adj_break[k]`` counts chain breaks at
+    rows ``<= k``; a break at ``k`` means ``pct[k]`` is non-finite or the step
+    ``k-1 → k`` is invalid.  A window ``[a, b]`` is adjustable iff ``pct[a]`` is
+    finite and ``adj_break[b] == adj_break[a]``.
+    """
+
+    n = len(closes)
+    factors = np.ones(n, dtype=np.float64)
+    breaks = np.zeros(n, dtype=np.int32)
+    if pcts is None or n == 0:
+        return factors, breaks
+    broken = ~np.isfinite(pcts)
+    for i in range(n - 2, -1, -1):
+        prev_close = float(closes[i])
+        next_close = float(closes[i + 1])
+        true_step = 1.0 + float(pcts[i + 1]) / 100.0
+        if not math.isfinite(prev_close) or not math.isfinite(next_close) or prev_close <= 0 or not math.isfinite(true_step) or true_step <= 0:
+            broken[i + 1] = True
+            factors[i] = factors[i + 1]
+            continue
+        factors[i] = factors[i + 1] * (next_close / prev_close) / true_step
+    np.cumsum(broken, out=breaks)
+    return factors, breaks
+
+
+def _read_price_csv(path: Path) -> pd.DataFrame | None:
+    """Parse one price_cache CSV with the same row rules as the CSV read path."""
+
+    try:
+        frame = pd.read_csv(path, dtype={"date": str})
+    except (OSError, UnicodeDecodeError, ValueError, pd.errors.ParserError, pd.errors.EmptyDataError):
+        return None
+    if frame.empty or "date" not in frame.columns or not set(_OHLCV_COLUMNS).issubset(frame.columns):
+        return None
+    frame = frame.copy()
+    frame["Date"] = pd.to_datetime(frame["date"], errors="coerce")
+    frame = frame.dropna(subset=["Date"]).sort_values("Date", kind="stable")
+    for column in _OHLCV_COLUMNS:
+        frame[column] = pd.to_numeric(frame[column], errors="coerce")
+    frame = frame.dropna(subset=list(_OHLCV_COLUMNS))
+    if "pct_change" in frame.columns:
+        frame["pct_change"] = pd.to_numeric(frame["pct_change"], errors="coerce")
+    return frame.reset_index(drop=True)
+
+
+def _ticker_columns(frame: pd.DataFrame) -> tuple[list[str], list[str]]:
+    """Return ``(stored, dropped)`` column names; only numeric extras are stored."""
+
+    stored: list[str] = list(_OHLCV_COLUMNS)
+    dropped: list[str] = []
+    for column in frame.columns:
+        if column in set(_OHLCV_COLUMNS) | {"date", "Date"}:
+            continue
+        (stored if pd.api.types.is_numeric_dtype(frame[column]) else dropped).append(column)
+    return stored, dropped
+
+
+def _segment_of(path: Path) -> str | None:
+    """``close.<segment>.npy`` → ``<segment>``."""
+
+    parts = path.name.split(".")
+    return parts[1] if len(parts) == 3 else None
+
+
+class PricePanelStore:
+    """Read side of the memory-mapped price panel.
+
+    The index and segment maps are opened lazily once per process and reopened
+    when ``index.json`` changes on disk (a rebuild publishes a new generation).
+    """
+
+    def __init__(self, panel_dir: Path | str = Path("data/price_panel")) -> None:
+        self.panel_dir = Path(panel_dir)
+        self._lock = RLock()
+        self._signature: tuple[int, int] | None = None
+        self._index: dict[str, Any] | None = None
+        self._segments: dict[str, dict[str, np.ndarray]] = {}
+
+    def _ensure_open(self) -> dict[str, Any] | None:
+        index_path = self.panel_dir / _INDEX_NAME
+        signature = _source_signature(index_path)
+        with self._lock:
+            if signature is None:
+                self._signature, self._index, self._segments = None, None, {}
+                return None
+            if signature == self._signature:
+                return self._index
+            try:
+                index = json.loads(index_path.read_text(encoding="utf-8"))
+                if int(index.get("version", 0)) != PANEL_FORMAT_VERSION:
+                    raise ValueError(f"unsupported price panel version {index.get('version')!r}")
+                # 未变化的段沿用已打开的映射, 只为新段建 mmap
+                segments = {
+                    segment_id: self._segments.get(segment_id)
+                    or {name: np.load(self.panel_dir / f"{name}.{segment_id}.npy", mmap_mode="r") for name in meta["fields"]}
+                    for segment_id, meta in index["segments"].items()
+                }
+            except (OSError, KeyError, TypeError, ValueError, AttributeError) as exc:
+                logger.warning("[PricePanel] ignoring unreadable panel at %s: %s", self.panel_dir, exc)
+                self._signature, self._index, self._segments = signature, None, {}
+                return None
+            self._signature, self._index, self._segments = signature, index, segments
+            return index
+
+    def tickers(self) -> list[str]:
+        index = self._ensure_open()
+        return sorted(index["tickers"]) if index else []
+
+    def entry(self, ticker: str) -> dict[str, Any] | None:
+        index = self._ensure_open()
+        if not index:
+            return None
+        return index["tickers"].get(_ticker6(ticker))
+
+    def window(
+        self,
+        ticker: str,
+        trade_date: str,
+        lookback_days: int = 400,
+        *,
+        source_path: Path | None = None,
+    ) -> PriceWindow | None:
+        """Return the ``[trade_date - lookback_days, trade_date]`` window.
+
+        Returns ``None`` when the ticker is not in the panel or ``source_path``
+        (the CSV import) changed since the panel was built, so callers fall
+        back to parsing the CSV.  A missing ``source_path`` is not stale: the
+        panel is then the only copy of the history.
+        """
+
+        ticker6 = _ticker6(ticker)
+        with self._lock:
+            index = self._ensure_open()
+            if not index:
+                return None
+            entry = index["tickers"].get(ticker6)
+            arrays = self._segments.get(entry["segment"]) if entry is not None else None
+        if entry is None or arrays is None:
+            return None
+        if source_path is not None:
+            signature = _source_signature(source_path)
+            if signature is not None and list(signature) != list(entry.get("source_signature") or []):
+                return None
+        start, stop = int(entry["start"]), int(entry["stop"])
+        dates = arrays["date"][start:stop]
+        column_order = tuple(entry["columns"])
+        end_dt = pd.to_datetime(trade_date, format="%Y%m%d", errors="coerce")
+        if pd.isna(end_dt):
+            end_dt = pd.to_datetime(trade_date, errors="coerce")
+        if pd.isna(end_dt):
+            lo, hi = 0, len(dates)
+        else:
+            end64 = np.datetime64(end_dt.to_datetime64(), "ns")
+            start64 = np.datetime64((end_dt - timedelta(days=int(lookback_days))).to_datetime64(), "ns")
+            lo = int(np.searchsorted(dates, start64, side="left"))
+            hi = int(np.searchsorted(dates, end64, side="right"))
+        if hi <= lo:
+            return PriceWindow(ticker6, dates[0:0], {name: arrays[name][start:start] for name in column_order}, column_order)
+        a, b = start + lo, start + hi
+        columns = {name: arrays[name][a:b] for name in column_order}
+        factors = arrays["adj_factor"][a:b]
+        breaks = arrays["adj_break"][a:b]
+        pcts = arrays["pct_change"][a:b] if entry.get("has_pct") and "pct_change" in arrays else None
+        adjustable = pcts is not None and bool(np.isfinite(pcts[0])) and int(breaks[-1]) == int(breaks[0])
+        anchor = float(factors[-1])
+        for name in _ADJUSTED_COLUMNS:
+            if adjustable:
+                if anchor != 1.0:
+                    columns[name] = columns[name] / anchor
+            elif entry.get("adjusted"):
+                columns[name] = columns[name] / factors
+        return PriceWindow(ticker6, dates[lo:hi], columns, column_order)
+
+
+def _write_segment(
+    panel_dir: Path,
+    segment_id: str,
+    segments: list[tuple[str, dict[str, np.ndarray], dict[str, Any]]],
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Write ``segments`` as one panel segment; return its meta and ticker entries."""
+
+    fields = sorted({name for _, data, _ in segments for name in data} | set(_INTERNAL_COLUMNS) | set(_OHLCV_COLUMNS))
+    total = sum(len(data["date"]) for _, data, _ in segments)
+    entries: dict[str, dict[str, Any]] = {}
+    for name in fields:
+        if name == "date":
+            out = np.empty(total, dtype="datetime64[ns]")
+        elif name == "adj_break":
+            out = np.zeros(total, dtype=np.int32)
+        elif name == "adj_factor":
+            out = np.ones(total, dtype=np.float64)
+        else:
+            out = np.full(total, np.nan, dtype=np.float64)
+        cursor = 0
+        for ticker6, data, meta in segments:
+            length = len(data["date"])
+            if name in data:
+                out[cursor : cursor + length] = data[name]
+            entries.setdefault(ticker6, {**meta, "segment": segment_id, "start": cursor, "stop": cursor + length})
+            cursor += length
+        np.save(panel_dir / f"{name}.{segment_id}.npy", out)
+    return {"fields": fields, "rows": total}, entries
+
+
+def _entry_rows(entry: dict[str, Any], arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    start, stop = int(entry["start"]), int(entry["stop"])
+    names = set(entry["columns"]) | set(_INTERNAL_COLUMNS)
+    return {name: arrays[name][start:stop] for name in names}
+
+
+def build_price_panel(
+    price_cache_dir: Path | str = Path("data/price_cache"),
+    panel_dir: Path | str = Path("data/price_panel"),
+    *,
+    tickers: list[str] | None = None,
+) -> dict[str, Any]:
+    """Import changed price_cache CSVs into the panel.
+
+    Tickers whose CSV signature (mtime_ns, size) matches the current panel
+    keep their existing segment rows; only changed files are parsed, and only
+    those tickers are written, as one new segment.  When ``tickers`` is given
+    only those CSVs are checked and every other existing entry is carried over.
+    Nothing is written when no ticker changed.  Once superseded rows make up
+    more than ``_COMPACT_DEAD_RATIO`` of the referenced segments (or more than
+    ``_COMPACT_MAX_SEGMENTS`` segments are referenced), all live rows are
+    rewritten into a single segment.  A new generation is published by
+    atomically replacing ``index.json``; readers on the old generation keep
+    their maps until they notice the new index.
+    """
+
+    price_cache_dir = Path(price_cache_dir)
+    panel_dir = Path(panel_dir)
+    panel_dir.mkdir(parents=True, exist_ok=True)
+    previous = PricePanelStore(panel_dir)
+    previous_index = previous._ensure_open() or {"tickers": {}, "segments": {}}
+    previous_segments = previous._segments
+    if tickers is None:
+        sources = sorted(price_cache_dir.glob("*.csv"))
+    else:
+        sources = [price_cache_dir / f"{_ticker6(ticker)}.csv" for ticker in tickers]
+
+    carried: dict[str, dict[str, Any]] = {}
+    fresh: list[tuple[str, dict[str, np.ndarray], dict[str, Any]]] = []
+    dropped_columns: dict[str, int] = {}
+    parsed = reused = skipped = 0
+    for path in sources:
+        ticker6 = path.stem
+        signature = _source_signature(path)
+        if signature is None:
+            skipped += 1
+            continue
+        old_entry = previous_index["tickers"].get(ticker6)
+        if old_entry is not None and list(old_entry.get("source_signature") or []) == list(signature):
+            carried[ticker6] = old_entry
+            reused += 1
+            continue
+        frame = _read_price_csv(path)
+        if frame is None or frame.empty:
+            skipped += 1
+            continue
+        columns, dropped = _ticker_columns(frame)
+        for column in dropped:
+            dropped_columns[column] = dropped_columns.get(column, 0) + 1
+        closes = frame["close"].astype(float).to_numpy()
+        pcts = frame["pct_change"].to_numpy(dtype=np.float64) if "pct_change" in frame.columns else None
+        factors, breaks = _adjustment_arrays(closes, pcts)
+        data: dict[str, np.ndarray] = {
+            "date": frame["Date"].to_numpy(dtype="datetime64[ns]"),
+            "adj_factor": factors,
+            "adj_break": breaks,
+        }
+        for column in columns:
+            values = pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=np.float64)
+            data[column] = values * factors if column in _ADJUSTED_COLUMNS else values
+        meta: dict[str, Any] = {
+            "columns": columns,
+            "has_pct": pcts is not None,
+            "adjusted": bool(np.any(factors != 1.0)),
+            "source_signature": list(signature),
+        }
+        if dropped:
+            meta["dropped_columns"] = dropped
+        fresh.append((ticker6, data, meta))
+        parsed += 1
+
+    if tickers is not None:
+        # Restricted rebuild: entries outside ``tickers`` carry over untouched;
+        # readers still verify their CSV signature before trusting them.
+        visited = {path.stem for path in sources}
+        for ticker6, old_entry in previous_index["tickers"].items():
+            if ticker6 not in visited:
+                carried[ticker6] = old_entry
+                reused += 1
+    if dropped_columns:
+        logger.warning(
+            "[PricePanel] non-numeric columns are not stored in the panel (column → tickers): %s",
+            dict(sorted(dropped_columns.items())),
+        )
+
+    summary: dict[str, Any] = {
+        "generation": previous_index.get("generation"),
+        "tickers": len(carried) + len(fresh),
+        "rows": sum(int(entry["stop"]) - int(entry["start"]) for entry in carried.values()) + sum(len(data["date"]) for _, data, _ in fresh),
+        "parsed": parsed,
+        "reused": reused,
+        "skipped": skipped,
+        "written_rows": 0,
+        "compacted": False,
+    }
+    if not fresh and set(carried) == set(previous_index["tickers"]) and previous_index.get("generation"):
+        logger.info("[PricePanel] unchanged %s", summary)
+        return summary
+
+    generation = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{secrets.token_hex(4)}"
+    segment_meta = {segment_id: previous_index["segments"][segment_id] for segment_id in {entry["segment"] for entry in carried.values()}}
+    referenced_rows = sum(int(meta["rows"]) for meta in segment_meta.values()) + sum(len(data["date"]) for _, data, _ in fresh)
+    compact = len(segment_meta) + 1 > _COMPACT_MAX_SEGMENTS or (
+        referenced_rows > 0 and (referenced_rows - summary["rows"]) / referenced_rows > _COMPACT_DEAD_RATIO
+    )
+    index_tickers: dict[str, dict[str, Any]] = {}
+    if compact:
+        rows = [(ticker6, _entry_rows(entry, previous_segments[entry["segment"]]), entry) for ticker6, entry in carried.items()]
+        rows.extend(fresh)
+        rows.sort(key=lambda segment: segment[0])
+        meta, index_tickers = _write_segment(panel_dir, generation, rows)
+        segment_meta = {generation: meta}
+    else:
+        index_tickers.update(carried)
+        if fresh:
+            meta, written = _write_segment(panel_dir, generation, fresh)
+            segment_meta[generation] = meta
+            index_tickers.update(written)
+    summary["written_rows"] = int(segment_meta[generation]["rows"]) if generation in segment_meta else 0
+
+    atomic_write_json(
+        panel_dir / _INDEX_NAME,
+        {
+            "version": PANEL_FORMAT_VERSION,
+            "generation": generation,
+            "built_at": datetime.now().isoformat(timespec="seconds"),
+            "source_dir": str(price_cache_dir),
+            "segments": segment_meta,
+            "tickers": dict(sorted(index_tickers.items())),
+        },
+    )
+    for stale in panel_dir.glob("*.npy"):
+        if _segment_of(stale) not in segment_meta:
+            try:
+                stale.unlink()
+            except OSError:
+                logger.debug("[PricePanel] could not remove old segment file %s", stale, exc_info=True)
+    summary.update(generation=generation, compacted=compact)
+    logger.info("[PricePanel] built %s", summary)
+    return summary
@@ -2,7 +2,8 @@
 
 设计目标:
 - **零配置** — 用户跑 ``--auto`` 后自动累积追踪数据，无需手动触发 lookback audit
-- **轻量存储** — JSON 历史；payload 路径对当日做 run-aware exact replacement，
+- **轻量存储** — SQLite 追踪库 (见 ``tracking_store``) 按 ``(ticker, recommended_date)``
+  upsert，同步导出 JSON 历史；payload 路径对当日做 run-aware exact replacement，
   其它日期保留；legacy report 路径按 ``(ticker, recommended_date)`` 幂等
 - **可插拔价格源** — ``fetch_actual_returns`` 接受可注入的 ``use_data_fetcher`` 回调，便于测试
 - **优雅降级** — 历史文件损坏 / 报告缺失 / 价格缺失一律返回 ``None`` 或空列表，不抛出
@@ -29,11 +30,15 @@ import logging
 import math
 import os
 import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable
 
+from src.screening.tracking_store import HORIZON_FIELDS, TrackingStore, bucket_totals, load_current_history, summary_from_totals
 from src.utils.numeric import optional_float as _optional_float
 from src.utils.numeric import safe_float as _safe_float
 from src.utils.atomic_files import atomic_write_json
@@ -536,19 +541,8 @@ def _extract_sorted_closes(
 
 
 def _load_history(history_path: Path) -> list[dict[str, Any]]:
-    """读取 tracking_history.json; 缺失/损坏返回空列表 (优雅降级)。"""
-    if not history_path.exists():
-        return []
-    try:
-        with open(history_path, encoding="utf-8") as f:
-            payload = json.load(f)
-    except (OSError, json.JSONDecodeError) as exc:
-        logger.warning("[Tracking] history 解析失败 %s: %s — 重置为空", history_path, exc)
-        return []
-    records = payload.get("records") if isinstance(payload, dict) else None
-    if not isinstance(records, list):
-        return []
-    return records
+    """读取最新追踪记录 (导出待写时取 SQLite 库, 否则 tracking_history.json); 缺失/损坏返回空列表 (优雅降级)。"""
+    return load_current_history(history_path)
 
 
 def _save_history(history_path: Path, records: list[dict[str, Any]]) -> None:
@@ -557,6 +551,77 @@ def _save_history(history_path: Path, records: list[dict[str, Any]]) -> None:
     atomic_write_json(history_path, payload)
 
 
+# 处于 deferred_tracking_export 批次中的 history 路径 → 嵌套深度
+_deferred_exports: dict[Path, int] = {}
+_deferred_lock = threading.Lock()
+
+
+def _export_deferred(history_path: Path) -> bool:
+    with _deferred_lock:
+        return _deferred_exports.get(Path(history_path).resolve(), 0) > 0
+
+
+def _export_history(store: TrackingStore) -> None:
+    # JSON 仍是其余模块读取的交换格式: 按 recommended_date 降序、ticker 升序导出
+    _save_history(store.history_path, store.records())
+    store.mark_exported()
+
+
+@contextmanager
+def _history_file_lock(history_path: Path) -> Iterator[None]:
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_fd = os.open(history_path.with_suffix(".json.lock"), os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)  # 阻塞直到拿到排他锁
+        yield
+    finally:
+        # finally 释放: 正常返回 / 异常 / Ctrl-C 都释放 fd (flock 随 fd close 自动释放)
+        try:
+            os.close(lock_fd)
+        except OSError:
+            pass
+
+
+def flush_tracking_history(history_path: Path) -> bool:
+    """Export ``tracking_history.json`` if the store holds deferred changes; returns whether it wrote.
+
+    Callers that write the JSON themselves flush first, so the pending store changes are not lost.
+    """
+    history_path = Path(history_path)
+    if not history_path.with_suffix(".sqlite3").exists():
+        return False
+    with _history_file_lock(history_path):
+        store = TrackingStore(history_path)
+        if not store.export_pending:
+            return False
+        _export_history(store)
+    return True
+
+
+@contextmanager
+def deferred_tracking_export(reports_dir: Path, *, history_filename: str = HISTORY_FILENAME) -> Iterator[None]:
+    """Batch several tracking updates into one ``tracking_history.json`` export.
+
+    Updates inside the block only write the SQLite store; the JSON is exported
+    once when the outermost block exits. Readers going through
+    :func:`load_current_history` see the store's records inside the block; raw
+    JSON readers see the pre-batch file.
+    """
+    history_path = Path(reports_dir) / history_filename
+    key = history_path.resolve()
+    with _deferred_lock:
+        _deferred_exports[key] = _deferred_exports.get(key, 0) + 1
+    try:
+        yield
+    finally:
+        with _deferred_lock:
+            depth = _deferred_exports.pop(key) - 1
+            if depth:
+                _deferred_exports[key] = depth
+        if not depth:
+            flush_tracking_history(history_path)
+
+
 def _record_key(rec: dict[str, Any]) -> tuple[str, str]:
     """record 唯一键: (ticker, recommended_date)。"""
     return (str(rec.get("ticker", "") or ""), str(rec.get("recommended_date", "") or ""))
@@ -601,7 +666,12 @@ def update_tracking_history_from_payload(
     *,
     use_data_fetcher: Callable[[str, str, str], list[dict[str, Any]]] | None = None,
 ) -> int:
-    """用本次 run 的精确 payload 替换当日追踪集合，不回读报告文件。"""
+    """用本次 run 的精确 payload 替换当日追踪集合，不回读报告文件。
+
+    nightly (``--auto``) 路径: 只写 SQLite 追踪库并标记导出待写, 不重写整份
+    ``tracking_history.json`` (O(历史)); 读取方经 :func:`load_current_history` 取库中记录,
+    JSON 由 :func:`flush_tracking_history` 补齐。
+    """
     payload_date = str(report_payload.get("date", "") or "")
     if payload_date != trade_date:
         raise ValueError(f"report payload date {payload_date!r} does not match trade_date {trade_date!r}")
@@ -618,6 +688,7 @@ def update_tracking_history_from_payload(
         model_version,
         source_run_id=source_run_id,
         use_data_fetcher=use_data_fetcher,
+        defer_export=True,
     )
 
 
@@ -630,16 +701,14 @@ def _update_tracking_history(
     source_run_id: str | None,
     history_filename: str = HISTORY_FILENAME,
     use_data_fetcher: Callable[[str, str, str], list[dict[str, Any]]] | None = None,
+    defer_export: bool = False,
 ) -> int:
     history_path = reports_dir / history_filename
     # c292 精确化 (文件级 flock 纵深): 守 read-modify-write 临界区, 防止锁外 caller
     # (backfill 脚本 / launcher Step 2) 并发导致 lost-update (后写覆盖先写, 丢 Phase 2
     # 回填的 T+30 returns)。c292 flock 守 --auto 流程内; 本锁守 tracking_history 文件
     # 本身, 不依赖 caller 协调。flock 进程退出自动释放 (crash-safe, kill -9 无 stale-lock)。
-    history_path.parent.mkdir(parents=True, exist_ok=True)
-    _lock_fd = os.open(history_path.with_suffix(".json.lock"), os.O_CREAT | os.O_RDWR, 0o644)
-    try:
-        fcntl.flock(_lock_fd, fcntl.LOCK_EX)  # 阻塞直到拿到排他锁
+    with _history_file_lock(history_path):
         return _update_tracking_history_locked(
             history_path,
             trade_date,
@@ -647,13 +716,8 @@ def _update_tracking_history(
             model_version,
             source_run_id,
             use_data_fetcher,
+            defer_export,
         )
-    finally:
-        # finally 释放: 正常返回 / 异常 / Ctrl-C 都释放 fd (flock 随 fd close 自动释放)
-        try:
-            os.close(_lock_fd)
-        except OSError:
-            pass
 
 
 def _update_tracking_history_locked(
@@ -663,10 +727,17 @@ def _update_tracking_history_locked(
     model_version: str,
     source_run_id: str | None,
     use_data_fetcher: Callable[[str, str, str], list[dict[str, Any]]] | None,
+    defer_export: bool = False,
 ) -> int:
-    """update_tracking_history 的临界区主体 (调用方已持 flock)。"""
-    history = _load_history(history_path)
+    """update_tracking_history 的临界区主体 (调用方已持 flock)。
+
+    只读取可能变动的记录 (当日 + 未 complete)，已 complete 的历史不再回读；
+    变动记录按 (ticker, recommended_date) upsert 进 :class:`TrackingStore`。
+    """
+    store = TrackingStore(history_path)
+    history = store.open_records(trade_date)
     history_index: dict[tuple[str, str], dict[str, Any]] = {_record_key(r): r for r in history}
+    loaded_snapshot = {key: json.dumps(record, sort_keys=True, default=str) for key, record in history_index.items()}
     previous_same_date = {
         key: dict(record)
         for key, record in history_index.items()
@@ -867,10 +938,16 @@ def _update_tracking_history_locked(
                         updated_count += 1
 
     # ----- Phase 3: 落盘 -----
-    records = list(history_index.values())
-    # 按 recommended_date 降序、ticker 升序排序 — 便于阅读
-    records.sort(key=lambda r: (-int(r.get("recommended_date", "0") or 0), str(r.get("ticker", ""))))
-    _save_history(history_path, records)
+    upserts = [record for key, record in history_index.items() if loaded_snapshot.get(key) != json.dumps(record, sort_keys=True, default=str)]
+    deletes = [key for key in loaded_snapshot if key not in history_index]
+    store.apply(upserts, deletes)
+    # 首次运行 (尚无 JSON) 仍导出, 让按文件存在性判断"有无历史"的读取方可见
+    if _export_deferred(history_path) or (defer_export and history_path.exists()):
+        if upserts or deletes:
+            store.mark_export_pending()
+    elif upserts or deletes or not store.is_exported():
+        # 无变动且 JSON 即上次导出时跳过整文件重写
+        _export_history(store)
     return updated_count
 
 
@@ -956,53 +1033,8 @@ def _summarize_history(
             continue
         scoped.append(rec)
 
-    total = len(scoped)
-
-    def _bucket(field: str) -> tuple[int, int, float | None, float | None]:
-        wins = 0
-        tracked = 0
-        sum_ret = 0.0
-        for rec in scoped:
-            v = rec.get(field)
-            if v is None:
-                continue
-            try:
-                fv = float(v)
-            except (TypeError, ValueError):
-                continue
-            if not math.isfinite(fv):
-                continue
-            tracked += 1
-            sum_ret += fv
-            if fv > 0:
-                wins += 1
-        win_rate = (wins / tracked) if tracked > 0 else None
-        avg_ret = (sum_ret / tracked) if tracked > 0 else None
-        return wins, tracked, win_rate, avg_ret
-
-    bucket_fields = {
-        1: "next_day_return",
-        3: "next_3day_return",
-        5: "next_5day_return",
-        10: "next_10day_return",
-        15: "next_15day_return",
-        20: "next_20day_return",
-        25: "next_25day_return",
-        30: "next_30day_return",
-    }
-    bucket_stats = {day: _bucket(field) for day, field in bucket_fields.items()}
-
-    summary = {
-        "lookback_days": lookback_days,
-        "total_recommendations": total,
-        "tracked_count": bucket_stats[1][1],
-    }
-    for day, (wins, tracked, win_rate, avg_ret) in bucket_stats.items():
-        summary[f"win_count_day{day}"] = wins
-        summary[f"tracked_count_day{day}"] = tracked
-        summary[f"win_rate_day{day}"] = win_rate
-        summary[f"avg_return_day{day}"] = avg_ret
-    return summary
+    totals = {day: bucket_totals(scoped, field) for day, field in HORIZON_FIELDS.items()}
+    return summary_from_totals(lookback_days, len(scoped), totals)
 
 
 def render_tracking_summary(
@@ -1027,11 +1059,14 @@ def render_tracking_summary(
     Returns:
         多行字符串, 含胜率与平均收益; 无数据时返回提示行。
     """
-    history = _load_history(history_path)
-    if not history:
-        return f"暂无追踪历史 (请先运行 --auto 至少一次): {history_path}\n"
-
-    summary = _summarize_history(history, lookback_days=lookback_days, as_of=as_of)
+    store = TrackingStore.open_existing(history_path)
+    if store is not None and store.count() > 0:
+        summary = store.summarize(lookback_days, as_of=as_of)
+    else:
+        history = _load_history(history_path)
+        if not history:
+            return f"暂无追踪历史 (请先运行 --auto 至少一次): {history_path}\n"
+        summary = _summarize_history(history, lookback_days=lookback_days, as_of=as_of)
     total = summary["total_recommendations"]
 
     if total == 0:
@@ -1084,6 +1119,10 @@ def get_tracking_summary(
 
     Returns:
         详见 ``_summarize_history``。当历史为空时, ``total_recommendations=0``。
+        由 :class:`TrackingStore` 的逐日聚合求和得到 (只读打开, 不建库也不同步);
+        库缺失或落后于 JSON 时回退为扫描 JSON。
     """
-    history = _load_history(history_path)
-    return _summarize_history(history, lookback_days=lookback_days, as_of=as_of)
+    store = TrackingStore.open_existing(history_path)
+    if store is None:
+        return _summarize_history(_load_history(history_path), lookback_days=lookback_days, as_of=as_of)
+    return store.summarize(lookback_days, as_of=as_of)
@@ -43,6 +43,8 @@ from datetime import date
 from pathlib import Path
 from typing import Any
 
+from src.screening.report_warehouse import get_report_warehouse
+
 logger = logging.getLogger(__name__)
 
 # 合法 regime 值 (与 regime_winrate.REGIME_HISTORICAL_WINRATES keys 一致)
@@ -378,29 +380,13 @@ def build_date_to_regime_map(reports_dir: Path) -> dict[str, str]:
         logger.warning("regime_winrate_recompute: reports_dir 不存在: %s", reports_dir)
         return {}
 
-    mapping: dict[str, str] = {}
-    for report_path in sorted(reports_dir.glob("auto_screening_*.json")):
-        try:
-            payload = json.loads(report_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as exc:
-            logger.warning(
-                "regime_winrate_recompute: 跳过损坏报告 %s: %s",
-                report_path.name,
-                exc,
-            )
-            continue
-
-        if not isinstance(payload, dict):
-            continue
-
-        report_date = payload.get("date")
-        if not report_date:
-            continue
+    warehouse = get_report_warehouse(reports_dir)
+    for filename, error in warehouse.unreadable_reports():
+        logger.warning("regime_winrate_recompute: 跳过损坏报告 %s: %s", filename, error)
 
-        market_state = payload.get("market_state") or {}
-        regime = str(market_state.get("regime_gate_level") or "normal").strip().lower()
-
-        mapping[str(report_date)] = regime
+    mapping: dict[str, str] = {}
+    for _filename, report_date, regime in warehouse.regimes():
+        mapping[report_date] = str(regime or "normal").strip().lower()
 
     return mapping
 
@@ -0,0 +1,448 @@
+"""Indexed warehouse over ``data/reports/auto_screening_*.json``.
+
+Multi-day consumers (``load_auto_screening_history`` and its ~20 callers,
+signal decay, regime win-rate recompute, ...) used to ``glob`` the report
+directory and ``json.load`` every report in their window on each call; a
+report carries the full Layer-A ``candidate_pool_run`` (hundreds of rows), so
+cost grew linearly with history depth.
+
+``ReportWarehouse`` keeps one SQLite table per reports directory:
+
+- ``reports``: one row per ``auto_screening_*.json`` file, keyed by file
+  name, with the file signature (mtime_ns / size / inode), parse status,
+  ``date``, regime and a *history projection* of the payload (the payload
+  minus the publication-only ``candidate_pool_run`` / ``shadow_rank``
+  blocks, which no history consumer reads);
+- ``recommendations``: one row per recommendation, indexed by
+  ``(trade_date)`` and ``(ticker, trade_date)``, with score / price columns,
+  the score decomposition and the original record.
+
+``sync()`` is incremental: it stats the directory and re-ingests only files
+whose signature changed, so queries stay cheap however many days accumulate.
+``auto_pipeline`` calls :meth:`ReportWarehouse.publish` right after writing a
+canonical report; any other writer is picked up by the next ``sync()``.
+
+The database lives under ``REPORT_WAREHOUSE_DIR`` (default
+``data/report_warehouse``), one file per reports directory.
+``REPORT_WAREHOUSE_ENABLED=false`` (or an unwritable location) keeps the index
+in memory for the life of the process instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.utils.env_helpers import get_env_enabled
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+DEFAULT_WAREHOUSE_DIR = Path("data/report_warehouse")
+REPORT_GLOB_PREFIX = "auto_screening_"
+_CANONICAL_FILENAME = re.compile(r"^auto_screening_(\d{8})\.json$")
+# 发布专用的大块字段：历史消费者从不读取，投影时剔除以减小每日解析量
+HISTORY_EXCLUDED_KEYS = ("candidate_pool_run", "shadow_rank")
+
+STATUS_OK = "ok"
+STATUS_CORRUPT = "corrupt"
+STATUS_INVALID = "invalid"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS warehouse_meta (
+  key TEXT PRIMARY KEY,
+  value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reports (
+  filename TEXT PRIMARY KEY,
+  file_date TEXT,
+  signature TEXT NOT NULL,
+  status TEXT NOT NULL,
+  error TEXT,
+  payload_date TEXT,
+  regime TEXT,
+  model_version TEXT,
+  history_json TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reports_file_date ON reports(file_date);
+CREATE TABLE IF NOT EXISTS recommendations (
+  filename TEXT NOT NULL,
+  position INTEGER NOT NULL,
+  trade_date TEXT NOT NULL,
+  ticker TEXT NOT NULL,
+  score_b REAL,
+  score_final REAL,
+  recommended_price REAL,
+  regime TEXT,
+  decomposition_json TEXT,
+  record_json TEXT NOT NULL,
+  PRIMARY KEY (filename, position)
+);
+CREATE INDEX IF NOT EXISTS idx_recommendations_date ON recommendations(trade_date);
+CREATE INDEX IF NOT EXISTS idx_recommendations_ticker ON recommendations(ticker, trade_date);
+"""
+
+
+@dataclass(frozen=True)
+class ReportEntry:
+    """One canonical report. ``payload`` is the history projection; ``None`` with ``error`` set when unreadable."""
+
+    trade_date: str
+    path: Path
+    payload: dict[str, Any] | None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class RecommendationRow:
+    trade_date: str
+    ticker: str
+    rank: int
+    score_b: float | None
+    score_final: float | None
+    recommended_price: float | None
+    regime: str | None
+    score_decomposition: dict[str, Any] | None
+    record: dict[str, Any]
+
+
+def warehouse_enabled() -> bool:
+    return get_env_enabled("REPORT_WAREHOUSE_ENABLED")
+
+
+def _warehouse_db_path(reports_dir: Path) -> Path:
+    base = Path(os.getenv("REPORT_WAREHOUSE_DIR", "").strip() or DEFAULT_WAREHOUSE_DIR)
+    digest = hashlib.sha1(str(reports_dir).encode("utf-8")).hexdigest()[:16]
+    return base / f"reports_{digest}.sqlite3"
+
+
+def _float_or_none(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _regime_of(payload: dict[str, Any]) -> str | None:
+    market_state = payload.get("market_state")
+    if not isinstance(market_state, dict):
+        return None
+    regime = market_state.get("regime_gate_level")
+    return str(regime) if regime not in (None, "") else None
+
+
+def _signature(stat_result: os.stat_result) -> str:
+    return f"{stat_result.st_mtime_ns}:{stat_result.st_size}:{stat_result.st_ino}"
+
+
+def _date_bounds(column: str, start: str | None, end: str | None) -> tuple[str, list[str]]:
+    clauses: list[str] = []
+    params: list[str] = []
+    if start is not None:
+        clauses.append(f"{column} >= ?")
+        params.append(start)
+    if end is not None:
+        clauses.append(f"{column} <= ?")
+        params.append(end)
+    return (" AND " + " AND ".join(clauses)) if clauses else "", params
+
+
+class ReportWarehouse:
+    """Incrementally synced SQLite index over one reports directory. Thread-safe."""
+
+    def __init__(self, reports_dir: Path | str, *, db_path: Path | str | None = None) -> None:
+        """``db_path=None`` keeps the index in memory; use :func:`get_report_warehouse` for the env-configured location."""
+        self.reports_dir = Path(reports_dir)
+        self._lock = threading.RLock()
+        self._memory_conn: sqlite3.Connection | None = None
+        self.db_path: Path | None = Path(db_path) if db_path is not None else None
+        try:
+            self._initialize()
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("[ReportWarehouse] %s 不可用，改用进程内索引: %s", self.db_path, exc)
+            self.db_path = None
+            self._initialize()
+
+    # ------------------------------------------------------------------
+    # Connection / schema
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.db_path is None:
+            if self._memory_conn is None:
+                self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+                self._memory_conn.row_factory = sqlite3.Row
+            return self._memory_conn
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _close(self, conn: sqlite3.Connection) -> None:
+        if conn is not self._memory_conn:
+            conn.close()
+
+    def _initialize(self) -> None:
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            if self.db_path is not None:
+                conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.executescript(_SCHEMA)
+                row = conn.execute("SELECT value FROM warehouse_meta WHERE key = 'schema_version'").fetchone()
+                if row is not None and int(row["value"]) != SCHEMA_VERSION:
+                    # 派生索引，版本不符直接清空重建
+                    conn.execute("DELETE FROM recommendations")
+                    conn.execute("DELETE FROM reports")
+                conn.execute("INSERT OR REPLACE INTO warehouse_meta(key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        finally:
+            self._close(conn)
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> dict[str, str]:
+        found: dict[str, str] = {}
+        try:
+            with os.scandir(self.reports_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith(REPORT_GLOB_PREFIX) and name.endswith(".json")):
+                        continue
+                    try:
+                        if entry.is_file():
+                            found[name] = _signature(entry.stat())
+                    except OSError:
+                        continue
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+        return found
+
+    def _ingest(self, conn: sqlite3.Connection, filename: str, signature: str, payload: Any = None, *, error: str | None = None) -> None:
+        match = _CANONICAL_FILENAME.match(filename)
+        file_date = match.group(1) if match else None
+        conn.execute("DELETE FROM recommendations WHERE filename = ?", (filename,))
+        if error is not None or not isinstance(payload, dict):
+            status = STATUS_CORRUPT if error is not None else STATUS_INVALID
+            conn.execute(
+                "INSERT OR REPLACE INTO reports(filename, file_date, signature, status, error) VALUES (?, ?, ?, ?, ?)",
+                (filename, file_date, signature, status, error),
+            )
+            return
+
+        regime = _regime_of(payload)
+        history = {key: value for key, value in payload.items() if key not in HISTORY_EXCLUDED_KEYS}
+        payload_date = payload.get("date")
+        conn.execute(
+            "INSERT OR REPLACE INTO reports(filename, file_date, signature, status, error, payload_date, regime, model_version, history_json) VALUES (?, ?, ?, ?, NULL, ?, ?, ?, ?)",
+            (
+                filename,
+                file_date,
+                signature,
+                STATUS_OK,
+                str(payload_date) if payload_date else None,
+                regime,
+                str(payload.get("model_version")) if payload.get("model_version") is not None else None,
+                json.dumps(history, ensure_ascii=False, default=str),
+            ),
+        )
+        if file_date is None:
+            return
+        rows = []
+        for position, rec in enumerate(payload.get("recommendations") or []):
+            if not isinstance(rec, dict) or not rec.get("ticker"):
+                continue
+            decomposition = rec.get("score_decomposition")
+            rows.append(
+                (
+                    filename,
+                    position,
+                    file_date,
+                    str(rec["ticker"]),
+                    _float_or_none(rec.get("score_b")),
+                    _float_or_none(rec.get("score_final")),
+                    _float_or_none(rec.get("recommended_price")),
+                    regime,
+                    json.dumps(decomposition, ensure_ascii=False, default=str) if isinstance(decomposition, dict) else None,
+                    json.dumps(rec, ensure_ascii=False, default=str),
+                )
+            )
+        conn.executemany(
+            "INSERT OR REPLACE INTO recommendations(filename, position, trade_date, ticker, score_b, score_final, recommended_price, regime, decomposition_json, record_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def _ingest_file(self, conn: sqlite3.Connection, filename: str, signature: str) -> None:
+        try:
+            payload = json.loads((self.reports_dir / filename).read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
+            self._ingest(conn, filename, signature, error=f"{type(exc).__name__}: {exc}")
+            return
+        self._ingest(conn, filename, signature, payload)
+
+    def sync(self) -> int:
+        """Bring the index in line with the directory; returns the number of (re)ingested files."""
+        with self._lock:
+            found = self._scan()
+            conn = self._connect()
+            try:
+                with conn:
+                    known = {row["filename"]: row["signature"] for row in conn.execute("SELECT filename, signature FROM reports")}
+                    removed = [name for name in known if name not in found]
+                    for name in removed:
+                        conn.execute("DELETE FROM recommendations WHERE filename = ?", (name,))
+                        conn.execute("DELETE FROM reports WHERE filename = ?", (name,))
+                    changed = [name for name, signature in found.items() if known.get(name) != signature]
+                    for name in sorted(changed):
+                        self._ingest_file(conn, name, found[name])
+            finally:
+                self._close(conn)
+            if changed:
+                logger.debug("[ReportWarehouse] %s: ingested %d report(s), dropped %d", self.reports_dir, len(changed), len(removed))
+            return len(changed)
+
+    def publish(self, path: Path | str, payload: dict[str, Any] | None = None) -> None:
+        """Index a report that was just written to ``path`` (``payload`` skips re-reading it)."""
+        path = Path(path)
+        with self._lock:
+            try:
+                signature = _signature(path.stat())
+            except OSError as exc:
+                logger.warning("[ReportWarehouse] publish 跳过 %s: %s", path, exc)
+                return
+            try:
+                conn = self._connect()
+                try:
+                    with conn:
+                        if payload is None:
+                            self._ingest_file(conn, path.name, signature)
+                        else:
+                            self._ingest(conn, path.name, signature, payload)
+                finally:
+                    self._close(conn)
+            except sqlite3.Error as exc:
+                # 报告文件已落盘，索引失败不影响发布；下次 sync() 会补齐
+                logger.warning("[ReportWarehouse] publish 入库失败 %s: %s", path, exc)
+
+    # ------------------------------------------------------------------
+    # Queries (each call syncs first)
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> list[sqlite3.Row]:
+        self.sync()
+        with self._lock:
+            conn = self._connect()
+            try:
+                return conn.execute(sql, list(params)).fetchall()
+            finally:
+                self._close(conn)
+
+    def report_dates(self, start: str | None = None, end: str | None = None) -> list[str]:
+        """Dates of canonical ``auto_screening_YYYYMMDD.json`` files (readable or not), ascending."""
+        bounds, params = _date_bounds("file_date", start, end)
+        rows = self._query(f"SELECT file_date FROM reports WHERE file_date IS NOT NULL{bounds} ORDER BY file_date", params)
+        return [row["file_date"] for row in rows]
+
+    def latest_report_date(self, end: str | None = None) -> str | None:
+        bounds, params = _date_bounds("file_date", None, end)
+        rows = self._query(f"SELECT MAX(file_date) AS latest FROM reports WHERE file_date IS NOT NULL{bounds}", params)
+        return rows[0]["latest"] if rows else None
+
+    def reports(self, start: str | None = None, end: str | None = None, *, descending: bool = False) -> list[ReportEntry]:
+        """Canonical reports with ``start <= date <= end`` (YYYYMMDD), history-projected payloads."""
+        bounds, params = _date_bounds("file_date", start, end)
+        order = "DESC" if descending else "ASC"
+        rows = self._query(
+            f"SELECT filename, file_date, status, error, history_json FROM reports WHERE file_date IS NOT NULL{bounds} ORDER BY file_date {order}",
+            params,
+        )
+        entries: list[ReportEntry] = []
+        for row in rows:
+            path = self.reports_dir / row["filename"]
+            if row["status"] == STATUS_OK:
+                entries.append(ReportEntry(row["file_date"], path, json.loads(row["history_json"])))
+            elif row["status"] == STATUS_CORRUPT:
+                entries.append(ReportEntry(row["file_date"], path, None, row["error"]))
+            else:
+                entries.append(ReportEntry(row["file_date"], path, None, "report payload is not a JSON object"))
+        return entries
+
+    def recommendations(self, start: str | None = None, end: str | None = None, *, tickers: Iterable[str] | None = None) -> list[RecommendationRow]:
+        """Recommendation rows of canonical reports in ``[start, end]``, by date then report order."""
+        bounds, params = _date_bounds("trade_date", start, end)
+        ticker_clause = ""
+        if tickers is not None:
+            ticker_list = list(dict.fromkeys(str(ticker) for ticker in tickers))
+            if not ticker_list:
+                return []
+            ticker_clause = f" AND ticker IN ({', '.join('?' for _ in ticker_list)})"
+            params = [*params, *ticker_list]
+        rows = self._query(
+            "SELECT trade_date, ticker, position, score_b, score_final, recommended_price, regime, decomposition_json, record_json "
+            f"FROM recommendations WHERE 1 = 1{bounds}{ticker_clause} ORDER BY trade_date, position",
+            params,
+        )
+        return [
+            RecommendationRow(
+                trade_date=row["trade_date"],
+                ticker=row["ticker"],
+                rank=int(row["position"]) + 1,
+                score_b=row["score_b"],
+                score_final=row["score_final"],
+                recommended_price=row["recommended_price"],
+                regime=row["regime"],
+                score_decomposition=json.loads(row["decomposition_json"]) if row["decomposition_json"] else None,
+                record=json.loads(row["record_json"]),
+            )
+            for row in rows
+        ]
+
+    def regimes(self) -> list[tuple[str, str, str | None]]:
+        """``(filename, payload date, regime_gate_level)`` for every readable report, by file name."""
+        rows = self._query("SELECT filename, payload_date, regime FROM reports WHERE status = ? AND payload_date IS NOT NULL ORDER BY filename", (STATUS_OK,))
+        return [(row["filename"], row["payload_date"], row["regime"]) for row in rows]
+
+    def unreadable_reports(self) -> list[tuple[str, str]]:
+        """``(filename, error)`` for reports that failed to parse, by file name."""
+        rows = self._query("SELECT filename, error FROM reports WHERE status = ? ORDER BY filename", (STATUS_CORRUPT,))
+        return [(row["filename"], row["error"] or "") for row in rows]
+
+
+_warehouses: dict[tuple[Path, Path | None], ReportWarehouse] = {}
+_warehouses_lock = threading.Lock()
+
+
+def get_report_warehouse(reports_dir: Path | str) -> ReportWarehouse:
+    """Process-wide warehouse for ``reports_dir`` (re-resolved when ``REPORT_WAREHOUSE_*`` env changes)."""
+    resolved = Path(reports_dir).resolve()
+    db_path = _warehouse_db_path(resolved) if warehouse_enabled() else None
+    key = (resolved, db_path)
+    warehouse = _warehouses.get(key)
+    if warehouse is not None:
+        return warehouse
+    with _warehouses_lock:
+        warehouse = _warehouses.get(key)
+        if warehouse is None:
+            warehouse = _warehouses[key] = ReportWarehouse(resolved, db_path=db_path)
+        return warehouse
+
+
+__all__ = [
+    "HISTORY_EXCLUDED_KEYS",
+    "RecommendationRow",
+    "ReportEntry",
+    "ReportWarehouse",
+    "get_report_warehouse",
+    "warehouse_enabled",
+]
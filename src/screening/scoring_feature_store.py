@@ -2,6 +2,8 @@
 
 Public provider calls belong in refresh code.  This store reads only local
 CSV/JSON snapshots and returns empty inputs when data is missing or malformed.
+Price history is served from the memory-mapped ``PricePanelStore`` when a
+fresh panel exists; the per-ticker CSVs remain the import/fallback format.
 """
 
 from __future__ import annotations
@@ -21,6 +23,7 @@ from pydantic import ValidationError
 
 from src.data.models import CompanyNews, FinancialMetrics, InsiderTrade
 from src.screening.optional_feature_store import OptionalFeatureStore
+from src.screening.price_panel_store import PricePanelStore
 from src.screening.scoring_feature_quality import (
     FEATURE_POLICY_TABLE,
     ObservationStatus,
@@ -400,12 +403,15 @@ class ScoringFeatureStore:
     legacy_snapshot_dir: Path | str = Path("data/snapshots")
     lhb_cache_dir: Path | str = Path("data/lhb_cache")
     fund_flow_cache_dir: Path | str = Path("data/fund_flow_cache")
+    price_panel_dir: Path | str = Path("data/price_panel")
     max_stale_days: int = 0
     allow_stale: bool = False
 
     def __post_init__(self) -> None:
         self.base_dir = Path(self.base_dir)
         self.price_cache_dir = Path(self.price_cache_dir)
+        self.price_panel_dir = Path(self.price_panel_dir)
+        self._price_panel = PricePanelStore(self.price_panel_dir)
         self.legacy_snapshot_dir = Path(self.legacy_snapshot_dir)
         self.lhb_cache_dir = Path(self.lhb_cache_dir)
         self.fund_flow_cache_dir = Path(self.fund_flow_cache_dir)
@@ -430,6 +436,16 @@ class ScoringFeatureStore:
         ticker6 = _ticker6(ticker)
         self._quality.note_requested("price_history", [ticker6])
         path = self.price_cache_dir / f"{ticker6}.csv"
+        # 列式面板命中时跳过 CSV 解析; CSV 比面板新 (签名不符) 时回退逐文件读取.
+        window = self._price_panel.window(ticker6, trade_date, lookback_days, source_path=path)
+        if window is not None:
+            self._quality.note_observed("price_history", ticker6)
+            if window.empty:
+                self._quality.note_consumption_failure(
+                    "price_history", ticker6, "empty_after_lookback"
+                )
+                return pd.DataFrame()
+            return self._finish_price_frame(ticker6, trade_date, window.to_frame())
         if not path.exists():
             self._quality.note_consumption_failure(
                 "price_history", ticker6, "missing_snapshot"
@@ -476,6 +492,9 @@ class ScoringFeatureStore:
         # 缺口会被读成崩盘/超跌幻影 — 用 pct_change 链回溯复权到最新行口径.
         normalized = _back_adjust_ohlcv(normalized)
         normalized = normalized.set_index("Date")
+        return self._finish_price_frame(ticker6, trade_date, normalized)
+
+    def _finish_price_frame(self, ticker6: str, trade_date: str, normalized: pd.DataFrame) -> pd.DataFrame:
         self._quality.note_loaded("price_history", ticker6, rows=len(normalized), source="local_price_cache")
         self._quality.note_usable("price_history", ticker6)
         self._quality.note_nonempty("price_history", ticker6)
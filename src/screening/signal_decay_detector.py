@@ -11,7 +11,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from dataclasses import dataclass
@@ -20,6 +19,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from src.screening.report_warehouse import get_report_warehouse
 from src.utils.numeric import safe_float as _coerce_score_b
 
 logger = logging.getLogger(__name__)
@@ -148,38 +148,24 @@ def _load_score_history(
 
     start_dt = end_dt - timedelta(days=lookback_days - 1)
 
-    collected: list[tuple[datetime, dict[str, Any]]] = []
-    for path in report_dir.glob("auto_screening_*.json"):
-        match = _REPORT_FILENAME_PATTERN.match(path.name)
-        if not match:
-            continue
-        date_str = match.group(1)
+    # 包含 end_date 当天在内的 lookback_days 天窗口，但排除当天（只要历史数据）
+    start_str = start_dt.strftime("%Y%m%d")
+    last_str = (end_dt - timedelta(days=1)).strftime("%Y%m%d")
+    warehouse = get_report_warehouse(report_dir)
+    score_maps: dict[str, dict[str, float]] = {}
+    for entry in warehouse.reports(start_str, last_str):
         try:
-            report_dt = _parse_date(date_str)
+            _parse_date(entry.trade_date)
         except ValueError:
             continue
-        # 包含 end_date 当天在内的 lookback_days 天窗口
-        # 但我们排除当天（只要历史数据）
-        if report_dt >= end_dt:
-            continue
-        if report_dt < start_dt:
-            continue
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as exc:
-            logger.warning("[SignalDecay] 跳过损坏报告 %s: %s", path.name, exc)
+        if entry.payload is None:
+            logger.warning("[SignalDecay] 跳过损坏报告 %s: %s", entry.path.name, entry.error)
             continue
-        score_map: dict[str, float] = {}
-        for rec in payload.get("recommendations", []) or []:
-            if not isinstance(rec, dict):
-                continue
-            ticker = rec.get("ticker")
-            if ticker:
-                score_map[ticker] = _coerce_score_b(rec.get("score_b"))
-        collected.append((report_dt, {"date": date_str, "score_map": score_map}))
-
-    collected.sort(key=lambda pair: pair[0])
-    return [item for _, item in collected]
+        score_maps[entry.trade_date] = {}
+    for row in warehouse.recommendations(start_str, last_str):
+        if row.trade_date in score_maps:
+            score_maps[row.trade_date][row.ticker] = _coerce_score_b(row.record.get("score_b"))
+    return [{"date": date_str, "score_map": score_map} for date_str, score_map in score_maps.items()]
 
 
 # ---------------------------------------------------------------------------
@@ -306,20 +292,12 @@ def _infer_end_date(report_dir: Path) -> str | None:
     """从报告目录推断最新日期。"""
     if not report_dir.exists():
         return None
-    latest: datetime | None = None
-    for path in report_dir.glob("auto_screening_*.json"):
-        match = _REPORT_FILENAME_PATTERN.match(path.name)
-        if not match:
-            continue
+    for date_str in reversed(get_report_warehouse(report_dir).report_dates()):
         try:
-            dt = _parse_date(match.group(1))
+            return _parse_date(date_str).strftime("%Y%m%d")
         except ValueError:
             continue
-        if latest is None or dt > latest:
-            latest = dt
-    if latest is None:
-        return None
-    return latest.strftime("%Y%m%d")
+    return None
 
 
 # ---------------------------------------------------------------------------
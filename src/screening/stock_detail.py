@@ -27,6 +27,7 @@ from src.screening.consecutive_recommendation import (
 )
 from src.screening.recommendation_tracker import HISTORY_FILENAME
 from src.screening.signal_decay_detector import detect_signal_decay
+from src.screening.tracking_store import pending_export_records
 from src.utils.numeric import safe_int as _safe_int
 
 logger = logging.getLogger(__name__)
@@ -196,13 +197,15 @@ def _compute_industry_rank(
 def _load_tracking_history(report_dir: Path) -> list[dict]:
     """加载 tracking_history.json，失败时返回空列表。"""
     history_path = report_dir / HISTORY_FILENAME
-    if not history_path.exists():
-        return []
-    try:
-        with open(history_path, encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return []
+    data = pending_export_records(history_path)  # nightly 更新未导出时以追踪库为准
+    if data is None:
+        if not history_path.exists():
+            return []
+        try:
+            with open(history_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return []
     if isinstance(data, list):
         return [item for item in data if isinstance(item, dict)]
     if isinstance(data, dict):
@@ -26,11 +26,13 @@ from src.screening.strategy_scorer_mean_reversion import (
 from src.screening.strategy_scorer_trend import (
     score_trend_strategy,
 )
+from src.screening.strategy_scorer_trend_panel import score_trend_strategy_batch
 from src.screening.strategy_scorer_utils import (
     aggregate_sub_factors,
     derive_completeness,
 )
 from src.tools import akshare_api as _akshare_api
+from src.utils.run_profiler import span
 
 logger = logging.getLogger(__name__)
 
@@ -126,14 +128,23 @@ def _compute_light_signals(
     candidate: CandidateStock,
     trade_date: str,
     feature_store: ScoringFeatureStore,
+    *,
+    prices_df: pd.DataFrame | None = None,
+    trend_signal: StrategySignal | None = None,
 ) -> tuple[dict[str, StrategySignal], pd.DataFrame]:
-    prices_df = feature_store.load_price_frame(candidate.ticker, trade_date)
-    return _build_light_signal_map(prices_df, ticker=candidate.ticker), prices_df
+    if prices_df is None:
+        prices_df = feature_store.load_price_frame(candidate.ticker, trade_date)
+    return _build_light_signal_map(prices_df, ticker=candidate.ticker, trend_signal=trend_signal), prices_df
 
 
-def _build_light_signal_map(prices_df: pd.DataFrame, *, ticker: str | None = None) -> dict[str, StrategySignal]:
+def _build_light_signal_map(
+    prices_df: pd.DataFrame,
+    *,
+    ticker: str | None = None,
+    trend_signal: StrategySignal | None = None,
+) -> dict[str, StrategySignal]:
     return {
-        "trend": score_trend_strategy(prices_df, ticker=ticker),
+        "trend": trend_signal if trend_signal is not None else score_trend_strategy(prices_df, ticker=ticker),
         "mean_reversion": score_mean_reversion_strategy(prices_df),
         "fundamental": _empty_signal(),
         "event_sentiment": _empty_signal(),
@@ -197,39 +208,71 @@ def _build_provisional_ranking(
     feature_store.note_eligible_tickers(
         "price_history", [candidate.ticker for candidate in technical_candidates]
     )
-    price_frames_by_ticker: dict[str, pd.DataFrame] = {}
+    with span("load_price_frames"):
+        price_frames_by_ticker = _load_technical_stage_price_frames(technical_candidates, trade_date, feature_store)
+    # 趋势子因子整池一次向量化计算 (行 × ticker 二维数组), 不再每只票各跑一遍 pandas 指标.
+    try:
+        with span("trend_batch"):
+            trend_signals = score_trend_strategy_batch(price_frames_by_ticker)
+    except Exception:
+        logger.warning("Vectorized trend scoring failed; falling back to per-ticker scoring", exc_info=True)
+        trend_signals = {}
 
-    # Parallel IO: load price frames and compute light signals concurrently
-    max_workers = min(SCORE_BATCH_CONCURRENCY, len(technical_candidates)) if technical_candidates else 1
-    if max_workers <= 1:
+    with span("light_signals"):
         for candidate in technical_candidates:
-            light_signals, price_frame = _compute_light_signals(candidate, trade_date, feature_store)
+            try:
+                light_signals, price_frame = _compute_light_signals(
+                    candidate,
+                    trade_date,
+                    feature_store,
+                    prices_df=price_frames_by_ticker.get(candidate.ticker, pd.DataFrame()),
+                    trend_signal=trend_signals.get(candidate.ticker),
+                )
+            except Exception:
+                logger.warning("Light-signal computation failed for %s", candidate.ticker, exc_info=True)
+                light_signals, price_frame = _build_light_signal_map(pd.DataFrame(), ticker=candidate.ticker), None
             results[candidate.ticker] = light_signals
-            if price_frame is not None:
+            if price_frame is None:
+                price_frames_by_ticker.pop(candidate.ticker, None)
+            else:
                 price_frames_by_ticker[candidate.ticker] = price_frame
             provisional_ranking.append((_provisional_score(light_signals), candidate))
-    else:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_candidate = {
-                executor.submit(_compute_light_signals, candidate, trade_date, feature_store): candidate
-                for candidate in technical_candidates
-            }
-            for future in concurrent.futures.as_completed(future_to_candidate):
-                candidate = future_to_candidate[future]
-                try:
-                    light_signals, price_frame = future.result()
-                except Exception:
-                    logger.warning("Light-signal computation failed for %s", candidate.ticker, exc_info=True)
-                    light_signals, price_frame = _build_light_signal_map(pd.DataFrame(), ticker=candidate.ticker), None
-                results[candidate.ticker] = light_signals
-                if price_frame is not None:
-                    price_frames_by_ticker[candidate.ticker] = price_frame
-                provisional_ranking.append((_provisional_score(light_signals), candidate))
 
     _populate_sector_diffusion_metrics(results, technical_candidates, price_frames_by_ticker)
     return _append_unranked_candidates_to_provisional_ranking(provisional_ranking, candidates)
 
 
+def _load_technical_stage_price_frames(
+    candidates: list[CandidateStock],
+    trade_date: str,
+    feature_store: ScoringFeatureStore,
+) -> dict[str, pd.DataFrame]:
+    """Load price frames for the technical stage; IO only, scoring happens batched."""
+
+    frames: dict[str, pd.DataFrame] = {}
+    max_workers = min(SCORE_BATCH_CONCURRENCY, len(candidates)) if candidates else 1
+    if max_workers <= 1:
+        for candidate in candidates:
+            frames[candidate.ticker] = _load_price_frame_or_empty(feature_store, candidate.ticker, trade_date)
+        return frames
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_candidate = {
+            executor.submit(_load_price_frame_or_empty, feature_store, candidate.ticker, trade_date): candidate
+            for candidate in candidates
+        }
+        for future in concurrent.futures.as_completed(future_to_candidate):
+            frames[future_to_candidate[future].ticker] = future.result()
+    return {candidate.ticker: frames[candidate.ticker] for candidate in candidates}
+
+
+def _load_price_frame_or_empty(feature_store: ScoringFeatureStore, ticker: str, trade_date: str) -> pd.DataFrame:
+    try:
+        return feature_store.load_price_frame(ticker, trade_date)
+    except Exception:
+        logger.warning("Price frame load failed for %s", ticker, exc_info=True)
+        return pd.DataFrame()
+
+
 def _append_unranked_candidates_to_provisional_ranking(provisional_ranking: list[tuple[float, CandidateStock]], candidates: list[CandidateStock]) -> list[tuple[float, CandidateStock]]:
     ranked_tickers = {ranked_candidate.ticker for _, ranked_candidate in provisional_ranking}
     for candidate in candidates:
@@ -697,10 +740,13 @@ def score_batch(
 ) -> dict[str, dict[str, StrategySignal]]:
     started_at = perf_counter()
     scoring_feature_store = feature_store or ScoringFeatureStore()
-    industry_pe_medians = _build_industry_pe_medians(trade_date, scoring_feature_store)
+    with span("industry_pe_medians"):
+        industry_pe_medians = _build_industry_pe_medians(trade_date, scoring_feature_store)
     results = _initialize_score_batch_results(candidates)
-    fundamental_candidates = _prepare_heavy_score_candidates(candidates, trade_date, results, scoring_feature_store)
-    _populate_heavy_signals(results, fundamental_candidates, trade_date, industry_pe_medians, scoring_feature_store)
+    with span("provisional_ranking"):
+        fundamental_candidates = _prepare_heavy_score_candidates(candidates, trade_date, results, scoring_feature_store)
+    with span("heavy_signals"):
+        _populate_heavy_signals(results, fundamental_candidates, trade_date, industry_pe_medians, scoring_feature_store)
     elapsed = perf_counter() - started_at
     logger.info(
         "评分: %d 只 · %d heavy · %.2fs",
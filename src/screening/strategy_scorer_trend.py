@@ -265,23 +265,39 @@ def score_trend_strategy(prices_df: pd.DataFrame, *, ticker: str | None = None)
     # 126 rows silently dropped all four attention components → attention_composite
     # never computed → att:— in the score waterfall. Compute them unconditionally.
     short_trade_metrics = _build_short_trade_doc_metrics(prices_df, ticker=ticker) if not prices_df.empty else {}
-    if momentum_signal is not None:
-        momentum_signal = {
-            **momentum_signal,
-            "metrics": {
-                **dict(momentum_signal.get("metrics") or {}),
-                **short_trade_metrics,
-            },
-        }
+    momentum_signal = _merge_short_trade_metrics(momentum_signal, short_trade_metrics)
     volatility_signal = calculate_volatility_signals(prices_df) if len(prices_df) >= 126 else None
-    result = aggregate_sub_factors(
+    return _finalize_trend_signal(
         _build_trend_sub_factors(
             prices_df=prices_df,
             trend_weights=trend_weights,
             momentum_signal=momentum_signal,
             volatility_signal=volatility_signal,
-        )
+        ),
+        momentum_signal=momentum_signal,
+        short_trade_metrics=short_trade_metrics,
     )
+
+
+def _merge_short_trade_metrics(momentum_signal: dict | None, short_trade_metrics: dict[str, float]) -> dict | None:
+    if momentum_signal is None:
+        return None
+    return {
+        **momentum_signal,
+        "metrics": {
+            **dict(momentum_signal.get("metrics") or {}),
+            **short_trade_metrics,
+        },
+    }
+
+
+def _finalize_trend_signal(
+    sub_factors: list[SubFactor],
+    *,
+    momentum_signal: dict | None,
+    short_trade_metrics: dict[str, float],
+) -> StrategySignal:
+    result = aggregate_sub_factors(sub_factors)
     # When momentum_signal was None (price_cache < 126 rows), the momentum
     # sub_factor's metrics dict is empty. Inject short_trade_metrics here so
     # _collect_raw_metrics_from_signals can pick up attention components.
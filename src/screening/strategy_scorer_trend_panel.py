@@ -0,0 +1,364 @@
+"""
+Cross-sectional trend sub-factor engine for Layer B light signals.
+
+``score_trend_strategy_batch`` computes EMA alignment, ADX strength, momentum,
+volatility, Donchian position and MA distance for a whole candidate pool in
+one pass over 2-D NumPy arrays (row × ticker) instead of one pandas pipeline
+per ticker.  Each ticker's rows are right-aligned so row ``-1`` is every
+ticker's latest bar; shorter histories are NaN-padded on top.  Indicators run
+over each ticker's own trading rows (not a calendar-aligned grid), which is
+what the per-ticker functions in ``strategy_scorer_trend`` compute.
+
+The recursive EWM replicates pandas' ``ewm(adjust=False)`` update rule
+(including ``min_periods`` and interior-NaN decay) so the resulting
+``SubFactor`` values match ``score_trend_strategy`` — see
+``tests/screening/test_strategy_scorer_trend_panel.py``.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.agents.technicals import (
+    MOM_WINDOW_1M,
+    MOM_WINDOW_3M,
+    MOM_WINDOW_6M,
+    VOL_ANNUALIZATION,
+    VOL_REGIME_WINDOW,
+    VOL_WINDOW,
+    momentum_signal_from_values,
+    volatility_signal_from_values,
+)
+from src.screening.models import StrategySignal, SubFactor
+from src.screening.strategy_scorer_trend import (
+    _build_optional_trend_factor,
+    _build_short_trade_doc_metrics,
+    _calculate_ema_alignment_confidence,
+    _finalize_trend_signal,
+    _merge_short_trade_metrics,
+    _resolve_adx_strength_direction,
+    _resolve_ema_alignment_direction,
+    score_trend_strategy,
+)
+from src.screening.strategy_scorer_utils import _get_trend_subfactor_weights, _make_sub_factor
+from src.utils.numeric import clip as _clip
+
+_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+_ADX_PERIOD = 20
+_ATR_PERIOD = 14
+_DONCHIAN_WINDOW = 20
+_MA_DISTANCE_WINDOW = 50
+_SIGNAL_MIN_ROWS = 126
+# Short-trade attention metrics read at most the last 61 bars (supply_pressure_60
+# needs 60 prior closes); scoring them on a tail slice is value-identical.
+_SHORT_TRADE_TAIL_ROWS = 64
+# Bound the (rows × tickers × window) sliding views used by rolling std.
+_TICKER_CHUNK = 512
+
+
+@dataclass(frozen=True)
+class TrendPanel:
+    """Right-aligned OHLCV arrays for a candidate pool.
+
+    Each array has shape ``(rows, len(tickers))``; ``lengths[j]`` is the
+    number of real rows for ticker ``j`` (the rest is leading NaN padding).
+    """
+
+    tickers: tuple[str, ...]
+    lengths: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame]) -> "TrendPanel":
+        tickers = tuple(frames)
+        lengths = np.array([len(frames[ticker]) for ticker in tickers], dtype=np.int64)
+        rows = int(lengths.max()) if len(lengths) else 0
+        arrays = {column: np.full((rows, len(tickers)), np.nan, dtype=np.float64) for column in _OHLCV_COLUMNS}
+        for j, ticker in enumerate(tickers):
+            length = int(lengths[j])
+            if length == 0:
+                continue
+            frame = frames[ticker]
+            for column in _OHLCV_COLUMNS:
+                arrays[column][rows - length :, j] = frame[column].to_numpy(dtype=np.float64)
+        return cls(tickers=tickers, lengths=lengths, **arrays)
+
+    @property
+    def padding(self) -> np.ndarray:
+        rows = self.close.shape[0]
+        return np.arange(rows)[:, None] < (rows - self.lengths)[None, :]
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    shifted = np.full_like(values, np.nan)
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _ewm_mean(values: np.ndarray, alpha: float, min_periods: int = 0) -> np.ndarray:
+    """Column-wise ``Series.ewm(alpha=alpha, adjust=False).mean()``.
+
+    Mirrors pandas' ``ewm`` kernel: the average starts at the first
+    observation, NaN inputs decay the old weight without resetting it, and
+    outputs are NaN until ``min_periods`` observations were seen.
+    """
+
+    old_wt_factor = 1.0 - alpha
+    new_wt = alpha
+    rows, cols = values.shape
+    out = np.full((rows, cols), np.nan, dtype=np.float64)
+    if rows == 0:
+        return out
+    weighted = values[0].copy()
+    nobs = (~np.isnan(weighted)).astype(np.int64)
+    old_wt = np.ones(cols, dtype=np.float64)
+    minp = max(int(min_periods), 1)
+    out[0] = np.where(nobs >= minp, weighted, np.nan)
+    for i in range(1, rows):
+        cur = values[i]
+        is_obs = ~np.isnan(cur)
+        nobs += is_obs
+        started = ~np.isnan(weighted)
+        old_wt = np.where(started, old_wt * old_wt_factor, old_wt)
+        update = started & is_obs & (weighted != cur)
+        with np.errstate(invalid="ignore"):
+            blended = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+        weighted = np.where(update, blended, weighted)
+        old_wt = np.where(started & is_obs, 1.0, old_wt)
+        weighted = np.where(~started & is_obs, cur, weighted)
+        out[i] = np.where(nobs >= minp, weighted, np.nan)
+    return out
+
+
+def _tail_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Latest-row ``rolling(window).sum()``: NaN unless the window is complete."""
+
+    if values.shape[0] < window:
+        return np.full(values.shape[1], np.nan)
+    tail = values[-window:]
+    return np.where(np.isnan(tail).any(axis=0), np.nan, np.nansum(tail, axis=0))
+
+
+def _tail_mean(values: np.ndarray, window: int) -> np.ndarray:
+    return _tail_sum(values, window) / window
+
+
+def _rolling_std_tail(values: np.ndarray, window: int, count: int) -> np.ndarray:
+    """``rolling(window).std()`` for the last ``count`` rows, shape ``(count, cols)``.
+
+    Constant windows yield exactly 0 like pandas' rolling variance kernel.
+    """
+
+    rows, cols = values.shape
+    out = np.full((count, cols), np.nan, dtype=np.float64)
+    needed = count + window - 1
+    if rows < window:
+        return out
+    source = values[-needed:] if rows >= needed else values
+    offset = count - (source.shape[0] - window + 1)
+    for start in range(0, cols, _TICKER_CHUNK):
+        chunk = source[:, start : start + _TICKER_CHUNK]
+        views = np.lib.stride_tricks.sliding_window_view(chunk, window, axis=0)
+        with np.errstate(invalid="ignore"):
+            std = np.std(views, axis=-1, ddof=1)
+        constant = np.ptp(views, axis=-1) == 0
+        std = np.where(constant, 0.0, std)
+        out[offset:, start : start + _TICKER_CHUNK] = std
+    return out
+
+
+def _true_range(panel: TrendPanel) -> np.ndarray:
+    prev_close = _shift(panel.close)
+    ranges = np.stack(
+        [panel.high - panel.low, np.abs(panel.high - prev_close), np.abs(panel.low - prev_close)],
+        axis=0,
+    )
+    all_nan = np.isnan(ranges).all(axis=0)
+    with np.errstate(invalid="ignore"):
+        true_range = np.nanmax(np.where(np.isnan(ranges), -np.inf, ranges), axis=0)
+    return np.where(all_nan, np.nan, true_range)
+
+
+def _adx_latest(panel: TrendPanel, period: int = _ADX_PERIOD) -> dict[str, np.ndarray]:
+    """Latest-row ``calculate_adx`` columns (Wilder RMA, ``min_periods=period``)."""
+
+    padding = panel.padding
+    true_range = _true_range(panel)
+    up_move = panel.high - _shift(panel.high)
+    down_move = _shift(panel.low) - panel.low
+    with np.errstate(invalid="ignore"):
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    plus_dm[padding] = np.nan
+    minus_dm[padding] = np.nan
+    alpha = 1.0 / period
+    tr_ema = _ewm_mean(true_range, alpha, period)
+    tr_ema = np.where(tr_ema == 0, np.nan, tr_ema)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        plus_di = 100 * (_ewm_mean(plus_dm, alpha, period) / tr_ema)
+        minus_di = 100 * (_ewm_mean(minus_dm, alpha, period) / tr_ema)
+        di_sum = plus_di + minus_di
+        dx = 100 * np.abs(plus_di - minus_di) / np.where(di_sum == 0, np.nan, di_sum)
+    adx = _ewm_mean(dx, alpha, period)
+    return {"adx": adx[-1], "+di": plus_di[-1], "-di": minus_di[-1]}
+
+
+def _momentum_inputs(panel: TrendPanel) -> dict[str, np.ndarray]:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = np.log1p(panel.close / _shift(panel.close) - 1.0)
+        volume_ma = _tail_mean(panel.volume, MOM_WINDOW_1M)
+        volume_momentum = panel.volume[-1] / np.where(volume_ma == 0, np.nan, volume_ma)
+    return {
+        "mom_1m": _tail_sum(returns, MOM_WINDOW_1M),
+        "mom_3m": _tail_sum(returns, MOM_WINDOW_3M),
+        "mom_6m": _tail_sum(returns, MOM_WINDOW_6M),
+        "volume_momentum": volume_momentum,
+    }
+
+
+def _volatility_inputs(panel: TrendPanel, atr: np.ndarray) -> dict[str, np.ndarray]:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = panel.close / _shift(panel.close) - 1.0
+        hist_vol = _rolling_std_tail(returns, VOL_WINDOW, VOL_REGIME_WINDOW) * math.sqrt(VOL_ANNUALIZATION)
+        incomplete = np.isnan(hist_vol).any(axis=0)
+        vol_ma = np.where(incomplete, np.nan, hist_vol.mean(axis=0))
+        vol_std = _rolling_std_tail(hist_vol, VOL_REGIME_WINDOW, 1)[0]
+        current = hist_vol[-1]
+        vol_regime = current / np.where(vol_ma == 0, np.nan, vol_ma)
+        vol_z_score = (current - vol_ma) / np.where(vol_std == 0, np.nan, vol_std)
+        close = panel.close[-1]
+        atr_ratio = atr / np.where(close == 0, np.nan, close)
+    return {
+        "historical_volatility": current,
+        "volatility_regime": vol_regime,
+        "volatility_z_score": vol_z_score,
+        "atr_ratio": atr_ratio,
+    }
+
+
+def _ema_alignment_factor(ema_10: float, ema_30: float, ema_60: float, close: float, length: int, weight: float) -> SubFactor:
+    if length < 60:
+        return _make_sub_factor("ema_alignment", 0, 0.0, weight, completeness=0.0)
+    ema_values = {"ema_10": float(ema_10), "ema_30": float(ema_30), "ema_60": float(ema_60)}
+    close = float(close) if not math.isnan(close) else 0.0
+    return _make_sub_factor(
+        "ema_alignment",
+        _resolve_ema_alignment_direction(ema_values),
+        _calculate_ema_alignment_confidence(ema_values, close),
+        weight,
+        metrics=ema_values,
+    )
+
+
+def _adx_strength_factor(adx: float, plus_di: float, minus_di: float, length: int, weight: float) -> SubFactor:
+    if length < 30:
+        return _make_sub_factor("adx_strength", 0, 0.0, weight, completeness=0.0)
+    adx_metrics = {
+        "adx": float(adx) if not math.isnan(adx) else 0.0,
+        "+di": float(plus_di) if not math.isnan(plus_di) else 0.0,
+        "-di": float(minus_di) if not math.isnan(minus_di) else 0.0,
+    }
+    return _make_sub_factor("adx_strength", _resolve_adx_strength_direction(adx_metrics), adx_metrics["adx"], weight, metrics=adx_metrics)
+
+
+def _donchian_factor(high_n: float, low_n: float, close: float, length: int, weight: float) -> SubFactor:
+    if length < _DONCHIAN_WINDOW:
+        return _make_sub_factor("donchian_position", 0, 0.0, weight, completeness=0.0)
+    channel_span = high_n - low_n
+    if channel_span <= 0:
+        return _make_sub_factor("donchian_position", 0, 50.0, weight, completeness=1.0, metrics={"donchian_pct": 0.5, "donchian_high": high_n, "donchian_low": low_n})
+    position = (close - low_n) / channel_span
+    return _make_sub_factor(
+        "donchian_position",
+        1 if position > 0.5 else -1,
+        _clip(abs(position - 0.5) * 200, 0.0, 100.0),
+        weight,
+        completeness=1.0,
+        metrics={"donchian_pct": round(position, 4), "donchian_high": high_n, "donchian_low": low_n},
+    )
+
+
+def _ma_distance_factor(ma_value: float, close: float, length: int, weight: float) -> SubFactor:
+    if length < _MA_DISTANCE_WINDOW or not ma_value > 0:
+        return _make_sub_factor("ma_distance", 0, 0.0, weight, completeness=0.0)
+    distance_pct = (close - ma_value) / ma_value * 100
+    return _make_sub_factor(
+        "ma_distance",
+        1 if distance_pct > 0 else (-1 if distance_pct < 0 else 0),
+        _clip(abs(distance_pct) * 10, 0.0, 100.0),
+        weight,
+        completeness=1.0,
+        metrics={"ma_distance_pct": round(distance_pct, 4), "ema_50": ma_value},
+    )
+
+
+def _is_panel_compatible(frame: pd.DataFrame) -> bool:
+    if frame.empty or not set(_OHLCV_COLUMNS).issubset(frame.columns):
+        return False
+    if not all(pd.api.types.is_numeric_dtype(frame[column]) for column in _OHLCV_COLUMNS):
+        return False
+    return not np.isnan(frame[list(_OHLCV_COLUMNS)].to_numpy(dtype=np.float64)).any()
+
+
+def score_trend_strategy_batch(price_frames: Mapping[str, pd.DataFrame]) -> dict[str, StrategySignal]:
+    """Vectorized ``score_trend_strategy`` for every ``ticker → frame`` entry.
+
+    Frames the panel cannot represent exactly (empty, missing OHLCV columns,
+    NaN bars) go through the per-ticker ``score_trend_strategy`` instead.
+    The short-trade attention metrics are tail-only and still come from
+    ``_build_short_trade_doc_metrics``, evaluated on the last
+    ``_SHORT_TRADE_TAIL_ROWS`` bars.
+    """
+
+    results: dict[str, StrategySignal] = {}
+    panel_frames: dict[str, pd.DataFrame] = {}
+    for ticker, frame in price_frames.items():
+        if _is_panel_compatible(frame):
+            panel_frames[ticker] = frame
+        else:
+            results[ticker] = score_trend_strategy(frame, ticker=ticker)
+    if not panel_frames:
+        return results
+
+    panel = TrendPanel.from_frames(panel_frames)
+    trend_weights = _get_trend_subfactor_weights()
+    ema = {span: _ewm_mean(panel.close, 2.0 / (span + 1.0))[-1] for span in (10, 30, 60, _MA_DISTANCE_WINDOW)}
+    adx = _adx_latest(panel)
+    true_range = _true_range(panel)
+    atr = _tail_mean(true_range, _ATR_PERIOD)
+    momentum = _momentum_inputs(panel)
+    volatility = _volatility_inputs(panel, atr)
+    close = panel.close[-1]
+    high_n = np.nanmax(panel.high[-_DONCHIAN_WINDOW:], axis=0) if panel.high.shape[0] >= _DONCHIAN_WINDOW else np.full(len(panel.tickers), np.nan)
+    low_n = np.nanmin(panel.low[-_DONCHIAN_WINDOW:], axis=0) if panel.low.shape[0] >= _DONCHIAN_WINDOW else np.full(len(panel.tickers), np.nan)
+
+    for j, ticker in enumerate(panel.tickers):
+        length = int(panel.lengths[j])
+        momentum_signal = None
+        volatility_signal = None
+        if length >= _SIGNAL_MIN_ROWS:
+            momentum_signal = momentum_signal_from_values(**{key: values[j] for key, values in momentum.items()})
+            volatility_signal = volatility_signal_from_values(**{key: values[j] for key, values in volatility.items()})
+        short_trade_metrics = _build_short_trade_doc_metrics(panel_frames[ticker].tail(_SHORT_TRADE_TAIL_ROWS), ticker=ticker)
+        momentum_signal = _merge_short_trade_metrics(momentum_signal, short_trade_metrics)
+        sub_factors = [
+            _ema_alignment_factor(ema[10][j], ema[30][j], ema[60][j], close[j], length, trend_weights["ema_alignment"]),
+            _adx_strength_factor(adx["adx"][j], adx["+di"][j], adx["-di"][j], length, trend_weights["adx_strength"]),
+            _build_optional_trend_factor("momentum", momentum_signal, trend_weights["momentum"]),
+            _build_optional_trend_factor("volatility", volatility_signal, trend_weights["volatility"]),
+        ]
+        if "donchian_position" in trend_weights:
+            sub_factors.append(_donchian_factor(float(high_n[j]), float(low_n[j]), float(close[j]), length, trend_weights["donchian_position"]))
+        if "ma_distance" in trend_weights:
+            sub_factors.append(_ma_distance_factor(float(ema[_MA_DISTANCE_WINDOW][j]), float(close[j]), length, trend_weights["ma_distance"]))
+        results[ticker] = _finalize_trend_signal(sub_factors, momentum_signal=momentum_signal, short_trade_metrics=short_trade_metrics)
+    return {ticker: results[ticker] for ticker in price_frames}
@@ -203,8 +203,13 @@ def load_tracking_records(reports_dir: Any) -> list[dict[str, Any]]:
     """
     from pathlib import Path
 
+    from src.screening.tracking_store import pending_export_records
+
     reports_path = Path(reports_dir)
     tracking_file = reports_path / "tracking_history.json"
+    pending = pending_export_records(tracking_file)  # nightly 更新未导出时以追踪库为准
+    if pending is not None:
+        return pending
     if not tracking_file.is_file():
         return []
 
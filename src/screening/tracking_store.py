@@ -0,0 +1,469 @@
+"""Indexed tracking-history store behind ``recommendation_tracker``.
+
+``tracking_history.json`` used to be the only store: every post-market update
+loaded the whole file, merged a handful of records, and rewrote it, and every
+``get_tracking_summary`` re-scanned all records. Both grew linearly with the
+years of history.
+
+``TrackingStore`` keeps the same records in a SQLite database (WAL) next to the
+JSON file (``tracking_history.json`` → ``tracking_history.sqlite3``):
+
+- ``tracking_records``: one row per ``(ticker, recommended_date)`` with the
+  full record dict, upserted in place;
+- ``tracking_daily``: per-``recommended_date`` aggregates (record count, and
+  per horizon the tracked / win counts and return sum), recomputed only for
+  dates an upsert touched, so summaries sum at most one row per day.
+
+An update only reads the *open* records (same-day, or not yet ``complete``);
+complete records are never re-read. WAL keeps readers off the writer's lock.
+
+``tracking_history.json`` stays the interchange format — about thirty modules
+and scripts read it — so it is still exported (a plain dump of
+:meth:`TrackingStore.records`, no parse or merge), but only when an update
+actually changed records. The nightly ``--auto`` update and batched callers
+(backfills) do not export at all: they mark the export pending
+(:meth:`TrackingStore.mark_export_pending`) and the whole-file rewrite waits
+for ``recommendation_tracker.flush_tracking_history`` (end of a backfill batch,
+the next non-deferred update, or a direct JSON writer). While an export is
+pending, readers take the records from the store instead
+(:func:`load_current_history` / :func:`pending_export_records`). The store
+records the export's file signature; when the JSON changes behind its back
+(hand edits, tests writing fixtures) the store rebuilds from the JSON on the
+next *write* open, so the JSON remains the source of truth for anything
+written outside ``recommendation_tracker``.
+
+Readers use :meth:`TrackingStore.open_existing`, a read-only open that never
+creates, migrates or syncs: it returns ``None`` when the database is missing
+or older than the JSON, and the caller scans the JSON instead.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import sqlite3
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+#: T+N → record 字段 (与 ``recommendation_tracker.DEFAULT_HORIZONS`` 一致)
+HORIZON_FIELDS: dict[int, str] = {
+    1: "next_day_return",
+    3: "next_3day_return",
+    5: "next_5day_return",
+    10: "next_10day_return",
+    15: "next_15day_return",
+    20: "next_20day_return",
+    25: "next_25day_return",
+    30: "next_30day_return",
+}
+
+_MISSING_SIGNATURE = "missing"
+
+_HORIZON_COLUMNS = ",\n".join(f"  t{day}_tracked INTEGER NOT NULL DEFAULT 0,\n  t{day}_wins INTEGER NOT NULL DEFAULT 0,\n  t{day}_sum REAL NOT NULL DEFAULT 0" for day in HORIZON_FIELDS)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS tracking_meta (
+  key TEXT PRIMARY KEY,
+  value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tracking_records (
+  ticker TEXT NOT NULL,
+  recommended_date TEXT NOT NULL,
+  date_key INTEGER,
+  sort_date INTEGER NOT NULL,
+  tracking_status TEXT NOT NULL,
+  record_json TEXT NOT NULL,
+  PRIMARY KEY (ticker, recommended_date)
+);
+CREATE INDEX IF NOT EXISTS idx_tracking_records_date ON tracking_records(recommended_date);
+CREATE INDEX IF NOT EXISTS idx_tracking_records_status ON tracking_records(tracking_status);
+CREATE TABLE IF NOT EXISTS tracking_daily (
+  date_key INTEGER PRIMARY KEY,
+  total INTEGER NOT NULL,
+{_HORIZON_COLUMNS}
+);
+"""
+
+
+def record_key(rec: Mapping[str, Any]) -> tuple[str, str]:
+    """record 唯一键: (ticker, recommended_date)。"""
+    return (str(rec.get("ticker", "") or ""), str(rec.get("recommended_date", "") or ""))
+
+
+def parse_record_date(value: Any) -> datetime | None:
+    """YYYYMMDD / YYYY-MM-DD → ``datetime``; 失败返回 ``None``。"""
+    if not value:
+        return None
+    cleaned = str(value).replace("-", "").strip()
+    if len(cleaned) != 8 or not cleaned.isdigit():
+        return None
+    try:
+        return datetime.strptime(cleaned, "%Y%m%d")
+    except ValueError:
+        return None
+
+
+def bucket_totals(records: Iterable[Mapping[str, Any]], field: str) -> tuple[int, int, float]:
+    """``(wins, tracked, sum_ret)`` over finite numeric ``field`` values."""
+    wins = 0
+    tracked = 0
+    sum_ret = 0.0
+    for rec in records:
+        value = rec.get(field)
+        if value is None:
+            continue
+        try:
+            fv = float(value)
+        except (TypeError, ValueError):
+            continue
+        if not math.isfinite(fv):
+            continue
+        tracked += 1
+        sum_ret += fv
+        if fv > 0:
+            wins += 1
+    return wins, tracked, sum_ret
+
+
+def summary_from_totals(lookback_days: int, total: int, totals: Mapping[int, tuple[int, int, float]]) -> dict[str, Any]:
+    """Build the ``get_tracking_summary`` dict from per-horizon ``(wins, tracked, sum_ret)``."""
+    summary: dict[str, Any] = {
+        "lookback_days": lookback_days,
+        "total_recommendations": total,
+        "tracked_count": totals[1][1],
+    }
+    for day, (wins, tracked, sum_ret) in totals.items():
+        summary[f"win_count_day{day}"] = wins
+        summary[f"tracked_count_day{day}"] = tracked
+        summary[f"win_rate_day{day}"] = (wins / tracked) if tracked > 0 else None
+        summary[f"avg_return_day{day}"] = (sum_ret / tracked) if tracked > 0 else None
+    return summary
+
+
+def _sort_date(recommended_date: str) -> int:
+    try:
+        return int(recommended_date or 0)
+    except ValueError:
+        return 0
+
+
+def _file_signature(path: Path) -> str:
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        return _MISSING_SIGNATURE
+    return f"{stat_result.st_mtime_ns}:{stat_result.st_size}:{stat_result.st_ino}"
+
+
+def load_history_records(history_path: Path) -> list[dict[str, Any]]:
+    """读取 tracking_history.json; 缺失/损坏返回空列表 (优雅降级)。"""
+    if not history_path.exists():
+        return []
+    try:
+        with open(history_path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("[Tracking] history 解析失败 %s: %s — 重置为空", history_path, exc)
+        return []
+    records = payload.get("records") if isinstance(payload, dict) else None
+    if not isinstance(records, list):
+        return []
+    return records
+
+
+def pending_export_records(history_path: Path) -> list[dict[str, Any]] | None:
+    """Records the store holds but ``history_path`` has not received yet; ``None`` when the JSON is current.
+
+    Read-only: never creates, syncs or exports anything.
+    """
+    store = TrackingStore.open_existing(history_path)
+    if store is None:
+        return None
+    try:
+        return store.records() if store.export_pending else None
+    except sqlite3.Error as exc:
+        logger.warning("[Tracking] store read failed %s: %s — falling back to the JSON", store.db_path, exc)
+        return None
+
+
+def load_current_history(history_path: Path) -> list[dict[str, Any]]:
+    """Latest tracking records: the store while an export is pending, else ``tracking_history.json``."""
+    records = pending_export_records(history_path)
+    return records if records is not None else load_history_records(history_path)
+
+
+def tracking_version_paths(history_path: Path) -> list[Path]:
+    """Files whose stat changes whenever the tracking records do (JSON, store, WAL) — for cache versions."""
+    history_path = Path(history_path)
+    db_path = history_path.with_suffix(".sqlite3")
+    return [history_path, db_path, db_path.with_name(f"{db_path.name}-wal")]
+
+
+def tracking_mtime(history_path: Path) -> float | None:
+    """Latest mtime over :func:`tracking_version_paths`; ``None`` when ``history_path`` is missing."""
+    mtimes: list[float] = []
+    for path in tracking_version_paths(history_path):
+        try:
+            mtimes.append(path.stat().st_mtime)
+        except FileNotFoundError:
+            if path == Path(history_path):
+                return None
+    return max(mtimes)
+
+
+class TrackingStore:
+    """SQLite-backed tracking history mirrored to ``history_path`` (JSON)."""
+
+    def __init__(self, history_path: Path) -> None:
+        self.history_path = Path(history_path)
+        self.db_path = self.history_path.with_suffix(".sqlite3")
+        self._read_only = False
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+        self.sync_from_json()
+
+    @classmethod
+    def open_existing(cls, history_path: Path) -> TrackingStore | None:
+        """Open the store read-only, without creating or syncing anything.
+
+        ``None`` when there is no database yet, or when the JSON changed since
+        the last export (the store would need a rebuild) — callers then read
+        the JSON directly.
+        """
+        store = cls.__new__(cls)
+        store.history_path = Path(history_path)
+        store.db_path = store.history_path.with_suffix(".sqlite3")
+        store._read_only = True
+        if not store.db_path.exists():
+            return None
+        try:
+            conn = store._connect()
+            try:
+                current = store._stored_signature(conn) == _file_signature(store.history_path) or store._export_pending(conn)
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            logger.debug("[Tracking] read-only open failed %s: %s", store.db_path, exc)
+            return None
+        return store if current else None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._read_only:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, timeout=5.0)
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    # ------------------------------------------------------------------
+    # JSON interchange
+    # ------------------------------------------------------------------
+
+    def _stored_signature(self, conn: sqlite3.Connection) -> str | None:
+        row = conn.execute("SELECT value FROM tracking_meta WHERE key = 'json_signature'").fetchone()
+        return row["value"] if row is not None else None
+
+    def _export_pending(self, conn: sqlite3.Connection) -> bool:
+        return conn.execute("SELECT 1 FROM tracking_meta WHERE key = 'export_pending'").fetchone() is not None
+
+    def sync_from_json(self) -> bool:
+        """Rebuild from ``history_path`` if it changed since the last export; returns whether it did.
+
+        Skipped while an export is pending: the store is then ahead of the JSON.
+        """
+        signature = _file_signature(self.history_path)
+        conn = self._connect()
+        try:
+            if self._stored_signature(conn) == signature:
+                return False
+            if self._export_pending(conn):
+                logger.warning("[Tracking] %s changed while an export is pending — keeping the store", self.history_path)
+                return False
+            records = [rec for rec in load_history_records(self.history_path) if isinstance(rec, dict)]
+            with conn:
+                conn.execute("DELETE FROM tracking_records")
+                conn.execute("DELETE FROM tracking_daily")
+                self._upsert(conn, records)
+                self._refresh_daily(conn, {record_key(rec)[1] for rec in records})
+                conn.execute("INSERT OR REPLACE INTO tracking_meta(key, value) VALUES ('json_signature', ?)", (signature,))
+        finally:
+            conn.close()
+        logger.info("[Tracking] store rebuilt from %s (%d records)", self.history_path, len(records))
+        return True
+
+    def mark_exported(self) -> None:
+        """Record the signature of the JSON the caller just wrote from :meth:`records`."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO tracking_meta(key, value) VALUES ('json_signature', ?)", (_file_signature(self.history_path),))
+                conn.execute("DELETE FROM tracking_meta WHERE key = 'export_pending'")
+        finally:
+            conn.close()
+
+    def mark_export_pending(self) -> None:
+        """Note that the store holds changes the JSON does not have yet."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO tracking_meta(key, value) VALUES ('export_pending', '1')")
+        finally:
+            conn.close()
+
+    @property
+    def export_pending(self) -> bool:
+        conn = self._connect()
+        try:
+            return self._export_pending(conn)
+        finally:
+            conn.close()
+
+    def is_exported(self) -> bool:
+        """Whether ``history_path`` is exactly the last export (nothing pending, no external edit)."""
+        conn = self._connect()
+        try:
+            return not self._export_pending(conn) and self._stored_signature(conn) == _file_signature(self.history_path)
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Records
+    # ------------------------------------------------------------------
+
+    def records(self) -> list[dict[str, Any]]:
+        """All records, ``recommended_date`` desc then ticker asc (the JSON export order)."""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT record_json FROM tracking_records ORDER BY sort_date DESC, ticker ASC").fetchall()
+        finally:
+            conn.close()
+        return [json.loads(row["record_json"]) for row in rows]
+
+    def count(self) -> int:
+        conn = self._connect()
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM tracking_records").fetchone()[0])
+        finally:
+            conn.close()
+
+    def open_records(self, trade_date: str) -> list[dict[str, Any]]:
+        """Records an update for ``trade_date`` may touch: that day's, plus every non-``complete`` one."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT record_json FROM tracking_records WHERE recommended_date = ? OR tracking_status != 'complete' ORDER BY sort_date DESC, ticker ASC",
+                (trade_date,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(row["record_json"]) for row in rows]
+
+    def apply(self, upserts: Iterable[Mapping[str, Any]], deletes: Iterable[tuple[str, str]] = ()) -> None:
+        """Upsert records by ``(ticker, recommended_date)`` / delete keys, refreshing touched daily aggregates."""
+        upserts = list(upserts)
+        deletes = list(deletes)
+        if not upserts and not deletes:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany("DELETE FROM tracking_records WHERE ticker = ? AND recommended_date = ?", deletes)
+                self._upsert(conn, upserts)
+                self._refresh_daily(conn, {record_key(rec)[1] for rec in upserts} | {key[1] for key in deletes})
+        finally:
+            conn.close()
+
+    def _upsert(self, conn: sqlite3.Connection, records: Iterable[Mapping[str, Any]]) -> None:
+        rows = []
+        for rec in records:
+            ticker, recommended_date = record_key(rec)
+            parsed = parse_record_date(recommended_date)
+            rows.append(
+                (
+                    ticker,
+                    recommended_date,
+                    int(parsed.strftime("%Y%m%d")) if parsed is not None else None,
+                    _sort_date(recommended_date),
+                    str(rec.get("tracking_status", "pending") or "pending"),
+                    json.dumps(rec, ensure_ascii=False, default=str),
+                )
+            )
+        conn.executemany(
+            "INSERT OR REPLACE INTO tracking_records(ticker, recommended_date, date_key, sort_date, tracking_status, record_json) VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def _refresh_daily(self, conn: sqlite3.Connection, recommended_dates: Iterable[str]) -> None:
+        date_keys = {int(parsed.strftime("%Y%m%d")) for parsed in map(parse_record_date, recommended_dates) if parsed is not None}
+        columns = ["date_key", "total"] + [f"t{day}_{suffix}" for day in HORIZON_FIELDS for suffix in ("tracked", "wins", "sum")]
+        insert_sql = f"INSERT OR REPLACE INTO tracking_daily({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+        for date_key in sorted(date_keys):
+            records = [json.loads(row["record_json"]) for row in conn.execute("SELECT record_json FROM tracking_records WHERE date_key = ?", (date_key,))]
+            if not records:
+                conn.execute("DELETE FROM tracking_daily WHERE date_key = ?", (date_key,))
+                continue
+            values: list[Any] = [date_key, len(records)]
+            for field in HORIZON_FIELDS.values():
+                wins, tracked, sum_ret = bucket_totals(records, field)
+                values.extend((tracked, wins, sum_ret))
+            conn.execute(insert_sql, values)
+
+    # ------------------------------------------------------------------
+    # Summary
+    # ------------------------------------------------------------------
+
+    def latest_recommended_date(self) -> datetime | None:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT MAX(date_key) FROM tracking_daily").fetchone()
+        finally:
+            conn.close()
+        return datetime.strptime(str(row[0]), "%Y%m%d") if row and row[0] is not None else None
+
+    def summarize(self, lookback_days: int, as_of: datetime | None = None) -> dict[str, Any]:
+        """Same result as ``recommendation_tracker._summarize_history`` over all records, from daily aggregates."""
+        today = as_of if as_of is not None else (self.latest_recommended_date() or datetime.now())
+        where, params = "", []
+        if lookback_days > 0:
+            cutoff = today - timedelta(days=lookback_days)
+            # 记录日为零点; 与 cutoff (可能带时刻) 比较等价于按日期取上界
+            first_day = cutoff.date() if cutoff.time() == datetime.min.time() else cutoff.date() + timedelta(days=1)
+            where, params = " WHERE date_key >= ?", [int(first_day.strftime("%Y%m%d"))]
+        select = ", ".join(["COALESCE(SUM(total), 0)"] + [f"COALESCE(SUM(t{day}_{suffix}), 0)" for day in HORIZON_FIELDS for suffix in ("wins", "tracked", "sum")])
+        conn = self._connect()
+        try:
+            row = conn.execute(f"SELECT {select} FROM tracking_daily{where}", params).fetchone()
+        finally:
+            conn.close()
+        totals: dict[int, tuple[int, int, float]] = {}
+        for offset, day in enumerate(HORIZON_FIELDS):
+            base = 1 + offset * 3
+            totals[day] = (int(row[base]), int(row[base + 1]), float(row[base + 2]))
+        return summary_from_totals(lookback_days, int(row[0]), totals)
+
+
+__all__ = [
+    "HORIZON_FIELDS",
+    "TrackingStore",
+    "bucket_totals",
+    "load_current_history",
+    "load_history_records",
+    "parse_record_date",
+    "pending_export_records",
+    "record_key",
+    "summary_from_totals",
+    "tracking_mtime",
+    "tracking_version_paths",
+]
@@ -42,6 +42,7 @@ from src.tools.tushare_api import (
     get_ashare_line_items_with_tushare,
     get_ashare_market_cap_with_tushare,
     get_ashare_prices_with_tushare,
+    get_ashare_unadjusted_prices_with_tushare,
 )
 
 # Global cache instance
@@ -152,26 +153,67 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
     return None
 
 
+def _data_provider_for(ticker: str) -> str:
+    """Provider tag used in cache keys: tushare for A-shares, financial_datasets otherwise."""
+    return "tushare" if is_ashare(ticker) else "financial_datasets"
+
+
+def _prices_cache_key(ticker: str, start_date: str, end_date: str) -> str:
+    return _provider_key(_data_provider_for(ticker), f"{ticker}_{start_date}_{end_date}")
+
+
+def _financial_metrics_cache_key(ticker: str, end_date: str, period: str, limit: int) -> str:
+    return _provider_key(_data_provider_for(ticker), f"{ticker}_{period}_{end_date}_{limit}")
+
+
+def prime_prices_cache(tickers: list[str], start_date: str, end_date: str) -> dict[str, list[dict]]:
+    """Batch-load cached price histories for *tickers*.
+
+    One ``get_many`` round trip per cache tier instead of one per ticker.
+    Returns ``{ticker: cached payload}`` for the tickers whose price window is
+    cached; callers hand the payload to :func:`prices_from_cache_data` rather
+    than re-reading it per ticker — the in-process LRU is far smaller than a
+    full universe, so primed entries would be evicted before the follow-up
+    reads. Priming is counted under the cache's ``prime_*`` stats, not as
+    hits / misses.
+    """
+    key_map = {_prices_cache_key(ticker, start_date, end_date): ticker for ticker in tickers}
+    found = _cache.get_many("prices", list(key_map), prime=True)
+    return {key_map[key]: data for key, data in found.items() if data}
+
+
+def prime_financial_metrics_cache(tickers: list[str], end_date: str, period: str = "ttm", limit: int = 10) -> dict[str, list[dict]]:
+    """Batch counterpart of ``prime_prices_cache`` for ``get_financial_metrics``."""
+    key_map = {_financial_metrics_cache_key(ticker, end_date, period, limit): ticker for ticker in tickers}
+    found = _cache.get_many("metrics", list(key_map), prime=True)
+    return {key_map[key]: data for key, data in found.items() if data}
+
+
+def prices_from_cache_data(ticker: str, end_date: str, cached_data: list[dict]) -> list[Price]:
+    """``get_prices`` cache-hit path for a payload already read (e.g. by ``prime_prices_cache``)."""
+    prices = [Price(**price) for price in cached_data]
+    _get_snapshot().export_prices(ticker, end_date, prices, "cache")
+    return prices
+
+
+def financial_metrics_from_cache_data(ticker: str, end_date: str, cached_data: list[dict]) -> list[FinancialMetrics]:
+    """``get_financial_metrics`` cache-hit path for an already-read payload."""
+    metrics = _dedupe_by_report_period([FinancialMetrics(**metric) for metric in cached_data])
+    _get_snapshot().export_financial_metrics(ticker, end_date, metrics, "cache")
+    return metrics
+
+
 def get_prices(ticker: str, start_date: str, end_date: str, api_key: str | None = None) -> list[Price]:
     """
     Fetch price data from cache or API.
     Supports both US stocks and A-shares (Chinese stocks).
     """
-    # Determine provider first so cache key includes it
-    if is_ashare(ticker):
-        provider = "tushare"
-    else:
-        provider = "financial_datasets"
-
     # Create a cache key that includes provider + all parameters
-    raw_key = f"{ticker}_{start_date}_{end_date}"
-    cache_key = _provider_key(provider, raw_key)
+    cache_key = _prices_cache_key(ticker, start_date, end_date)
 
     # Check cache first - simple exact match
     if cached_data := _cache.get_prices(cache_key):
-        prices = [Price(**price) for price in cached_data]
-        _get_snapshot().export_prices(ticker, end_date, prices, "cache")
-        return prices
+        return prices_from_cache_data(ticker, end_date, cached_data)
 
     # Check if it's an A-share (Chinese stock)
     if is_ashare(ticker):
@@ -223,21 +265,12 @@ def get_financial_metrics(
     Fetch financial metrics from cache or API.
     Supports both US stocks and A-shares (Chinese stocks).
     """
-    # Determine provider first so cache key includes it
-    if is_ashare(ticker):
-        provider = "tushare"
-    else:
-        provider = "financial_datasets"
-
     # Create a cache key that includes provider + all parameters
-    raw_key = f"{ticker}_{period}_{end_date}_{limit}"
-    cache_key = _provider_key(provider, raw_key)
+    cache_key = _financial_metrics_cache_key(ticker, end_date, period, limit)
 
     # Check cache first - simple exact match
     if cached_data := _cache.get_financial_metrics(cache_key):
-        metrics = _dedupe_by_report_period([FinancialMetrics(**metric) for metric in cached_data])
-        _get_snapshot().export_financial_metrics(ticker, end_date, metrics, "cache")
-        return metrics
+        return financial_metrics_from_cache_data(ticker, end_date, cached_data)
 
     # Check if it's an A-share (Chinese stock)
     if is_ashare(ticker):
@@ -506,6 +539,19 @@ def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     return df
 
 
+def get_ashare_unadjusted_price_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """A-share daily bars without forward adjustment, as a ``prices_to_df`` frame.
+
+    Not cached through ``_cache`` (the underlying tushare call has its own
+    query cache) and not exported to snapshots; used by the backtester's
+    ``DailyPriceMatrix`` to reproduce per-day ``get_price_data`` closes.
+    """
+    prices = get_ashare_unadjusted_prices_with_tushare(ticker, start_date, end_date)
+    if not prices:
+        return pd.DataFrame()
+    return prices_to_df(prices)
+
+
 # Update the get_price_data function to use the new functions
 def get_price_data(ticker: str, start_date: str, end_date: str, api_key: str | None = None) -> pd.DataFrame:
     prices = get_prices(ticker, start_date, end_date, api_key=api_key)
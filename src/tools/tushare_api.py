@@ -11,6 +11,7 @@ import time
 from datetime import date, datetime
 from typing import Any, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
@@ -22,6 +23,11 @@ from src.data.enhanced_cache import get_enhanced_cache
 from src.data.models import FinancialMetrics, InsiderTrade, LineItem, Price
 from src.tools.ashare_board_utils import to_tushare_code
 from src.tools.tushare_batch_fetch_helpers import fetch_batch_cached_frame
+from src.tools.tushare_client import (
+    acquire_tushare_call_slot,
+    record_tushare_rate_limited,
+    tushare_single_flight,
+)
 from src.tools.tushare_daily_basic_helpers import (
     load_daily_basic_batch,
     select_latest_daily_basic_row,
@@ -64,6 +70,7 @@ from src.tools.tushare_sw_industry_helpers import (
     load_sw_index_classification,
     resolve_cached_sw_industry_mapping,
 )
+from src.utils.env_helpers import get_env_flag, get_env_int
 
 # NS-17 / BH-017 family sibling drain: 本模块是 A 股核心生产数据层
 # (价格/财报/daily_basic/涨幅榜/行业/北向资金), 被 main.py / screening / data /
@@ -78,8 +85,16 @@ _pro_lock = threading.Lock()
 _stock_name_cache: dict[str, str] = {}
 _persistent_cache = get_enhanced_cache()
 
-# Tushare 原始 DataFrame 内存缓存 — 同一次运行内复用，避免多 Agent 并行重复请求
+# Tushare 原始 DataFrame 内存缓存 — 同一次运行内复用，避免多 Agent 并行重复请求。
+# 缓存帧按内存占用 (TUSHARE_DF_CACHE_MAX_BYTES) 做 LRU 淘汰，条目数只是兜底上限。
+# 只读模式 (TUSHARE_DF_CACHE_READONLY=1，默认关) 下入缓存的帧把底层 NumPy 缓冲区
+# 冻结为不可写，命中时返回零拷贝的浅副本：增删列/排序/重建索引只影响调用方自己
+# 的副本，而原地改值 (loc/iloc 赋值、fillna(inplace=True) 等) 会直接抛
+# ValueError("... read-only")，不会悄悄污染缓存。candidate_pool / macro_data /
+# batch_data_fetcher 等调用方仍有原地修改，未逐一改为 .copy() 前只能显式开启；
+# 默认每次命中返回深拷贝。
 _tushare_df_cache: dict[str, pd.DataFrame] = {}
+_tushare_df_cache_nbytes: dict[str, int] = {}
 _tushare_df_cache_lock = threading.Lock()
 
 
@@ -92,6 +107,45 @@ def _resolve_tushare_df_cache_max_entries() -> int:
 
 
 _TUSHARE_DF_CACHE_MAX_ENTRIES = _resolve_tushare_df_cache_max_entries()
+_TUSHARE_DF_CACHE_MAX_BYTES = get_env_int("TUSHARE_DF_CACHE_MAX_BYTES", 512 * 1024 * 1024, minimum=16 * 1024 * 1024)
+_TUSHARE_DF_CACHE_READONLY = get_env_flag("TUSHARE_DF_CACHE_READONLY")
+
+
+def _dataframe_blocks(df: pd.DataFrame) -> list[Any] | None:
+    # pandas 没有公开的块访问接口；拿不到 (未来版本/扩展类型) 时退回深拷贝路径
+    try:
+        return [block.values for block in df._mgr.blocks]
+    except AttributeError:
+        return None
+
+
+def _freeze_dataframe(df: pd.DataFrame) -> bool:
+    """把 df 的全部 NumPy 块设为只读；含扩展数组 (无法冻结) 时返回 False。"""
+    blocks = _dataframe_blocks(df)
+    if blocks is None or not all(isinstance(values, np.ndarray) for values in blocks):
+        return False
+    for values in blocks:
+        values.flags.writeable = False
+    return True
+
+
+def _is_frozen_dataframe(df: pd.DataFrame) -> bool:
+    blocks = _dataframe_blocks(df)
+    return blocks is not None and all(isinstance(values, np.ndarray) and not values.flags.writeable for values in blocks)
+
+
+def _cached_df_view(df: pd.DataFrame) -> pd.DataFrame:
+    """缓存帧交给调用方的形态：冻结帧给零拷贝浅副本，否则深拷贝。"""
+    if _TUSHARE_DF_CACHE_READONLY and _is_frozen_dataframe(df):
+        return df.copy(deep=False)
+    return df.copy()
+
+
+def _dataframe_nbytes(df: pd.DataFrame) -> int:
+    try:
+        return int(df.memory_usage(index=True, deep=True).sum())
+    except Exception:
+        return 0
 
 
 def _get_tushare_cached_df(cache_key: str) -> pd.DataFrame | None:
@@ -100,17 +154,39 @@ def _get_tushare_cached_df(cache_key: str) -> pd.DataFrame | None:
         if cached_df is None:
             return None
         _tushare_df_cache[cache_key] = cached_df
-        return cached_df.copy()
+    return _cached_df_view(cached_df)
 
 
 def _store_tushare_cached_df(cache_key: str, df: pd.DataFrame) -> None:
+    if _TUSHARE_DF_CACHE_READONLY:
+        _freeze_dataframe(df)
+    nbytes = _dataframe_nbytes(df)
     with _tushare_df_cache_lock:
         if cache_key in _tushare_df_cache:
             _tushare_df_cache.pop(cache_key)
         _tushare_df_cache[cache_key] = df
-        while len(_tushare_df_cache) > _TUSHARE_DF_CACHE_MAX_ENTRIES:
+        _tushare_df_cache_nbytes[cache_key] = nbytes
+        # 外部直接 clear() 过 _tushare_df_cache 时，清掉失配的占用记录
+        for stale_key in [key for key in _tushare_df_cache_nbytes if key not in _tushare_df_cache]:
+            _tushare_df_cache_nbytes.pop(stale_key)
+        total_bytes = sum(_tushare_df_cache_nbytes.values())
+        # 至少保留刚写入的这一帧，即使它单独就超过预算
+        while len(_tushare_df_cache) > 1 and (total_bytes > _TUSHARE_DF_CACHE_MAX_BYTES or len(_tushare_df_cache) > _TUSHARE_DF_CACHE_MAX_ENTRIES):
             oldest_key = next(iter(_tushare_df_cache))
             _tushare_df_cache.pop(oldest_key)
+            total_bytes -= _tushare_df_cache_nbytes.pop(oldest_key, 0)
+
+
+def get_tushare_df_cache_stats() -> dict[str, int]:
+    """进程内 DataFrame 缓存的条目数 / 占用字节 / 预算。"""
+    with _tushare_df_cache_lock:
+        live_bytes = sum(_tushare_df_cache_nbytes.get(key, 0) for key in _tushare_df_cache)
+        return {
+            "entries": len(_tushare_df_cache),
+            "bytes": live_bytes,
+            "max_bytes": _TUSHARE_DF_CACHE_MAX_BYTES,
+            "max_entries": _TUSHARE_DF_CACHE_MAX_ENTRIES,
+        }
 
 
 def _normalize_tushare_cache_value(value: Any) -> Any:
@@ -152,7 +228,7 @@ def _get_persisted_tushare_cached_df(cache_key: str) -> pd.DataFrame | None:
     if not isinstance(persisted_df, pd.DataFrame):
         return None
     _store_tushare_cached_df(cache_key, persisted_df)
-    return persisted_df.copy()
+    return _cached_df_view(persisted_df)
 
 
 def _is_tushare_rate_limit_error(exc: BaseException) -> bool:
@@ -180,6 +256,9 @@ def _call_tushare_dataframe_api(pro, api_name: str, **kwargs) -> pd.DataFrame |
     秒（默认 30s），加 ±30% jitter 防止并发雪崩。
     非瞬时错误（参数错误 / 数据不存在）不重试，直接返回 None。
 
+    每次实际请求 (含重试) 前先从 ``tushare_client`` 的共享令牌桶取令牌，
+    按 ``TUSHARE_CALLS_PER_MINUTE`` 主动限速，429 退避只作为兜底。
+
     Tushare 限速配额（参考 tushare.pro 文档）：
       - 免费用户：~200 req/min
       - 付费用户：~10000 req/min
@@ -200,6 +279,7 @@ def _call_tushare_dataframe_api(pro, api_name: str, **kwargs) -> pd.DataFrame |
     # 上限：transient + rate_limit 各自耗尽后退出，避免无限循环
     max_total = max_retries + rate_limit_max_retries + 1
     for _ in range(max_total):
+        acquire_tushare_call_slot()
         try:
             return api_func(**kwargs)
         except Exception as e:
@@ -219,6 +299,7 @@ def _call_tushare_dataframe_api(pro, api_name: str, **kwargs) -> pd.DataFrame |
             is_rate_limit = _is_tushare_rate_limit_error(e)
 
             if is_rate_limit:
+                record_tushare_rate_limited()
                 rate_limit_attempts += 1
                 if rate_limit_attempts > rate_limit_max_retries:
                     logger.warning(
@@ -273,7 +354,7 @@ def _persist_tushare_dataframe_result(cache_key: str, df: pd.DataFrame, *, api_n
         df,
         ttl=ttl if ttl is not None else _resolve_tushare_cache_ttl(api_name, **kwargs),
     )
-    return df.copy()
+    return _cached_df_view(df)
 
 
 def _cached_tushare_dataframe_call(
@@ -297,21 +378,26 @@ def _cached_tushare_dataframe_call(
         if cache_empty or not persisted_df.empty:
             return persisted_df
 
-    df = _call_tushare_dataframe_api(pro, api_name, **kwargs)
+    def _fetch() -> pd.DataFrame | None:
+        df = _call_tushare_dataframe_api(pro, api_name, **kwargs)
 
-    if dedupe and df is not None and not df.empty:
-        df = _dedupe_tushare_df(df)
+        if dedupe and df is not None and not df.empty:
+            df = _dedupe_tushare_df(df)
 
-    if df is not None and (cache_empty or not df.empty):
-        return _persist_tushare_dataframe_result(
-            cache_key,
-            df,
-            api_name=api_name,
-            ttl=ttl,
-            **kwargs,
-        )
+        if df is not None and (cache_empty or not df.empty):
+            return _persist_tushare_dataframe_result(
+                cache_key,
+                df,
+                api_name=api_name,
+                ttl=ttl,
+                **kwargs,
+            )
+        return df
+
+    # 同一 key 并发 miss 时只由 leader 打 API，其余线程共享结果 (各自拿副本)
+    df, _shared = tushare_single_flight(f"{cache_key}:dedupe={int(dedupe)}:empty={int(cache_empty)}", _fetch)
     if df is not None:
-        return df.copy()
+        return _cached_df_view(df)
 
     return None
 
@@ -470,6 +556,33 @@ def get_ashare_prices_with_tushare(ticker: str, start_date: str, end_date: str)
         return []
 
 
+def get_ashare_unadjusted_prices_with_tushare(ticker: str, start_date: str, end_date: str) -> list[Price]:
+    """
+    使用 Tushare 获取 A 股不复权日线（``pro.daily`` 原始价格，不做 qfq）。
+
+    回测逐日按 ``[previous_date, current_date]`` 窗口调用 ``get_prices`` 时，
+    qfq 以窗口内最后一根 K 线为锚（ratio = 1），取到的当日收盘价即不复权收盘价。
+    ``DailyPriceMatrix`` 一次性拉取整个回测区间时必须使用同一口径，否则以区间
+    末日为锚的 qfq 价格会与逐日路径在除权日前后出现水平差异。
+    """
+    pro = _get_pro()
+    if not pro:
+        logger.warning("[Tushare] 未初始化，检查 TUSHARE_TOKEN")
+        return []
+    try:
+        df = _cached_tushare_dataframe_call(
+            pro,
+            "daily",
+            ts_code=_to_ts_code(ticker),
+            start_date=start_date.replace("-", ""),
+            end_date=end_date.replace("-", ""),
+        )
+        return build_prices_from_tushare_daily_df(df)
+    except Exception as e:
+        logger.error("[Tushare] 获取不复权价格数据失败: %s", e, exc_info=True)
+        return []
+
+
 def _fetch_tushare_ashare_prices_df(pro, ts_code: str, start_fmt: str, end_fmt: str) -> pd.DataFrame | None:
     """Fetch A-share daily OHLCV with forward-adjustment (前复权 qfq).
 
@@ -0,0 +1,294 @@
+"""Tushare 客户端调度层 — 同键请求合并 (single-flight) + 主动令牌桶限速。
+
+``_cached_tushare_dataframe_call`` 先查进程内 / 持久化缓存，未命中才打 API。
+多个打分线程同时 miss 同一个 cache key 时，以前每个线程都会各自请求一次，
+既浪费配额又更容易触发 429；而限速只在 429 之后被动退避 30s。本模块提供:
+
+- :class:`SingleFlight`: 同一 key 同时只有一个 leader 真正执行，其余调用方
+  等待并共享 leader 的结果 (或异常)。
+- :class:`LaneTokenBucket`: 按账号每分钟配额补充令牌的共享令牌桶，带优先级
+  通道 — ``interactive`` (CLI 交互调用，默认) 有等待者时 ``bulk`` (缓存预热 /
+  回测预取等批量刷新) 让行；并记录各通道的排队等待指标。
+- :func:`tushare_lane`: 以 contextvar 标记当前调用所属通道。注意线程池 worker
+  不继承 contextvar，批量任务需在 worker 内部进入该上下文。
+
+这是进程内唯一的 Tushare 限速器: 回测预取等批量调用只按并发限流，配额统一
+在这里扣减，避免两层令牌桶叠加限速。
+
+配置:
+    TUSHARE_CALLS_PER_MINUTE  账号每分钟配额 (按积分档位设置)，默认 200 (与
+                              candidate_pool 的日线批量节奏一致); 显式设 0 关闭
+                              主动限速，仅靠 429 退避
+    TUSHARE_RATE_BURST        令牌桶容量 (允许的瞬时突发)，默认 20
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, TypeVar
+
+from src.utils.env_helpers import get_env_int
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 配额因账号积分档位而异；默认按 200 次/分主动限速，0 为显式关闭
+DEFAULT_TUSHARE_CALLS_PER_MINUTE = 200
+DEFAULT_TUSHARE_RATE_BURST = 20
+
+
+class TushareLane(str, Enum):
+    """Priority lane of a Tushare call: interactive calls jump ahead of bulk."""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+_current_lane: ContextVar[TushareLane] = ContextVar("tushare_lane", default=TushareLane.INTERACTIVE)
+
+
+@contextmanager
+def tushare_lane(lane: TushareLane | str) -> Iterator[None]:
+    """Run the enclosed Tushare calls in *lane* (contextvar, per thread/task)."""
+    token = _current_lane.set(TushareLane(lane))
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def current_tushare_lane() -> TushareLane:
+    return _current_lane.get()
+
+
+@dataclass
+class LaneStats:
+    acquired: int = 0
+    waited: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record(self, waited_seconds: float) -> None:
+        self.acquired += 1
+        if waited_seconds > 0:
+            self.waited += 1
+            self.wait_seconds += waited_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, waited_seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "avg_wait_seconds": round(self.wait_seconds / self.acquired, 4) if self.acquired else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+
+
+class LaneTokenBucket:
+    """Thread-safe token bucket shared by all lanes, interactive first.
+
+    Tokens refill at ``calls_per_minute / 60`` per second up to ``burst``.
+    A bulk caller only takes a token while no interactive caller is
+    waiting, so an interactive call waits at most for the next refill.
+    ``acquire`` returns the seconds spent queued; ``clock`` is injectable
+    for tests.
+    """
+
+    def __init__(self, calls_per_minute: int, burst: int = DEFAULT_TUSHARE_RATE_BURST, *, clock: Callable[[], float] = time.monotonic) -> None:
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute must be positive")
+        self.calls_per_minute = int(calls_per_minute)
+        self._rate = calls_per_minute / 60.0
+        self._capacity = max(1.0, float(burst))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated_at = clock()
+        self._condition = threading.Condition()
+        self._waiting = {lane: 0 for lane in TushareLane}
+        self._stats = {lane: LaneStats() for lane in TushareLane}
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def _blocked(self, lane: TushareLane) -> bool:
+        if self._tokens < 1.0:
+            return True
+        return lane is TushareLane.BULK and self._waiting[TushareLane.INTERACTIVE] > 0
+
+    def acquire(self, lane: TushareLane | None = None) -> float:
+        lane = current_tushare_lane() if lane is None else TushareLane(lane)
+        started = self._clock()
+        with self._condition:
+            self._waiting[lane] += 1
+            try:
+                self._refill()
+                while self._blocked(lane):
+                    # 令牌不足时按补充速度估算等待；被其他线程让出/唤醒时重新判断
+                    delay = max(1.0 - self._tokens, 0.0) / self._rate
+                    self._condition.wait(timeout=max(delay, 0.001))
+                    self._refill()
+                self._tokens -= 1.0
+            finally:
+                self._waiting[lane] -= 1
+            waited = max(0.0, self._clock() - started)
+            self._stats[lane].record(waited)
+            # 交互通道清空后唤醒让行中的 bulk 等待者
+            self._condition.notify_all()
+        return waited
+
+    def queue_depth(self) -> dict[str, int]:
+        with self._condition:
+            return {lane.value: count for lane, count in self._waiting.items()}
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._condition:
+            return {lane.value: stats.as_dict() for lane, stats in self._stats.items()}
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one execution.
+
+    The first caller of a key (the leader) runs ``fn``; callers arriving
+    while it runs block and receive the leader's result, or re-raise its
+    exception. Nothing is memoized once the flight lands — caching stays
+    the job of the caller's cache layers.
+    """
+
+    class _Flight:
+        __slots__ = ("done", "result", "error")
+
+        def __init__(self) -> None:
+            self.done = threading.Event()
+            self.result: Any = None
+            self.error: BaseException | None = None
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, SingleFlight._Flight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Return ``(result, shared)``; ``shared`` is True for coalesced callers."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                flight = self._flights[key] = SingleFlight._Flight()
+                self.leaders += 1
+                leader = True
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+_limiter: LaneTokenBucket | None = None
+_limiter_config: tuple[int, int] | None = None
+_limiter_lock = threading.Lock()
+_single_flight = SingleFlight()
+_rate_limited_count = 0
+
+
+def get_tushare_rate_limiter() -> LaneTokenBucket | None:
+    """Process-wide limiter for the configured quota; None when explicitly disabled (``0``).
+
+    The env is re-read on every call so a changed quota takes effect
+    without a restart (the bucket is rebuilt only when it changes).
+    """
+    global _limiter, _limiter_config
+    config = (
+        get_env_int("TUSHARE_CALLS_PER_MINUTE", DEFAULT_TUSHARE_CALLS_PER_MINUTE),
+        get_env_int("TUSHARE_RATE_BURST", DEFAULT_TUSHARE_RATE_BURST, minimum=1),
+    )
+    if config[0] <= 0:
+        return None
+    with _limiter_lock:
+        if _limiter is None or _limiter_config != config:
+            _limiter = LaneTokenBucket(*config)
+            _limiter_config = config
+        return _limiter
+
+
+def acquire_tushare_call_slot() -> float:
+    """Block until the shared quota admits one API call; return seconds queued."""
+    limiter = get_tushare_rate_limiter()
+    if limiter is None:
+        return 0.0
+    waited = limiter.acquire()
+    if waited >= 1.0:
+        logger.debug("[Tushare] %s lane queued %.2fs for quota", current_tushare_lane().value, waited)
+    return waited
+
+
+def record_tushare_rate_limited() -> None:
+    """Count a server-side 429: with a correctly sized bucket this stays 0."""
+    global _rate_limited_count
+    with _limiter_lock:
+        _rate_limited_count += 1
+
+
+def tushare_single_flight(key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+    return _single_flight.do(key, fn)
+
+
+def get_tushare_client_metrics() -> dict[str, Any]:
+    """Queue-wait, coalescing and 429 counters of this process."""
+    limiter = get_tushare_rate_limiter()
+    with _limiter_lock:
+        rate_limited = _rate_limited_count
+    return {
+        "calls_per_minute": limiter.calls_per_minute if limiter is not None else 0,
+        "lanes": limiter.stats() if limiter is not None else {},
+        "queue_depth": limiter.queue_depth() if limiter is not None else {},
+        "single_flight": {
+            "leaders": _single_flight.leaders,
+            "coalesced": _single_flight.coalesced,
+            "in_flight": _single_flight.in_flight(),
+        },
+        "rate_limited": rate_limited,
+    }
+
+
+__all__ = [
+    "DEFAULT_TUSHARE_CALLS_PER_MINUTE",
+    "DEFAULT_TUSHARE_RATE_BURST",
+    "LaneTokenBucket",
+    "SingleFlight",
+    "TushareLane",
+    "acquire_tushare_call_slot",
+    "current_tushare_lane",
+    "get_tushare_client_metrics",
+    "get_tushare_rate_limiter",
+    "record_tushare_rate_limited",
+    "tushare_lane",
+    "tushare_single_flight",
+]
@@ -1,23 +1,23 @@
 """Constants and utilities related to analysts configuration."""
 
-from src.agents.aswath_damodaran import aswath_damodaran_agent
-from src.agents.ben_graham import ben_graham_agent
-from src.agents.bill_ackman import bill_ackman_agent
-from src.agents.cathie_wood import cathie_wood_agent
-from src.agents.charlie_munger import charlie_munger_agent
-from src.agents.fundamentals import fundamentals_analyst_agent
-from src.agents.growth_agent import growth_analyst_agent
-from src.agents.michael_burry import michael_burry_agent
-from src.agents.mohnish_pabrai import mohnish_pabrai_agent
+from src.agents.aswath_damodaran import ASWATH_DAMODARAN_FUNDAMENTALS, aswath_damodaran_agent
+from src.agents.ben_graham import BEN_GRAHAM_FUNDAMENTALS, ben_graham_agent
+from src.agents.bill_ackman import BILL_ACKMAN_FUNDAMENTALS, bill_ackman_agent
+from src.agents.cathie_wood import CATHIE_WOOD_FUNDAMENTALS, cathie_wood_agent
+from src.agents.charlie_munger import CHARLIE_MUNGER_FUNDAMENTALS, charlie_munger_agent
+from src.agents.fundamentals import FUNDAMENTALS_ANALYST_FUNDAMENTALS, fundamentals_analyst_agent
+from src.agents.growth_agent import GROWTH_ANALYST_FUNDAMENTALS, growth_analyst_agent
+from src.agents.michael_burry import MICHAEL_BURRY_FUNDAMENTALS, michael_burry_agent
+from src.agents.mohnish_pabrai import MOHNISH_PABRAI_FUNDAMENTALS, mohnish_pabrai_agent
 from src.agents.news_sentiment import news_sentiment_agent
-from src.agents.peter_lynch import peter_lynch_agent
-from src.agents.phil_fisher import phil_fisher_agent
-from src.agents.rakesh_jhunjhunwala import rakesh_jhunjhunwala_agent
+from src.agents.peter_lynch import PETER_LYNCH_FUNDAMENTALS, peter_lynch_agent
+from src.agents.phil_fisher import PHIL_FISHER_FUNDAMENTALS, phil_fisher_agent
+from src.agents.rakesh_jhunjhunwala import RAKESH_JHUNJHUNWALA_FUNDAMENTALS, rakesh_jhunjhunwala_agent
 from src.agents.sentiment import sentiment_analyst_agent
-from src.agents.stanley_druckenmiller import stanley_druckenmiller_agent
+from src.agents.stanley_druckenmiller import STANLEY_DRUCKENMILLER_FUNDAMENTALS, stanley_druckenmiller_agent
 from src.agents.technicals import technical_analyst_agent
-from src.agents.valuation import valuation_analyst_agent
-from src.agents.warren_buffett import warren_buffett_agent
+from src.agents.valuation import VALUATION_ANALYST_FUNDAMENTALS, valuation_analyst_agent
+from src.agents.warren_buffett import WARREN_BUFFETT_FUNDAMENTALS, warren_buffett_agent
 
 # Define analyst configuration - single source of truth
 ANALYST_CONFIG = {
@@ -26,6 +26,7 @@ ANALYST_CONFIG = {
         "description": "The Dean of Valuation",
         "investing_style": "Focuses on intrinsic value and financial metrics to assess investment opportunities through rigorous valuation analysis.",
         "agent_func": aswath_damodaran_agent,
+        "fundamentals": ASWATH_DAMODARAN_FUNDAMENTALS,
         "type": "analyst",
         "order": 0,
     },
@@ -34,6 +35,7 @@ ANALYST_CONFIG = {
         "description": "The Father of Value Investing",
         "investing_style": "Emphasizes a margin of safety and invests in undervalued companies with strong fundamentals through systematic value analysis.",
         "agent_func": ben_graham_agent,
+        "fundamentals": BEN_GRAHAM_FUNDAMENTALS,
         "type": "analyst",
         "order": 1,
     },
@@ -42,6 +44,7 @@ ANALYST_CONFIG = {
         "description": "The Activist Investor",
         "investing_style": "Seeks to influence management and unlock value through strategic activism and contrarian investment positions.",
         "agent_func": bill_ackman_agent,
+        "fundamentals": BILL_ACKMAN_FUNDAMENTALS,
         "type": "analyst",
         "order": 2,
     },
@@ -50,6 +53,7 @@ ANALYST_CONFIG = {
         "description": "The Queen of Growth Investing",
         "investing_style": "Focuses on disruptive innovation and growth, investing in companies that are leading technological advancements and market disruption.",
         "agent_func": cathie_wood_agent,
+        "fundamentals": CATHIE_WOOD_FUNDAMENTALS,
         "type": "analyst",
         "order": 3,
     },
@@ -58,6 +62,7 @@ ANALYST_CONFIG = {
         "description": "The Rational Thinker",
         "investing_style": "Advocates for value investing with a focus on quality businesses and long-term growth through rational decision-making.",
         "agent_func": charlie_munger_agent,
+        "fundamentals": CHARLIE_MUNGER_FUNDAMENTALS,
         "type": "analyst",
         "order": 4,
     },
@@ -66,6 +71,7 @@ ANALYST_CONFIG = {
         "description": "The Big Short Contrarian",
         "investing_style": "Makes contrarian bets, often shorting overvalued markets and investing in undervalued assets through deep fundamental analysis.",
         "agent_func": michael_burry_agent,
+        "fundamentals": MICHAEL_BURRY_FUNDAMENTALS,
         "type": "analyst",
         "order": 5,
     },
@@ -74,6 +80,7 @@ ANALYST_CONFIG = {
         "description": "The Dhandho Investor",
         "investing_style": "Focuses on value investing and long-term growth through fundamental analysis and a margin of safety.",
         "agent_func": mohnish_pabrai_agent,
+        "fundamentals": MOHNISH_PABRAI_FUNDAMENTALS,
         "type": "analyst",
         "order": 6,
     },
@@ -82,6 +89,7 @@ ANALYST_CONFIG = {
         "description": "The 10-Bagger Investor",
         "investing_style": "Invests in companies with understandable business models and strong growth potential using the 'buy what you know' strategy.",
         "agent_func": peter_lynch_agent,
+        "fundamentals": PETER_LYNCH_FUNDAMENTALS,
         "type": "analyst",
         "order": 6,
     },
@@ -90,6 +98,7 @@ ANALYST_CONFIG = {
         "description": "The Scuttlebutt Investor",
         "investing_style": "Emphasizes investing in companies with strong management and innovative products, focusing on long-term growth through scuttlebutt research.",
         "agent_func": phil_fisher_agent,
+        "fundamentals": PHIL_FISHER_FUNDAMENTALS,
         "type": "analyst",
         "order": 7,
     },
@@ -98,6 +107,7 @@ ANALYST_CONFIG = {
         "description": "The Big Bull Of India",
         "investing_style": "Leverages macroeconomic insights to invest in high-growth sectors, particularly within emerging markets and domestic opportunities.",
         "agent_func": rakesh_jhunjhunwala_agent,
+        "fundamentals": RAKESH_JHUNJHUNWALA_FUNDAMENTALS,
         "type": "analyst",
         "order": 8,
     },
@@ -106,6 +116,7 @@ ANALYST_CONFIG = {
         "description": "The Macro Investor",
         "investing_style": "Focuses on macroeconomic trends, making large bets on currencies, commodities, and interest rates through top-down analysis.",
         "agent_func": stanley_druckenmiller_agent,
+        "fundamentals": STANLEY_DRUCKENMILLER_FUNDAMENTALS,
         "type": "analyst",
         "order": 9,
     },
@@ -114,6 +125,7 @@ ANALYST_CONFIG = {
         "description": "The Oracle of Omaha",
         "investing_style": "Seeks companies with strong fundamentals and competitive advantages through value investing and long-term ownership.",
         "agent_func": warren_buffett_agent,
+        "fundamentals": WARREN_BUFFETT_FUNDAMENTALS,
         "type": "analyst",
         "order": 10,
     },
@@ -130,6 +142,7 @@ ANALYST_CONFIG = {
         "description": "Financial Statement Specialist",
         "investing_style": "Delves into financial statements and economic indicators to assess the intrinsic value of companies through fundamental analysis.",
         "agent_func": fundamentals_analyst_agent,
+        "fundamentals": FUNDAMENTALS_ANALYST_FUNDAMENTALS,
         "type": "analyst",
         "order": 12,
     },
@@ -138,6 +151,7 @@ ANALYST_CONFIG = {
         "description": "Growth Specialist",
         "investing_style": "Analyzes growth trends and valuation to identify growth opportunities through growth analysis.",
         "agent_func": growth_analyst_agent,
+        "fundamentals": GROWTH_ANALYST_FUNDAMENTALS,
         "type": "analyst",
         "order": 13,
     },
@@ -162,6 +176,7 @@ ANALYST_CONFIG = {
         "description": "Company Valuation Specialist",
         "investing_style": "Specializes in determining the fair value of companies, using various valuation models and financial metrics for investment decisions.",
         "agent_func": valuation_analyst_agent,
+        "fundamentals": VALUATION_ANALYST_FUNDAMENTALS,
         "type": "analyst",
         "order": 16,
     },
@@ -176,6 +191,11 @@ def get_analyst_nodes():
     return {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
 
 
+def get_analyst_fundamentals_requests(analyst_keys):
+    """Fundamentals requests of the selected analysts, for the shared run dataset."""
+    return [ANALYST_CONFIG[key]["fundamentals"] for key in analyst_keys if key in ANALYST_CONFIG and "fundamentals" in ANALYST_CONFIG[key]]
+
+
 def get_agents_list():
     """Get a list of agent info dicts for API consumption."""
     return [
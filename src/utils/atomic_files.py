@@ -153,3 +153,24 @@ def atomic_write_json(path: Path | str, payload: Any) -> None:
 
 def atomic_write_csv(path: Path | str, frame: pd.DataFrame) -> None:
     _atomic_write(path, lambda file: frame.to_csv(file, index=False), newline="")
+
+
+def append_csv_rows(path: Path | str, frame: pd.DataFrame) -> None:
+    """Append *frame* rows (no header) to an existing CSV in one durable write.
+
+    The rows are encoded up front and handed to a single ``os.write`` on an
+    ``O_APPEND`` descriptor, then fsynced: a crash can at worst leave a torn
+    final line, never a rewritten or truncated history. The file must exist
+    and end with a newline.
+    """
+    payload = frame.to_csv(index=False, header=False, lineterminator="\n").encode("utf-8")
+    if not payload:
+        return
+    fd = os.open(os.fspath(path), os.O_WRONLY | os.O_APPEND | getattr(os, "O_NOFOLLOW", 0))
+    try:
+        written = os.write(fd, payload)
+        if written != len(payload):
+            raise OSError(errno.EIO, f"short append to {path}: {written}/{len(payload)} bytes")
+        os.fsync(fd)
+    finally:
+        os.close(fd)
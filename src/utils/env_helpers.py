@@ -9,26 +9,34 @@ from __future__ import annotations
 import os
 
 
-def get_env_float(name: str, default: float) -> float:
-    """Parse a float from an environment variable, falling back to *default*."""
+def get_env_float(name: str, default: float, *, minimum: float | None = None) -> float:
+    """Parse a float from an environment variable, falling back to *default*.
+
+    When *minimum* is given the result (including the default) is clamped to it.
+    """
     raw_value = os.getenv(name)
-    if raw_value is None:
-        return default
-    try:
-        return float(raw_value)
-    except ValueError:
-        return default
+    value = default
+    if raw_value is not None:
+        try:
+            value = float(raw_value)
+        except ValueError:
+            value = default
+    return value if minimum is None else max(minimum, value)
+
 
+def get_env_int(name: str, default: int, *, minimum: int | None = None) -> int:
+    """Parse an int from an environment variable, falling back to *default*.
 
-def get_env_int(name: str, default: int) -> int:
-    """Parse an int from an environment variable, falling back to *default*."""
+    When *minimum* is given the result (including the default) is clamped to it.
+    """
     raw_value = os.getenv(name)
-    if raw_value is None:
-        return default
-    try:
-        return int(raw_value)
-    except ValueError:
-        return default
+    value = default
+    if raw_value is not None:
+        try:
+            value = int(raw_value)
+        except ValueError:
+            value = default
+    return value if minimum is None else max(minimum, value)
 
 
 def get_env_csv_set(name: str, default: str) -> set[str]:
@@ -54,6 +62,18 @@ def get_env_flag(name: str, default: bool = False) -> bool:
     return raw_value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def get_env_enabled(name: str, default: bool = True) -> bool:
+    """Parse an on-by-default switch from an environment variable.
+
+    Unset or blank falls back to *default*; any value other than ``0``,
+    ``false``, ``no``, ``off`` (case-insensitive) counts as enabled.
+    """
+    raw_value = (os.getenv(name) or "").strip().lower()
+    if not raw_value:
+        return default
+    return raw_value not in {"0", "false", "no", "off"}
+
+
 def get_env_mode(name: str, default: str) -> str:
     """Parse a string mode from an environment variable, falling back to *default*."""
     raw_value = os.getenv(name)
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures
 import json
 import logging
 import os
 import re
+import sqlite3
 import time
 from time import perf_counter
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 if TYPE_CHECKING:
     # ``from __future__ import annotations`` makes the ``AgentState`` annotations
@@ -29,13 +31,29 @@ from src.llm.models import (
     get_provider_profile,
     get_provider_routes,
 )
-from src.monitoring.llm_metrics import record_llm_attempt
+from src.monitoring.llm_metrics import record_llm_attempt, record_llm_cache_event
 from src.utils import llm_provider_routing
 from src.utils.llm_call_helpers import (
+    LlmCallContext,
     handle_llm_failure,
     resolve_llm_call_context,
     return_success_result,
 )
+from src.utils.llm_client_pool import (
+    get_llm_client_registry,
+    get_llm_invoke_executor,
+    llm_client_key,
+    llm_client_pool_enabled,
+    record_llm_invoke_timeout,
+)
+from src.utils.llm_response_cache import (
+    MODE_OFF,
+    MODE_REPLAY,
+    LLMReplayMissError,
+    get_llm_response_cache,
+    llm_response_cache_key,
+    llm_response_cache_mode,
+)
 from src.utils.llm_json_helpers import extract_json_payload_from_content
 from src.utils.progress import progress
 
@@ -84,6 +102,10 @@ def _wait_for_provider_rate_limit_cooldown(model_provider: str, route_id: str |
     return llm_provider_routing._wait_for_provider_rate_limit_cooldown(model_provider, route_id)
 
 
+async def _await_provider_rate_limit_cooldown(model_provider: str, route_id: str | None) -> float:
+    return await llm_provider_routing._await_provider_rate_limit_cooldown(model_provider, route_id)
+
+
 def _reset_provider_rate_limit_cooldowns_for_testing() -> None:
     llm_provider_routing._reset_provider_rate_limit_cooldowns_for_testing()
 
@@ -135,7 +157,15 @@ def _get_llm_observability_context(state: AgentState | None) -> dict[str, str]:
     return context
 
 
-def _build_llm(model_name: str, model_provider: str, api_keys: dict | None, pydantic_model: type[BaseModel]):
+def _build_llm(model_name: str, model_provider: str, api_keys: dict | None, pydantic_model: type[BaseModel], route_id: str | None = None):
+    """Returns the pooled LLM client for this provider/model/route, building it on first use."""
+    if not llm_client_pool_enabled():
+        return _create_llm(model_name, model_provider, api_keys, pydantic_model)
+    key = llm_client_key(model_provider, model_name, route_id, api_keys, pydantic_model)
+    return get_llm_client_registry().get_or_create(key, lambda: _create_llm(model_name, model_provider, api_keys, pydantic_model))
+
+
+def _create_llm(model_name: str, model_provider: str, api_keys: dict | None, pydantic_model: type[BaseModel]):
     """Builds an LLM client and applies structured output when supported."""
     model_info = get_model_info(model_name, model_provider)
     llm = get_model(model_name, model_provider, api_keys)
@@ -241,6 +271,52 @@ def _record_llm_attempt_safely(**kwargs) -> None:
         logger.warning("Failed to record LLM metrics: %s", metrics_error)
 
 
+def _record_llm_cache_event_safely(**kwargs) -> None:
+    try:
+        record_llm_cache_event(**kwargs)
+    except Exception as metrics_error:
+        logger.warning("Failed to record LLM cache metrics: %s", metrics_error)
+
+
+def _lookup_cached_response(prompt, pydantic_model: type[BaseModel], agent_name: str | None, context: LlmCallContext) -> tuple[str | None, BaseModel | None]:
+    """Returns ``(cache_key, cached_response)``; the key is None when caching is off.
+
+    Raises :class:`LLMReplayMissError` on a miss in strict replay mode.
+    """
+    mode = llm_response_cache_mode()
+    if mode == MODE_OFF:
+        return None, None
+    model_provider, model_name = context.active_model_provider, context.active_model_name
+    key = llm_response_cache_key(prompt, pydantic_model, model_provider, model_name)
+    event = {"agent_name": agent_name, "model_provider": model_provider, "model_name": model_name}
+    try:
+        cached = get_llm_response_cache().get(key)
+        response = pydantic_model.model_validate(cached.payload) if cached is not None else None
+    except (OSError, sqlite3.Error, ValidationError) as error:
+        logger.warning("LLM response cache read failed for %s: %s", agent_name or pydantic_model.__name__, error)
+        response = None
+    if response is not None:
+        _record_llm_cache_event_safely(event="hit", **event)
+        return key, response
+    if mode == MODE_REPLAY:
+        _record_llm_cache_event_safely(event="replay_miss", **event)
+        raise LLMReplayMissError(f"No cached LLM response for {agent_name or pydantic_model.__name__} ({model_provider}:{model_name}, key {key[:12]})")
+    _record_llm_cache_event_safely(event="miss", **event)
+    return key, None
+
+
+def _store_cached_response(cache_key: str | None, response, pydantic_model: type[BaseModel], agent_name: str | None, model_provider: str, model_name: str):
+    if cache_key is None or not isinstance(response, pydantic_model):
+        return response
+    try:
+        get_llm_response_cache().put(cache_key, schema_name=pydantic_model.__name__, model=f"{model_provider}:{model_name}", payload=response.model_dump(mode="json"))
+    except (OSError, sqlite3.Error, TypeError, ValueError) as error:
+        logger.warning("LLM response cache write failed for %s: %s", agent_name or pydantic_model.__name__, error)
+        return response
+    _record_llm_cache_event_safely(event="store", agent_name=agent_name, model_provider=model_provider, model_name=model_name)
+    return response
+
+
 def _resolve_llm_invoke_timeout_seconds() -> float:
     raw_value = os.getenv("LLM_INVOKE_TIMEOUT_SECONDS", "").strip()
     if not raw_value:
@@ -254,17 +330,99 @@ def _resolve_llm_invoke_timeout_seconds() -> float:
     return parsed_value if parsed_value > 0 else DEFAULT_LLM_INVOKE_TIMEOUT_SECONDS
 
 
-def _invoke_llm_with_timeout(llm, prompt):
+def _invoke_llm_with_timeout(llm, prompt, route: str = ""):
     timeout_seconds = _resolve_llm_invoke_timeout_seconds()
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-    future = executor.submit(llm.invoke, prompt)
+    future = get_llm_invoke_executor(route).submit(llm.invoke, prompt)
     try:
         return future.result(timeout=timeout_seconds)
     except concurrent.futures.TimeoutError as exc:
-        future.cancel()
+        # 尚在排队的调用直接取消；已开始的同步调用无法中断，其 worker 在底层请求返回后归还该 route 的线程池
+        if not future.cancel():
+            record_llm_invoke_timeout(route)
         raise TimeoutError(f"LLM invoke timed out after {timeout_seconds}s") from exc
-    finally:
-        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _ainvoke_llm_with_timeout(llm, prompt, route: str = ""):
+    timeout_seconds = _resolve_llm_invoke_timeout_seconds()
+    native = hasattr(llm, "ainvoke")
+    if native:
+        awaitable = llm.ainvoke(prompt)
+    else:
+        awaitable = asyncio.get_running_loop().run_in_executor(get_llm_invoke_executor(route), llm.invoke, prompt)
+    try:
+        # wait_for 超时会取消 ainvoke 任务，连同其在途的 HTTP 请求，不占用任何 invoke worker
+        return await asyncio.wait_for(awaitable, timeout=timeout_seconds)
+    except asyncio.TimeoutError as exc:
+        if not native:
+            # 无 ainvoke 的客户端退回同步 invoke：已开始的调用仍占着该 route 的 worker
+            record_llm_invoke_timeout(route)
+        raise TimeoutError(f"LLM invoke timed out after {timeout_seconds}s") from exc
+
+
+def _resolve_call_context(state: AgentState | None, agent_name: str | None) -> LlmCallContext:
+    return resolve_llm_call_context(
+        state=state,
+        agent_name=agent_name,
+        get_agent_model_config=get_agent_model_config,
+        get_default_model_config=get_default_model_config,
+        extract_state_api_keys=_extract_state_api_keys,
+        get_agent_llm_override=_get_agent_llm_override,
+        get_llm_observability_context=_get_llm_observability_context,
+        merge_api_keys=_merge_api_keys,
+        apply_priority_strategy=_apply_priority_strategy,
+        get_transport_family=_get_transport_family,
+    )
+
+
+def _build_context_llm(context: LlmCallContext, pydantic_model: type[BaseModel]):
+    return _build_llm(
+        context.active_model_name,
+        context.active_model_provider,
+        context.active_api_keys,
+        pydantic_model,
+        route_id=context.active_route_id,
+    )
+
+
+def _return_attempt_success(result, *, model_info, pydantic_model, prompt, attempt: int, attempt_started_at: float, agent_name: str | None, context: LlmCallContext):
+    return return_success_result(
+        llm_result=result,
+        model_info=model_info,
+        pydantic_model=pydantic_model,
+        prompt=prompt,
+        attempt_number=attempt + 1,
+        duration_ms=(perf_counter() - attempt_started_at) * 1000,
+        agent_name=agent_name,
+        context=context,
+        extract_json_from_response=extract_json_from_response,
+        record_llm_attempt_safely=_record_llm_attempt_safely,
+    )
+
+
+def _handle_attempt_failure(error: Exception, *, attempt: int, max_retries: int, attempt_started_at: float, prompt, agent_name: str | None, pydantic_model, context: LlmCallContext, llm, model_info, default_factory, sleep):
+    return handle_llm_failure(
+        error=error,
+        attempt_number=attempt + 1,
+        max_retries=max_retries,
+        duration_ms=(perf_counter() - attempt_started_at) * 1000,
+        prompt=prompt,
+        agent_name=agent_name,
+        pydantic_model=pydantic_model,
+        context=context,
+        llm=llm,
+        model_info=model_info,
+        record_llm_attempt_safely=_record_llm_attempt_safely,
+        compute_retry_delay=_compute_retry_delay,
+        is_rate_limit_error=_is_rate_limit_error,
+        should_fallback_on_error=_should_fallback_on_error,
+        register_provider_rate_limit_cooldown=_register_provider_rate_limit_cooldown,
+        is_provider_fallback_disabled=_is_provider_fallback_disabled,
+        get_transport_family=_get_transport_family,
+        build_llm=_build_llm,
+        progress_update_status=progress.update_status,
+        create_default_response=(lambda _model: default_factory()) if default_factory else create_default_response,
+        sleep=sleep,
+    )
 
 
 def call_llm(
@@ -290,70 +448,102 @@ def call_llm(
         An instance of the specified Pydantic model
     """
 
-    context = resolve_llm_call_context(
-        state=state,
-        agent_name=agent_name,
-        get_agent_model_config=get_agent_model_config,
-        get_default_model_config=get_default_model_config,
-        extract_state_api_keys=_extract_state_api_keys,
-        get_agent_llm_override=_get_agent_llm_override,
-        get_llm_observability_context=_get_llm_observability_context,
-        merge_api_keys=_merge_api_keys,
-        apply_priority_strategy=_apply_priority_strategy,
-        get_transport_family=_get_transport_family,
-    )
-    llm, model_info = _build_llm(
-        context.active_model_name,
-        context.active_model_provider,
-        context.active_api_keys,
-        pydantic_model,
-    )
+    context = _resolve_call_context(state, agent_name)
+    cache_key, cached_response = _lookup_cached_response(prompt, pydantic_model, agent_name, context)
+    if cached_response is not None:
+        return cached_response
+    # fallback 会改写 context，缓存仍记在请求的模型名下
+    requested_model = (context.active_model_provider, context.active_model_name)
+    llm, model_info = _build_context_llm(context, pydantic_model)
 
     for attempt in range(max_retries):
         _wait_for_provider_rate_limit_cooldown(context.active_model_provider, context.active_route_id)
         attempt_started_at = perf_counter()
         try:
-            result = _invoke_llm_with_timeout(llm, prompt)
-            return return_success_result(
-                llm_result=result,
-                model_info=model_info,
-                pydantic_model=pydantic_model,
+            result = _invoke_llm_with_timeout(llm, prompt, context.active_route_id or str(context.active_model_provider))
+            response = _return_attempt_success(result, model_info=model_info, pydantic_model=pydantic_model, prompt=prompt, attempt=attempt, attempt_started_at=attempt_started_at, agent_name=agent_name, context=context)
+            return _store_cached_response(cache_key, response, pydantic_model, agent_name, *requested_model)
+        except Exception as error:
+            outcome = _handle_attempt_failure(
+                error,
+                attempt=attempt,
+                max_retries=max_retries,
+                attempt_started_at=attempt_started_at,
                 prompt=prompt,
-                attempt_number=attempt + 1,
-                duration_ms=(perf_counter() - attempt_started_at) * 1000,
                 agent_name=agent_name,
+                pydantic_model=pydantic_model,
                 context=context,
-                extract_json_from_response=extract_json_from_response,
-                record_llm_attempt_safely=_record_llm_attempt_safely,
+                llm=llm,
+                model_info=model_info,
+                default_factory=default_factory,
+                sleep=time.sleep,
             )
+            llm = outcome.llm
+            model_info = outcome.model_info
+            if outcome.response is not None:
+                return outcome.response
+            if outcome.should_continue:
+                continue
+
+    if default_factory:
+        return default_factory()
+    return create_default_response(pydantic_model)
+
+
+async def acall_llm(
+    prompt,
+    pydantic_model: type[BaseModel],
+    agent_name: str | None = None,
+    state: AgentState | None = None,
+    max_retries: int = 3,
+    default_factory=None,
+) -> BaseModel:
+    """Async counterpart of :func:`call_llm` built on the models' ``ainvoke``.
+
+    Same routing, retry, fallback, cache and metrics behaviour; cooldowns and
+    retry backoff are awaited instead of blocking the event loop, and a
+    timed-out attempt is cancelled (together with its HTTP request) instead of
+    holding an invoke worker until the provider answers. Clients without
+    ``ainvoke`` run on the route's bounded invoke executor.
+    """
+
+    context = _resolve_call_context(state, agent_name)
+    cache_key, cached_response = _lookup_cached_response(prompt, pydantic_model, agent_name, context)
+    if cached_response is not None:
+        return cached_response
+    # fallback 会改写 context，缓存仍记在请求的模型名下
+    requested_model = (context.active_model_provider, context.active_model_name)
+    llm, model_info = _build_context_llm(context, pydantic_model)
+
+    for attempt in range(max_retries):
+        await _await_provider_rate_limit_cooldown(context.active_model_provider, context.active_route_id)
+        attempt_started_at = perf_counter()
+        try:
+            result = await _ainvoke_llm_with_timeout(llm, prompt, context.active_route_id or str(context.active_model_provider))
+            response = _return_attempt_success(result, model_info=model_info, pydantic_model=pydantic_model, prompt=prompt, attempt=attempt, attempt_started_at=attempt_started_at, agent_name=agent_name, context=context)
+            return _store_cached_response(cache_key, response, pydantic_model, agent_name, *requested_model)
         except Exception as error:
-            outcome = handle_llm_failure(
-                error=error,
-                attempt_number=attempt + 1,
+            retry_delays: list[float] = []
+            outcome = _handle_attempt_failure(
+                error,
+                attempt=attempt,
                 max_retries=max_retries,
-                duration_ms=(perf_counter() - attempt_started_at) * 1000,
+                attempt_started_at=attempt_started_at,
                 prompt=prompt,
                 agent_name=agent_name,
                 pydantic_model=pydantic_model,
                 context=context,
                 llm=llm,
                 model_info=model_info,
-                record_llm_attempt_safely=_record_llm_attempt_safely,
-                compute_retry_delay=_compute_retry_delay,
-                is_rate_limit_error=_is_rate_limit_error,
-                should_fallback_on_error=_should_fallback_on_error,
-                register_provider_rate_limit_cooldown=_register_provider_rate_limit_cooldown,
-                is_provider_fallback_disabled=_is_provider_fallback_disabled,
-                get_transport_family=_get_transport_family,
-                build_llm=_build_llm,
-                progress_update_status=progress.update_status,
-                create_default_response=(lambda _model: default_factory()) if default_factory else create_default_response,
-                sleep=time.sleep,
+                default_factory=default_factory,
+                sleep=retry_delays.append,
             )
             llm = outcome.llm
             model_info = outcome.model_info
             if outcome.response is not None:
                 return outcome.response
+            for delay in retry_delays:
+                await asyncio.sleep(delay)
             if outcome.should_continue:
                 continue
 
@@ -178,7 +178,7 @@ def handle_llm_failure(
             context.active_api_keys = fallback_config.get("api_keys")
             context.active_route_id = str(fallback_config.get("route_id") or "") or None
             context.active_transport_family = str(fallback_config.get("transport_family") or get_transport_family(context.active_model_provider, context.active_route_id, context.active_api_keys))
-            llm, model_info = build_llm(context.active_model_name, context.active_model_provider, context.active_api_keys, pydantic_model)
+            llm, model_info = build_llm(context.active_model_name, context.active_model_provider, context.active_api_keys, pydantic_model, route_id=context.active_route_id)
             if agent_name:
                 progress_update_status(agent_name, None, str(fallback_config["status_message"]))
             return LlmFailureOutcome(should_continue=True, llm=llm, model_info=model_info)
@@ -0,0 +1,171 @@
+"""LLM 客户端池 — 按 (provider, model, route) 复用 chat model + 按 route 有界的调用线程池。
+
+``call_llm`` 以前每次调用都经 ``_build_llm`` 重建 chat model (以及其底层 HTTP
+连接池)，``_invoke_llm_with_timeout`` 每次新建又丢弃一个单线程
+``ThreadPoolExecutor``，超时的调用线程无人回收。一次运行几百次 agent 调用时，
+客户端构造和泄漏线程都是纯开销。本模块提供:
+
+- :class:`LLMClientRegistry`: 进程级 LRU 注册表，按
+  (provider, model, route, api key 指纹, 输出 schema) 缓存 ``_build_llm`` 的结果，
+  同一 route 的调用复用同一个客户端 (及其 keep-alive 连接)。
+- :func:`get_llm_invoke_executor`: 每个 provider route 一个有界线程池执行同步
+  调用。超时调用仍占用一个 worker 直到底层请求返回，尚未开始的排队调用在超时
+  后被取消；按 route 分池使一个挂起的 provider 只耗尽自己的 worker，不会饿死
+  其他 route 的调用。
+
+配置:
+    LLM_CLIENT_POOL                   是否复用客户端，默认 true
+    LLM_CLIENT_POOL_MAX               注册表最多保留的客户端数，默认 64
+    LLM_INVOKE_MAX_WORKERS_PER_ROUTE  每个 route 的同步调用线程数，默认 8
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from src.utils.env_helpers import get_env_enabled, get_env_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LLM_CLIENT_POOL_MAX = 64
+DEFAULT_LLM_INVOKE_MAX_WORKERS_PER_ROUTE = 8
+
+
+def llm_client_pool_enabled() -> bool:
+    return get_env_enabled("LLM_CLIENT_POOL")
+
+
+def api_keys_fingerprint(api_keys: dict | None) -> str:
+    """Stable short digest of *api_keys*, so raw keys never become cache keys."""
+    if not api_keys:
+        return ""
+    payload = json.dumps(api_keys, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def llm_client_key(model_provider: str, model_name: str, route_id: str | None, api_keys: dict | None, schema: Hashable = None) -> tuple:
+    return (str(model_provider), str(model_name), route_id or "", api_keys_fingerprint(api_keys), schema)
+
+
+class LLMClientRegistry:
+    """Thread-safe LRU of built LLM clients.
+
+    ``factory`` runs outside the lock, so two threads missing the same key
+    may both build; the first stored client wins and the other is dropped.
+    """
+
+    def __init__(self, max_clients: int = DEFAULT_LLM_CLIENT_POOL_MAX) -> None:
+        self.max_clients = max(1, int(max_clients))
+        self._lock = threading.Lock()
+        self._clients: OrderedDict[tuple, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_create(self, key: tuple, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._clients:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return self._clients[key]
+            self.misses += 1
+        client = factory()
+        with self._lock:
+            client = self._clients.setdefault(key, client)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+                self.evictions += 1
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "max_clients": self.max_clients,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_registry: LLMClientRegistry | None = None
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executor_workers = 0
+_timed_out_invocations: dict[str, int] = {}
+_pool_lock = threading.Lock()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    global _registry
+    with _pool_lock:
+        if _registry is None:
+            _registry = LLMClientRegistry(get_env_int("LLM_CLIENT_POOL_MAX", DEFAULT_LLM_CLIENT_POOL_MAX))
+        return _registry
+
+
+def get_llm_invoke_executor(route: str = "") -> ThreadPoolExecutor:
+    """Bounded pool running synchronous ``llm.invoke`` calls for one provider *route*.
+
+    Timed-out calls keep their worker until the request returns, so each
+    route gets its own pool: a hung provider can only exhaust its own
+    workers. :func:`src.utils.llm.acall_llm` avoids the pool entirely for
+    clients with ``ainvoke`` and cancels timed-out requests.
+    """
+    global _executor_workers
+    with _pool_lock:
+        executor = _executors.get(route)
+        if executor is None:
+            _executor_workers = get_env_int("LLM_INVOKE_MAX_WORKERS_PER_ROUTE", DEFAULT_LLM_INVOKE_MAX_WORKERS_PER_ROUTE, minimum=1)
+            executor = _executors[route] = ThreadPoolExecutor(max_workers=_executor_workers, thread_name_prefix=f"llm-invoke-{route or 'default'}")
+        return executor
+
+
+def record_llm_invoke_timeout(route: str = "") -> None:
+    with _pool_lock:
+        _timed_out_invocations[route] = _timed_out_invocations.get(route, 0) + 1
+
+
+def get_llm_client_pool_metrics() -> dict[str, Any]:
+    registry = get_llm_client_registry()
+    with _pool_lock:
+        return {
+            "registry": registry.stats(),
+            "invoke_routes": sorted(_executors),
+            "invoke_workers_per_route": _executor_workers,
+            "timed_out_invocations": sum(_timed_out_invocations.values()),
+            "timed_out_by_route": dict(_timed_out_invocations),
+        }
+
+
+def _reset_llm_client_pool_for_testing() -> None:
+    """Drops cached clients so monkeypatched model factories take effect."""
+    global _registry
+    with _pool_lock:
+        _registry = None
+        _timed_out_invocations.clear()
+
+
+__all__ = [
+    "DEFAULT_LLM_CLIENT_POOL_MAX",
+    "DEFAULT_LLM_INVOKE_MAX_WORKERS_PER_ROUTE",
+    "LLMClientRegistry",
+    "api_keys_fingerprint",
+    "get_llm_client_pool_metrics",
+    "get_llm_client_registry",
+    "get_llm_invoke_executor",
+    "llm_client_key",
+    "llm_client_pool_enabled",
+    "record_llm_invoke_timeout",
+]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import threading
 import time
@@ -599,6 +600,16 @@ def _wait_for_provider_rate_limit_cooldown(model_provider: str, route_id: str |
     return remaining
 
 
+async def _await_provider_rate_limit_cooldown(model_provider: str, route_id: str | None) -> float:
+    """Async variant of :func:`_wait_for_provider_rate_limit_cooldown` that yields the event loop."""
+    remaining = _resolve_provider_rate_limit_remaining(model_provider, route_id)
+    if remaining <= 0:
+        return 0.0
+
+    await asyncio.sleep(remaining)
+    return remaining
+
+
 def _resolve_provider_rate_limit_remaining(model_provider: str, route_id: str | None) -> float:
     cooldown_key = _provider_rate_limit_key(model_provider, route_id)
     with _PROVIDER_RATE_LIMIT_LOCK:
@@ -0,0 +1,218 @@
+"""内容寻址的 LLM 响应缓存 + 严格回放模式。
+
+agent 的 prompt 完全由 (agent, ticker, trade_date, 输入数据, 模型) 决定：agent 模式
+回测 (``engine_agent_mode``) 重跑同一窗口、或同一天重复跑日频流程时，每次都为
+相同的 prompt 付出完整的 LLM 延迟和费用。
+
+本模块把 ``call_llm`` / ``acall_llm`` 的成功结果按内容地址落盘：
+
+- key = sha256(规范化 prompt 消息 + pydantic schema + provider/model)，prompt
+  任意字节变化都会换 key，无需手动失效;
+- 存储为本地 SQLite (``LLM_RESPONSE_CACHE_DIR``，默认 ``data/llm_response_cache``)，
+  总大小超过 ``LLM_RESPONSE_CACHE_MAX_MB`` 时按最近使用时间淘汰最旧条目;
+- 命中 / 未命中 / 写入计数记入 ``llm_metrics`` 汇总的 ``response_cache`` 段。
+
+``LLM_RESPONSE_CACHE`` 选择模式:
+
+    off      (默认) 不读不写
+    on       先查缓存，未命中再调用模型并写入
+    replay   只读；未命中抛 :class:`LLMReplayMissError`，保证回放结果可复现
+
+key 使用请求的 (primary) 模型身份：某次调用若 fallback 到其他 provider，其结果
+仍记在原请求模型名下，重跑时同样命中。默认响应 (重试耗尽) 不写入缓存。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from src.utils.env_helpers import get_env_float
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+DEFAULT_CACHE_DIR = Path("data/llm_response_cache")
+DEFAULT_MAX_MB = 256.0
+# 淘汰时降到上限的该比例，避免每次写入都触发一次淘汰
+_EVICT_TARGET_RATIO = 0.9
+
+MODE_OFF = "off"
+MODE_ON = "on"
+MODE_REPLAY = "replay"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+  key TEXT PRIMARY KEY,
+  schema_name TEXT NOT NULL,
+  model TEXT NOT NULL,
+  payload TEXT NOT NULL,
+  size INTEGER NOT NULL,
+  created_at REAL NOT NULL,
+  last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used);
+"""
+
+
+class LLMReplayMissError(RuntimeError):
+    """Strict replay found no cached response for a prompt."""
+
+
+def llm_response_cache_mode() -> str:
+    raw = os.getenv("LLM_RESPONSE_CACHE", MODE_OFF).strip().lower()
+    if raw in {"1", "true", "yes", MODE_ON, "readwrite"}:
+        return MODE_ON
+    if raw == MODE_REPLAY:
+        return MODE_REPLAY
+    return MODE_OFF
+
+
+def _canonical_message(message: Any) -> Any:
+    if isinstance(message, str):
+        return {"role": "human", "content": message}
+    if isinstance(message, tuple) and len(message) == 2:
+        return {"role": str(message[0]), "content": message[1]}
+    if isinstance(message, dict):
+        return {str(key): message[key] for key in sorted(message)}
+    role = getattr(message, "type", None)
+    content = getattr(message, "content", None)
+    if role is not None and content is not None:
+        return {"role": str(role), "content": content}
+    return {"role": type(message).__name__, "content": str(message)}
+
+
+def canonical_prompt_messages(prompt: Any) -> list[Any]:
+    """Provider-neutral ``[{role, content}, ...]`` form of a call_llm prompt."""
+    if hasattr(prompt, "to_messages"):
+        prompt = prompt.to_messages()
+    if isinstance(prompt, list):
+        return [_canonical_message(message) for message in prompt]
+    return [_canonical_message(prompt)]
+
+
+def llm_response_cache_key(prompt: Any, pydantic_model: type[BaseModel], model_provider: str, model_name: str) -> str:
+    document = {
+        "v": SCHEMA_VERSION,
+        "messages": canonical_prompt_messages(prompt),
+        "schema": pydantic_model.model_json_schema(),
+        "provider": str(model_provider),
+        "model": str(model_name),
+    }
+    payload = json.dumps(document, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    key: str
+    payload: dict[str, Any]
+
+
+class LLMResponseCache:
+    """SQLite-backed response store with size-bounded LRU eviction."""
+
+    def __init__(self, db_path: Path | str, max_bytes: int) -> None:
+        self.db_path = Path(db_path)
+        self.max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._total_bytes = int(self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0])
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        try:
+            return CachedResponse(key=key, payload=json.loads(row[0]))
+        except json.JSONDecodeError:
+            logger.warning("corrupt LLM response cache entry %s, ignoring", key[:12])
+            return None
+
+    def put(self, key: str, *, schema_name: str, model: str, payload: dict[str, Any]) -> None:
+        text = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        size = len(text.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, schema_name, model, payload, size, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, schema_name, model, text, size, now, now),
+            )
+            self._total_bytes += size - (int(previous[0]) if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked(int(self.max_bytes * _EVICT_TARGET_RATIO))
+            self._conn.commit()
+
+    def _evict_locked(self, target_bytes: int) -> None:
+        evicted = 0
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_used ASC").fetchall():
+            if self._total_bytes <= target_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= int(size)
+            evicted += 1
+        if evicted:
+            logger.info("LLM response cache evicted %d entries (now %.1f MB)", evicted, self._total_bytes / 1e6)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries = int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+            return {"entries": entries, "bytes": self._total_bytes, "max_bytes": self.max_bytes}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_caches: dict[Path, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _max_bytes() -> int:
+    return int(get_env_float("LLM_RESPONSE_CACHE_MAX_MB", DEFAULT_MAX_MB, minimum=0.001) * 1024 * 1024)
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    db_path = Path(os.getenv("LLM_RESPONSE_CACHE_DIR", str(DEFAULT_CACHE_DIR))) / "responses.sqlite"
+    with _caches_lock:
+        cache = _caches.get(db_path)
+        if cache is None:
+            cache = _caches[db_path] = LLMResponseCache(db_path, _max_bytes())
+        return cache
+
+
+def _reset_llm_response_caches_for_testing() -> None:
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
+
+
+__all__ = [
+    "CachedResponse",
+    "LLMReplayMissError",
+    "LLMResponseCache",
+    "MODE_OFF",
+    "MODE_ON",
+    "MODE_REPLAY",
+    "canonical_prompt_messages",
+    "get_llm_response_cache",
+    "llm_response_cache_key",
+    "llm_response_cache_mode",
+]
@@ -0,0 +1,491 @@
+"""流水线内置剖析 — 嵌套 span 计时 / 分配计数 / 可选采样剖析 / 逐次运行计时产物。
+
+``--auto`` 夜间运行要跑十几分钟, 但只有 ``_print_cache_hit_summary`` 之类的
+粗粒度统计, 无法回答 "时间花在哪一段"。本模块提供不依赖外部剖析器的
+埋点面:
+
+- :func:`span`: 嵌套计时上下文 (也可作装饰器)。记录每条 span 路径的调用次数、
+  墙钟时间、调用线程 CPU 时间、GC 回收次数; 开启分配统计时额外记录 tracemalloc
+  净分配字节。没有活动的 :class:`RunProfile` 时为空操作 (一次 ContextVar 读取),
+  因此可以常驻在热路径上; Web 后台任务等未开启剖析的调用方不受影响。
+- :class:`RunProfile`: 一次运行的采集器。``start()`` / ``stop()`` 之间当前
+  上下文内的 span 都归入本次运行; 可选开启 tracemalloc 与采样剖析 (后台线程
+  定时抓取运行线程的调用栈, 聚合为 folded stacks + 每个 span 的样本数)。
+- :func:`write_timing_artifact` / :func:`compare_timing_artifacts`: 每次运行写一份
+  机器可读的 JSON 计时产物 (含运行结果 ``status``), 并与上一份成功运行的产物
+  逐 span 对比, 标记回归。
+
+span 只在开启剖析的线程 / 上下文内生效: 线程池 worker 内的 span 不会自动继承
+(需调用方显式 ``copy_context``), 其耗时计入外层 span。
+
+Config (``--auto`` 入口读取, 见 :func:`profile_from_env`):
+    AUTO_TIMING_ENABLED              是否采集并写计时产物, 默认 true
+    AUTO_TIMING_DIR                  产物目录, 默认 ``logs/auto_timings``
+    AUTO_PROFILE_ALLOCATIONS         开启 tracemalloc 分配统计, 默认 false (有 CPU 开销)
+    AUTO_PROFILE_SAMPLE_MS           采样剖析间隔 (毫秒), 默认 0 = 关闭
+    AUTO_TIMING_REGRESSION_RATIO     span 耗时超过基线的倍数视为回归, 默认 1.25
+    AUTO_TIMING_REGRESSION_MIN_SECONDS  绝对增量低于该值不报回归, 默认 1.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.utils.env_helpers import get_env_enabled, get_env_flag, get_env_float
+
+logger = logging.getLogger(__name__)
+
+TIMING_SCHEMA_VERSION = 1
+DEFAULT_TIMING_DIR = Path(__file__).resolve().parents[2] / "logs" / "auto_timings"
+
+_SPAN_SEPARATOR = "/"
+_MAX_STACK_DEPTH = 64
+_TOP_STACKS = 50
+
+_ACTIVE_PROFILE: ContextVar[RunProfile | None] = ContextVar("run_profile", default=None)
+_SPAN_PATH: ContextVar[tuple[str, ...]] = ContextVar("run_profile_span_path", default=())
+
+
+def _gc_collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+@dataclass
+class SpanStats:
+    """单条 span 路径的累计统计。"""
+
+    path: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    max_wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    gc_collections: int = 0
+    alloc_net_bytes: int | None = None
+    samples: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["wall_seconds"] = round(self.wall_seconds, 6)
+        payload["max_wall_seconds"] = round(self.max_wall_seconds, 6)
+        payload["cpu_seconds"] = round(self.cpu_seconds, 6)
+        return payload
+
+
+class _StackSampler(threading.Thread):
+    """定时抓取目标线程调用栈的后台线程 (纯 Python, 无外部依赖)。"""
+
+    def __init__(self, profile: RunProfile, thread_id: int, interval: float) -> None:
+        super().__init__(name="run-profile-sampler", daemon=True)
+        self._profile = profile
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            stack: list[str] = []
+            while frame is not None and len(stack) < _MAX_STACK_DEPTH:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+                frame = frame.f_back
+            self._profile._record_sample(";".join(reversed(stack)), self._thread_id)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join(timeout=max(1.0, self._interval * 5))
+
+
+@dataclass
+class RunProfile:
+    """一次运行的 span 采集器。
+
+    Args:
+        label: 根 span 名 (如 ``"auto"``), 所有 span 路径以它开头
+        attrs: 写入产物的运行属性 (trade_date / top_n 等)
+        allocations: 开启 tracemalloc 净分配统计
+        sample_interval: 采样剖析间隔 (秒); ``None`` / 0 关闭
+        status: 运行结果 (``"ok"`` / ``"failed"``), 由调用方在写产物前设置;
+            只有 ``"ok"`` 的产物会被选作回归基线
+        exit_code: 运行退出码 (可选)
+    """
+
+    label: str
+    attrs: dict[str, Any] = field(default_factory=dict)
+    allocations: bool = False
+    sample_interval: float | None = None
+    status: str | None = None
+    exit_code: int | None = None
+    started_at: str = ""
+    wall_seconds: float = 0.0
+    peak_traced_bytes: int | None = None
+    spans: dict[str, SpanStats] = field(default_factory=dict)
+    stacks: Counter = field(default_factory=Counter)
+    total_samples: int = 0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active_paths: dict[int, str] = {}
+        self._tokens: tuple[Token, Token] | None = None
+        self._root_cm: Any = None
+        self._sampler: _StackSampler | None = None
+        self._started_tracemalloc = False
+        self._wall_started = 0.0
+
+    # -- lifecycle -----------------------------------------------------
+
+    def start(self) -> RunProfile:
+        """在当前上下文激活本次运行并打开根 span。"""
+        if self._tokens is not None:
+            raise RuntimeError("RunProfile already started")
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._tokens = (_ACTIVE_PROFILE.set(self), _SPAN_PATH.set(()))
+        self._wall_started = time.perf_counter()
+        self._root_cm = span(self.label)
+        self._root_cm.__enter__()
+        if self.sample_interval and self.sample_interval > 0:
+            self._sampler = _StackSampler(self, threading.get_ident(), self.sample_interval)
+            self._sampler.start()
+        return self
+
+    def stop(self) -> RunProfile:
+        """关闭根 span、停止采样 / tracemalloc, 并恢复调用前的上下文。幂等。"""
+        if self._tokens is None:
+            return self
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+        self._root_cm.__exit__(None, None, None)
+        self.wall_seconds = time.perf_counter() - self._wall_started
+        if tracemalloc.is_tracing() and self.allocations:
+            self.peak_traced_bytes = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        active_token, path_token = self._tokens
+        _SPAN_PATH.reset(path_token)
+        _ACTIVE_PROFILE.reset(active_token)
+        self._tokens = None
+        return self
+
+    def __enter__(self) -> RunProfile:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    # -- recording -----------------------------------------------------
+
+    def _enter_span(self, path: str) -> str | None:
+        thread_id = threading.get_ident()
+        with self._lock:
+            previous = self._active_paths.get(thread_id)
+            self._active_paths[thread_id] = path
+        return previous
+
+    def _exit_span(self, path: str, previous: str | None, *, wall: float, cpu: float, collections: int, alloc: int | None) -> None:
+        thread_id = threading.get_ident()
+        with self._lock:
+            if previous is None:
+                self._active_paths.pop(thread_id, None)
+            else:
+                self._active_paths[thread_id] = previous
+            stats = self.spans.get(path)
+            if stats is None:
+                stats = self.spans[path] = SpanStats(path=path)
+            stats.calls += 1
+            stats.wall_seconds += wall
+            stats.max_wall_seconds = max(stats.max_wall_seconds, wall)
+            stats.cpu_seconds += cpu
+            stats.gc_collections += collections
+            if alloc is not None:
+                stats.alloc_net_bytes = (stats.alloc_net_bytes or 0) + alloc
+
+    def _record_sample(self, folded_stack: str, thread_id: int) -> None:
+        with self._lock:
+            self.total_samples += 1
+            self.stacks[folded_stack] += 1
+            path = self._active_paths.get(thread_id)
+            if path is not None and path in self.spans:
+                self.spans[path].samples += 1
+            elif path is not None:
+                self.spans[path] = SpanStats(path=path, samples=1)
+
+    # -- export --------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            spans = sorted(self.spans.values(), key=lambda item: item.path)
+            top_stacks = self.stacks.most_common(_TOP_STACKS)
+        return {
+            "schema_version": TIMING_SCHEMA_VERSION,
+            "label": self.label,
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "attrs": dict(self.attrs),
+            "started_at": self.started_at,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "allocations_enabled": self.allocations,
+            "peak_traced_bytes": self.peak_traced_bytes,
+            "sample_interval_seconds": self.sample_interval or None,
+            "total_samples": self.total_samples,
+            "spans": [item.to_dict() for item in spans],
+            "top_stacks": [{"stack": stack, "samples": count} for stack, count in top_stacks],
+        }
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """计时一段代码, 归入当前活动 :class:`RunProfile` 的 ``父路径/name``。
+
+    无活动 profile 时直接执行 (零统计开销)。生成器式上下文管理器同样可用作
+    装饰器: ``@span("score_batch.heavy_signals")``。
+    """
+    profile = _ACTIVE_PROFILE.get()
+    if profile is None:
+        yield
+        return
+    parent = _SPAN_PATH.get()
+    segments = (*parent, name)
+    path = _SPAN_SEPARATOR.join(segments)
+    token = _SPAN_PATH.set(segments)
+    previous = profile._enter_span(path)
+    track_alloc = profile.allocations and tracemalloc.is_tracing()
+    alloc_started = tracemalloc.get_traced_memory()[0] if track_alloc else 0
+    gc_started = _gc_collections()
+    cpu_started = time.thread_time()
+    wall_started = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_started
+        cpu = time.thread_time() - cpu_started
+        alloc = tracemalloc.get_traced_memory()[0] - alloc_started if track_alloc else None
+        profile._exit_span(path, previous, wall=wall, cpu=cpu, collections=_gc_collections() - gc_started, alloc=alloc)
+        _SPAN_PATH.reset(token)
+
+
+def active_profile() -> RunProfile | None:
+    return _ACTIVE_PROFILE.get()
+
+
+def profile_from_env(label: str, attrs: Mapping[str, Any] | None = None) -> RunProfile | None:
+    """按 ``AUTO_TIMING_*`` / ``AUTO_PROFILE_*`` 环境变量构建 (未启动的) profile; 关闭时返回 None。"""
+    if not get_env_enabled("AUTO_TIMING_ENABLED"):
+        return None
+    sample_ms = get_env_float("AUTO_PROFILE_SAMPLE_MS", 0.0, minimum=0.0)
+    return RunProfile(
+        label=label,
+        attrs=dict(attrs or {}),
+        allocations=get_env_flag("AUTO_PROFILE_ALLOCATIONS"),
+        sample_interval=sample_ms / 1000.0 if sample_ms > 0 else None,
+    )
+
+
+def timing_dir_from_env() -> Path:
+    raw = os.environ.get("AUTO_TIMING_DIR", "").strip()
+    return Path(raw) if raw else DEFAULT_TIMING_DIR
+
+
+# ---------------------------------------------------------------------------
+# 计时产物 + 回归对比
+# ---------------------------------------------------------------------------
+
+
+def write_timing_artifact(profile: RunProfile, directory: Path, *, prefix: str | None = None) -> Path:
+    """写 ``{prefix}_timing_{YYYYmmddTHHMMSS}_{pid}.json``; 有采样数据时同名写 ``.folded`` 供火焰图工具使用。
+
+    同一秒启动的两次运行靠 pid 区分; 同进程同秒重复写入再追加序号, 绝不覆盖已有产物。
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = (profile.started_at or datetime.now().isoformat(timespec="seconds")).replace("-", "").replace(":", "")
+    base_name = f"{prefix or profile.label}_timing_{stamp}_{os.getpid()}"
+    path = directory / f"{base_name}.json"
+    counter = 0
+    while path.exists():
+        counter += 1
+        path = directory / f"{base_name}_{counter}.json"
+    # 诊断产物: tmp + rename 保证读者看不到半份 JSON 即可, 不需要 fsync 级持久化
+    staging = path.with_name(f"{path.name}.tmp")
+    staging.write_text(json.dumps(profile.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(staging, path)
+    if profile.stacks:
+        with profile._lock:
+            folded = "".join(f"{stack} {count}\n" for stack, count in profile.stacks.most_common())
+        path.with_suffix(".folded").write_text(folded, encoding="utf-8")
+    return path
+
+
+def load_timing_artifact(path: Path) -> dict[str, Any]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("schema_version") != TIMING_SCHEMA_VERSION:
+        raise ValueError(f"unsupported timing artifact: {path}")
+    return payload
+
+
+def previous_timing_artifact(directory: Path, current: Path, *, prefix: str) -> Path | None:
+    """``directory`` 中按文件名排序位于 ``current`` 之前、最近一份成功运行的同前缀产物。
+
+    ``status`` 非 ``"ok"`` (失败 / 部分运行) 或无法读取的产物不作基线; 未记录 ``status``
+    的旧产物视为可用。
+    """
+    candidates = sorted(path for path in Path(directory).glob(f"{prefix}_timing_*.json") if path.name < Path(current).name)
+    for path in reversed(candidates):
+        try:
+            status = load_timing_artifact(path).get("status")
+        except (OSError, ValueError) as exc:
+            logger.debug("skip unreadable timing artifact %s: %s", path, exc)
+            continue
+        if status in (None, "ok"):
+            return path
+    return None
+
+
+@dataclass(frozen=True)
+class TimingRegression:
+    path: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def delta_seconds(self) -> float:
+        return self.current_seconds - self.baseline_seconds
+
+    @property
+    def ratio(self) -> float:
+        return self.current_seconds / self.baseline_seconds if self.baseline_seconds > 0 else float("inf")
+
+    def describe(self) -> str:
+        return f"{self.path}: {self.baseline_seconds:.2f}s → {self.current_seconds:.2f}s " f"(+{self.delta_seconds:.2f}s, x{self.ratio:.2f})"
+
+
+def compare_timing_artifacts(
+    baseline: Mapping[str, Any],
+    current: Mapping[str, Any],
+    *,
+    ratio: float | None = None,
+    min_delta_seconds: float | None = None,
+) -> list[TimingRegression]:
+    """逐 span 路径对比墙钟耗时, 返回 ``current > baseline × ratio`` 且增量 ≥ ``min_delta_seconds`` 的回归。
+
+    只对比两边都存在的 span (新增 / 消失的阶段不算回归); 按增量从大到小排序。
+    """
+    ratio = ratio if ratio is not None else get_env_float("AUTO_TIMING_REGRESSION_RATIO", 1.25, minimum=1.0)
+    min_delta = min_delta_seconds if min_delta_seconds is not None else get_env_float("AUTO_TIMING_REGRESSION_MIN_SECONDS", 1.0, minimum=0.0)
+    baseline_wall = {str(item["path"]): float(item.get("wall_seconds") or 0.0) for item in baseline.get("spans", [])}
+    regressions = []
+    for item in current.get("spans", []):
+        path = str(item["path"])
+        if path not in baseline_wall:
+            continue
+        before = baseline_wall[path]
+        after = float(item.get("wall_seconds") or 0.0)
+        if after - before >= min_delta and after > before * ratio:
+            regressions.append(TimingRegression(path=path, baseline_seconds=before, current_seconds=after))
+    return sorted(regressions, key=lambda item: item.delta_seconds, reverse=True)
+
+
+def format_timing_summary(payload: Mapping[str, Any], *, max_depth: int = 2) -> str:
+    """按 span 树缩进输出 ``max_depth`` 层以内的耗时 (墙钟 / CPU / 占比)。"""
+    total = float(payload.get("wall_seconds") or 0.0) or 1e-9
+    lines = [f"{payload.get('label', 'run')} 计时 ({payload.get('wall_seconds', 0.0):.2f}s):"]
+    for item in payload.get("spans", []):
+        depth = str(item["path"]).count(_SPAN_SEPARATOR)
+        if depth == 0 or depth > max_depth:
+            continue
+        name = str(item["path"]).rsplit(_SPAN_SEPARATOR, 1)[-1]
+        wall = float(item.get("wall_seconds") or 0.0)
+        lines.append(f"{'  ' * depth}{name:<28s} {wall:8.2f}s  cpu {float(item.get('cpu_seconds') or 0.0):7.2f}s  {wall / total:6.1%}  x{item.get('calls', 0)}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """对比两份计时产物; 缺省取 ``AUTO_TIMING_DIR`` 中最近两份。有回归且 ``--fail-on-regression`` 时返回 1。"""
+    parser = argparse.ArgumentParser(description="Compare --auto timing artifacts and flag per-span regressions")
+    parser.add_argument("--dir", type=Path, default=None, help="Timing artifact directory (default: AUTO_TIMING_DIR or logs/auto_timings)")
+    parser.add_argument("--prefix", default="auto", help="Artifact prefix (default: auto)")
+    parser.add_argument("--baseline", type=Path, default=None, help="Baseline artifact (default: the one before --current)")
+    parser.add_argument("--current", type=Path, default=None, help="Current artifact (default: latest in --dir)")
+    parser.add_argument("--ratio", type=float, default=None, help="Regression ratio threshold (default: 1.25)")
+    parser.add_argument("--min-delta", type=float, default=None, help="Minimum absolute regression in seconds (default: 1.0)")
+    parser.add_argument("--depth", type=int, default=2, help="Span tree depth shown in the summary (default: 2)")
+    parser.add_argument("--json", action="store_true", dest="output_json", help="Output regressions as JSON")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 when any regression is found")
+    args = parser.parse_args(argv)
+
+    directory = args.dir or timing_dir_from_env()
+    current_path = args.current
+    if current_path is None:
+        artifacts = sorted(directory.glob(f"{args.prefix}_timing_*.json"))
+        if not artifacts:
+            print(f"no timing artifacts under {directory}")
+            return 1
+        current_path = artifacts[-1]
+    baseline_path = args.baseline or previous_timing_artifact(current_path.parent, current_path, prefix=args.prefix)
+    current = load_timing_artifact(current_path)
+    regressions = compare_timing_artifacts(load_timing_artifact(baseline_path), current, ratio=args.ratio, min_delta_seconds=args.min_delta) if baseline_path else []
+
+    if args.output_json:
+        print(
+            json.dumps(
+                {
+                    "baseline": str(baseline_path) if baseline_path else None,
+                    "current": str(current_path),
+                    "regressions": [{**asdict(item), "delta_seconds": round(item.delta_seconds, 6), "ratio": round(item.ratio, 4)} for item in regressions],
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+    else:
+        print(format_timing_summary(current, max_depth=args.depth))
+        if baseline_path is None:
+            print("(no baseline artifact to compare against)")
+        elif regressions:
+            print(f"\n回归 (基线 {baseline_path.name}):")
+            for item in regressions:
+                print(f"  {item.describe()}")
+        else:
+            print(f"\n无回归 (基线 {baseline_path.name})")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+__all__ = [
+    "DEFAULT_TIMING_DIR",
+    "RunProfile",
+    "SpanStats",
+    "TIMING_SCHEMA_VERSION",
+    "TimingRegression",
+    "active_profile",
+    "compare_timing_artifacts",
+    "format_timing_summary",
+    "load_timing_artifact",
+    "main",
+    "previous_timing_artifact",
+    "profile_from_env",
+    "span",
+    "timing_dir_from_env",
+    "write_timing_artifact",
+]
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import pytest
+
+from app.backend.services.screening_jobs import shutdown_screening_job_manager
+
+
+@pytest.fixture(autouse=True)
+def _isolated_screening_jobs():
+    """每个测试使用全新的选股任务 manager — 结果缓存 / 在途任务不跨测试共享。"""
+    shutdown_screening_job_manager()
+    yield
+    shutdown_screening_job_manager()
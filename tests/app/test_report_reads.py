@@ -0,0 +1,129 @@
+"""Tests for the 报告读取层 (线程池读取 / mtime 解析缓存 / 响应缓存 / ETag 304)."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.routes import screening as screening_routes
+from app.backend.services.report_reader import (
+    REPORT_CACHE_CONTROL,
+    ReportReadService,
+    etag_matches,
+    get_report_read_service,
+    glob_version,
+)
+
+
+def _write_report(reports_dir: Path, trade_date: str, tickers: list[str], *, mtime_ns: int | None = None) -> Path:
+    path = reports_dir / f"auto_screening_{trade_date}.json"
+    payload = {
+        "date": trade_date,
+        "market_state": {"state_type": "trend", "regime_gate_level": "normal"},
+        "recommendations": [{"ticker": ticker, "score_b": 0.6, "strategy_signals": {}} for ticker in tickers],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.fixture()
+def reports_dir(tmp_path, monkeypatch) -> Path:
+    directory = tmp_path / "reports"
+    directory.mkdir()
+    monkeypatch.setattr(screening_routes, "_auto_screening_reports_dir", lambda: directory)
+    return directory
+
+
+@pytest.fixture()
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(screening_routes.router)
+    return TestClient(app)
+
+
+def test_latest_answers_if_none_match_with_304(client, reports_dir) -> None:
+    _write_report(reports_dir, "20260607", ["600000"])
+
+    first = client.get("/api/screening/latest")
+    etag = first.headers["etag"]
+    revalidated = client.get("/api/screening/latest", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == REPORT_CACHE_CONTROL
+    assert first.json()["recommendations"][0]["ticker"] == "600000"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+
+def test_latest_renders_once_per_report_version(client, reports_dir, monkeypatch) -> None:
+    _write_report(reports_dir, "20260607", ["600000"], mtime_ns=1_000_000_000)
+    loads: list[str | None] = []
+    original = screening_routes._load_latest_auto_screening_payload
+
+    def _counting_loader(trade_date=None):
+        loads.append(trade_date)
+        return original(trade_date=trade_date)
+
+    monkeypatch.setattr(screening_routes, "_load_latest_auto_screening_payload", _counting_loader)
+
+    first = client.get("/api/screening/latest")
+    second = client.get("/api/screening/latest")
+    _write_report(reports_dir, "20260607", ["600000", "000001"], mtime_ns=2_000_000_000)
+    third = client.get("/api/screening/latest", headers={"If-None-Match": first.headers["etag"]})
+
+    assert len(loads) == 2
+    assert second.content == first.content
+    assert third.status_code == 200
+    assert third.headers["etag"] != first.headers["etag"]
+    assert [rec["ticker"] for rec in third.json()["recommendations"]] == ["600000", "000001"]
+    assert get_report_read_service().stats()["render_hits"] == 1
+
+
+def test_new_report_file_changes_directory_version(reports_dir) -> None:
+    _write_report(reports_dir, "20260607", ["600000"])
+    before = glob_version(reports_dir, "auto_screening_*.json")
+    _write_report(reports_dir, "20260608", ["600000"])
+
+    assert glob_version(reports_dir, "auto_screening_*.json") != before
+
+
+def test_pinned_stock_detail_version_tracks_other_dates_and_tracking_history(reports_dir) -> None:
+    # 固定 trade_date 的 stock-detail / compare 仍读其他日期 (连续推荐 / 信号衰减) 与追踪历史
+    _write_report(reports_dir, "20260608", ["600000"])
+    pinned = screening_routes._report_history_version(reports_dir)
+    _write_report(reports_dir, "20260605", ["600000"], mtime_ns=1_000_000_000)
+    with_older_report = screening_routes._report_history_version(reports_dir)
+    (reports_dir / "tracking_history.json").write_text("[]", encoding="utf-8")
+
+    assert with_older_report != pinned
+    assert screening_routes._report_history_version(reports_dir) != with_older_report
+
+
+def test_load_json_reuses_parse_until_file_changes(tmp_path) -> None:
+    service = ReportReadService()
+    path = _write_report(tmp_path, "20260607", ["600000"], mtime_ns=1_000_000_000)
+
+    first = service.load_json(path)
+    second = service.load_json(path)
+    _write_report(tmp_path, "20260607", ["000001"], mtime_ns=2_000_000_000)
+    third = service.load_json(path)
+
+    assert second is first
+    assert third["recommendations"][0]["ticker"] == "000001"
+    assert service.stats()["payload_hits"] == 1
+    assert service.stats()["payload_misses"] == 2
+
+
+def test_etag_matching_accepts_lists_weak_tags_and_wildcard() -> None:
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"c"')
+    assert not etag_matches(None, '"a"')
+    assert not etag_matches('"a"', '"b"')
@@ -36,6 +36,7 @@ from app.backend.routes.screening import (
     MIN_TOP_N,
 )
 from app.backend.routes.screening import router as screening_router
+from src.main import AutoScreeningEmptyPool
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -326,13 +327,13 @@ def test_top_n_at_max_accepted() -> None:
 
 
 def test_empty_candidate_pool_returns_503() -> None:
-    """当 compute_auto_screening_results 抛 ValueError (候选池空) → 503。"""
+    """当 compute_auto_screening_results 抛 AutoScreeningEmptyPool (候选池空) → 503。"""
     client = _build_client()
     with (
         patch.dict(os.environ, {"TUSHARE_TOKEN": "test_token"}, clear=False),
         patch(
             "app.backend.routes.screening.compute_auto_screening_results",
-            side_effect=ValueError("候选池为空 (trade_date=20260607), 请检查市场数据源是否可用"),
+            side_effect=AutoScreeningEmptyPool("候选池为空 (trade_date=20260607), 请检查市场数据源是否可用"),
         ),
     ):
         response = client.post("/api/screening/auto", json={"trade_date": "20260607"})
@@ -0,0 +1,171 @@
+"""Tests for the /api/screening 后台任务层 (请求合并 / 结果缓存 / 取消 / SSE)."""
+
+from __future__ import annotations
+
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.routes.screening import router as screening_router
+from src.main import AutoScreeningCancelled, AutoScreeningEmptyPool
+from src.utils.progress import progress
+
+_COMPUTE = "app.backend.routes.screening.compute_auto_screening_results"
+
+
+def _payload(trade_date: str = "20260607") -> dict:
+    return {
+        "date": trade_date,
+        "market_state": {"state_type": "trend", "regime_gate_level": "normal"},
+        "recommendations": [{"ticker": "600000", "score_b": 0.6, "strategy_signals": {}}],
+        "top_n": 20,
+    }
+
+
+class _BlockingCompute:
+    """可控的 compute_auto_screening_results 替身: 在 release 前阻塞, 记录调用。"""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, trade_date, top_n, selected_strategies=None, cancel_event=None):
+        self.calls.append((trade_date, top_n, selected_strategies))
+        progress.update_status("auto_screening", None, "Step 1/4: 全市场快筛 (Layer A)")
+        self.started.set()
+        while not self.release.wait(0.01):
+            if cancel_event is not None and cancel_event.is_set():
+                raise AutoScreeningCancelled("cancelled")
+        return _payload(trade_date)
+
+
+@pytest.fixture()
+def client():
+    app = FastAPI()
+    app.include_router(screening_router)
+    with patch.dict(os.environ, {"TUSHARE_TOKEN": "test_token"}, clear=False):
+        yield TestClient(app)
+
+
+def test_concurrent_requests_coalesce_and_later_requests_hit_result_cache(client) -> None:
+    compute = _BlockingCompute()
+    with patch(_COMPUTE, compute):
+        first = client.post("/api/screening/jobs", json={"trade_date": "20260607", "strategies": ["trend", "fundamental"]})
+        second = client.post("/api/screening/jobs", json={"trade_date": "2026-06-07", "strategies": ["fundamental", "trend"]})
+        assert compute.started.wait(5)
+        compute.release.set()
+        auto = client.post("/api/screening/auto", json={"trade_date": "20260607", "strategies": ["trend", "fundamental"], "use_explain": False})
+        again = client.post("/api/screening/auto", json={"trade_date": "20260607", "strategies": ["trend", "fundamental"]})
+
+    assert first.status_code == second.status_code == 202
+    assert second.json()["job_id"] == first.json()["job_id"]
+    assert second.json()["coalesced"] is True
+    assert auto.status_code == again.status_code == 200
+    assert again.json()["meta"]["job"] == {"job_id": first.json()["job_id"], "coalesced": False, "cache_hit": True}
+    assert compute.calls == [("20260607", 20, ["fundamental", "trend"])]
+
+
+def test_timeout_keeps_single_job_running_for_the_next_request(client, monkeypatch) -> None:
+    monkeypatch.setattr("app.backend.routes.screening.DEFAULT_TIMEOUT_SECONDS", 0.05)
+    compute = _BlockingCompute()
+    with patch(_COMPUTE, compute):
+        timed_out = client.post("/api/screening/auto", json={"trade_date": "20260607"})
+        compute.release.set()
+        monkeypatch.setattr("app.backend.routes.screening.DEFAULT_TIMEOUT_SECONDS", 5.0)
+        retried = client.post("/api/screening/auto", json={"trade_date": "20260607"})
+
+    assert timed_out.status_code == 504
+    job_id = timed_out.json()["detail"].rsplit("job_id=", 1)[1]
+    assert retried.status_code == 200
+    assert retried.json()["meta"]["job"]["job_id"] == job_id
+    assert len(compute.calls) == 1
+
+
+def test_cancel_stops_running_job_and_dequeues_pending_job(client) -> None:
+    compute = _BlockingCompute()
+    with patch(_COMPUTE, compute):
+        running = client.post("/api/screening/jobs", json={"trade_date": "20260607"}).json()
+        queued = client.post("/api/screening/jobs", json={"trade_date": "20260608"}).json()
+        assert compute.started.wait(5)
+
+        cancelled_queued = client.delete(f"/api/screening/jobs/{queued['job_id']}")
+        client.delete(f"/api/screening/jobs/{running['job_id']}")
+        events = client.get(f"/api/screening/jobs/{running['job_id']}/events")
+        result = client.get(f"/api/screening/jobs/{running['job_id']}/result")
+
+    assert cancelled_queued.json()["status"] == "cancelled"
+    assert client.get(f"/api/screening/jobs/{running['job_id']}").json()["status"] == "cancelled"
+    assert "event: error" in events.text
+    assert result.status_code == 409
+    assert [call[0] for call in compute.calls] == ["20260607"]
+
+
+def test_cancel_on_coalesced_job_only_detaches_until_last_requester(client) -> None:
+    compute = _BlockingCompute()
+    with patch(_COMPUTE, compute):
+        first = client.post("/api/screening/jobs", json={"trade_date": "20260607"}).json()
+        client.post("/api/screening/jobs", json={"trade_date": "20260607"})
+        assert compute.started.wait(5)
+
+        detached = client.delete(f"/api/screening/jobs/{first['job_id']}").json()
+        assert detached["status"] == "running"
+        assert detached["requesters"] == 1 and detached["cancel_requested"] is False
+
+        last = client.delete(f"/api/screening/jobs/{first['job_id']}").json()
+        assert last["cancel_requested"] is True
+        events = client.get(f"/api/screening/jobs/{first['job_id']}/events")
+
+    assert "requester_detached" in events.text
+    assert client.get(f"/api/screening/jobs/{first['job_id']}").json()["status"] == "cancelled"
+    assert len(compute.calls) == 1
+
+
+def test_only_empty_candidate_pool_maps_to_503(client) -> None:
+    def _empty(*args, **kwargs):
+        raise AutoScreeningEmptyPool("候选池为空 (trade_date=20260607)")
+
+    def _broken(*args, **kwargs):
+        raise ValueError("effective trade date must be exact YYYYMMDD")
+
+    with patch(_COMPUTE, _empty):
+        empty = client.post("/api/screening/auto", json={"trade_date": "20260607"})
+    with patch(_COMPUTE, _broken):
+        broken = client.post("/api/screening/auto", json={"trade_date": "20260608"})
+
+    assert empty.status_code == 503 and "候选池为空" in empty.json()["detail"]
+    assert broken.status_code == 500
+    assert broken.json()["detail"] == "Internal server error"
+
+
+def test_job_events_stream_progress_and_completion(client) -> None:
+    compute = _BlockingCompute()
+    compute.release.set()
+    with patch(_COMPUTE, compute):
+        job = client.post("/api/screening/jobs", json={"trade_date": "20260607"}).json()
+        response = client.get(f"/api/screening/jobs/{job['job_id']}/events")
+        result = client.get(f"/api/screening/jobs/{job['job_id']}/result", params={"score_threshold": 0.7})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    body = response.text
+    assert body.startswith("event: start")
+    assert "Step 1/4" in body
+    assert body.rstrip().split("\n\n")[-1].startswith("event: complete")
+    assert result.status_code == 200 and result.json()["recommendations"] == []
+
+
+def test_full_inflight_capacity_rejects_new_keys(client, monkeypatch) -> None:
+    monkeypatch.setenv("SCREENING_JOB_MAX_INFLIGHT", "1")
+    compute = _BlockingCompute()
+    with patch(_COMPUTE, compute):
+        client.post("/api/screening/jobs", json={"trade_date": "20260607"})
+        attached = client.post("/api/screening/jobs", json={"trade_date": "20260607"})
+        rejected = client.post("/api/screening/jobs", json={"trade_date": "20260608"})
+        compute.release.set()
+
+    assert attached.status_code == 202
+    assert rejected.status_code == 429
@@ -0,0 +1,215 @@
+"""engine_prefetch: 按 provider 限并发/限速的预取阶段。"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.backtesting import engine_market_data
+from src.backtesting.engine_market_data import MarketDataLoader
+from src.backtesting.engine_prefetch import (
+    PROVIDER_AKSHARE,
+    PROVIDER_FINANCIAL_DATASETS,
+    PROVIDER_TUSHARE,
+    PrefetchTask,
+    ProviderLimit,
+    TokenBucket,
+    prefetch_provider_for,
+    resolve_provider_limits,
+    run_prefetch,
+)
+from src.backtesting.portfolio import Portfolio
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces_to_rate():
+    clock = _FakeClock()
+    bucket = TokenBucket.per_minute(120, burst=2, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.5)
+    assert waits[3] == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_run_prefetch_caps_concurrency_per_provider():
+    active: dict[str, int] = {PROVIDER_TUSHARE: 0, PROVIDER_AKSHARE: 0}
+    peak: dict[str, int] = {PROVIDER_TUSHARE: 0, PROVIDER_AKSHARE: 0}
+    lock = threading.Lock()
+
+    def make_call(provider: str):
+        def call() -> None:
+            with lock:
+                active[provider] += 1
+                peak[provider] = max(peak[provider], active[provider])
+            time.sleep(0.01)
+            with lock:
+                active[provider] -= 1
+
+        return call
+
+    tasks = [PrefetchTask(provider, "prices", f"{index:06d}", make_call(provider)) for index in range(12) for provider in (PROVIDER_TUSHARE, PROVIDER_AKSHARE)]
+    limits = {PROVIDER_TUSHARE: ProviderLimit(max_concurrency=3), PROVIDER_AKSHARE: ProviderLimit(max_concurrency=1)}
+
+    report = run_prefetch(tasks, max_workers=8, limits=limits)
+
+    assert report.completed == len(tasks)
+    assert peak[PROVIDER_TUSHARE] == 3
+    assert peak[PROVIDER_AKSHARE] == 1
+    assert report.providers[PROVIDER_TUSHARE].calls == 12
+    assert report.providers[PROVIDER_AKSHARE].max_seconds > 0
+
+
+def test_run_prefetch_serial_mode_keeps_task_order():
+    order: list[int] = []
+    tasks = [PrefetchTask(PROVIDER_TUSHARE if index % 2 else PROVIDER_AKSHARE, "prices", str(index), lambda index=index: order.append(index)) for index in range(6)]
+
+    run_prefetch(tasks, max_workers=1, limits={})
+
+    assert order == list(range(6))
+
+
+def test_run_prefetch_runs_every_task_then_reraises_first_error():
+    ran: list[str] = []
+
+    def fail(name: str):
+        def call() -> None:
+            ran.append(name)
+            raise RuntimeError(name)
+
+        return call
+
+    tasks = [
+        PrefetchTask(PROVIDER_TUSHARE, "prices", "a", lambda: ran.append("a")),
+        PrefetchTask(PROVIDER_TUSHARE, "prices", "b", fail("b")),
+        PrefetchTask(PROVIDER_AKSHARE, "company_news", "c", fail("c")),
+    ]
+
+    with pytest.raises(RuntimeError, match="b"):
+        run_prefetch(tasks, max_workers=1, limits={})
+
+    assert ran == ["a", "b", "c"]
+
+
+def test_cached_tasks_skip_the_token_bucket():
+    limits = {PROVIDER_TUSHARE: ProviderLimit(max_concurrency=1, calls_per_minute=1, burst=1)}
+    tasks = [PrefetchTask(PROVIDER_TUSHARE, "prices", str(index), lambda: None, cached=index > 0) for index in range(5)]
+
+    started = time.perf_counter()
+    report = run_prefetch(tasks, max_workers=2, limits=limits)
+
+    # 只有第一个非缓存调用消耗令牌（burst=1，无需等待）；若缓存命中也排队，需等待数分钟
+    assert time.perf_counter() - started < 5
+    stats = report.providers[PROVIDER_TUSHARE]
+    assert stats.calls == 5
+    assert stats.cached_calls == 4
+    assert stats.throttled_seconds == 0.0
+
+
+def test_provider_routing_and_env_overrides(monkeypatch):
+    assert prefetch_provider_for("600519") == PROVIDER_TUSHARE
+    assert prefetch_provider_for("600519", news=True) == PROVIDER_AKSHARE
+    assert prefetch_provider_for("AAPL", news=True) == PROVIDER_FINANCIAL_DATASETS
+
+    monkeypatch.setenv("BACKTEST_PREFETCH_TUSHARE_CALLS_PER_MINUTE", "500")
+    monkeypatch.setenv("BACKTEST_PREFETCH_AKSHARE_CONCURRENCY", "bogus")
+    limits = resolve_provider_limits()
+    assert limits[PROVIDER_TUSHARE].calls_per_minute == 500
+    assert limits[PROVIDER_AKSHARE].max_concurrency == 2
+
+
+def test_loader_prefetch_issues_same_calls_and_records_report(monkeypatch):
+    calls: list[tuple] = []
+    lock = threading.Lock()
+
+    def recorder(name: str):
+        def call(ticker, *args, **kwargs):
+            with lock:
+                calls.append((name, ticker, args, tuple(sorted(kwargs.items()))))
+            return []
+
+        return call
+
+    for name in ("get_prices", "get_financial_metrics", "get_insider_trades", "get_company_news", "prices_from_cache_data"):
+        monkeypatch.setattr(engine_market_data, name, recorder(name))
+    monkeypatch.setattr(engine_market_data, "prime_prices_cache", lambda tickers, *a, **k: {"600519": [{"close": 1.0}]})
+    monkeypatch.setattr(engine_market_data, "prime_financial_metrics_cache", lambda tickers, *a, **k: {})
+    monkeypatch.setattr(engine_market_data, "PRICE_MATRIX_ENABLED", False)
+    monkeypatch.setenv("BACKTEST_PREFETCH_MAX_WORKERS", "4")
+
+    tickers = ["600519", "000001"]
+    loader = MarketDataLoader(
+        tickers=tickers,
+        start_date="2024-01-02",
+        end_date="2024-03-29",
+        portfolio=Portfolio(tickers=tickers, initial_cash=100_000.0, margin_requirement=0.5),
+        exit_reentry_cooldowns={},
+    )
+    loader.prefetch_data()
+
+    assert len(calls) == 2 * 4 + 1
+    # 预热命中的 payload 直接交给预取任务, 不再逐只回读缓存
+    assert ("prices_from_cache_data", "600519", ("2024-03-29", [{"close": 1.0}]), ()) in calls
+    assert not any(name == "get_prices" and ticker == "600519" for name, ticker, *_ in calls)
+    assert ("get_prices", "000300.SH", ("2024-01-02", "2024-03-29"), ()) in calls
+    assert ("get_company_news", "000001", ("2024-03-29",), (("limit", 1000), ("start_date", "2024-01-02"))) in calls
+    report = loader.last_prefetch_report
+    assert report is not None and report.completed == 9
+    # 基准指数 000300.SH 不被 is_ashare 识别，与 get_prices 实际走的 provider 一致
+    assert report.providers[PROVIDER_TUSHARE].calls == 6
+    assert report.providers[PROVIDER_FINANCIAL_DATASETS].calls == 1
+    assert report.providers[PROVIDER_TUSHARE].cached_calls == 1
+    assert report.providers[PROVIDER_AKSHARE].calls == 2
+
+
+def test_primed_universe_larger_than_lru_is_not_reread_per_ticker(tmp_path, monkeypatch):
+    from src.data.enhanced_cache import CacheAdapter, EnhancedCache
+    from src.tools import api
+
+    ec = EnhancedCache(disk_path=str(tmp_path / "prime.sqlite"))
+    adapter = CacheAdapter(ec)
+    monkeypatch.setattr(api, "_cache", adapter)
+    monkeypatch.setattr(api, "_get_snapshot", lambda: type("_Snap", (), {"export_prices": lambda *a: None, "export_financial_metrics": lambda *a: None})())
+    # 股票池远大于 LRU 默认容量 (128 条)
+    tickers = [f"{600000 + i}" for i in range(100)]
+    bar = {"open": 1.0, "close": 1.0, "high": 1.0, "low": 1.0, "volume": 1, "time": "2024-03-29"}
+    ec.disk.set_many({adapter._make_key("prices", api._prices_cache_key(ticker, "2023-03-29", "2024-03-29")): [bar] for ticker in tickers})
+    # 个股 get_prices 保持真实实现: 逐只回读缓存会体现在命中统计里; 基准指数不走网络
+    real_get_prices = engine_market_data.get_prices
+    monkeypatch.setattr(engine_market_data, "get_prices", lambda ticker, *a, **k: real_get_prices(ticker, *a, **k) if ticker in tickers else [])
+    for name in ("get_financial_metrics", "get_insider_trades", "get_company_news"):
+        monkeypatch.setattr(engine_market_data, name, lambda *a, **k: [])
+    monkeypatch.setattr(engine_market_data, "PRICE_MATRIX_ENABLED", False)
+    monkeypatch.setenv("BACKTEST_PREFETCH_AKSHARE_CALLS_PER_MINUTE", "0")
+    before = ec.get_stats()
+
+    loader = MarketDataLoader(
+        tickers=tickers,
+        start_date="2024-01-02",
+        end_date="2024-03-29",
+        portfolio=Portfolio(tickers=tickers, initial_cash=100_000.0, margin_requirement=0.5),
+        exit_reentry_cooldowns={},
+    )
+    loader.prefetch_data()
+
+    after = ec.get_stats()
+    assert loader.last_prefetch_report.providers[PROVIDER_TUSHARE].cached_calls == len(tickers)
+    # 只有一次批量预热, 没有逐 ticker 的缓存回读
+    for stat in ("lru_hits", "redis_hits", "disk_hits", "misses"):
+        assert after[stat] == before[stat], stat
@@ -0,0 +1,258 @@
+"""DailyPriceMatrix: 矩阵取价与逐 ticker get_price_data 路径逐日一致。"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtesting.engine_market_data import MarketDataLoader
+from src.backtesting.engine_price_matrix import DailyPriceMatrix
+from src.backtesting.portfolio import Portfolio
+
+TICKERS = ["AAPL", "MSFT", "NOVOL", "GAPPY", "EMPTY"]
+
+
+def _synthetic_frames() -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(7)
+    business_days = pd.bdate_range("2024-01-01", "2024-03-29")
+    frames: dict[str, pd.DataFrame] = {}
+    for ticker in TICKERS:
+        if ticker == "EMPTY":
+            frames[ticker] = pd.DataFrame()
+            continue
+        keep = rng.random(len(business_days)) > (0.4 if ticker == "GAPPY" else 0.05)
+        dates = business_days[keep]
+        close = 10 + rng.standard_normal(len(dates)).cumsum()
+        close[rng.random(len(dates)) < 0.05] = np.nan
+        volume = rng.integers(0, 5, len(dates)) * 1_000.0
+        frame = pd.DataFrame({"open": close, "close": close, "high": close, "low": close, "volume": volume}, index=pd.DatetimeIndex(dates, name="Date"))
+        if ticker == "NOVOL":
+            frame = frame.drop(columns=["volume"])
+        frames[ticker] = frame
+    return frames
+
+
+FRAMES = _synthetic_frames()
+
+
+def _fake_get_price_data(ticker: str, start_date: str, end_date: str, api_key=None) -> pd.DataFrame:
+    frame = FRAMES.get(ticker, pd.DataFrame())
+    if frame.empty:
+        return frame
+    return frame.loc[(frame.index >= pd.Timestamp(start_date)) & (frame.index <= pd.Timestamp(end_date))]
+
+
+def _make_loader() -> MarketDataLoader:
+    portfolio = Portfolio(tickers=TICKERS, initial_cash=100_000.0, margin_requirement=0.5)
+    return MarketDataLoader(
+        tickers=["AAPL", "MSFT", "NOVOL", "EMPTY"],
+        start_date="2024-01-08",
+        end_date="2024-03-29",
+        portfolio=portfolio,
+        exit_reentry_cooldowns={},
+    )
+
+
+def _same(left: dict | None, right: dict | None) -> bool:
+    if left is None or right is None:
+        return left is right
+    if left.keys() != right.keys():
+        return False
+    return all((math.isnan(left[key]) and math.isnan(right[key])) or left[key] == right[key] for key in left)
+
+
+def test_matrix_backed_loader_matches_per_ticker_path(monkeypatch):
+    calls: list[str] = []
+
+    def counting_get_price_data(ticker, start_date, end_date, api_key=None):
+        calls.append(ticker)
+        return _fake_get_price_data(ticker, start_date, end_date)
+
+    monkeypatch.setattr("src.backtesting.engine_market_data.get_price_data", counting_get_price_data)
+
+    baseline = _make_loader()
+    matrix_loader = _make_loader()
+    matrix_loader.build_price_matrix()
+    # GAPPY 不在初始 universe，通过持仓进入 → 首次出现时懒加载进矩阵
+    for loader in (baseline, matrix_loader):
+        loader._portfolio.apply_long_buy("GAPPY", 100, 9.5)
+
+    days = pd.bdate_range("2024-01-08", "2024-03-29")
+    windows = [(current.strftime("%Y-%m-%d"), (current - pd.Timedelta(days=1)).strftime("%Y-%m-%d")) for current in days]
+
+    def run_day(loader: MarketDataLoader, current_str: str, previous_str: str):
+        prices = loader.load_current_prices(TICKERS, previous_str, current_str)
+        turnover = loader.get_daily_turnovers(TICKERS, previous_str, current_str)
+        hydrated = loader.hydrate_position_prices(prices or {}, previous_str, current_str)
+        return prices, turnover, hydrated
+
+    calls.clear()
+    actual = [run_day(matrix_loader, current_str, previous_str) for current_str, previous_str in windows]
+    matrix_calls = list(calls)
+    expected = [run_day(baseline, current_str, previous_str) for current_str, previous_str in windows]
+
+    for (current_str, _), got, want in zip(windows, actual, expected):
+        assert got == want, current_str
+    # 只有整段为空的 EMPTY 留在逐 ticker 路径；GAPPY 只在首次出现时懒加载一次
+    assert sorted(set(matrix_calls)) == ["EMPTY", "GAPPY"]
+    assert matrix_calls.count("GAPPY") == 1
+
+
+def test_matrix_lookup_outside_coverage_falls_back(monkeypatch):
+    monkeypatch.setattr("src.backtesting.engine_market_data.get_price_data", _fake_get_price_data)
+    loader = _make_loader()
+    loader.build_price_matrix("2024-02-15")
+
+    assert loader._matrix_rows(["AAPL"], "2024-02-20", "2024-02-21") == {}
+    assert "AAPL" in loader._matrix_rows(["AAPL"], "2024-02-13", "2024-02-14")
+
+
+def test_latest_rows_window_semantics():
+    frame = pd.DataFrame({"close": [1.0, 2.0], "volume": [10.0, 0.0]}, index=pd.to_datetime(["2024-01-02", "2024-01-05"]))
+    matrix = DailyPriceMatrix.from_frames({"X": frame}, start_date="2024-01-01", end_date="2024-01-31")
+
+    assert matrix.latest_rows(["X"], "2024-01-02", "2024-01-03") == {"X": {"close": 1.0, "volume": 10.0}}
+    assert matrix.latest_rows(["X"], "2024-01-03", "2024-01-04") == {}
+    assert matrix.latest_rows(["X"], "2024-01-04", "2024-01-08") == {"X": {"close": 2.0, "volume": 0.0}}
+    assert matrix.latest_rows(["X"], "2023-12-01", "2023-12-31") == {}
+
+
+def test_with_frames_preserves_existing_columns():
+    base = DailyPriceMatrix.from_frames({"A": FRAMES["AAPL"], "N": FRAMES["NOVOL"]}, start_date="2024-01-01", end_date="2024-03-31")
+    extended = base.with_frames({"G": FRAMES["GAPPY"]})
+
+    for day in ("2024-01-10", "2024-02-14", "2024-03-29"):
+        previous = (pd.Timestamp(day) - pd.Timedelta(days=3)).strftime("%Y-%m-%d")
+        before = base.latest_rows(["A", "N"], previous, day)
+        after = extended.latest_rows(["A", "N"], previous, day)
+        assert before.keys() == after.keys()
+        assert all(_same(before[key], after[key]) for key in before)
+    assert "volume" not in next(iter(extended.latest_rows(["N"], "2024-03-01", "2024-03-29").values()))
+
+
+@pytest.mark.parametrize("ticker", ["000001", "600519"])
+def test_ashare_matrix_frames_use_unadjusted_source(monkeypatch, ticker):
+    seen: list[str] = []
+    monkeypatch.setattr("src.backtesting.engine_market_data.get_ashare_unadjusted_price_data", lambda t, s, e: seen.append(t) or FRAMES["AAPL"])
+    monkeypatch.setattr("src.backtesting.engine_market_data.get_price_data", lambda *a, **k: pytest.fail("qfq source must not be used"))
+
+    assert not MarketDataLoader._load_matrix_frame(ticker, "2024-01-01", "2024-03-29").empty
+    assert seen == [ticker]
+
+
+def _assert_same_matrix(left: DailyPriceMatrix, right: DailyPriceMatrix) -> None:
+    assert np.array_equal(left.dates, right.dates)
+    order = [left.tickers.index(ticker) for ticker in right.tickers]
+    assert np.array_equal(left.last_bar[:, order], right.last_bar)
+    assert np.array_equal(left.close[:, order], right.close, equal_nan=True)
+    assert np.array_equal(left.has_volume[order], right.has_volume)
+
+
+def _sliced(start: str, end: str, tickers=("AAPL", "MSFT", "NOVOL", "GAPPY")) -> dict[str, pd.DataFrame]:
+    return {ticker: _fake_get_price_data(ticker, start, end) for ticker in tickers}
+
+
+def test_window_view_equals_matrix_built_from_window_frames():
+    full = DailyPriceMatrix.from_frames(_sliced("2024-01-01", "2024-03-29"), start_date="2024-01-01", end_date="2024-03-29")
+    view = full.window("2024-02-05", "2024-02-29")
+    direct = DailyPriceMatrix.from_frames(_sliced("2024-02-05", "2024-02-29"), start_date="2024-02-05", end_date="2024-02-29")
+
+    _assert_same_matrix(view, direct)
+    # 视图之外（embargo 之后）的行不可见
+    assert view.latest_rows(["AAPL"], "2024-03-01", "2024-03-05") == {}
+
+
+def test_extended_equals_single_full_build():
+    head = DailyPriceMatrix.from_frames(_sliced("2024-01-01", "2024-02-15"), start_date="2024-01-01", end_date="2024-02-15")
+    grown = head.extended(_sliced("2024-02-16", "2024-03-29"), end_date="2024-03-29")
+    full = DailyPriceMatrix.from_frames(_sliced("2024-01-01", "2024-03-29"), start_date="2024-01-01", end_date="2024-03-29")
+
+    _assert_same_matrix(grown, full)
+
+
+def test_walk_forward_cache_loads_only_new_dates_and_caps_views(monkeypatch):
+    from src.backtesting.walk_forward_cache import WalkForwardDataCache
+
+    loads: list[tuple[str, str, str]] = []
+
+    def recording_get_price_data(ticker, start_date, end_date, api_key=None):
+        loads.append((ticker, start_date, end_date))
+        return _fake_get_price_data(ticker, start_date, end_date)
+
+    monkeypatch.setattr("src.backtesting.engine_market_data.get_price_data", recording_get_price_data)
+    cache = WalkForwardDataCache()
+
+    first, unavailable = cache.matrix_view(["AAPL", "MSFT", "EMPTY"], "2024-01-01", "2024-01-31")
+    assert unavailable == {"EMPTY"}
+    second, _ = cache.matrix_view(["AAPL", "MSFT", "GAPPY"], "2024-02-01", "2024-02-29")
+
+    assert sorted(loads[:3]) == [("AAPL", "2024-01-01", "2024-01-31"), ("EMPTY", "2024-01-01", "2024-01-31"), ("MSFT", "2024-01-01", "2024-01-31")]
+    # 第二个窗口：已有 ticker 只追加新日期段，新 ticker 取整段，EMPTY 不再重试
+    assert sorted(loads[3:]) == [("AAPL", "2024-02-01", "2024-02-29"), ("GAPPY", "2024-01-01", "2024-02-29"), ("MSFT", "2024-02-01", "2024-02-29")]
+    assert str(first.dates.max()) <= "2024-01-31"
+    assert str(second.dates.max()) <= "2024-02-29"
+    direct = DailyPriceMatrix.from_frames(_sliced("2024-02-01", "2024-02-29", ("AAPL", "MSFT", "GAPPY")), start_date="2024-02-01", end_date="2024-02-29")
+    _assert_same_matrix(second, direct)
+
+
+def test_shared_cache_loader_matches_private_matrix_loader(monkeypatch):
+    from src.backtesting.walk_forward_cache import WalkForwardDataCache
+
+    monkeypatch.setattr("src.backtesting.engine_market_data.get_price_data", _fake_get_price_data)
+    cache = WalkForwardDataCache()
+    cache.warm(TICKERS, "2024-01-01", "2024-03-29")
+
+    private = _make_loader()
+    private.build_price_matrix("2024-02-29")
+    shared = _make_loader()
+    shared._market_data_cache = cache
+    shared.build_price_matrix("2024-02-29")
+
+    loads = cache.frame_loads
+    for day in pd.bdate_range("2024-01-09", "2024-02-29").strftime("%Y-%m-%d"):
+        previous = (pd.Timestamp(day) - pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+        expected = private._matrix_rows(["AAPL", "MSFT", "NOVOL", "EMPTY"], previous, day)
+        actual = shared._matrix_rows(["AAPL", "MSFT", "NOVOL", "EMPTY"], previous, day)
+        assert expected.keys() == actual.keys()
+        assert all(_same(expected[key], actual[key]) for key in expected)
+    assert cache.frame_loads == loads
+
+
+def test_with_frames_equals_full_build_and_normalizes_only_new_frames(monkeypatch):
+    base = DailyPriceMatrix.from_frames(_sliced("2024-01-01", "2024-03-29", ("AAPL", "NOVOL", "MSFT")), start_date="2024-01-01", end_date="2024-03-29")
+    built: list[list[str]] = []
+    original = DailyPriceMatrix.from_frames.__func__
+
+    def recording_from_frames(cls, frames, **kwargs):
+        built.append(list(frames))
+        return original(cls, frames, **kwargs)
+
+    monkeypatch.setattr(DailyPriceMatrix, "from_frames", classmethod(recording_from_frames))
+    # GAPPY 带来矩阵里没有的日期; MSFT 被替换为 GAPPY 的 bars
+    grown = base.with_frames({"GAPPY": FRAMES["GAPPY"], "MSFT": FRAMES["GAPPY"].iloc[::2]})
+
+    assert built == [["GAPPY", "MSFT"]]
+    full = original(
+        DailyPriceMatrix,
+        {"AAPL": FRAMES["AAPL"], "NOVOL": FRAMES["NOVOL"], "GAPPY": FRAMES["GAPPY"], "MSFT": FRAMES["GAPPY"].iloc[::2]},
+        start_date="2024-01-01",
+        end_date="2024-03-29",
+    )
+    assert grown.tickers == ["AAPL", "NOVOL", "GAPPY", "MSFT"]
+    _assert_same_matrix(grown, full)
+    assert np.array_equal(grown.volume, full.volume, equal_nan=True)
+
+
+def test_extended_overlay_wins_on_overlapping_dates():
+    head = DailyPriceMatrix.from_frames({"X": FRAMES["NOVOL"].loc[:"2024-02-15"]}, start_date="2024-01-01", end_date="2024-02-15")
+    tail = FRAMES["AAPL"].loc["2024-02-15":]
+
+    grown = head.extended({"X": tail}, end_date="2024-03-29")
+    combined = pd.concat([FRAMES["NOVOL"].loc[:"2024-02-15", ["close"]], tail[["close", "volume"]]])
+    full = DailyPriceMatrix.from_frames({"X": combined}, start_date="2024-01-01", end_date="2024-03-29")
+
+    _assert_same_matrix(grown, full)
+    assert np.array_equal(grown.volume, full.volume, equal_nan=True)
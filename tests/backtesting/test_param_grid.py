@@ -13,12 +13,15 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
+import os
 import threading
 import time
 from pathlib import Path
 
 import pytest
 
+from src.backtesting.param_executor import EXECUTOR_ENV_VAR, resolve_executor_kind
 from src.backtesting.param_grid import (
     COMPARISON_METRICS,
     DEFAULT_GRID_MAX_WORKERS,
@@ -268,6 +271,110 @@ def test_run_param_grid_clamps_zero_or_negative_max_workers():
     assert report.max_workers == 1
 
 
+_requires_fork = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="process backend test relies on fork")
+
+
+@_requires_fork
+def test_run_param_grid_process_backend_runs_in_workers_in_canonical_order():
+    parent_pid = os.getpid()
+    preload_calls: list[int] = []
+    # 父进程 preload 写入的数据，fork 后的 worker 直接可见（无需 pickle evaluator 闭包）
+    shared_prices: dict[int, float] = {}
+
+    def preload():
+        preload_calls.append(os.getpid())
+        shared_prices.update({x: x * 1.5 for x in range(1, 7)})
+
+    def evaluator(params):
+        return {"sharpe_ratio": shared_prices[params["x"]], "worker_pid": os.getpid()}
+
+    report = run_param_grid(grid={"x": [6, 5, 4, 3, 2, 1]}, evaluator=evaluator, max_workers=2, executor="process", preload=preload)
+
+    assert preload_calls == [parent_pid]
+    assert [t.trial_index for t in report.trials] == list(range(6))
+    assert [t.params["x"] for t in report.trials] == [6, 5, 4, 3, 2, 1]
+    assert [t.metrics["sharpe_ratio"] for t in report.trials] == [9.0, 7.5, 6.0, 4.5, 3.0, 1.5]
+    assert all(t.metrics["worker_pid"] != parent_pid for t in report.trials)
+
+
+@_requires_fork
+def test_run_param_grid_process_workers_reopen_inherited_disk_cache(tmp_path):
+    from src.data.enhanced_cache import EnhancedCache
+
+    cache = EnhancedCache(disk_path=str(tmp_path / "fork.sqlite"))
+    parent_conn = cache.disk._conn
+
+    def preload():
+        cache.set("prices:000001", [{"close": 1.0}])
+
+    def evaluator(params):
+        # fork 之后、首次访问之前: 继承的 sqlite 连接已被丢弃
+        inherited = cache.disk._conn is parent_conn
+        cache.lru.clear()
+        value = cache.get("prices:000001")
+        return {"sharpe_ratio": 1.0, "inherited": inherited, "reopened": cache.disk._conn is not parent_conn, "value": value}
+
+    report = run_param_grid(grid={"x": [1, 2]}, evaluator=evaluator, max_workers=2, executor="process", preload=preload)
+
+    assert report.completed == 2
+    assert not any(t.metrics["inherited"] for t in report.trials)
+    assert all(t.metrics["reopened"] and t.metrics["value"] == [{"close": 1.0}] for t in report.trials)
+    # 父进程的连接未受子进程影响
+    assert cache.disk._conn is parent_conn
+    assert cache.disk.get("prices:000001") == [{"close": 1.0}]
+
+
+@_requires_fork
+def test_run_param_grid_process_backend_captures_evaluator_exceptions():
+    def evaluator(params):
+        if params["x"] == 2:
+            raise RuntimeError("boom")
+        return {"sharpe_ratio": 1.0}
+
+    report = run_param_grid(grid={"x": [1, 2, 3]}, evaluator=evaluator, max_workers=2, executor="process")
+    assert report.completed == 2
+    assert report.failed == 1
+    assert report.trials[1].error == "RuntimeError: boom"
+
+
+def test_run_param_grid_process_backend_defaults_to_one_worker_per_core(monkeypatch):
+    monkeypatch.delenv(GRID_ENV_VAR, raising=False)
+    monkeypatch.setattr("src.backtesting.param_executor.os.cpu_count", lambda: 3)
+    monkeypatch.setattr("src.backtesting.param_grid.TrialExecutor", _InlineExecutor)
+    report = run_param_grid(grid={"x": [1]}, evaluator=lambda p: {"sharpe_ratio": 1.0}, executor="process")
+    assert report.max_workers == 3
+
+
+def test_resolve_executor_kind_reads_env_and_rejects_unknown(monkeypatch):
+    monkeypatch.delenv(EXECUTOR_ENV_VAR, raising=False)
+    assert resolve_executor_kind(None) == "thread"
+    monkeypatch.setenv(EXECUTOR_ENV_VAR, " Process ")
+    assert resolve_executor_kind(None) == "process"
+    assert resolve_executor_kind("thread") == "thread"
+    with pytest.raises(ValueError, match="unknown trial executor"):
+        resolve_executor_kind("gpu")
+
+
+class _InlineExecutor:
+    """Runs submissions synchronously; lets worker-count tests skip a real pool."""
+
+    def __init__(self, evaluator, *, max_workers, kind="thread", preload=None):
+        self._evaluator = evaluator
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+
+        future = Future()
+        future.set_result(fn(self._evaluator, *args))
+        return future
+
+
 def test_run_param_grid_empty_grid_yields_empty_report():
     report = run_param_grid(grid={}, evaluator=lambda p: {})
     assert report.total_combinations == 0
@@ -1,4 +1,6 @@
 import json
+import multiprocessing
+import os
 from pathlib import Path
 
 import pytest
@@ -225,6 +227,77 @@ def test_run_param_search_checkpoint_resume(tmp_path):
     assert call_count == 2, "should not re-evaluate completed trials"
 
 
+_requires_fork = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="process backend test relies on fork")
+
+
+@_requires_fork
+def test_run_param_search_process_backend_resumes_from_checkpoint(tmp_path):
+    cp_path = tmp_path / "checkpoint.json"
+    run_param_search(
+        space=ParamSpace(grid={"x": [1, 2]}),
+        objective=SearchObjective.SHARPE,
+        evaluator=lambda params: {"sharpe_ratio": float(params["x"]), "sortino_ratio": 1.0, "max_drawdown": -0.1},
+        checkpoint_path=cp_path,
+    )
+
+    parent_pid = os.getpid()
+
+    def evaluator(params):
+        # 已在 checkpoint 中的 trial 不得再次提交给 worker
+        assert params["x"] not in (1, 2)
+        assert os.getpid() != parent_pid
+        return {"sharpe_ratio": float(params["x"]), "sortino_ratio": 1.0, "max_drawdown": -0.1}
+
+    report = run_param_search(
+        space=ParamSpace(grid={"x": [1, 2, 3, 4, 5]}),
+        objective=SearchObjective.SHARPE,
+        evaluator=evaluator,
+        checkpoint_path=cp_path,
+        max_workers=2,
+        executor="process",
+    )
+
+    assert report.completed_trials == 5
+    assert report.best_params == {"x": 5}
+    saved = json.loads(cp_path.read_text(encoding="utf-8"))["completed_trials"]
+    assert [trial["trial_index"] for trial in saved] == [0, 1, 2, 3, 4]
+
+
+def test_run_param_search_parallel_matches_sequential_and_checkpoints_before_failure(tmp_path):
+    space = ParamSpace(grid={"x": [1, 2, 3, 4], "y": [0, 1]})
+
+    def evaluator(params):
+        value = params["x"] + params["y"] * 0.5
+        return {"sharpe_ratio": value, "sortino_ratio": value, "max_drawdown": -0.1}
+
+    sequential = run_param_search(space=space, objective=SearchObjective.SHARPE, evaluator=evaluator)
+    parallel = run_param_search(space=space, objective=SearchObjective.SHARPE, evaluator=evaluator, max_workers=4, executor="thread")
+    assert [r.trial_index for r in parallel.results] == [r.trial_index for r in sequential.results]
+    assert parallel.best_params == sequential.best_params
+
+    cp_path = tmp_path / "checkpoint.json"
+
+    def flaky(params):
+        if params == {"x": 4, "y": 1}:
+            raise RuntimeError("interrupted")
+        return evaluator(params)
+
+    with pytest.raises(RuntimeError, match="interrupted"):
+        run_param_search(space=space, objective=SearchObjective.SHARPE, evaluator=flaky, checkpoint_path=cp_path, max_workers=1, executor="thread")
+    saved = json.loads(cp_path.read_text(encoding="utf-8"))["completed_trials"]
+    assert len(saved) == 7
+
+    calls: list[dict] = []
+
+    def resumed(params):
+        calls.append(params)
+        return evaluator(params)
+
+    report = run_param_search(space=space, objective=SearchObjective.SHARPE, evaluator=resumed, checkpoint_path=cp_path, max_workers=2, executor="thread")
+    assert calls == [{"x": 4, "y": 1}]
+    assert report.completed_trials == 8
+
+
 def test_load_checkpoint_corrupt_falls_back_to_empty(tmp_path, caplog):
     """R88 drain: 损坏的 checkpoint.json (运行中断 / 磁盘错误 / 部分写入) 不应让
     整个 --param-search JSONDecodeError 崩溃丢失已完成 trials, 而应回退空 checkpoint
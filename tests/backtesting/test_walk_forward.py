@@ -1730,3 +1730,87 @@ def test_classify_win_rate_first_rollout_verdict_no_baseline_no_deltas_returns_n
     assert verdict == "rejected"
     assert detail["verdict_reason"] == "rollout_blocked"
     assert "rollout_blocked" in detail["rejection_reasons"]
+
+
+def _monthly_windows(count: int) -> list[WalkForwardWindow]:
+    months = pd.date_range("2025-01-01", periods=count + 1, freq="MS")
+    return [
+        WalkForwardWindow(
+            train_start=months[index].strftime("%Y-%m-%d"),
+            train_end=(months[index + 1] - pd.Timedelta(days=1)).strftime("%Y-%m-%d"),
+            test_start=months[index + 1].strftime("%Y-%m-%d"),
+            test_end=(months[index + 1] + pd.offsets.MonthEnd(0)).strftime("%Y-%m-%d"),
+        )
+        for index in range(count)
+    ]
+
+
+class _WindowEngine:
+    def __init__(self, window: WalkForwardWindow):
+        self._window = window
+
+    def run_backtest(self):
+        import os
+
+        return {"sharpe_ratio": float(self._window.test_start[5:7]), "test_trading_days": 20, "pid": os.getpid()}
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_run_walk_forward_parallel_keeps_window_order(executor):
+    import multiprocessing
+    import os
+
+    if executor == "process" and "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("process backend test relies on fork")
+    windows = _monthly_windows(5)
+    preloaded: list[int] = []
+
+    results = run_walk_forward(windows, _WindowEngine, max_workers=3, executor=executor, preload=lambda: preloaded.append(os.getpid()))
+
+    assert [result.window for result in results] == windows
+    assert [result.metrics["sharpe_ratio"] for result in results] == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert preloaded == [os.getpid()]
+    if executor == "process":
+        assert all(result.metrics["pid"] != os.getpid() for result in results)
+
+
+def test_shared_engine_factory_passes_embargo_and_one_cache():
+    from src.backtesting.walk_forward import build_shared_walk_forward_engine_factory
+
+    built: list[dict] = []
+    windows = _monthly_windows(3)
+    factory, _ = build_shared_walk_forward_engine_factory(windows, ["AAPL"], lambda start, end, **kwargs: built.append({"start": start, "end": end, **kwargs}))
+    for window in windows:
+        factory(window)
+
+    assert [item["data_through"] for item in built] == [window.test_end for window in windows]
+    assert [item["end"] for item in built] == [window.test_end for window in windows]
+    assert len({id(item["market_data_cache"]) for item in built}) == 1
+
+
+def test_run_walk_forward_process_workers_reopen_inherited_disk_cache(tmp_path):
+    import multiprocessing
+
+    from src.data.enhanced_cache import EnhancedCache
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("process backend test relies on fork")
+    cache = EnhancedCache(disk_path=str(tmp_path / "wf.sqlite"))
+    parent_conn = cache.disk._conn
+
+    class CachedEngine:
+        def __init__(self, window):
+            self._window = window
+
+        def run_backtest(self):
+            # 与参数网格共用同一个 at-fork 复位: 子进程不会复用父进程的 sqlite 连接
+            inherited = cache.disk._conn is parent_conn
+            cache.lru.clear()
+            return {"sharpe_ratio": 1.0, "inherited": inherited, "value": cache.get("prices:000001"), "test_trading_days": 20}
+
+    windows = _monthly_windows(3)
+    results = run_walk_forward(windows, CachedEngine, max_workers=2, executor="process", preload=lambda: cache.set("prices:000001", [{"close": 1.0}]))
+
+    assert not any(result.metrics["inherited"] for result in results)
+    assert all(result.metrics["value"] == [{"close": 1.0}] for result in results)
+    assert cache.disk._conn is parent_conn
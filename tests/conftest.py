@@ -20,6 +20,29 @@ dossier script test) reads the reduced frame and dies on
 that several analyzers rely on across the run, and clearing it forces real
 re-fetches that fail in a no-credential environment.  The persistent disk
 cache is isolated separately by tests/offensive/conftest.py.
+
+The persistent trading calendar / limit-list index (``src.data.trading_index``)
+is pointed at a per-test directory: a fake calendar injected by one test must
+not turn into "real" trading days for the next one, and a developer's
+``data/trading_index`` must not change what BDay-fallback tests observe.
+
+The pooled LLM clients (``src.utils.llm_client_pool``) are dropped after each
+test: tests monkeypatch ``get_model`` with per-test fakes, and a client cached
+by one test must not answer another test's calls.
+
+The proactive Tushare quota limiter (``src.tools.tushare_client``) is switched
+off: fake ``pro`` objects answer instantly, and a suite issuing hundreds of
+them must not be paced at the real per-minute quota.
+
+``--auto`` timing artifacts (``src.utils.run_profiler``) are written to a
+per-test directory: a test driving ``run_auto_screening`` must not leave
+artifacts in the developer's ``logs/auto_timings`` or become the regression
+baseline of the next real run.
+
+The backend report-read cache (``app.backend.services.report_reader``) is
+dropped after each test: tests patch report loaders and write report fixtures
+whose mtime can collide within one clock tick, and a response rendered for one
+test must not be served to the next.
 """
 
 from __future__ import annotations
@@ -27,6 +50,58 @@ from __future__ import annotations
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _isolate_trading_index(monkeypatch, tmp_path):
+    """Give every test an empty, private trading index."""
+    from src.data import trading_index
+
+    monkeypatch.setenv("TRADING_INDEX_DIR", str(tmp_path / "trading_index"))
+    monkeypatch.setattr(trading_index, "_index", None)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _isolate_report_warehouse(monkeypatch, tmp_path):
+    """Give every test a private screening-report warehouse."""
+    from src.screening import report_warehouse
+
+    monkeypatch.setenv("REPORT_WAREHOUSE_DIR", str(tmp_path / "report_warehouse"))
+    monkeypatch.setattr(report_warehouse, "_warehouses", {})
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _isolate_auto_timing_dir(monkeypatch, tmp_path):
+    """Write ``--auto`` timing artifacts into a private directory."""
+    monkeypatch.setenv("AUTO_TIMING_DIR", str(tmp_path / "auto_timings"))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _unthrottled_tushare_client(monkeypatch):
+    """Disable the shared Tushare token bucket (tests build their own)."""
+    monkeypatch.setenv("TUSHARE_CALLS_PER_MINUTE", "0")
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_llm_client_pool() -> None:
+    """Drop pooled LLM clients built from a test's fake ``get_model``."""
+    yield
+    from src.utils.llm_client_pool import _reset_llm_client_pool_for_testing
+
+    _reset_llm_client_pool_for_testing()
+
+
+@pytest.fixture(autouse=True)
+def _reset_report_read_cache() -> None:
+    """Drop parsed reports / rendered responses cached by a test's requests."""
+    yield
+    from app.backend.services.report_reader import reset_report_read_service
+
+    reset_report_read_service()
+
+
 @pytest.fixture(autouse=True)
 def _reset_network_layer_singletons() -> None:
     """Neutralize module-level tushare/akshare caches after each test."""
@@ -15,6 +15,13 @@ import pytest
 from src.screening.offensive import cache_refresh
 
 
+@pytest.fixture(autouse=True)
+def _inline_price_partition_compaction(monkeypatch: pytest.MonkeyPatch):
+    """Compact price partitions synchronously: no background thread may
+    touch a test's price cache after the refresh returns."""
+    monkeypatch.setenv("PRICE_CACHE_COMPACTION", "inline")
+
+
 @pytest.fixture(autouse=True)
 def _disable_listed_universe_default_loader(monkeypatch: pytest.MonkeyPatch):
     original = cache_refresh._load_listed_ticker_symbols
@@ -109,6 +109,8 @@ def test_price_evidence_is_bound_to_frame_captured_before_post_write_replacement
 
     price_cache = tmp_path / "price"
     price_cache.mkdir()
+    # 钉住全量重写路径 (追加路径见 test_price_partitions.py)
+    monkeypatch.setenv("PRICE_CACHE_APPEND_WRITES", "false")
     (price_cache / "000001.csv").write_text(
         "date,close,open,high,low,pct_change,volume\n"
         "2026-07-10,10,9.9,10.2,9.8,1,1000\n",
@@ -161,6 +163,8 @@ def test_price_evidence_is_copied_before_writer_mutates_input_frame(
 
     price_cache = tmp_path / "price"
     price_cache.mkdir()
+    # 钉住全量重写路径 (追加路径见 test_price_partitions.py)
+    monkeypatch.setenv("PRICE_CACHE_APPEND_WRITES", "false")
     (price_cache / "000001.csv").write_text(
         "date,close,open,high,low,pct_change,volume\n"
         "2026-07-10,10,9.9,10.2,9.8,1,1000\n",
@@ -370,6 +374,8 @@ def test_failed_price_write_does_not_retain_baseline_fingerprint(tmp_path, monke
 
     price_cache = tmp_path / "price"
     price_cache.mkdir()
+    # 钉住全量重写路径 (追加路径见 test_price_partitions.py)
+    monkeypatch.setenv("PRICE_CACHE_APPEND_WRITES", "false")
     (price_cache / "000001.csv").write_text(
         "date,close,open,high,low,pct_change,volume\n"
         "2026-07-10,10,9.9,10.2,9.8,1,1000\n",
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+from datetime import date
+
+import pandas as pd
+
+from src.screening.offensive import cache_refresh as cr
+from src.screening.offensive import price_partitions as pp
+from src.screening.offensive.cache_readiness import PriceStatus, SuspensionEvidence
+from src.screening.offensive.pit_evidence import canonical_price_fingerprint
+
+_HEADER = "date,close,open,high,low,pct_change,volume\n"
+
+
+def _daily_prices(rows: list[dict]) -> pd.DataFrame:
+    defaults = {
+        "ts_code": "000001.SZ",
+        "trade_date": "20260713",
+        "open": 10.0,
+        "high": 10.6,
+        "low": 9.9,
+        "close": 10.5,
+        "pct_chg": 5.0,
+        "vol": 12345.0,
+    }
+    return pd.DataFrame([{**defaults, **row} for row in rows])
+
+
+def _seed(price_cache, ticker: str, lines: list[str]) -> None:
+    price_cache.mkdir(exist_ok=True)
+    (price_cache / f"{ticker}.csv").write_text(_HEADER + "".join(line + "\n" for line in lines), encoding="utf-8")
+
+
+def _refresh(tmp_path, price_cache, tickers, batch):
+    return cr.refresh_daily_action_caches(
+        "20260713",
+        price_cache_dir=price_cache,
+        fund_flow_cache_dir=tmp_path / "flow",
+        snapshot_dir=tmp_path / "snapshots",
+        target_tickers=tickers,
+        daily_prices_df=batch,
+        suspension_loader=lambda _trade_date: SuspensionEvidence.available(date(2026, 7, 13), set()),
+        refresh_industry_index=False,
+        refresh_fund_flow=False,
+    )
+
+
+def test_daily_refresh_appends_one_row_without_rewriting_history(tmp_path, monkeypatch):
+    monkeypatch.setenv("PRICE_CACHE_COMPACTION", "off")
+    price_cache = tmp_path / "price"
+    _seed(price_cache, "000001", ["2026-07-09,9.8,9.7,9.9,9.6,-1,900", "2026-07-10,10,9.9,10.2,9.8,1,1000"])
+    _seed(price_cache, "000002", ["2026-07-10,20,19.9,20.2,19.8,1,2000"])
+    monkeypatch.setattr(cr, "atomic_write_csv", lambda *_args: (_ for _ in ()).throw(AssertionError("history must not be rewritten")))
+    batch = _daily_prices([{"ts_code": "000001.SZ"}, {"ts_code": "000002.SZ", "close": 21.0}])
+
+    result = _refresh(tmp_path, price_cache, ["000001", "000002"], batch)
+
+    text = (price_cache / "000001.csv").read_text(encoding="utf-8")
+    assert text.startswith(_HEADER + "2026-07-09,9.8,9.7,9.9,9.6,-1,900\n2026-07-10,10,9.9,10.2,9.8,1,1000\n")
+    assert text.count("\n") == 4 and "2026-07-13,10.5," in text
+    on_disk = pd.read_csv(price_cache / "000001.csv", dtype={"date": str})
+    assert result.outcomes["000001"].price_status is PriceStatus.CURRENT
+    assert result.outcomes["000001"].evidence_fingerprints["price"] == canonical_price_fingerprint(on_disk, "000001", "20260713")
+    assert result.outcomes["000001"].price_history_rows == 3
+
+    partition = pp.read_price_partition(pp.partition_path(price_cache, "20260713"))
+    assert partition["ticker"].tolist() == ["000001", "000002"]
+    assert partition["close"].tolist() == [10.5, 21.0]
+
+
+def test_failed_append_marks_ticker_failed(tmp_path, monkeypatch):
+    monkeypatch.setenv("PRICE_CACHE_COMPACTION", "off")
+    price_cache = tmp_path / "price"
+    _seed(price_cache, "000001", ["2026-07-10,10,9.9,10.2,9.8,1,1000"])
+    monkeypatch.setattr(cr, "append_csv_rows", lambda *_args: (_ for _ in ()).throw(OSError("disk full")))
+
+    result = _refresh(tmp_path, price_cache, ["000001"], _daily_prices([{}]))
+
+    assert result.outcomes["000001"].price_status is PriceStatus.FAILED
+    assert result.outcomes["000001"].evidence_fingerprints.get("price") is None
+
+
+def test_replacing_existing_day_still_rewrites(tmp_path, monkeypatch):
+    monkeypatch.setenv("PRICE_CACHE_COMPACTION", "off")
+    price_cache = tmp_path / "price"
+    _seed(price_cache, "000001", ["2026-07-10,10,9.9,10.2,9.8,1,1000", "2026-07-13,10.1,10,10.2,9.9,1,1100"])
+    writes = []
+    real_write = cr.atomic_write_csv
+    monkeypatch.setattr(cr, "atomic_write_csv", lambda path, frame: (writes.append(path), real_write(path, frame)))
+
+    _refresh(tmp_path, price_cache, ["000001"], _daily_prices([{}]))
+
+    on_disk = pd.read_csv(price_cache / "000001.csv", dtype={"date": str})
+    assert len(writes) == 1
+    assert on_disk["date"].tolist() == ["2026-07-10", "2026-07-13"]
+    assert on_disk["close"].tolist() == [10.0, 10.5]
+
+
+def test_compaction_repairs_torn_append_and_missing_rows(tmp_path):
+    price_cache = tmp_path / "price"
+    _seed(price_cache, "000001", ["2026-07-10,10,9.9,10.2,9.8,1,1000"])
+    _seed(price_cache, "000002", ["2026-07-10,20,19.9,20.2,19.8,1,2000"])
+    _seed(price_cache, "000003", ["2026-07-10,30,29.9,30.2,29.8,1,3000"])
+    rows = {
+        ticker: {"date": "2026-07-13", "close": close, "open": close, "high": close, "low": close, "pct_change": 1.0, "volume": 10.0}
+        for ticker, close in (("000001", 10.5), ("000002", 21.0), ("000003", 31.0))
+    }
+    path, rejected = pp.write_price_partition(price_cache, "20260713", rows)
+    assert rejected == set() and path.exists()
+    # 000001 已追加; 000002 追加时崩溃留下半截行; 000003 尚未追加
+    with (price_cache / "000001.csv").open("a", encoding="utf-8") as handle:
+        handle.write("2026-07-13,10.5,10.5,10.5,10.5,1.0,10.0\n")
+    with (price_cache / "000002.csv").open("a", encoding="utf-8") as handle:
+        handle.write("2026-07-13,21.")
+
+    stats = pp.compact_price_partitions(price_cache)
+
+    assert (stats.verified, stats.rewritten, stats.appended, stats.failed) == (1, 1, 1, 0)
+    assert pp.pending_price_partitions(price_cache) == []
+    for ticker, close in (("000001", 10.5), ("000002", 21.0), ("000003", 31.0)):
+        frame = pd.read_csv(price_cache / f"{ticker}.csv", dtype={"date": str})
+        assert frame["date"].tolist() == ["2026-07-10", "2026-07-13"]
+        assert frame["close"].iloc[-1] == close
+
+
+def test_next_refresh_compacts_leftover_partition_before_baseline(tmp_path, monkeypatch):
+    monkeypatch.setenv("PRICE_CACHE_COMPACTION", "off")
+    price_cache = tmp_path / "price"
+    _seed(price_cache, "000001", ["2026-07-09,9.8,9.7,9.9,9.6,-1,900"])
+    leftover = {"date": "2026-07-10", "close": 10.0, "open": 9.9, "high": 10.2, "low": 9.8, "pct_change": 2.04, "volume": 1000.0}
+    pp.write_price_partition(price_cache, "20260710", {"000001": leftover})
+
+    result = _refresh(tmp_path, price_cache, ["000001"], _daily_prices([{}]))
+
+    frame = pd.read_csv(price_cache / "000001.csv", dtype={"date": str})
+    assert frame["date"].tolist() == ["2026-07-09", "2026-07-10", "2026-07-13"]
+    assert result.outcomes["000001"].price_history_rows == 3
+    assert [path.name for path in pp.pending_price_partitions(price_cache)] == ["price_20260713.csv"]
+
+
+def test_background_compaction_and_foreground_append_do_not_lose_rows(tmp_path, monkeypatch):
+    price_cache = tmp_path / "price"
+    _seed(price_cache, "000001", ["2026-07-09,9.8,9.7,9.9,9.6,-1,900", "2026-07-10,10,9.9,10.2,9.8,1,1000"])
+    # 分区值与缓存末行不一致 → 压实走 _merge_row 全量重写
+    corrected = {"date": "2026-07-10", "close": 10.1, "open": 9.9, "high": 10.2, "low": 9.8, "pct_change": 1.0, "volume": 1000.0}
+    pp.write_price_partition(price_cache, "20260710", {"000001": corrected})
+    entered, proceed = threading.Event(), threading.Event()
+    original_merge = pp._merge_row
+
+    def slow_merge(path, row):
+        entered.set()
+        proceed.wait(5)
+        original_merge(path, row)
+
+    monkeypatch.setattr(pp, "_merge_row", slow_merge)
+    compaction = threading.Thread(target=pp.compact_price_partitions, args=(price_cache,))
+    compaction.start()
+    assert entered.wait(5)
+
+    appended = {"date": "2026-07-13", "close": 10.5, "open": 10.5, "high": 10.6, "low": 10.4, "pct_change": 3.96, "volume": 1200.0}
+    foreground = threading.Thread(target=cr._write_price_cache_row, args=(price_cache / "000001.csv", appended))
+    foreground.start()
+    foreground.join(0.2)
+    # 前台写入等待该文件的压实完成，而不是与其交错
+    assert foreground.is_alive()
+    proceed.set()
+    compaction.join(5)
+    foreground.join(5)
+
+    frame = pd.read_csv(price_cache / "000001.csv", dtype={"date": str})
+    assert frame["date"].tolist() == ["2026-07-09", "2026-07-10", "2026-07-13"]
+    assert frame["close"].tolist() == [9.8, 10.1, 10.5]
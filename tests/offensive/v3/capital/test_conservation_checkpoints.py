@@ -0,0 +1,224 @@
+"""Incremental conservation verification from in-memory checkpoints.
+
+A checkpoint carries the raw replay fold at one (stream_version,
+flow_version) pair plus hash chains over both streams; later verifications
+walk only the appended events when the checkpointed prefix is provably
+unchanged, and a full replay still fails on any divergence of it.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+
+from src.screening.offensive.v3.capital import conservation
+from src.screening.offensive.v3.capital.conservation import verify_conservation
+from src.screening.offensive.v3.capital.fills import (
+    FillAttribution,
+    FillRevisionRequest,
+)
+from src.screening.offensive.v3.capital.repository import (
+    AccountBinding,
+    CapitalCommand,
+    CapitalCommandPayload,
+    CapitalConflict,
+    CapitalRepository,
+)
+from src.screening.offensive.v3.contracts import (
+    CashEconomicEventLeg,
+    CashReceivableEconomicEventLeg,
+    EconomicAssetKind,
+    EconomicEventKind,
+    EconomicLegDirection,
+    ExecutionMode,
+    ExecutionSide,
+)
+
+
+T0 = datetime(2026, 8, 3, 9, 0, tzinfo=timezone.utc)
+
+
+def binding() -> AccountBinding:
+    return AccountBinding(
+        portfolio_id="pf-test",
+        mode=ExecutionMode.BROKER_CONFIRMED,
+        broker_account_id="acct-test",
+        base_currency="CNY",
+        environment_fingerprint="ab" * 32,
+    )
+
+
+@pytest.fixture()
+def repository(tmp_path: Path) -> CapitalRepository:
+    return CapitalRepository.initialize(tmp_path / "capital.sqlite3")
+
+
+def deposit(repository: CapitalRepository, cents: int, sequence: int) -> None:
+    amount = Decimal(cents) / 100
+    at = T0 + timedelta(minutes=sequence)
+    receivable_id = f"rcv-{sequence}"
+    for key, kind, legs in (
+        (
+            f"declare-{sequence}",
+            EconomicEventKind.DIVIDEND_RECEIVABLE,
+            (
+                CashReceivableEconomicEventLeg(
+                    leg_id=f"declare-{sequence}-r",
+                    direction=EconomicLegDirection.CREDIT,
+                    asset_kind=EconomicAssetKind.CASH_RECEIVABLE,
+                    receivable_id=receivable_id,
+                    security_id="000001.SZ",
+                    cash_amount=amount,
+                ),
+            ),
+        ),
+        (
+            f"settle-{sequence}",
+            EconomicEventKind.DIVIDEND_CASH_SETTLED,
+            (
+                CashReceivableEconomicEventLeg(
+                    leg_id=f"settle-{sequence}-r",
+                    direction=EconomicLegDirection.DEBIT,
+                    asset_kind=EconomicAssetKind.CASH_RECEIVABLE,
+                    receivable_id=receivable_id,
+                    security_id="000001.SZ",
+                    cash_amount=amount,
+                ),
+                CashEconomicEventLeg(
+                    leg_id=f"settle-{sequence}-c",
+                    direction=EconomicLegDirection.CREDIT,
+                    asset_kind=EconomicAssetKind.CASH,
+                    cash_amount=amount,
+                ),
+            ),
+        ),
+    ):
+        repository.append_atomic(
+            CapitalCommand(
+                idempotency_key=key,
+                account_binding=binding(),
+                expected_stream_version=repository.stream_version(),
+                as_of=at,
+                payload=CapitalCommandPayload(
+                    event_kind=kind,
+                    effective_at=at,
+                    source_authority="test.seed",
+                    legs=legs,
+                ),
+            )
+        )
+
+
+def fill(repository: CapitalRepository, execution_id: str, side: ExecutionSide, step: int) -> None:
+    repository.record_fill_revision(
+        FillRevisionRequest(
+            execution_id=execution_id,
+            revision=1,
+            order_id=f"ord-{execution_id}",
+            side=side,
+            security_id="600000.SH",
+            price_micros=10_000_000,
+            quantity=100,
+            position_lineage_id="lin-1",
+            economic_lot_id="lot-1",
+            attribution=FillAttribution(
+                producer_namespace="btst",
+                research_program_id="prog-1",
+                economic_lineage_id="eline-1",
+                stage_id="stage-1",
+            ),
+            reserve_source_id=None,
+            source_authority="broker.test",
+            effective_at=T0 + timedelta(minutes=step),
+            as_of=T0 + timedelta(minutes=step, seconds=1),
+            expected_stream_version=repository.stream_version(),
+        )
+    )
+
+
+def _tamper_first_event(repository: CapitalRepository, *, restore_trigger: bool) -> None:
+    with repository.engine.begin() as conn:
+        conn.exec_driver_sql("DROP TRIGGER IF EXISTS no_update_economic_events")
+        conn.execute(
+            sa.text(
+                "UPDATE economic_events SET payload_content_hash = :h"
+                " WHERE stream_version = 1"
+            ),
+            {"h": "f" * 64},
+        )
+        if restore_trigger:
+            conn.exec_driver_sql(
+                "CREATE TRIGGER no_update_economic_events BEFORE UPDATE ON"
+                " economic_events BEGIN SELECT RAISE(ABORT, 'immutable table:"
+                " economic_events rejects UPDATE'); END;"
+            )
+
+
+def test_incremental_verification_matches_full_replay(repository: CapitalRepository) -> None:
+    assert repository.assert_conservation().event_count == 0
+    deposit(repository, 1_000_000, 1)
+    first = repository.assert_conservation()
+    checkpoint = repository.conservation_checkpoint
+    assert checkpoint is not None and checkpoint.stream_version == 2
+
+    fill(repository, "exec-1", ExecutionSide.ENTRY, 2)
+    deposit(repository, 50_000, 3)
+    fill(repository, "exec-2", ExecutionSide.EXIT, 4)
+
+    incremental = repository.assert_conservation()
+    advanced = repository.conservation_checkpoint
+    assert advanced.previous_checkpoint_hash == checkpoint.checkpoint_hash
+    assert advanced.stream_version == incremental.event_count > first.event_count
+
+    full = repository.assert_conservation(full_replay=True)
+    with repository.engine.connect() as conn:
+        assert incremental == full == verify_conservation(conn, repository._metadata)
+    # Replaying the same history reproduces the same chains and fold.
+    replayed = repository.conservation_checkpoint
+    assert (replayed.economic_chain, replayed.economic_state) == (advanced.economic_chain, advanced.economic_state)
+
+
+def test_resume_walks_only_appended_events(repository: CapitalRepository, monkeypatch: pytest.MonkeyPatch) -> None:
+    deposit(repository, 1_000_000, 1)
+    repository.assert_conservation()
+    fill(repository, "exec-1", ExecutionSide.ENTRY, 2)
+
+    seen: list[int] = []
+    original = conservation._replay_economic_events
+
+    def spy(connection, resume=None, after_version=0):
+        seen.append(after_version)
+        return original(connection, resume, after_version)
+
+    monkeypatch.setattr(conservation, "_replay_economic_events", spy)
+    repository.assert_conservation()
+    repository.assert_conservation(full_replay=True)
+
+    assert seen == [2, 0]
+
+
+def test_rewritten_prefix_fails_full_replay_against_checkpoint(repository: CapitalRepository) -> None:
+    deposit(repository, 1_000_000, 1)
+    deposit(repository, 20_000, 2)
+    repository.assert_conservation()
+
+    _tamper_first_event(repository, restore_trigger=True)
+
+    with pytest.raises(CapitalConflict) as excinfo:
+        repository.assert_conservation(full_replay=True)
+    assert excinfo.value.code == "conservation_violation"
+    assert "diverged" in str(excinfo.value)
+
+
+def test_missing_immutability_trigger_forces_full_replay(repository: CapitalRepository) -> None:
+    deposit(repository, 1_000_000, 1)
+    repository.assert_conservation()
+
+    _tamper_first_event(repository, restore_trigger=False)
+
+    with pytest.raises(CapitalConflict, match="diverged"):
+        repository.assert_conservation()
@@ -302,6 +302,46 @@ def test_block_bootstrap_requires_complete_path() -> None:
         )
 
 
+def test_block_bootstrap_seed_contract_is_pinned_across_chunking() -> None:
+    import math
+
+    from src.screening.offensive.v3.evidence.paired_statistics import (
+        PairedStatisticsError,
+        block_bootstrap_lcb,
+    )
+
+    # Golden bounds from the per-resample reference loop: the batched
+    # engine must reproduce them bit for bit under any chunk size.
+    values = tuple(0.0005 + 0.01 * math.sin(index * 1.7) for index in range(60))
+    golden = {
+        "moving": -5.213309513983631e-05,
+        "circular": -6.912442130728684e-05,
+        "stationary": 6.37483675495724e-06,
+    }
+    for method, expected in golden.items():
+        for chunk_size in (None, 1, 37, 500):
+            bound = block_bootstrap_lcb(
+                values,
+                method=method,
+                block_length=6,
+                repetitions=500,
+                seed=2024,
+                confidence=0.9,
+                chunk_size=chunk_size,
+            )
+            assert bound == expected
+    with pytest.raises(PairedStatisticsError, match="invalid_chunk_size"):
+        block_bootstrap_lcb(
+            values,
+            method="moving",
+            block_length=6,
+            repetitions=10,
+            seed=1,
+            confidence=0.9,
+            chunk_size=0,
+        )
+
+
 def test_newey_west_lcb_is_deterministic_and_conservative() -> None:
     from src.screening.offensive.v3.evidence.paired_statistics import (
         newey_west_lcb,
@@ -0,0 +1,183 @@
+"""Unit tests for src/portfolio/risk_engine.py
+
+NumPy risk kernels: incremental rolling covariance / correlation (checked
+against pandas on the same window), threshold clustering via connected
+components, tail-quantile VaR / CVaR and OLS beta.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.portfolio.correlation_cluster import build_correlation_clusters, market_median_correlation
+from src.portfolio.risk_engine import (
+    RollingCovariance,
+    connected_component_labels,
+    correlated_pairs,
+    group_by_labels,
+    historical_cvar,
+    historical_var,
+    ols_beta,
+)
+from src.portfolio.risk_metrics import _weighted_portfolio_daily_returns
+
+
+def _returns_frame(rows: int = 80, cols: int = 6, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    base = rng.normal(0.0, 0.02, size=(rows, 1))
+    data = base + rng.normal(0.0, 0.01, size=(rows, cols))
+    frame = pd.DataFrame(data, columns=[f"{600000 + i:06d}" for i in range(cols)])
+    frame.iloc[3, 1] = np.nan
+    frame.iloc[50, 4] = np.nan
+    return frame
+
+
+# ---------------------------------------------------------------------------
+# RollingCovariance
+# ---------------------------------------------------------------------------
+
+
+def test_rolling_covariance_matches_pandas_pairwise_window() -> None:
+    frame = _returns_frame()
+    engine = RollingCovariance(list(frame.columns), window=20)
+    for step, row in enumerate(frame.to_numpy()):
+        engine.update(row)
+        if step in (10, 45, 79):
+            window = frame.iloc[max(0, step - 19) : step + 1]
+            np.testing.assert_allclose(engine.covariance(), window.cov().to_numpy(), rtol=1e-9, atol=1e-12)
+            np.testing.assert_allclose(engine.correlation(), window.corr().to_numpy(), rtol=1e-9, atol=1e-12)
+    assert len(engine) == 20
+
+
+def test_rolling_covariance_from_frame_uses_last_window_rows() -> None:
+    frame = _returns_frame()
+    engine = RollingCovariance.from_frame(frame, window=30)
+
+    pd.testing.assert_frame_equal(engine.correlation_frame(), frame.iloc[-30:].corr(), rtol=1e-9)
+
+
+def test_rolling_covariance_marks_insufficient_and_constant_pairs_nan() -> None:
+    engine = RollingCovariance(["A", "B", "C"], window=5)
+    engine.update([0.01, np.nan, 0.02])
+    engine.update([0.02, 0.01, 0.02])
+    engine.update([0.03, np.inf, 0.02])
+
+    corr = engine.correlation()
+    assert math.isnan(corr[0, 1])  # A/B 只有一行成对观测
+    assert math.isnan(corr[0, 2])  # C 零方差
+    assert corr[0, 0] == pytest.approx(1.0)
+
+
+def test_rolling_covariance_rejects_wrong_row_width() -> None:
+    engine = RollingCovariance(["A", "B"], window=5)
+    with pytest.raises(ValueError):
+        engine.update([0.01, 0.02, 0.03])
+
+
+# ---------------------------------------------------------------------------
+# Clustering
+# ---------------------------------------------------------------------------
+
+
+def _legacy_clusters(matrix: pd.DataFrame, threshold: float) -> list[set[str]]:
+    tickers = list(matrix.index)
+    parent = {t: t for t in tickers}
+
+    def find(node: str) -> str:
+        while parent[node] != node:
+            node = parent[node]
+        return node
+
+    for row in tickers:
+        for col in tickers:
+            value = matrix.loc[row, col]
+            if row < col and pd.notna(value) and value > threshold:
+                parent[find(col)] = find(row)
+    groups: dict[str, set[str]] = {}
+    for ticker in tickers:
+        groups.setdefault(find(ticker), set()).add(ticker)
+    return list(groups.values())
+
+
+def test_clusters_match_pairwise_union_find_on_large_matrix() -> None:
+    rng = np.random.default_rng(3)
+    tickers = [f"{i:06d}" for i in rng.permutation(150)]
+    values = rng.uniform(-0.2, 1.0, size=(150, 150))
+    values[rng.uniform(size=values.shape) < 0.05] = np.nan
+    matrix = pd.DataFrame(values, index=tickers, columns=tickers)
+
+    assert build_correlation_clusters(matrix, threshold=0.995) == _legacy_clusters(matrix, threshold=0.995)
+
+
+def test_correlated_pairs_reads_key_ordered_upper_triangle() -> None:
+    # 非对称矩阵: 只读取 key 较小一侧的行
+    values = np.array([[1.0, 0.1], [0.9, 1.0]])
+    rows, cols = correlated_pairs(values, ["B", "A"], threshold=0.8)
+
+    assert list(zip(rows.tolist(), cols.tolist())) == [(1, 0)]
+
+
+def test_group_by_labels_orders_groups_by_first_member() -> None:
+    labels = connected_component_labels(4, np.array([1]), np.array([3]))
+
+    assert group_by_labels(["A", "B", "C", "D"], labels) == [{"A"}, {"B", "D"}, {"C"}]
+
+
+def test_market_median_correlation_ignores_nan_and_lower_triangle() -> None:
+    matrix = pd.DataFrame(
+        [[1.0, 0.2, 0.4], [0.9, 1.0, np.nan], [0.9, 0.9, 1.0]],
+        index=["A", "B", "C"],
+        columns=["A", "B", "C"],
+    )
+
+    assert market_median_correlation(matrix) == pytest.approx(0.3)
+
+
+# ---------------------------------------------------------------------------
+# VaR / CVaR / beta / portfolio series
+# ---------------------------------------------------------------------------
+
+
+def test_historical_var_and_cvar_follow_sorted_tail_definition() -> None:
+    returns = np.linspace(-0.05, 0.05, 101)
+    ordered = np.sort(returns)
+    index = math.floor(0.05 * returns.size)
+
+    assert historical_var(returns, 0.95) == pytest.approx(-ordered[index])
+    assert historical_cvar(returns, 0.95) == pytest.approx(-ordered[:index].mean())
+    assert historical_var(np.zeros(10), 0.95) == 0.0
+    assert historical_cvar(np.array([-0.03]), 0.95) == pytest.approx(0.03)
+
+
+def test_ols_beta_matches_numpy_cov_and_rejects_flat_benchmark() -> None:
+    rng = np.random.default_rng(11)
+    bench = rng.normal(0.0, 0.01, 60)
+    portfolio = 1.3 * bench + rng.normal(0.0, 0.002, 60)
+    expected = np.cov(portfolio, bench)[0, 1] / np.var(bench, ddof=1)
+
+    assert ols_beta(portfolio, bench) == pytest.approx(expected)
+    assert ols_beta(portfolio, np.full(60, 0.01)) is None
+
+
+def test_weighted_portfolio_returns_skip_unobserved_positions_and_days() -> None:
+    positions = [
+        {"ticker": "A", "market_value": 300.0},
+        {"ticker": "B", "market_value": 100.0},
+    ]
+    lookback = [
+        {"date": "d2", "ticker": "A", "return_pct": 0.02},
+        {"date": "d1", "ticker": "A", "return_pct": 0.01},
+        {"date": "d1", "ticker": "B", "return_pct": -0.02},
+        {"date": "d3", "ticker": "Z", "return_pct": 0.50},
+        {"date": "d2", "ticker": "B", "return_pct": 0.04},
+        {"date": "d2", "ticker": "B", "return_pct": float("nan")},
+    ]
+
+    series = _weighted_portfolio_daily_returns(positions, lookback)
+
+    # d2 的 B 以最后一条 (NaN → 0) 为准; d3 只有非持仓标的, 整天丢弃
+    np.testing.assert_allclose(series, [0.75 * 0.01 + 0.25 * -0.02, 0.75 * 0.02 + 0.25 * 0.0])
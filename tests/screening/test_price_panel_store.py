@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.screening.price_panel_store import PricePanelStore, build_price_panel
+from src.screening.scoring_feature_store import ScoringFeatureStore
+
+
+def _write_history(path: Path, *, with_split: bool = True, bad_pct_row: int | None = None) -> None:
+    dates = pd.bdate_range("2025-06-02", periods=260)
+    close = 10.0 + np.cumsum(np.sin(np.arange(len(dates)) / 7.0) * 0.1)
+    if with_split:
+        close[180:] = close[180:] / 2.0  # 10送10: raw close halves, provider pct stays small
+    pct = np.empty(len(dates))
+    pct[0] = 0.0
+    pct[1:] = (close[1:] / close[:-1] - 1.0) * 100.0
+    if with_split:
+        pct[180] = 0.8
+    if bad_pct_row is not None:
+        pct[bad_pct_row] = np.nan
+    pd.DataFrame(
+        {
+            "date": dates.strftime("%Y-%m-%d"),
+            "open": close * 0.99,
+            "high": close * 1.02,
+            "low": close * 0.97,
+            "close": close,
+            "volume": np.arange(len(dates)) * 10 + 1000,
+            "pct_change": pct,
+            "amount": close * 1000,
+        }
+    ).to_csv(path, index=False)
+
+
+def _store(tmp_path: Path, *, panel: bool) -> ScoringFeatureStore:
+    return ScoringFeatureStore(
+        base_dir=tmp_path / "feature_cache",
+        price_cache_dir=tmp_path / "price_cache",
+        legacy_snapshot_dir=tmp_path / "snapshots",
+        lhb_cache_dir=tmp_path / "lhb_cache",
+        price_panel_dir=tmp_path / ("price_panel" if panel else "no_panel"),
+    )
+
+
+@pytest.mark.parametrize("bad_pct_row", [None, 100, 230])
+@pytest.mark.parametrize(
+    ("trade_date", "lookback_days"),
+    [("20260522", 400), ("20260522", 60), ("20260102", 120), ("20251201", 30), ("20240101", 400)],
+)
+def test_panel_window_matches_csv_read_path(tmp_path: Path, bad_pct_row, trade_date, lookback_days) -> None:
+    price_dir = tmp_path / "price_cache"
+    price_dir.mkdir()
+    _write_history(price_dir / "000001.csv", bad_pct_row=bad_pct_row)
+    build_price_panel(price_dir, tmp_path / "price_panel")
+
+    expected = _store(tmp_path, panel=False).load_price_frame("000001", trade_date, lookback_days)
+    actual = _store(tmp_path, panel=True).load_price_frame("000001", trade_date, lookback_days)
+
+    if expected.empty:
+        assert actual.empty
+        return
+    assert list(actual.columns) == list(expected.columns)
+    assert list(actual.index) == list(expected.index)
+    pd.testing.assert_frame_equal(actual, expected.astype(float), check_dtype=False, rtol=1e-9)
+
+
+def test_panel_window_is_zero_copy_when_anchor_factor_is_one(tmp_path: Path) -> None:
+    price_dir = tmp_path / "price_cache"
+    price_dir.mkdir()
+    _write_history(price_dir / "000001.csv")
+    build_price_panel(price_dir, tmp_path / "price_panel")
+    panel = PricePanelStore(tmp_path / "price_panel")
+
+    latest = panel.window("000001", "20260522", 60)
+    earlier = panel.window("000001", "20260102", 60)
+
+    assert latest is not None and earlier is not None
+    arrays = panel._segments[panel.entry("000001")["segment"]]
+    assert np.shares_memory(latest.columns["close"], arrays["close"])
+    assert np.shares_memory(earlier.columns["volume"], arrays["volume"])
+    # 除权日之前结束的窗口需按锚点因子重标, 只有 OHLC 复制.
+    assert not np.shares_memory(earlier.columns["close"], arrays["close"])
+
+
+def test_changed_csv_falls_back_to_csv_until_rebuilt(tmp_path: Path) -> None:
+    price_dir = tmp_path / "price_cache"
+    price_dir.mkdir()
+    path = price_dir / "000001.csv"
+    _write_history(path, with_split=False)
+    summary = build_price_panel(price_dir, tmp_path / "price_panel")
+    assert summary["parsed"] == 1
+
+    frame = pd.read_csv(path)
+    frame.loc[len(frame)] = ["2026-05-25", 1.0, 1.0, 1.0, 1.0, 5.0, 0.0, 1.0]
+    frame.to_csv(path, index=False)
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+
+    panel = PricePanelStore(tmp_path / "price_panel")
+    assert panel.window("000001", "20260525", 30, source_path=path) is None
+    assert _store(tmp_path, panel=True).load_price_frame("000001", "20260525").index[-1] == pd.Timestamp("2026-05-25")
+
+    rebuilt = build_price_panel(price_dir, tmp_path / "price_panel")
+    assert rebuilt["parsed"] == 1
+    assert panel.window("000001", "20260525", 30, source_path=path).dates[-1] == np.datetime64("2026-05-25")
+
+
+def test_restricted_rebuild_keeps_other_tickers_and_reuses_unchanged_rows(tmp_path: Path) -> None:
+    price_dir = tmp_path / "price_cache"
+    price_dir.mkdir()
+    _write_history(price_dir / "000001.csv")
+    _write_history(price_dir / "600000.csv", with_split=False)
+    build_price_panel(price_dir, tmp_path / "price_panel")
+
+    summary = build_price_panel(price_dir, tmp_path / "price_panel", tickers=["000001"])
+
+    assert summary == {**summary, "parsed": 0, "reused": 2, "tickers": 2}
+    assert PricePanelStore(tmp_path / "price_panel").tickers() == ["000001", "600000"]
+    assert len(list((tmp_path / "price_panel").glob("close.*.npy"))) == 1
+
+
+def test_panel_serves_history_when_csv_import_removed(tmp_path: Path) -> None:
+    price_dir = tmp_path / "price_cache"
+    price_dir.mkdir()
+    _write_history(price_dir / "000001.csv")
+    build_price_panel(price_dir, tmp_path / "price_panel")
+    (price_dir / "000001.csv").unlink()
+
+    store = _store(tmp_path, panel=True)
+    frame = store.load_price_frame("000001", "20260522")
+
+    assert not frame.empty
+    assert store._quality.sources["price_history"] == "local_price_cache"
+
+
+def _append_row(path: Path, date: str) -> None:
+    frame = pd.read_csv(path)
+    frame.loc[len(frame)] = [date, 1.0, 1.0, 1.0, 1.0, 5.0, 0.0, 1.0]
+    frame.to_csv(path, index=False)
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+
+
+def test_rebuild_writes_only_changed_tickers(tmp_path: Path) -> None:
+    price_dir = tmp_path / "price_cache"
+    price_dir.mkdir()
+    for ticker in ("000001", "000002", "600000"):
+        _write_history(price_dir / f"{ticker}.csv", with_split=False)
+    build_price_panel(price_dir, tmp_path / "price_panel")
+    panel = PricePanelStore(tmp_path / "price_panel")
+    untouched_segment = panel.entry("600000")["segment"]
+
+    unchanged = build_price_panel(price_dir, tmp_path / "price_panel")
+    assert unchanged["written_rows"] == 0 and unchanged["parsed"] == 0
+
+    _append_row(price_dir / "000001.csv", "2026-05-25")
+    summary = build_price_panel(price_dir, tmp_path / "price_panel")
+
+    assert summary["parsed"] == 1 and summary["reused"] == 2
+    assert summary["written_rows"] == 261 and not summary["compacted"]
+    assert panel.entry("600000")["segment"] == untouched_segment
+    assert panel.entry("000001")["segment"] != untouched_segment
+    assert panel.window("000001", "20260525", 30, source_path=price_dir / "000001.csv").dates[-1] == np.datetime64("2026-05-25")
+    assert len(panel.window("600000", "20260522", 30, source_path=price_dir / "600000.csv")) > 0
+
+
+def test_rebuild_compacts_when_superseded_rows_dominate(tmp_path: Path) -> None:
+    price_dir = tmp_path / "price_cache"
+    price_dir.mkdir()
+    for ticker in ("000001", "000002", "600000"):
+        _write_history(price_dir / f"{ticker}.csv", with_split=False)
+    build_price_panel(price_dir, tmp_path / "price_panel")
+
+    # 3 只中 2 只变化: 首段 2/3 的行失效, 超过压实阈值
+    _append_row(price_dir / "000001.csv", "2026-05-26")
+    _append_row(price_dir / "000002.csv", "2026-05-26")
+    summary = build_price_panel(price_dir, tmp_path / "price_panel")
+
+    panel = PricePanelStore(tmp_path / "price_panel")
+    assert summary["compacted"]
+    assert summary["written_rows"] == summary["rows"]
+    assert summary["rows"] == 3 * 260 + 2
+    assert panel.entry("000001")["segment"] == panel.entry("600000")["segment"]
+    assert len(list((tmp_path / "price_panel").glob("close.*.npy"))) == 1
+    assert panel.window("000001", "20260526", 30).dates[-1] == np.datetime64("2026-05-26")
+
+
+def test_non_numeric_columns_are_dropped_with_warning(tmp_path: Path, caplog) -> None:
+    price_dir = tmp_path / "price_cache"
+    price_dir.mkdir()
+    path = price_dir / "000001.csv"
+    _write_history(path, with_split=False)
+    frame = pd.read_csv(path)
+    frame["ts_code"] = "000001.SZ"
+    frame.to_csv(path, index=False)
+
+    with caplog.at_level("WARNING", logger="src.screening.price_panel_store"):
+        build_price_panel(price_dir, tmp_path / "price_panel")
+
+    entry = PricePanelStore(tmp_path / "price_panel").entry("000001")
+    assert entry["dropped_columns"] == ["ts_code"]
+    assert "ts_code" not in entry["columns"]
+    assert "ts_code" in caplog.text
@@ -0,0 +1,128 @@
+"""src.screening.report_warehouse: 增量同步的 auto_screening 报告索引。"""
+
+from __future__ import annotations
+
+import json
+import os
+
+from src.screening.consecutive_recommendation import load_auto_screening_history
+from src.screening.report_warehouse import ReportWarehouse, get_report_warehouse
+
+
+def _write_report(reports_dir, date: str, recommendations: list[dict], **extra) -> None:
+    payload = {"date": date, "recommendations": recommendations, "candidate_pool_run": [{"ticker": "x"}] * 3, **extra}
+    (reports_dir / f"auto_screening_{date}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_sync_ingests_only_new_or_changed_reports(tmp_path):
+    _write_report(tmp_path, "20260210", [{"ticker": "000001", "score_b": 0.5}])
+    _write_report(tmp_path, "20260211", [{"ticker": "000002", "score_b": 0.7}])
+    (tmp_path / "auto_attempt_20260211_run.json").write_text("{}", encoding="utf-8")
+    warehouse = ReportWarehouse(tmp_path, db_path=tmp_path / "wh.sqlite3")
+
+    assert warehouse.sync() == 2
+    assert warehouse.sync() == 0
+
+    _write_report(tmp_path, "20260211", [{"ticker": "000002", "score_b": 0.9}, {"ticker": "000003", "score_b": 0.1}])
+    os.utime(tmp_path / "auto_screening_20260211.json", ns=(1, 1))
+    (tmp_path / "auto_screening_20260210.json").unlink()
+
+    assert warehouse.sync() == 1
+    assert warehouse.report_dates() == ["20260211"]
+    assert [(row.ticker, row.rank, row.score_b) for row in warehouse.recommendations()] == [("000002", 1, 0.9), ("000003", 2, 0.1)]
+
+
+def test_reports_drop_publication_only_blocks_and_keep_corrupt_entries(tmp_path):
+    _write_report(tmp_path, "20260210", [{"ticker": "000001"}], market_state={"regime_gate_level": "Crisis"})
+    (tmp_path / "auto_screening_20260211.json").write_text("{broken", encoding="utf-8")
+    (tmp_path / "auto_screening_20260212_rerun.json").write_text(json.dumps({"date": "20260212"}), encoding="utf-8")
+    warehouse = ReportWarehouse(tmp_path)
+
+    entries = warehouse.reports(descending=True)
+
+    assert [entry.trade_date for entry in entries] == ["20260211", "20260210"]
+    assert entries[0].payload is None and "JSONDecodeError" in entries[0].error
+    assert "candidate_pool_run" not in entries[1].payload
+    assert entries[1].payload["recommendations"] == [{"ticker": "000001"}]
+    assert warehouse.latest_report_date() == "20260211"
+    assert warehouse.latest_report_date(end="20260210") == "20260210"
+    # 非规范文件名只参与 regime 映射
+    assert warehouse.regimes() == [("auto_screening_20260210.json", "20260210", "Crisis"), ("auto_screening_20260212_rerun.json", "20260212", None)]
+
+
+def test_recommendations_filter_by_ticker_and_range(tmp_path):
+    for date, tickers in (("20260209", ["A", "B"]), ("20260210", ["B"]), ("20260211", ["A", "C"])):
+        _write_report(tmp_path, date, [{"ticker": ticker, "score_b": 1.0, "score_decomposition": {"momentum": 0.2}} for ticker in tickers])
+    warehouse = ReportWarehouse(tmp_path)
+
+    rows = warehouse.recommendations("20260210", "20260211", tickers=["A", "B"])
+
+    assert [(row.trade_date, row.ticker) for row in rows] == [("20260210", "B"), ("20260211", "A")]
+    assert rows[0].score_decomposition == {"momentum": 0.2}
+    assert warehouse.recommendations(tickers=[]) == []
+
+
+def test_index_persists_across_instances_and_publish(tmp_path):
+    reports_dir = tmp_path / "reports"
+    reports_dir.mkdir()
+    db_path = tmp_path / "wh.sqlite3"
+    _write_report(reports_dir, "20260210", [{"ticker": "000001"}])
+    ReportWarehouse(reports_dir, db_path=db_path).sync()
+
+    reopened = ReportWarehouse(reports_dir, db_path=db_path)
+    assert reopened.sync() == 0
+    _write_report(reports_dir, "20260211", [{"ticker": "000002"}])
+    reopened.publish(reports_dir / "auto_screening_20260211.json")
+    assert reopened.sync() == 0
+    assert reopened.report_dates() == ["20260210", "20260211"]
+
+
+def test_history_loader_reads_through_shared_warehouse(tmp_path, monkeypatch):
+    _write_report(tmp_path, "20260209", [{"ticker": "000001"}])
+    _write_report(tmp_path, "20260211", [{"ticker": "000002"}])
+
+    history = load_auto_screening_history(lookback_days=3, report_dir=tmp_path)
+
+    assert [item["date"] for item in history] == ["20260211", "20260209"]
+    assert history[0]["path"] == str(tmp_path / "auto_screening_20260211.json")
+    assert get_report_warehouse(tmp_path) is get_report_warehouse(tmp_path)
+
+    monkeypatch.setenv("REPORT_WAREHOUSE_ENABLED", "false")
+    assert get_report_warehouse(tmp_path).db_path is None
+
+
+def test_factor_history_consumers_read_through_warehouse(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from src.research.factor_ic_analysis import extract_factor_panel_from_history
+    from src.screening.factor_attribution_by_state import load_factor_attribution_by_state_records
+
+    dates = [f"202602{day:02d}" for day in range(1, 13)]
+    for offset, date in enumerate(dates):
+        recs = [
+            {
+                "ticker": ticker,
+                "score_b": 0.1 * (offset + idx),
+                "strategy_signals": {"trend": {"sub_factors": {"momentum": {"confidence": 50 + offset + idx}}}},
+                "score_decomposition": {"base_contributions": {"trend": 0.1 * idx}},
+            }
+            for idx, ticker in enumerate(("000001", "000002"))
+        ]
+        _write_report(tmp_path, date, recs, market_state={"state_type": "trend"})
+    tracking = [{"ticker": "000001", "recommended_date": date, "next_5day_return": 0.01} for date in dates[-3:]]
+    (tmp_path / "tracking_history.json").write_text(json.dumps({"records": tracking}), encoding="utf-8")
+    get_report_warehouse(tmp_path).sync()
+
+    real_read_text = Path.read_text
+
+    def _no_report_reads(self, *args, **kwargs):
+        assert not self.name.startswith("auto_screening_"), f"report re-read: {self.name}"
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _no_report_reads)
+
+    factors, returns = extract_factor_panel_from_history(tmp_path, lookback_days=30)
+    records = load_factor_attribution_by_state_records(tmp_path)
+
+    assert set(factors) == {"momentum"} and returns
+    assert [(rec["recommended_date"], rec["state_type"]) for rec in records] == [(date, "trend") for date in dates[-3:]]
@@ -141,7 +141,7 @@ def test_score_batch_delays_heavy_signals_to_ranked_subset():
     fundamental_calls: list[str] = []
     event_calls: list[str] = []
 
-    def fake_light(candidate, trade_date, feature_store):
+    def fake_light(candidate, trade_date, feature_store, **_precomputed):
         return light_signals[candidate.ticker], None
 
     def fake_fundamental(candidate, trade_date, industry_pe_medians, feature_store):
@@ -380,7 +380,7 @@ def test_score_batch_enriches_sector_diffusion_metrics_for_industry_peers() -> N
         "000003": pd.DataFrame({"close": [10.0, 9.9]}),
     }
 
-    def fake_light(candidate, trade_date, feature_store):
+    def fake_light(candidate, trade_date, feature_store, **_precomputed):
         return (
             {
                 "trend": _trend_with_momentum(),
@@ -439,7 +439,7 @@ def test_score_batch_enriches_sector_amount_share_metrics_for_industry_peers() -
         "000003": pd.DataFrame({"close": [10.0, 9.9], "amount": [300.0, 200.0]}),
     }
 
-    def fake_light(candidate, trade_date, feature_store):
+    def fake_light(candidate, trade_date, feature_store, **_precomputed):
         return (
             {
                 "trend": _trend_with_momentum(),
@@ -634,7 +634,7 @@ def test_score_batch_limits_technical_scoring_to_ranked_subset():
     ]
     technical_calls: list[str] = []
 
-    def fake_light(candidate, trade_date, feature_store):
+    def fake_light(candidate, trade_date, feature_store, **_precomputed):
         technical_calls.append(candidate.ticker)
         return {
             "trend": _signal(1, 70),
@@ -664,7 +664,7 @@ def test_score_batch_technical_stage_prefers_smaller_market_cap_within_same_liqu
     ]
     technical_calls: list[str] = []
 
-    def fake_light(candidate, trade_date, feature_store):
+    def fake_light(candidate, trade_date, feature_store, **_precomputed):
         technical_calls.append(candidate.ticker)
         return {
             "trend": _signal(1, 70),
@@ -1525,7 +1525,7 @@ def test_score_batch_parallel_produces_same_results_as_serial():
     ]
     trade_date = "20260305"
 
-    def fake_light(candidate, trade_date, feature_store):
+    def fake_light(candidate, trade_date, feature_store, **_precomputed):
         return {
             "trend": _signal(1, 70),
             "mean_reversion": _signal(0, 0, completeness=0.0),
@@ -1650,7 +1650,7 @@ def test_parallel_handles_individual_candidate_failure_gracefully():
         _candidate("000002", avg_volume_20d=20000.0, market_cap=200.0),
     ]
 
-    def fake_light(candidate, trade_date, feature_store):
+    def fake_light(candidate, trade_date, feature_store, **_precomputed):
         if candidate.ticker == "000001":
             raise RuntimeError("Simulated IO failure")
         return {
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.screening.strategy_scorer_trend import score_trend_strategy
+from src.screening.strategy_scorer_trend_panel import _ewm_mean, score_trend_strategy_batch
+
+
+def _random_frame(rng: np.random.Generator, rows: int, *, flat: bool = False) -> pd.DataFrame:
+    dates = pd.bdate_range(end="2026-07-08", periods=rows)
+    if flat:
+        close = np.full(rows, 12.5)
+    else:
+        close = 10.0 * np.exp(np.cumsum(rng.normal(0.0005, 0.025, rows)))
+    spread = np.abs(rng.normal(0.0, 0.015, rows)) * close
+    open_ = close * (1.0 + rng.normal(0.0, 0.01, rows))
+    high = np.maximum(close, open_) + spread
+    low = np.minimum(close, open_) - spread
+    volume = rng.integers(50_000, 500_000, rows)
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "close": close,
+            "high": high,
+            "low": low,
+            "volume": volume,
+            "amount": volume * close,
+            "turnover_rate": rng.uniform(0.5, 8.0, rows),
+        },
+        index=pd.DatetimeIndex(dates, name="Date"),
+    )
+
+
+def _assert_close(actual, expected, path: str = "") -> None:
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict), path
+        assert set(actual) == set(expected), path
+        for key in expected:
+            _assert_close(actual[key], expected[key], f"{path}.{key}")
+    elif isinstance(expected, float) and not isinstance(expected, bool):
+        if math.isnan(expected):
+            assert math.isnan(actual), path
+        else:
+            assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9), path
+    else:
+        assert actual == expected, path
+
+
+def test_ewm_mean_matches_pandas_with_leading_and_interior_nans() -> None:
+    rng = np.random.default_rng(7)
+    values = rng.normal(size=(80, 4))
+    values[:10, 1] = np.nan
+    values[30:33, 2] = np.nan
+    values[:, 3] = 5.0
+    for alpha, min_periods in ((2.0 / 11.0, 0), (1.0 / 20.0, 20)):
+        expected = pd.DataFrame(values).ewm(alpha=alpha, adjust=False, min_periods=min_periods).mean().to_numpy()
+        np.testing.assert_allclose(_ewm_mean(values, alpha, min_periods), expected, rtol=1e-12, equal_nan=True)
+
+
+def test_batch_trend_signals_match_per_ticker_scoring() -> None:
+    rng = np.random.default_rng(20260708)
+    frames = {f"{300000 + idx:06d}": _random_frame(rng, rows) for idx, rows in enumerate((12, 25, 45, 59, 60, 100, 125, 126, 127, 200, 280, 280))}
+    frames["600000"] = _random_frame(rng, 200, flat=True)
+    frames["000002"] = pd.DataFrame()
+
+    batched = score_trend_strategy_batch(frames)
+
+    assert list(batched) == list(frames)
+    for ticker, frame in frames.items():
+        expected = score_trend_strategy(frame, ticker=ticker)
+        actual = batched[ticker]
+        assert actual.direction == expected.direction, ticker
+        _assert_close(actual.model_dump(), expected.model_dump(), ticker)
+
+
+def test_batch_trend_scoring_matches_per_ticker_on_full_pool() -> None:
+    rng = np.random.default_rng(1)
+    template = _random_frame(rng, 280)
+    frames = {f"{idx:06d}": template * rng.uniform(0.5, 2.0) for idx in range(600)}
+
+    batched = score_trend_strategy_batch(frames)
+
+    assert list(batched) == list(frames)
+    for ticker in list(frames)[::50]:
+        _assert_close(batched[ticker].model_dump(), score_trend_strategy(frames[ticker], ticker=ticker).model_dump(), ticker)
@@ -2,7 +2,8 @@ import json
 import stat
 from pathlib import Path
 
-from src.screening.recommendation_tracker import update_tracking_history_from_payload
+from src.screening.consecutive_recommendation import load_tracking_history
+from src.screening.recommendation_tracker import flush_tracking_history, update_tracking_history_from_payload
 
 
 def test_tracking_accepts_payload_without_report_file(tmp_path: Path) -> None:
@@ -72,7 +73,7 @@ def test_payload_tracking_exactly_replaces_same_date_and_preserves_other_dates(
         tmp_path, "20260710", payload, use_data_fetcher=lambda *args: []
     )
 
-    records = json.loads(history_path.read_text(encoding="utf-8"))["records"]
+    records = load_tracking_history(tmp_path)
     assert {(row["ticker"], row["recommended_date"]) for row in records} == {
         ("600000", "20260709"),
         ("000001", "20260710"),
@@ -132,10 +133,7 @@ def test_payload_tracking_preserves_labels_only_for_identical_recommendation_ide
         tmp_path, "20260710", payload, use_data_fetcher=lambda *args: []
     )
 
-    rows = {
-        row["ticker"]: row
-        for row in json.loads(history_path.read_text(encoding="utf-8"))["records"]
-    }
+    rows = {row["ticker"]: row for row in load_tracking_history(tmp_path)}
     assert rows["000001"]["next_day_return"] == 2.0
     assert rows["000001"]["return_t1_date"] == "20260711"
     assert rows["000002"]["next_day_return"] is None
@@ -161,11 +159,38 @@ def test_tracking_save_uses_durable_atomic_primitive_and_preserves_mode(
     update_tracking_history_from_payload(
         tmp_path, "20260710", payload, use_data_fetcher=lambda *args: []
     )
+    assert flush_tracking_history(history_path) is True
 
     assert stat.S_IMODE(history_path.stat().st_mode) == 0o640
     assert list(tmp_path.glob(".tracking_history.json.*.tmp")) == []
 
 
+def test_nightly_payload_tracking_defers_the_json_export(tmp_path: Path) -> None:
+    history_path = tmp_path / "tracking_history.json"
+    history_path.write_text(
+        json.dumps({"records": [{"ticker": "600000", "recommended_date": "20260709", "recommendation_score": 0.1}]}),
+        encoding="utf-8",
+    )
+    before = history_path.read_bytes()
+    payload = {
+        "date": "20260710",
+        "run_id": "nightly-run",
+        "model_version": "m1",
+        "recommendations": [{"ticker": "000001", "score_b": 0.5, "recommended_price": 10.0}],
+    }
+
+    update_tracking_history_from_payload(tmp_path, "20260710", payload, use_data_fetcher=lambda *args: [])
+
+    # 只写 SQLite 追踪库, 不整份重写 JSON; 读取方看到库中的新记录
+    assert history_path.read_bytes() == before
+    assert [row["ticker"] for row in load_tracking_history(tmp_path)] == ["000001", "600000"]
+
+    assert flush_tracking_history(history_path) is True
+    exported = json.loads(history_path.read_text(encoding="utf-8"))["records"]
+    assert [row["ticker"] for row in exported] == ["000001", "600000"]
+    assert flush_tracking_history(history_path) is False
+
+
 def test_post_publication_enrichment_does_not_track_or_republish(tmp_path: Path, monkeypatch) -> None:
     import src.main as main
 
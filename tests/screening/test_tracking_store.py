@@ -0,0 +1,123 @@
+"""src.screening.tracking_store: SQLite 追踪历史 + 逐日聚合。"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.screening import recommendation_tracker as rt
+from src.screening.tracking_store import TrackingStore
+
+
+def _record(ticker: str, date: str, status: str = "complete", **returns) -> dict:
+    return {"ticker": ticker, "recommended_date": date, "recommended_price": 10.0, "tracking_status": status, **returns}
+
+
+def _write_history(path, records) -> None:
+    path.write_text(json.dumps({"records": records}), encoding="utf-8")
+
+
+def test_summary_from_daily_aggregates_matches_full_scan(tmp_path):
+    history_path = tmp_path / "tracking_history.json"
+    records = [
+        _record("000001", "20260202", next_day_return=1.5, next_3day_return=-0.5, next_30day_return=2.0),
+        _record("000002", "20260202", next_day_return=-1.0, next_3day_return="0.25", next_30day_return=float("nan")),
+        _record("000003", "20260210", "partial", next_day_return=0.3),
+        _record("000004", "2026-02-12", "pending"),
+        _record("000005", "bogus", "pending", next_day_return=9.9),
+    ]
+    _write_history(history_path, records)
+    TrackingStore(history_path)
+
+    for lookback, as_of in ((30, None), (5, None), (0, None), (9, datetime(2026, 2, 11, 15, 30))):
+        expected = rt._summarize_history(records, lookback_days=lookback, as_of=as_of)
+        actual = rt.get_tracking_summary(history_path, lookback_days=lookback, as_of=as_of)
+        assert actual == pytest.approx(expected)
+
+
+def test_update_reads_only_open_records_and_exports_json(tmp_path, monkeypatch):
+    reports_dir = tmp_path
+    history_path = reports_dir / rt.HISTORY_FILENAME
+    _write_history(history_path, [_record("000001", "20260105", next_30day_return=3.0), _record("000002", "20260201", "pending")])
+    monkeypatch.setattr(rt, "fetch_actual_returns", lambda **kw: {"000002": {"day_1": 1.2, "day_1_date": "20260202"}})
+
+    store = TrackingStore(history_path)
+    assert [rec["ticker"] for rec in store.open_records("20260210")] == ["000002"]
+
+    updated = rt._update_tracking_history(reports_dir, "20260210", [{"ticker": "000003", "score_b": 0.4, "recommended_price": 8.0}], "v1", source_run_id=None)
+
+    assert updated == 2
+    exported = json.loads(history_path.read_text(encoding="utf-8"))["records"]
+    assert [(rec["ticker"], rec["recommended_date"], rec["tracking_status"]) for rec in exported] == [
+        ("000003", "20260210", "pending"),
+        ("000002", "20260201", "partial"),
+        ("000001", "20260105", "complete"),
+    ]
+    # 导出后签名一致，重新打开无需重建
+    assert TrackingStore(history_path).sync_from_json() is False
+    assert rt.get_tracking_summary(history_path, lookback_days=0)["tracked_count_day1"] == 1
+
+
+def test_external_json_edit_triggers_rebuild(tmp_path):
+    history_path = tmp_path / "tracking_history.json"
+    _write_history(history_path, [_record("000001", "20260202", next_day_return=1.0)])
+    assert rt.get_tracking_summary(history_path)["total_recommendations"] == 1
+
+    _write_history(history_path, [_record("000001", "20260202", next_day_return=1.0), _record("000002", "20260203", next_day_return=-2.0)])
+
+    summary = rt.get_tracking_summary(history_path)
+    assert summary["total_recommendations"] == 2
+    assert summary["win_rate_day1"] == 0.5
+
+
+def test_missing_history_creates_nothing(tmp_path):
+    history_path = tmp_path / "absent" / "tracking_history.json"
+
+    assert rt.get_tracking_summary(history_path)["total_recommendations"] == 0
+    assert "暂无追踪历史" in rt.render_tracking_summary(history_path)
+    assert not history_path.parent.exists()
+
+
+def test_summary_read_path_never_writes(tmp_path):
+    history_path = tmp_path / "tracking_history.json"
+    _write_history(history_path, [_record("000001", "20260202", next_day_return=1.0)])
+
+    assert rt.get_tracking_summary(history_path)["total_recommendations"] == 1
+    assert "总推荐: 1" in rt.render_tracking_summary(history_path)
+    # 只读路径不建库
+    assert not history_path.with_suffix(".sqlite3").exists()
+
+    TrackingStore(history_path)
+    _write_history(history_path, [_record("000001", "20260202", next_day_return=1.0), _record("000002", "20260203", next_day_return=-2.0)])
+    db_mtime = history_path.with_suffix(".sqlite3").stat().st_mtime_ns
+
+    # 库落后于 JSON: 回退扫描 JSON, 不在读路径上同步
+    assert rt.get_tracking_summary(history_path)["total_recommendations"] == 2
+    assert history_path.with_suffix(".sqlite3").stat().st_mtime_ns == db_mtime
+    assert TrackingStore.open_existing(history_path) is None
+
+
+def test_deferred_export_writes_json_once(tmp_path, monkeypatch):
+    history_path = tmp_path / rt.HISTORY_FILENAME
+    _write_history(history_path, [_record("000001", "20260105", next_30day_return=3.0)])
+    monkeypatch.setattr(rt, "fetch_actual_returns", lambda **kw: {})
+    saves: list[int] = []
+    original_save = rt._save_history
+    monkeypatch.setattr(rt, "_save_history", lambda path, records: (saves.append(len(records)), original_save(path, records)))
+
+    with rt.deferred_tracking_export(tmp_path):
+        for trade_date, ticker in (("20260210", "000002"), ("20260211", "000003")):
+            rt._update_tracking_history(tmp_path, trade_date, [{"ticker": ticker, "score_b": 0.4, "recommended_price": 8.0}], "v1", source_run_id=None)
+        assert saves == []
+        # 批次中: 读路径仍可从库得到最新汇总
+        assert rt.get_tracking_summary(history_path, lookback_days=0)["total_recommendations"] == 3
+
+    assert saves == [3]
+    assert [rec["ticker"] for rec in json.loads(history_path.read_text(encoding="utf-8"))["records"]] == ["000003", "000002", "000001"]
+    assert TrackingStore(history_path).sync_from_json() is False
+
+    # 无变动的 update 不再整文件重写
+    rt._update_tracking_history(tmp_path, "20260211", [{"ticker": "000003", "score_b": 0.4, "recommended_price": 8.0}], "v1", source_run_id=None)
+    assert saves == [3]
@@ -1,6 +1,13 @@
+import threading
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from src.graph.analyst_scheduler import AnalystTask, create_analyst_scheduler_node, run_analyst_pool
 from src.llm import models as llm_models
 from src.main import (
     _build_analyst_batches,
+    _get_analyst_scheduler_mode,
     _get_analyst_concurrency_limit,
     _order_selected_analysts,
 )
@@ -293,3 +300,98 @@ def test_build_parallel_provider_execution_plan_supports_generic_registered_prov
     assert [overrides[f"agent_{index}"]["model_provider"] for index in range(1, 5)] == ["Alpha", "Beta", "Alpha", "Beta"]
     assert overrides["agent_1"]["model_name"] == "alpha-primary"
     assert overrides["agent_2"]["model_name"] == "beta-fallback"
+
+
+def _signal_agent(name, before=None, after=None):
+    def agent(state):
+        if before is not None:
+            before()
+        state["data"]["analyst_signals"][name] = {"signal": "neutral"}
+        if after is not None:
+            after()
+        return {"messages": [HumanMessage(content=name, name=name)], "data": state["data"]}
+
+    return agent
+
+
+def test_analyst_pool_starts_next_agent_as_soon_as_a_slot_frees():
+    # a_agent 一直等到 d_agent 完成：固定批次 [a, b] / [c, d] 下会死锁，动态池里
+    # b/c/d 依次占用另一个空位即可跑完
+    d_done = threading.Event()
+
+    def wait_for_d():
+        assert d_done.wait(timeout=5), "d_agent never started while a_agent was running"
+
+    tasks = [
+        AnalystTask("a_agent", _signal_agent("a_agent", before=wait_for_d), "p1"),
+        AnalystTask("b_agent", _signal_agent("b_agent"), "p1"),
+        AnalystTask("c_agent", _signal_agent("c_agent"), "p1"),
+        AnalystTask("d_agent", _signal_agent("d_agent", after=d_done.set), "p1"),
+    ]
+
+    results, timings = run_analyst_pool({"data": {"analyst_signals": {}}, "metadata": {}}, tasks, max_workers=2)
+
+    assert [list(result["data"]["analyst_signals"]) for result in results] == [["a_agent"], ["b_agent"], ["c_agent"], ["d_agent"]]
+    assert {timing.status for timing in timings.values()} == {"done"}
+    assert timings["d_agent"].queued_seconds < timings["a_agent"].queued_seconds + timings["a_agent"].run_seconds
+
+
+def test_analyst_pool_respects_per_provider_caps():
+    lock = threading.Lock()
+    active = {"p1": 0, "p2": 0}
+    peak = {"p1": 0, "p2": 0}
+    release = threading.Event()
+
+    def tracked(provider):
+        def agent(state):
+            with lock:
+                active[provider] += 1
+                peak[provider] = max(peak[provider], active[provider])
+            release.wait(timeout=0.05)
+            with lock:
+                active[provider] -= 1
+            return {"messages": [], "data": state["data"]}
+
+        return agent
+
+    tasks = [AnalystTask(f"agent_{index}", tracked("p1" if index % 3 else "p2"), "p1" if index % 3 else "p2") for index in range(9)]
+
+    run_analyst_pool({"data": {"analyst_signals": {}}, "metadata": {}}, tasks, max_workers=4, provider_limits={"p1": 1, "p2": 3})
+
+    assert peak["p1"] == 1
+    assert 1 <= peak["p2"] <= 3
+
+
+def test_analyst_scheduler_node_merges_in_selection_order_and_records_timings():
+    node = create_analyst_scheduler_node([("b_agent", _signal_agent("b_agent")), ("a_agent", _signal_agent("a_agent"))], concurrency_limit=2)
+    state = {
+        "messages": [],
+        "data": {"tickers": ["600519"], "analyst_signals": {}},
+        "metadata": {"model_provider": "MiniMax", "agent_llm_overrides": {"a_agent": {"model_provider": "Zhipu"}}, "analyst_provider_limits": {"MiniMax": 1, "Zhipu": 1}},
+    }
+
+    update = node(state)
+
+    assert [message.name for message in update["messages"]] == ["b_agent", "a_agent"]
+    assert set(update["data"]["analyst_signals"]) == {"a_agent", "b_agent"}
+    assert state["data"]["analyst_signals"] == {}
+    agents = update["metadata"]["analyst_schedule"]["agents"]
+    assert agents["a_agent"]["provider"] == "Zhipu" and agents["b_agent"]["provider"] == "MiniMax"
+    assert all(entry["status"] == "done" for entry in agents.values())
+
+
+def test_analyst_pool_reraises_agent_error():
+    def broken(state):
+        raise RuntimeError("llm down")
+
+    tasks = [AnalystTask("ok_agent", _signal_agent("ok_agent"), "p1"), AnalystTask("broken_agent", broken, "p1")]
+
+    with pytest.raises(RuntimeError, match="llm down"):
+        run_analyst_pool({"data": {"analyst_signals": {}}, "metadata": {}}, tasks, max_workers=2)
+
+
+def test_analyst_scheduler_mode_defaults_to_pool(monkeypatch):
+    monkeypatch.delenv("ANALYST_SCHEDULER_MODE", raising=False)
+    assert _get_analyst_scheduler_mode() == "pool"
+    monkeypatch.setenv("ANALYST_SCHEDULER_MODE", "batch")
+    assert _get_analyst_scheduler_mode() == "batch"
@@ -0,0 +1,130 @@
+"""缓存编解码层回归测试：列式记录、压缩、旧 pickle 条目兼容。"""
+
+from __future__ import annotations
+
+import math
+import pickle
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.data.cache_codec import (
+    CODEC_MAGIC,
+    COMPRESSION_NONE,
+    COMPRESSION_ZLIB,
+    LAYOUT_PICKLE,
+    LAYOUT_RECORDS,
+    CacheCodecError,
+    decode_value,
+    encode_value,
+)
+from src.data.enhanced_cache import DiskCache
+from src.data.models import FinancialMetrics, Price
+
+
+def _price_rows(count: int = 250) -> list[dict]:
+    return [
+        Price(open=10.0 + i * 0.01, close=10.1 + i * 0.01, high=10.5 + i * 0.01, low=9.8 + i * 0.01, volume=100_000 + i, time=f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}").model_dump()
+        for i in range(count)
+    ]
+
+
+def _layout(blob: bytes) -> int:
+    return blob[len(CODEC_MAGIC) + 1]
+
+
+def test_price_records_round_trip_columnar_and_shrink():
+    rows = _price_rows()
+    blob = encode_value(rows)
+
+    assert blob.startswith(CODEC_MAGIC)
+    assert _layout(blob) == LAYOUT_RECORDS
+    assert decode_value(blob) == rows
+    assert len(blob) * 3 < len(pickle.dumps(rows))
+
+
+def test_sparse_metric_records_keep_none_and_types():
+    blank = dict.fromkeys(FinancialMetrics.model_fields)
+    rows = [
+        FinancialMetrics(**{**blank, "ticker": "000001", "report_period": f"2024-0{q}-30", "period": "ttm", "currency": "CNY", "market_cap": 1.5e11 if q % 2 else None, "return_on_equity": 0.12 * q}).model_dump()
+        for q in range(1, 5)
+    ]
+    rows[0]["custom_flag"] = True
+    for row in rows[1:]:
+        row["custom_flag"] = False
+
+    decoded = decode_value(encode_value(rows, compression=COMPRESSION_ZLIB))
+
+    assert decoded == rows
+    assert decoded[1]["market_cap"] is None
+    assert decoded[0]["custom_flag"] is True
+
+
+def test_mixed_int_float_nan_and_big_ints_round_trip_exactly():
+    rows = [
+        {"a": 1, "b": 1.0, "c": float("nan"), "d": 2**70, "e": None},
+        {"a": 2, "b": 2, "c": -0.0, "d": 3, "e": "x"},
+    ]
+    decoded = decode_value(encode_value(rows))
+
+    assert [type(row["b"]) for row in decoded] == [float, int]
+    assert math.isnan(decoded[0]["c"]) and math.copysign(1.0, decoded[1]["c"]) == -1.0
+    assert decoded[0]["d"] == 2**70
+    assert decoded[1]["e"] == "x" and decoded[0]["e"] is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"nested": [1, 2]},
+        [],
+        [{"a": 1}, {"b": 2}],
+        [{"a": [1, 2]}],
+        ("tuple", 1),
+        None,
+    ],
+)
+def test_non_record_values_fall_back_to_pickle(value):
+    blob = encode_value(value, compression=COMPRESSION_NONE)
+
+    assert _layout(blob) == LAYOUT_PICKLE
+    assert decode_value(blob) == value
+
+
+def test_legacy_pickle_payload_still_decodes():
+    rows = _price_rows(5)
+    assert decode_value(pickle.dumps(rows)) == rows
+
+
+def test_corrupt_codec_payload_raises_codec_error():
+    blob = encode_value(_price_rows())
+    with pytest.raises(CacheCodecError):
+        decode_value(blob[:-40])
+
+
+@pytest.mark.parametrize(("setting", "expected"), [(" ZLIB ", COMPRESSION_ZLIB), ("None", COMPRESSION_NONE)])
+def test_compression_env_setting_is_normalized(monkeypatch, setting, expected):
+    monkeypatch.setenv("CACHE_CODEC_COMPRESSION", setting)
+    blob = encode_value(_price_rows())
+
+    assert blob[len(CODEC_MAGIC) + 2] == expected
+    assert decode_value(blob) == _price_rows()
+
+
+def test_disk_cache_reads_legacy_pickled_rows(tmp_path: Path):
+    path = tmp_path / "legacy.sqlite"
+    cache = DiskCache(path=str(path), default_ttl=3600)
+    try:
+        rows = _price_rows(10)
+        conn = sqlite3.connect(str(path))
+        conn.execute("INSERT INTO cache (key, value, expires_at) VALUES (?, ?, 0)", ("legacy", pickle.dumps(rows)))
+        conn.commit()
+        conn.close()
+
+        cache.set("fresh", rows)
+
+        assert cache.get("legacy") == rows
+        assert cache.get_many(["legacy", "fresh"]) == {"legacy": rows, "fresh": rows}
+    finally:
+        cache.close()
@@ -0,0 +1,152 @@
+"""EnhancedCache 批量 get_many / set_many 回归测试。"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from src.data.enhanced_cache import CacheAdapter, DiskCache, EnhancedCache, RedisCache
+
+
+class _FakeRedisClient:
+    """最小内存版 redis 客户端：只实现 get_many/set_many 用到的命令。"""
+
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+        self.mget_calls = 0
+        self.pipeline_executions = 0
+
+    def mget(self, keys):
+        self.mget_calls += 1
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class _Pipe:
+            def __init__(self):
+                self.ops = []
+
+            def setex(self, key, _ttl, data):
+                self.ops.append((key, data))
+
+            def execute(self):
+                client.pipeline_executions += 1
+                for key, data in self.ops:
+                    client.store[key] = data
+
+        return _Pipe()
+
+
+def _fake_redis() -> RedisCache:
+    cache = RedisCache.__new__(RedisCache)
+    cache.default_ttl = 60
+    cache._client = _FakeRedisClient()
+    cache._available = True
+    return cache
+
+
+def test_disk_cache_get_many_round_trips_and_skips_missing(tmp_path: Path):
+    cache = DiskCache(path=str(tmp_path / "batch.sqlite"), default_ttl=3600)
+    try:
+        items = {f"prices:{i:06d}": [{"close": float(i)}] for i in range(1200)}
+        cache.set_many(items)
+
+        found = cache.get_many(list(items) + ["prices:missing"])
+
+        assert found == items
+        assert cache.count_entries() == 1200
+    finally:
+        cache.close()
+
+
+def test_disk_cache_get_many_purges_expired_and_corrupted_rows(tmp_path: Path):
+    path = tmp_path / "purge.sqlite"
+    cache = DiskCache(path=str(path), default_ttl=3600)
+    try:
+        cache.set_many({"fresh": 1, "stale": 2, "broken": 3})
+        conn = sqlite3.connect(str(path))
+        conn.execute("UPDATE cache SET expires_at = 1 WHERE key = 'stale'")
+        conn.execute("UPDATE cache SET value = X'00FF' WHERE key = 'broken'")
+        conn.commit()
+        conn.close()
+
+        assert cache.get_many(["fresh", "stale", "broken"]) == {"fresh": 1}
+        assert cache.count_entries() == 1
+    finally:
+        cache.close()
+
+
+def test_redis_cache_batch_uses_single_mget_and_pipeline():
+    cache = _fake_redis()
+    cache.set_many({"a": [1], "b": {"x": 2}})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": [1], "b": {"x": 2}}
+    assert cache._client.mget_calls == 1
+    assert cache._client.pipeline_executions == 1
+
+
+def test_enhanced_cache_get_many_walks_tiers_and_backfills(tmp_path: Path):
+    ec = EnhancedCache(disk_path=str(tmp_path / "tiers.sqlite"))
+    ec.redis = _fake_redis()
+    ec.set_many({"lru": 1, "redis": 2, "disk": 3}, ttl=3600)
+    ec.lru.delete("redis")
+    ec.lru.delete("disk")
+    ec.redis._client.store.pop(ec.redis._make_key("disk"))
+    before = ec.get_stats()
+
+    found = ec.get_many(["lru", "redis", "disk", "none", "lru"])
+
+    assert found == {"lru": 1, "redis": 2, "disk": 3}
+    after = ec.get_stats()
+    assert after["lru_hits"] - before["lru_hits"] == 1
+    assert after["redis_hits"] - before["redis_hits"] == 1
+    assert after["disk_hits"] - before["disk_hits"] == 1
+    assert after["misses"] - before["misses"] == 1
+    # 下层命中已回填到 LRU 与 Redis
+    assert set(ec.lru.keys()) >= {"lru", "redis", "disk"}
+    assert ec.redis.get_many(["disk"]) == {"disk": 3}
+
+
+def test_cache_adapter_batch_maps_identifiers(tmp_path: Path):
+    adapter = CacheAdapter(EnhancedCache(disk_path=str(tmp_path / "adapter.sqlite")))
+    adapter.set_many("prices", {"000001": [{"close": 1.0}], "600519": [{"close": 2.0}]}, provider="tushare")
+
+    assert adapter.get_prices("000001", provider="tushare") == [{"close": 1.0}]
+    assert adapter.get_many("prices", ["000001", "600519", "300750"], provider="tushare") == {
+        "000001": [{"close": 1.0}],
+        "600519": [{"close": 2.0}],
+    }
+
+
+def test_prime_prices_cache_reports_cached_tickers(tmp_path: Path, monkeypatch):
+    from src.tools import api
+
+    adapter = CacheAdapter(EnhancedCache(disk_path=str(tmp_path / "prime.sqlite")))
+    monkeypatch.setattr(api, "_cache", adapter)
+    adapter.set_prices(api._prices_cache_key("000001", "2025-01-01", "2025-06-30"), [{"close": 1.0}])
+
+    assert api.prime_prices_cache(["000001", "600519"], "2025-01-01", "2025-06-30") == {"000001": [{"close": 1.0}]}
+
+
+def test_prime_lookups_do_not_count_as_hits_or_misses(tmp_path: Path, monkeypatch):
+    from src.tools import api
+
+    ec = EnhancedCache(disk_path=str(tmp_path / "prime_stats.sqlite"))
+    adapter = CacheAdapter(ec)
+    monkeypatch.setattr(api, "_cache", adapter)
+    cached_key = api._prices_cache_key("000001", "2025-01-01", "2025-06-30")
+    ec.disk.set(adapter._make_key("prices", cached_key), [{"close": 1.0}])
+    before = ec.get_stats()
+
+    assert api.prime_prices_cache(["000001", "600519"], "2025-01-01", "2025-06-30") == {"000001": [{"close": 1.0}]}
+    primed = ec.get_stats()
+    assert adapter.get_prices(cached_key) == [{"close": 1.0}]
+    after = ec.get_stats()
+
+    assert primed["total_requests"] == before["total_requests"]
+    assert primed["prime_lookups"] - before["prime_lookups"] == 2
+    assert primed["prime_loaded"] - before["prime_loaded"] == 1
+    # 预热后的真实读取只算一次 LRU 命中
+    assert after["lru_hits"] - primed["lru_hits"] == 1
+    assert after["total_requests"] - primed["total_requests"] == 1
@@ -0,0 +1,95 @@
+"""LRUCache O(1) 淘汰与字节预算回归测试。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.data.enhanced_cache import EnhancedCache, LRUCache, estimate_value_bytes
+
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a 变为最近使用
+    cache.set("c", 3)
+
+    assert cache.keys() == ["a", "c"]
+    assert cache.get("b") is None
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_lru_overwrite_does_not_evict_or_double_count_bytes():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", "x" * 100)
+    cache.set("b", "y")
+    before = cache.get_stats()["resident_bytes"]
+    cache.set("a", "x" * 100)
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 0
+    assert stats["resident_bytes"] == before
+
+
+def test_lru_byte_budget_evicts_until_within_budget():
+    row = {"open": 1.0, "close": 2.0, "volume": 100, "time": "2026-01-02"}
+    small = [dict(row) for _ in range(10)]
+    large = [dict(row) for _ in range(200)]
+    budget = estimate_value_bytes(large) + 2 * estimate_value_bytes(small)
+    cache = LRUCache(maxsize=1000, max_bytes=budget)
+
+    for i in range(5):
+        cache.set(f"small-{i}", small)
+    cache.set("large", large)
+
+    stats = cache.get_stats()
+    assert stats["resident_bytes"] <= budget
+    assert stats["evictions"] == 3
+    assert cache.keys() == ["small-3", "small-4", "large"]
+
+
+def test_lru_skips_value_larger_than_budget():
+    cache = LRUCache(maxsize=10, max_bytes=1024)
+    cache.set("keep", "x")
+    cache.set("huge", b"\0" * 10_000)
+
+    assert cache.get("huge") is None
+    assert cache.keys() == ["keep"]
+    assert cache.get_stats()["evictions"] == 0
+
+
+def test_lru_delete_and_clear_release_resident_bytes():
+    cache = LRUCache(maxsize=10)
+    cache.set("a", "x" * 1000)
+    cache.set("b", "y" * 1000)
+    cache.delete("a")
+    assert cache.get_stats()["resident_bytes"] == estimate_value_bytes("y" * 1000)
+    cache.clear()
+    assert cache.get_stats() == {"entries": 0, "resident_bytes": 0, "evictions": 0}
+
+
+def test_estimate_value_bytes_scales_with_list_length():
+    row = {"close": 1.0, "time": "2026-01-02"}
+    assert estimate_value_bytes([row] * 1000) > 50 * estimate_value_bytes([row] * 10)
+
+
+def test_enhanced_cache_stats_report_lru_evictions_and_bytes(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("ENHANCED_CACHE_LRU_MAX_BYTES", raising=False)
+    ec = EnhancedCache(lru_size=2, disk_path=str(tmp_path / "lru.sqlite"))
+    ec.set("a", [1, 2, 3])
+    ec.set("b", [4, 5, 6])
+    ec.set("c", [7, 8, 9])
+
+    stats = ec.get_stats()
+    assert stats["lru_entries"] == 2
+    assert stats["lru_evictions"] == 1
+    assert stats["lru_resident_bytes"] > 0
+    # 被淘汰的值仍可从 Disk 层读回
+    assert ec.get("a") == [1, 2, 3]
+
+
+def test_enhanced_cache_reads_byte_budget_from_env(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("ENHANCED_CACHE_LRU_MAX_BYTES", "4096")
+    ec = EnhancedCache(disk_path=str(tmp_path / "env.sqlite"))
+    assert ec.lru.max_bytes == 4096
@@ -0,0 +1,141 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+import src.agents.fundamentals as fundamentals
+import src.tools.api as api
+from src.agents.valuation import VALUATION_ANALYST_FUNDAMENTALS
+from src.agents.warren_buffett import WARREN_BUFFETT_FUNDAMENTALS
+from src.data.fundamentals_dataset import (
+    FUNDAMENTALS_STATE_KEY,
+    FundamentalsRequest,
+    build_fundamentals_dataset,
+    shared_fundamentals,
+)
+from src.data.models import FinancialMetrics, LineItem
+from src.utils.analysts import get_analyst_fundamentals_requests
+
+
+def _metrics(ticker: str, period: str, count: int) -> list[FinancialMetrics]:
+    records = []
+    for index in range(count):
+        values = {name: None for name in FinancialMetrics.model_fields}
+        values.update(ticker=ticker, report_period=f"{2025 - index}-12-31", period=period, currency="CNY", return_on_equity=0.2, net_margin=0.25, operating_margin=0.18, revenue_growth=0.12, earnings_growth=0.1, book_value_growth=0.11, current_ratio=1.8, debt_to_equity=0.3, free_cash_flow_per_share=4.0, earnings_per_share=4.5, price_to_earnings_ratio=20.0, price_to_book_ratio=2.0, price_to_sales_ratio=4.0, market_cap=1e9)
+        records.append(FinancialMetrics(**values))
+    return records
+
+
+@pytest.fixture()
+def fake_api(monkeypatch):
+    calls = []
+
+    def fake_get_financial_metrics(ticker, end_date, period="ttm", limit=10, api_key=None):
+        calls.append(("metrics", ticker, period, limit))
+        return _metrics(ticker, period, limit)
+
+    def fake_search_line_items(ticker, line_items, end_date, period="ttm", limit=10, api_key=None):
+        calls.append(("line_items", ticker, period, limit, tuple(line_items)))
+        return [LineItem(ticker=ticker, report_period=f"{2025 - index}-12-31", period=period, currency="CNY", **{name: float(index) for name in line_items}) for index in range(limit)]
+
+    def fake_get_market_cap(ticker, end_date, api_key=None):
+        calls.append(("market_cap", ticker))
+        return 1e9
+
+    monkeypatch.setattr(api, "get_financial_metrics", fake_get_financial_metrics)
+    monkeypatch.setattr(api, "search_line_items", fake_search_line_items)
+    monkeypatch.setattr(api, "get_market_cap", fake_get_market_cap)
+    return calls
+
+
+def test_dataset_fetches_union_of_selected_agents_once_per_ticker(fake_api):
+    requests = get_analyst_fundamentals_requests(["warren_buffett", "valuation_analyst", "fundamentals_analyst", "growth_analyst", "ben_graham", "technical_analyst"])
+
+    dataset = build_fundamentals_dataset(["600519", "000001"], "2026-04-10", requests)
+
+    assert dataset is not None and set(dataset.tickers) == {"600519", "000001"}
+    per_ticker = [call for call in fake_api if call[1] == "600519"]
+    assert sorted(call[:4] for call in per_ticker if call[0] == "metrics") == [("metrics", "600519", "annual", 10), ("metrics", "600519", "ttm", 12)]
+    (line_item_call,) = [call for call in per_ticker if call[0] == "line_items"]
+    assert line_item_call[2:4] == ("annual", 10)
+    assert set(line_item_call[4]) == set(WARREN_BUFFETT_FUNDAMENTALS.line_items) | set(VALUATION_ANALYST_FUNDAMENTALS.line_items) | {"earnings_per_share", "book_value_per_share", "current_assets", "current_liabilities"}
+    assert per_ticker.count(("market_cap", "600519")) == 1
+
+
+def test_views_are_sliced_projected_and_read_only(fake_api):
+    dataset = build_fundamentals_dataset(["600519"], "2026-04-10", [WARREN_BUFFETT_FUNDAMENTALS, VALUATION_ANALYST_FUNDAMENTALS])
+    state = {"data": {"end_date": "2026-04-10", FUNDAMENTALS_STATE_KEY: dataset}}
+
+    view = shared_fundamentals(state, "600519", VALUATION_ANALYST_FUNDAMENTALS)
+
+    assert len(view.financial_metrics) == 8 and len(view.line_items) == 8
+    assert all(isinstance(item, LineItem) for item in view.line_items)
+    assert set(view.line_items[0].model_dump()) == {"ticker", "report_period", "period", "currency", *VALUATION_ANALYST_FUNDAMENTALS.line_items}
+    assert view.market_cap == 1e9
+    assert shared_fundamentals(state, "600519", VALUATION_ANALYST_FUNDAMENTALS) is view
+    with pytest.raises(ValidationError):
+        view.financial_metrics[0].market_cap = 0.0
+    with pytest.raises(ValidationError):
+        view.line_items[0].revenue = 0.0
+
+
+def test_uncovered_request_or_stale_dataset_falls_back(fake_api, monkeypatch):
+    dataset = build_fundamentals_dataset(["600519"], "2026-04-10", [VALUATION_ANALYST_FUNDAMENTALS])
+    state = {"data": {"end_date": "2026-04-10", FUNDAMENTALS_STATE_KEY: dataset}}
+
+    assert shared_fundamentals(state, "600519", FundamentalsRequest(metrics_period="ttm", metrics_limit=12)) is None
+    assert shared_fundamentals(state, "600519", FundamentalsRequest(line_items=("goodwill",), line_items_limit=8)) is None
+    assert shared_fundamentals(state, "000001", VALUATION_ANALYST_FUNDAMENTALS) is None
+    assert shared_fundamentals({"data": {"end_date": "2026-04-11", FUNDAMENTALS_STATE_KEY: dataset}}, "600519", VALUATION_ANALYST_FUNDAMENTALS) is None
+
+    monkeypatch.setenv("SHARED_FUNDAMENTALS_DATASET", "false")
+    assert build_fundamentals_dataset(["600519"], "2026-04-10", [VALUATION_ANALYST_FUNDAMENTALS]) is None
+
+
+def test_failed_ticker_is_left_out_of_dataset(fake_api, monkeypatch):
+    def flaky_market_cap(ticker, end_date, api_key=None):
+        if ticker == "000001":
+            raise RuntimeError("boom")
+        return 1e9
+
+    monkeypatch.setattr(api, "get_market_cap", flaky_market_cap)
+
+    dataset = build_fundamentals_dataset(["600519", "000001"], "2026-04-10", [VALUATION_ANALYST_FUNDAMENTALS])
+
+    assert set(dataset.tickers) == {"600519"}
+
+
+def test_agent_reads_shared_dataset_instead_of_fetching(fake_api, monkeypatch):
+    dataset = build_fundamentals_dataset(["600519"], "2026-04-10", get_analyst_fundamentals_requests(["fundamentals_analyst", "growth_analyst"]))
+    monkeypatch.setattr(fundamentals.progress, "update_status", lambda *args, **kwargs: None)
+
+    def unexpected_fetch(**kwargs):
+        raise AssertionError("agent should read the shared dataset")
+
+    monkeypatch.setattr(fundamentals, "get_financial_metrics", unexpected_fetch)
+    state = {
+        "messages": [],
+        "data": {"end_date": "2026-04-10", "tickers": ["600519"], "analyst_signals": {}, FUNDAMENTALS_STATE_KEY: dataset},
+        "metadata": {"show_reasoning": False},
+    }
+
+    result = fundamentals.fundamentals_analyst_agent(state)
+
+    assert json.loads(result["messages"][0].content)["600519"]["signal"] == "bullish"
+
+
+def test_state_holding_dataset_survives_deepcopy_and_pickle(fake_api):
+    import copy
+    import pickle
+
+    dataset = build_fundamentals_dataset(["600519"], "2026-04-10", [WARREN_BUFFETT_FUNDAMENTALS, VALUATION_ANALYST_FUNDAMENTALS])
+    state = {"data": {"end_date": "2026-04-10", FUNDAMENTALS_STATE_KEY: dataset}}
+    before = shared_fundamentals(state, "600519", VALUATION_ANALYST_FUNDAMENTALS)
+
+    for restored in (copy.deepcopy(state), pickle.loads(pickle.dumps(state))):
+        restored_dataset = restored["data"][FUNDAMENTALS_STATE_KEY]
+        assert restored_dataset == dataset and set(restored_dataset.tickers) == {"600519"}
+        view = shared_fundamentals(restored, "600519", VALUATION_ANALYST_FUNDAMENTALS)
+        assert view == before
+        with pytest.raises(TypeError):
+            restored_dataset.tickers["000001"] = None
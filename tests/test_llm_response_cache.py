@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from src.monitoring.llm_metrics import get_llm_cache_summary, reset_llm_metrics_for_testing
+from src.utils import llm as llm_utils
+from src.utils import llm_response_cache
+from src.utils.llm import acall_llm, call_llm
+from src.utils.llm_response_cache import LLMReplayMissError, LLMResponseCache, llm_response_cache_key
+
+
+class _Signal(BaseModel):
+    signal: str
+    confidence: float
+
+
+class _OtherSignal(BaseModel):
+    signal: str
+
+
+class _FakeModelInfo:
+    def has_json_mode(self):
+        return True
+
+
+class _CountingLLM:
+    def __init__(self, invocations):
+        self._invocations = invocations
+
+    def with_structured_output(self, pydantic_model, method="json_mode"):
+        return self
+
+    def invoke(self, prompt):
+        self._invocations.append(prompt)
+        return _Signal(signal="bullish", confidence=float(len(self._invocations)))
+
+
+@pytest.fixture()
+def cached_llm(monkeypatch, tmp_path):
+    invocations = []
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_DIR", str(tmp_path / "llm_cache"))
+    monkeypatch.setenv("LLM_RESPONSE_CACHE", "on")
+    monkeypatch.setattr(llm_utils, "get_agent_model_config", lambda state, agent_name: ("MiniMax-M2.7", "MiniMax"))
+    monkeypatch.setattr(llm_utils, "_apply_priority_strategy", lambda model_name, model_provider, api_keys: (model_name, model_provider, api_keys, [], None, "openai_compatible"))
+    monkeypatch.setattr(llm_utils, "get_model_info", lambda model_name, model_provider: _FakeModelInfo())
+    monkeypatch.setattr(llm_utils, "get_model", lambda model_name, model_provider, api_keys=None: _CountingLLM(invocations))
+    reset_llm_metrics_for_testing()
+    yield invocations
+    llm_response_cache._reset_llm_response_caches_for_testing()
+
+
+def _prompt(ticker: str):
+    return [SystemMessage(content="You are Warren Buffett."), HumanMessage(content=f"Analyze {ticker} as of 2026-04-10")]
+
+
+def test_identical_prompt_is_served_from_cache(cached_llm):
+    state = {"metadata": {}}
+
+    first = call_llm(_prompt("600519"), _Signal, agent_name="warren_buffett_agent", state=state)
+    second = call_llm(_prompt("600519"), _Signal, agent_name="warren_buffett_agent", state=state)
+    third = asyncio.run(acall_llm(_prompt("600519"), _Signal, agent_name="warren_buffett_agent", state=state))
+    call_llm(_prompt("000001"), _Signal, agent_name="warren_buffett_agent", state=state)
+
+    assert len(cached_llm) == 2
+    assert first == second == third
+    summary = get_llm_cache_summary()
+    assert summary["totals"] == {"hits": 2, "misses": 2, "stores": 2, "replay_misses": 0}
+    assert summary["agents"]["warren_buffett_agent"]["hits"] == 2
+
+
+def test_strict_replay_fails_on_miss_and_never_calls_model(cached_llm, monkeypatch):
+    call_llm(_prompt("600519"), _Signal, agent_name="warren_buffett_agent", state={"metadata": {}})
+    monkeypatch.setenv("LLM_RESPONSE_CACHE", "replay")
+
+    replayed = call_llm(_prompt("600519"), _Signal, agent_name="warren_buffett_agent", state={"metadata": {}})
+    with pytest.raises(LLMReplayMissError):
+        call_llm(_prompt("000001"), _Signal, agent_name="warren_buffett_agent", state={"metadata": {}})
+
+    assert replayed.confidence == 1.0
+    assert len(cached_llm) == 1
+    assert get_llm_cache_summary()["totals"]["replay_misses"] == 1
+
+
+def test_cache_off_by_default(cached_llm, monkeypatch):
+    monkeypatch.delenv("LLM_RESPONSE_CACHE")
+
+    call_llm(_prompt("600519"), _Signal, agent_name="warren_buffett_agent", state={"metadata": {}})
+    call_llm(_prompt("600519"), _Signal, agent_name="warren_buffett_agent", state={"metadata": {}})
+
+    assert len(cached_llm) == 2
+    assert get_llm_cache_summary()["totals"]["misses"] == 0
+
+
+def test_key_covers_prompt_schema_and_model_identity():
+    base = llm_response_cache_key(_prompt("600519"), _Signal, "MiniMax", "MiniMax-M2.7")
+
+    assert base == llm_response_cache_key(_prompt("600519"), _Signal, "MiniMax", "MiniMax-M2.7")
+    assert base != llm_response_cache_key(_prompt("600520"), _Signal, "MiniMax", "MiniMax-M2.7")
+    assert base != llm_response_cache_key(_prompt("600519"), _OtherSignal, "MiniMax", "MiniMax-M2.7")
+    assert base != llm_response_cache_key(_prompt("600519"), _Signal, "Zhipu", "MiniMax-M2.7")
+    assert base != llm_response_cache_key(_prompt("600519"), _Signal, "MiniMax", "MiniMax-M2.5")
+
+
+def test_store_evicts_least_recently_used_over_size_budget(tmp_path):
+    cache = LLMResponseCache(tmp_path / "responses.sqlite", max_bytes=300)
+    payload = {"reasoning": "x" * 80}
+    try:
+        for key in ("a", "b", "c"):
+            cache.put(key, schema_name="Signal", model="MiniMax:M2.7", payload=payload)
+        assert cache.get("a") is not None
+        cache.put("d", schema_name="Signal", model="MiniMax:M2.7", payload=payload)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("d") is not None
+        stored_bytes = cache.stats()["bytes"]
+        assert stored_bytes <= 300
+    finally:
+        cache.close()
+
+    reopened = LLMResponseCache(tmp_path / "responses.sqlite", max_bytes=300)
+    try:
+        assert reopened.get("a").payload == payload
+        assert reopened.stats()["bytes"] == stored_bytes
+    finally:
+        reopened.close()
@@ -1,6 +1,7 @@
 import json
 import time
 
+import pytest
 from pydantic import BaseModel
 
 from src.monitoring.llm_metrics import (
@@ -8,6 +9,7 @@ from src.monitoring.llm_metrics import (
     reset_llm_metrics_for_testing,
 )
 from src.utils import llm as llm_utils
+from src.utils import llm_client_pool
 from src.utils.llm import call_llm, extract_json_from_response
 
 
@@ -785,3 +787,157 @@ def test_build_llm_skips_structured_output_for_volcengine_non_json_model(monkeyp
     assert model_info is not None
     assert model_info.has_json_mode() is False
     assert calls == []
+
+
+def _patch_single_route_model(monkeypatch, llm_factory, built):
+    monkeypatch.setattr(llm_utils, "get_agent_model_config", lambda state, agent_name: ("MiniMax-M2.7", "MiniMax"))
+    monkeypatch.setattr(llm_utils, "_apply_priority_strategy", lambda model_name, model_provider, api_keys: (model_name, model_provider, api_keys, [], "MiniMax:default", "openai_compatible"))
+    monkeypatch.setattr(llm_utils, "get_model_info", lambda model_name, model_provider: _FakeModelInfo(has_json_mode=True))
+
+    def fake_get_model(model_name, model_provider, api_keys=None):
+        built.append((model_name, str(model_provider)))
+        return llm_factory()
+
+    monkeypatch.setattr(llm_utils, "get_model", fake_get_model)
+
+
+def test_call_llm_reuses_pooled_client_per_route(monkeypatch):
+    calls = []
+    built = []
+    _patch_single_route_model(monkeypatch, lambda: _FakeLLM("MiniMax", "MiniMax-M2.7", None, calls), built)
+
+    for _ in range(5):
+        assert call_llm(prompt="hi", pydantic_model=_FallbackSignal, agent_name="test_agent", state={"metadata": {}}).signal == "ok"
+
+    assert built == [("MiniMax-M2.7", "MiniMax")]
+    assert sum(1 for call in calls if call[3] == "with_structured_output") == 1
+    first, _ = llm_utils._build_llm("MiniMax-M2.7", "MiniMax", None, _FallbackSignal, route_id="MiniMax:default")
+    other_route, _ = llm_utils._build_llm("MiniMax-M2.7", "MiniMax", None, _FallbackSignal, route_id="MiniMax:backup")
+    assert first is not other_route
+
+    monkeypatch.setenv("LLM_CLIENT_POOL", "false")
+    call_llm(prompt="hi", pydantic_model=_FallbackSignal, agent_name="test_agent", state={"metadata": {}})
+    assert len(built) == 3
+
+
+def test_timed_out_invokes_share_one_bounded_executor(monkeypatch):
+    import threading
+
+    release = threading.Event()
+
+    class HangingLLM:
+        def invoke(self, prompt):
+            release.wait(5)
+            return _FallbackSignal(signal="late")
+
+    monkeypatch.setenv("LLM_INVOKE_TIMEOUT_SECONDS", "0.05")
+    before = threading.active_count()
+    try:
+        for _ in range(4):
+            try:
+                llm_utils._invoke_llm_with_timeout(HangingLLM(), "hang")
+            except TimeoutError as error:
+                assert "timed out" in str(error)
+            else:
+                raise AssertionError("expected a timeout")
+        assert llm_client_pool.get_llm_invoke_executor() is llm_client_pool.get_llm_invoke_executor()
+        assert threading.active_count() - before <= 4
+    finally:
+        release.set()
+
+
+def test_hung_route_does_not_starve_other_routes(monkeypatch):
+    import threading
+
+    release = threading.Event()
+
+    class HangingLLM:
+        def invoke(self, prompt):
+            release.wait(5)
+            return _FallbackSignal(signal="late")
+
+    class FastLLM:
+        def invoke(self, prompt):
+            return _FallbackSignal(signal="fast")
+
+    monkeypatch.setenv("LLM_INVOKE_TIMEOUT_SECONDS", "0.05")
+    monkeypatch.setenv("LLM_INVOKE_MAX_WORKERS_PER_ROUTE", "1")
+    try:
+        for _ in range(2):
+            try:
+                llm_utils._invoke_llm_with_timeout(HangingLLM(), "hang", "Hung:default")
+            except TimeoutError:
+                pass
+            else:
+                raise AssertionError("expected a timeout")
+        # 挂起的 route 占满了自己的 worker，其他 route 仍能立即执行
+        assert llm_utils._invoke_llm_with_timeout(FastLLM(), "hi", "Healthy:default").signal == "fast"
+        assert llm_client_pool.get_llm_invoke_executor("Hung:default") is not llm_client_pool.get_llm_invoke_executor("Healthy:default")
+        assert llm_client_pool.get_llm_client_pool_metrics()["timed_out_by_route"] == {"Hung:default": 1}
+    finally:
+        release.set()
+
+
+def test_acall_llm_cancels_timed_out_ainvoke_and_frees_its_slot(monkeypatch):
+    import asyncio
+
+    cancelled = []
+    in_flight = []
+
+    class AsyncStructuredLLM:
+        def __init__(self, hang):
+            self.hang = hang
+
+        def invoke(self, prompt):
+            raise AssertionError("async path must not call invoke")
+
+        async def ainvoke(self, prompt):
+            in_flight.append(prompt)
+            try:
+                if self.hang:
+                    await asyncio.Event().wait()
+                return _FallbackSignal(signal="async-ok")
+            except asyncio.CancelledError:
+                cancelled.append(prompt)
+                raise
+            finally:
+                in_flight.remove(prompt)
+
+    class AsyncLLM:
+        def __init__(self, hang):
+            self.hang = hang
+
+        def with_structured_output(self, pydantic_model, method="json_mode"):
+            return AsyncStructuredLLM(self.hang)
+
+    built = []
+    monkeypatch.setenv("LLM_INVOKE_TIMEOUT_SECONDS", "0.05")
+    monkeypatch.setenv("LLM_INVOKE_MAX_WORKERS_PER_ROUTE", "1")
+    monkeypatch.setattr(llm_utils, "_compute_retry_delay", lambda attempt, error: 0.0)
+    _patch_single_route_model(monkeypatch, lambda: AsyncLLM(True), built)
+    # 原生 ainvoke 路径从不占用同步 invoke 线程池
+    monkeypatch.setattr(llm_utils, "get_llm_invoke_executor", lambda route="": pytest.fail("ainvoke path used the invoke executor"))
+    llm_client_pool._reset_llm_client_pool_for_testing()
+
+    async def _scenario():
+        timed_out = await llm_utils.acall_llm(
+            prompt="slow",
+            pydantic_model=_FallbackSignal,
+            agent_name="test_agent",
+            state={"metadata": {}},
+            max_retries=2,
+            default_factory=lambda: _FallbackSignal(signal="timed_out"),
+        )
+        # 超时的请求已被取消，没有残留任务或被占用的 invoke worker
+        assert in_flight == []
+        llm_client_pool._reset_llm_client_pool_for_testing()
+        _patch_single_route_model(monkeypatch, lambda: AsyncLLM(False), built)
+        recovered = await llm_utils.acall_llm(prompt="fast", pydantic_model=_FallbackSignal, agent_name="test_agent", state={"metadata": {}})
+        return timed_out, recovered
+
+    timed_out, recovered = asyncio.run(_scenario())
+
+    assert timed_out.signal == "timed_out"
+    assert recovered.signal == "async-ok"
+    assert cancelled == ["slow", "slow"]
+    assert "MiniMax:default" not in llm_client_pool.get_llm_client_pool_metrics()["timed_out_by_route"]
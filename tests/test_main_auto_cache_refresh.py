@@ -619,3 +619,34 @@ def test_attach_freshness_check_stale_data_prints_warning(monkeypatch, capsys):
     main_mod._attach_freshness_check("20260708", payload)
     captured = capsys.readouterr()
     assert "资金流向" in captured.out
+
+
+def test_run_auto_screening_writes_timing_artifact(monkeypatch, tmp_path):
+    from src import main as main_mod
+    from src.screening import auto_pipeline
+
+    monkeypatch.setenv("AUTO_TIMING_DIR", str(tmp_path / "timings"))
+    monkeypatch.setattr(main_mod, "_try_acquire_pipeline_lock", lambda _path: 321)
+    monkeypatch.setattr(main_mod.os, "close", lambda _fd: None)
+    monkeypatch.setattr(
+        "src.utils.date_utils.latest_open_trade_date_on_or_before",
+        lambda value: value,
+    )
+    monkeypatch.setattr(
+        "src.screening.auto_pipeline.run_auto_pipeline",
+        lambda *args, **kwargs: auto_pipeline.AutoRunResult(
+            status=auto_pipeline.AutoRunStatus.FATAL,
+            exit_code=1,
+            artifact_path=None,
+            payload=None,
+            manifest=None,
+        ),
+    )
+
+    assert main_mod.run_auto_screening("20260710", top_n=5) == 1
+
+    [artifact] = (tmp_path / "timings").glob("auto_timing_*.json")
+    payload = json.loads(artifact.read_text(encoding="utf-8"))
+    assert payload["attrs"] == {"trade_date": "20260710", "top_n": 5}
+    assert [item["path"] for item in payload["spans"]] == ["auto", "auto/pipeline"]
+    assert (payload["status"], payload["exit_code"]) == ("failed", 1)
@@ -0,0 +1,156 @@
+"""src.data.trading_index: 本地交易日历 + 涨跌停索引。"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from src.backtesting.engine_market_data import MarketDataLoader, shift_business_days
+from src.data import trading_index
+from src.data.trading_index import TradingIndex, get_trading_index
+from src.screening.candidate_pool_persistence_helpers import add_cooldown
+
+# 2026 春节休市 2/16–2/20（周一至周五）
+OPEN_DATES = ["20260209", "20260210", "20260211", "20260212", "20260213", "20260223", "20260224", "20260225", "20260226", "20260227"]
+
+
+def _fetch_calendar(calls: list[tuple[str, str]]):
+    def fetch(start: str, end: str) -> list[str]:
+        calls.append((start, end))
+        return [value for value in OPEN_DATES if start <= value <= end]
+
+    return fetch
+
+
+def test_calendar_queries_respect_holidays():
+    index = TradingIndex()
+    index.record_calendar("20260209", "20260227", OPEN_DATES)
+
+    assert index.is_open("20260213") is True
+    assert index.is_open("20260217") is False
+    assert index.is_open("20260301") is None
+    assert index.shift_trading_days("20260213", 1) == "20260223"
+    assert index.shift_trading_days("20260217", 1) == "20260223"  # 休市日从前一开市日起算
+    assert index.shift_trading_days("20260213", 0) == "20260213"
+    assert index.shift_trading_days("20260226", 5) is None
+    assert index.trading_days_between("20260212", "20260224") == 3
+    assert index.trading_days_between("20260224", "20260212") == -3
+    assert index.open_dates("20260214", "20260223") == ["20260223"]
+
+
+def test_ensure_calendar_fetches_once_and_merges_gaps():
+    calls: list[tuple[str, str]] = []
+    index = TradingIndex()
+
+    assert index.ensure_calendar("20260223", "20260227", _fetch_calendar(calls))
+    assert index.ensure_calendar("20260224", "20260226", _fetch_calendar(calls))
+    assert calls == [("20260223", "20260227")]
+
+    assert index.ensure_calendar("20260209", "20260213", _fetch_calendar(calls))
+    assert calls[-1] == ("20260209", "20260227")
+    assert index.open_dates("20260209", "20260227") == OPEN_DATES
+
+
+def test_unpublished_calendar_tail_is_not_recorded_as_holiday():
+    index = TradingIndex()
+    index.record_calendar("20260209", "20260430", OPEN_DATES)
+
+    assert index.covers("20260209", "20260227")
+    assert not index.covers("20260209", "20260302")
+
+
+def test_limit_state_is_fetched_once_and_persisted(tmp_path):
+    path = tmp_path / "idx.npz"
+    calls: list[str] = []
+
+    def fetch(trade_date: str) -> pd.DataFrame:
+        calls.append(trade_date)
+        return pd.DataFrame({"ts_code": ["000001.SZ", "600000.SH", "300750.SZ"], "limit": ["U", "D", "Z"]})
+
+    index = TradingIndex(path)
+    index.record_calendar("20260209", "20260227", OPEN_DATES)
+    assert index.get_limit_state("20260210", fetch) == (frozenset({"000001"}), frozenset({"600000"}))
+    assert index.get_limit_state("20260210", fetch) == (frozenset({"000001"}), frozenset({"600000"}))
+    assert calls == ["20260210"]
+    index.flush()
+
+    reloaded = TradingIndex(path)
+    assert reloaded.get_limit_state("20260210", fetch) == (frozenset({"000001"}), frozenset({"600000"}))
+    assert reloaded.shift_trading_days("20260213", 1) == "20260223"
+    assert calls == ["20260210"]
+
+
+def test_failed_or_current_day_limit_lists_are_not_persisted(tmp_path):
+    path = tmp_path / "idx.npz"
+    index = TradingIndex(path)
+    today = datetime.now().strftime("%Y%m%d")
+
+    assert index.get_limit_state("20260210", lambda _date: None) == (frozenset(), frozenset())
+    assert index.limit_state("20260210") is None
+
+    index.get_limit_state(today, lambda _date: pd.DataFrame({"ts_code": ["000001.SZ"], "limit": ["U"]}))
+    index.get_limit_state("20260211", lambda _date: pd.DataFrame(columns=["ts_code", "limit"]))
+    index.flush()
+
+    reloaded = TradingIndex(path)
+    assert reloaded.limit_state(today) is None
+    assert reloaded.limit_state("20260211") == (frozenset(), frozenset())
+
+
+def test_corrupt_index_file_is_rebuilt(tmp_path):
+    path = tmp_path / "idx.npz"
+    path.write_bytes(b"not an npz")
+
+    index = TradingIndex(path)
+
+    assert index.covers("20260209", "20260209") is False
+
+
+def test_backtest_and_cooldowns_use_the_shared_calendar(monkeypatch):
+    calls: list[tuple[str, str]] = []
+    monkeypatch.setattr("src.tools.tushare_api.get_open_trade_dates", _fetch_calendar(calls))
+    loader = MarketDataLoader(tickers=["000001"], start_date="2026-02-09", end_date="2026-02-24", portfolio=object(), exit_reentry_cooldowns={})
+
+    dates = loader.iter_backtest_dates()
+    loader.iter_backtest_dates()
+
+    assert [date.strftime("%Y%m%d") for date in dates] == OPEN_DATES[:7]
+    assert len(calls) == 1
+    assert shift_business_days("20260212", 3) == "20260224"
+
+    stored: dict[str, str] = {}
+    add_cooldown("000001", "20260212", days=2, load_cooldown_registry_fn=lambda: dict(stored), save_cooldown_registry_fn=stored.update)
+    assert stored == {"000001": "20260223"}
+
+
+def test_limit_state_via_loader_hits_index(monkeypatch):
+    calls: list[str] = []
+
+    def fake_limit_list(trade_date: str) -> pd.DataFrame:
+        calls.append(trade_date)
+        return pd.DataFrame({"ts_code": ["000001.SZ"], "limit": ["U"]})
+
+    monkeypatch.setattr("src.backtesting.engine_market_data.get_limit_list", fake_limit_list)
+    loader = MarketDataLoader(tickers=["000001"], start_date="2026-02-09", end_date="2026-02-24", portfolio=object(), exit_reentry_cooldowns={})
+
+    assert loader.get_limit_state("20260210") == ({"000001"}, set())
+    assert loader.get_limit_state("20260210") == ({"000001"}, set())
+    assert calls == ["20260210"]
+
+
+def test_disabled_index_keeps_bday_fallback(monkeypatch):
+    monkeypatch.setenv("TRADING_INDEX_ENABLED", "false")
+    assert get_trading_index() is None
+    assert shift_business_days("20260213", 1) == "20260216"
+
+
+def test_singleton_follows_index_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("TRADING_INDEX_DIR", str(tmp_path / "a"))
+    first = get_trading_index()
+    assert get_trading_index() is first
+    monkeypatch.setenv("TRADING_INDEX_DIR", str(tmp_path / "b"))
+    assert get_trading_index() is not first
+    trading_index.reset_trading_index()
+    assert trading_index._index is None
+    assert (datetime(2026, 2, 13) + timedelta(days=3)).strftime("%Y%m%d") == "20260216"
@@ -0,0 +1,133 @@
+"""src.tools.tushare_client: single-flight 合并 + 带优先级通道的主动限速。"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pandas as pd
+
+from src.tools import tushare_api
+from src.tools.tushare_client import (
+    DEFAULT_TUSHARE_CALLS_PER_MINUTE,
+    LaneTokenBucket,
+    SingleFlight,
+    TushareLane,
+    get_tushare_client_metrics,
+    get_tushare_rate_limiter,
+    tushare_lane,
+)
+
+
+class _MemoryCache:
+    def __init__(self) -> None:
+        self.values: dict[str, object] = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.values[key] = value
+
+
+def test_single_flight_runs_one_leader_and_shares_its_result():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+    results: list[tuple[object, bool]] = []
+
+    def slow():
+        calls.append(1)
+        release.wait(2)
+        return "value"
+
+    threads = [threading.Thread(target=lambda: results.append(flight.do("k", slow))) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    while flight.coalesced < 5:
+        time.sleep(0.005)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False] + [True] * 5
+    assert {value for value, _ in results} == {"value"}
+    assert flight.in_flight() == 0
+
+
+def test_concurrent_cache_misses_hit_the_api_once(monkeypatch):
+    monkeypatch.setattr(tushare_api, "_persistent_cache", _MemoryCache())
+    api_calls = []
+    gate = threading.Barrier(4)
+
+    def fake_api(pro, api_name, **kwargs):
+        api_calls.append(api_name)
+        time.sleep(0.2)
+        return pd.DataFrame({"ts_code": ["000001.SZ"], "close": [10.0]})
+
+    monkeypatch.setattr(tushare_api, "_call_tushare_dataframe_api", fake_api)
+    frames: list[pd.DataFrame] = []
+
+    def worker():
+        gate.wait()
+        frames.append(tushare_api._cached_tushare_dataframe_call(None, "daily", ts_code="000001.SZ", trade_date="20990101"))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert api_calls == ["daily"]
+    assert len(frames) == 4 and all(frame["close"].tolist() == [10.0] for frame in frames)
+    # 每个调用方拿到独立副本
+    assert len({id(frame) for frame in frames}) == 4
+
+
+def test_interactive_lane_jumps_ahead_of_queued_bulk():
+    bucket = LaneTokenBucket(calls_per_minute=600, burst=1)
+    bucket.acquire(TushareLane.INTERACTIVE)  # drain the burst
+    order: list[str] = []
+
+    def take(lane: TushareLane) -> None:
+        with tushare_lane(lane):
+            bucket.acquire()
+        order.append(lane.value)
+
+    bulk = threading.Thread(target=take, args=(TushareLane.BULK,))
+    bulk.start()
+    time.sleep(0.02)
+    interactive = threading.Thread(target=take, args=(TushareLane.INTERACTIVE,))
+    interactive.start()
+    bulk.join(2)
+    interactive.join(2)
+
+    assert order == ["interactive", "bulk"]
+    stats = bucket.stats()
+    assert stats["bulk"]["acquired"] == 1 and stats["bulk"]["max_wait_seconds"] > 0.1
+    assert bucket.queue_depth() == {"interactive": 0, "bulk": 0}
+
+
+def test_limiter_follows_env_quota(monkeypatch):
+    monkeypatch.setenv("TUSHARE_CALLS_PER_MINUTE", "0")
+    assert get_tushare_rate_limiter() is None
+    assert get_tushare_client_metrics()["calls_per_minute"] == 0
+
+    monkeypatch.setenv("TUSHARE_CALLS_PER_MINUTE", "120")
+    limiter = get_tushare_rate_limiter()
+    assert limiter is get_tushare_rate_limiter() and limiter.calls_per_minute == 120
+    assert set(get_tushare_client_metrics()["lanes"]) == {"interactive", "bulk"}
+
+
+def test_quota_paces_by_default_and_prefetch_does_not_double_throttle(monkeypatch):
+    from src.backtesting.engine_prefetch import PROVIDER_TUSHARE, resolve_provider_limits
+
+    monkeypatch.delenv("TUSHARE_CALLS_PER_MINUTE", raising=False)
+    monkeypatch.delenv("BACKTEST_PREFETCH_TUSHARE_CALLS_PER_MINUTE", raising=False)
+
+    # 未配置时按账号配额主动限速, 而不是撞 429 再退避 30s
+    limiter = get_tushare_rate_limiter()
+    assert limiter is not None and limiter.calls_per_minute == DEFAULT_TUSHARE_CALLS_PER_MINUTE == 200
+    # 预取阶段对 Tushare 只限并发，配额只在客户端共享令牌桶扣一次
+    assert resolve_provider_limits()[PROVIDER_TUSHARE].calls_per_minute == 0
@@ -1,4 +1,10 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
 import pandas as pd
+import pytest
 
 from src.tools import tushare_api
 from src.tools.tushare_stock_details_helpers import build_prices_from_tushare_daily_df
@@ -33,6 +39,63 @@ def test_tushare_df_cache_get_refreshes_lru_order(monkeypatch):
     assert "second" not in tushare_api._tushare_df_cache
 
 
+def test_tushare_df_cache_hits_are_zero_copy_read_only_views(monkeypatch):
+    monkeypatch.setattr(tushare_api, "_TUSHARE_DF_CACHE_READONLY", True)
+    tushare_api._tushare_df_cache.clear()
+    tushare_api._store_tushare_cached_df("frame", pd.DataFrame({"close": [1.0, 2.0], "ts_code": ["a", "b"]}))
+
+    first = tushare_api._get_tushare_cached_df("frame")
+    second = tushare_api._get_tushare_cached_df("frame")
+
+    assert np.shares_memory(first["close"].to_numpy(), second["close"].to_numpy())
+    # 结构性修改只落在调用方自己的副本上
+    first["extra"] = 1
+    first.sort_values("close", ascending=False, inplace=True)
+    # 原地改值直接失败，缓存保持原样
+    with pytest.raises(ValueError, match="read-only"):
+        second.loc[0, "close"] = 99.0
+    writable = second.copy()
+    writable.loc[0, "close"] = 99.0
+    assert tushare_api._get_tushare_cached_df("frame").to_dict("list") == {"close": [1.0, 2.0], "ts_code": ["a", "b"]}
+
+
+def test_tushare_df_cache_read_only_mode_is_opt_in():
+    # 仍有调用方原地修改缓存帧, 只读零拷贝模式必须显式开启; 模块导入时读取, 用子进程验证默认值
+    env = {key: value for key, value in os.environ.items() if key != "TUSHARE_DF_CACHE_READONLY"}
+    probe = "from src.tools import tushare_api; print(tushare_api._TUSHARE_DF_CACHE_READONLY)"
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", probe], cwd=repo_root, env=env, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_tushare_df_cache_copies_when_read_only_mode_is_off(monkeypatch):
+    monkeypatch.setattr(tushare_api, "_TUSHARE_DF_CACHE_READONLY", False)
+    tushare_api._tushare_df_cache.clear()
+    tushare_api._store_tushare_cached_df("frame", pd.DataFrame({"close": [1.0]}))
+
+    cached = tushare_api._get_tushare_cached_df("frame")
+    cached.loc[0, "close"] = 5.0
+
+    assert tushare_api._get_tushare_cached_df("frame")["close"].tolist() == [1.0]
+
+
+def test_tushare_df_cache_evicts_by_memory_footprint(monkeypatch):
+    frame_bytes = tushare_api._dataframe_nbytes(pd.DataFrame({"value": np.zeros(1000)}))
+    monkeypatch.setattr(tushare_api, "_TUSHARE_DF_CACHE_MAX_BYTES", frame_bytes * 2 + 10)
+    tushare_api._tushare_df_cache.clear()
+
+    for key in ("first", "second", "third"):
+        tushare_api._store_tushare_cached_df(key, pd.DataFrame({"value": np.zeros(1000)}))
+
+    assert list(tushare_api._tushare_df_cache) == ["second", "third"]
+    stats = tushare_api.get_tushare_df_cache_stats()
+    assert stats["entries"] == 2 and stats["bytes"] == frame_bytes * 2
+    # 单帧超预算时仍保留最新写入的一帧
+    tushare_api._store_tushare_cached_df("huge", pd.DataFrame({"value": np.zeros(5000)}))
+    assert list(tushare_api._tushare_df_cache) == ["huge"]
+
+
 def test_build_prices_from_tushare_daily_df_skips_nan_volume_row():
     """R134 (R83/R132/R133 same-class drain residue): ``build_prices_from_tushare_daily_df``
     is a FOURTH sibling df→Price converter (besides AKShareProvider R83,
@@ -1,6 +1,6 @@
 """Characterization tests for src/utils/env_helpers.py.
 
-These 6 centralized env-var parsing utilities are used 100+ times across the
+These centralized env-var parsing utilities are used 100+ times across the
 codebase (get_env_float alone has 104 call sites) yet had zero direct test
 coverage. Tests lock down the parse + fallback contract for each.
 """
@@ -12,6 +12,7 @@ import pytest
 from src.utils.env_helpers import (
     get_env_csv_list,
     get_env_csv_set,
+    get_env_enabled,
     get_env_flag,
     get_env_float,
     get_env_int,
@@ -48,6 +49,12 @@ class TestGetEnvFloat:
         monkeypatch.setenv("EH_FLOAT", "")
         assert get_env_float("EH_FLOAT", 1.5) == 1.5
 
+    def test_minimum_clamps_parsed_and_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("EH_FLOAT", "-3")
+        assert get_env_float("EH_FLOAT", 1.0, minimum=0.0) == 0.0
+        monkeypatch.delenv("EH_FLOAT")
+        assert get_env_float("EH_FLOAT", -1.0, minimum=0.0) == 0.0
+
 
 # ---------------------------------------------------------------------------
 # get_env_int
@@ -76,6 +83,12 @@ class TestGetEnvInt:
         monkeypatch.setenv("EH_INT", "abc")
         assert get_env_int("EH_INT", 7) == 7
 
+    def test_minimum_clamps_parsed_value(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("EH_INT", "0")
+        assert get_env_int("EH_INT", 4, minimum=1) == 1
+        monkeypatch.setenv("EH_INT", "9")
+        assert get_env_int("EH_INT", 4, minimum=1) == 9
+
 
 # ---------------------------------------------------------------------------
 # get_env_csv_set
@@ -158,6 +171,32 @@ class TestGetEnvFlag:
         assert get_env_flag("EH_FLAG", default=True) is True
 
 
+# ---------------------------------------------------------------------------
+# get_env_enabled
+# ---------------------------------------------------------------------------
+
+
+class TestGetEnvEnabled:
+    @pytest.mark.parametrize("disabled", ["0", "false", "FALSE", "no", "off", " Off "])
+    def test_disabled_values(self, disabled: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("EH_ENABLED", disabled)
+        assert get_env_enabled("EH_ENABLED") is False
+
+    @pytest.mark.parametrize("enabled", ["1", "true", "yes", "anything"])
+    def test_other_values_enable(self, enabled: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("EH_ENABLED", enabled)
+        assert get_env_enabled("EH_ENABLED", default=False) is True
+
+    @pytest.mark.parametrize("blank", [None, "", "  "])
+    def test_unset_or_blank_returns_default(self, blank: str | None, monkeypatch: pytest.MonkeyPatch) -> None:
+        if blank is None:
+            monkeypatch.delenv("EH_ENABLED", raising=False)
+        else:
+            monkeypatch.setenv("EH_ENABLED", blank)
+        assert get_env_enabled("EH_ENABLED") is True
+        assert get_env_enabled("EH_ENABLED", default=False) is False
+
+
 # ---------------------------------------------------------------------------
 # get_env_mode
 # ---------------------------------------------------------------------------
@@ -0,0 +1,164 @@
+"""Tests for src/utils/run_profiler.py — nested spans, artifacts, regression comparison."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from src.utils.run_profiler import (
+    RunProfile,
+    active_profile,
+    compare_timing_artifacts,
+    load_timing_artifact,
+    main,
+    previous_timing_artifact,
+    profile_from_env,
+    span,
+    write_timing_artifact,
+)
+
+
+def _artifact(spans: dict[str, float]) -> dict:
+    return {"schema_version": 1, "label": "auto", "wall_seconds": max(spans.values()), "spans": [{"path": path, "wall_seconds": wall, "calls": 1} for path, wall in spans.items()]}
+
+
+def test_nested_spans_accumulate_by_path() -> None:
+    with RunProfile(label="auto") as profile:
+        with span("score_batch"):
+            for _ in range(3):
+                with span("heavy_signals"):
+                    time.sleep(0.001)
+        with span("fuse_batch"):
+            pass
+
+    spans = profile.to_dict()["spans"]
+    by_path = {item["path"]: item for item in spans}
+    assert [item["path"] for item in spans] == ["auto", "auto/fuse_batch", "auto/score_batch", "auto/score_batch/heavy_signals"]
+    assert by_path["auto/score_batch/heavy_signals"]["calls"] == 3
+    assert by_path["auto/score_batch"]["wall_seconds"] >= by_path["auto/score_batch/heavy_signals"]["wall_seconds"] > 0
+    assert by_path["auto"]["calls"] == 1
+    assert active_profile() is None
+
+
+def test_span_without_active_profile_is_noop() -> None:
+    @span("decorated")
+    def work() -> int:
+        return 42
+
+    with span("outside"):
+        assert work() == 42
+    assert active_profile() is None
+
+
+def test_span_in_unpropagated_worker_thread_is_not_recorded() -> None:
+    def work() -> None:
+        with span("worker"):
+            pass
+
+    with RunProfile(label="auto") as profile:
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+
+    assert "auto/worker" not in profile.spans
+
+
+def test_allocation_counters_and_sampling() -> None:
+    with RunProfile(label="auto", allocations=True, sample_interval=0.002) as profile:
+        with span("allocate"):
+            blob = [bytes(1024) for _ in range(2000)]
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                sum(range(1000))
+
+    stats = profile.spans["auto/allocate"]
+    assert stats.alloc_net_bytes is not None and stats.alloc_net_bytes > 1024 * 1000
+    assert profile.peak_traced_bytes >= stats.alloc_net_bytes
+    assert profile.total_samples > 0 and stats.samples > 0
+    assert any("test_allocation_counters_and_sampling" in stack for stack in profile.stacks)
+    del blob
+
+
+def test_artifact_round_trip_and_previous_lookup(tmp_path) -> None:
+    first = RunProfile(label="auto", attrs={"trade_date": "20261015"})
+    first.start()
+    first.stop()
+    first.started_at = "2026-10-15T22:00:00"
+    second = RunProfile(label="auto")
+    second.start()
+    second.stop()
+    second.started_at = "2026-10-16T22:00:00"
+
+    first_path = write_timing_artifact(first, tmp_path)
+    second_path = write_timing_artifact(second, tmp_path)
+
+    assert first_path.name == f"auto_timing_20261015T220000_{os.getpid()}.json"
+    assert load_timing_artifact(first_path)["attrs"] == {"trade_date": "20261015"}
+    assert previous_timing_artifact(tmp_path, second_path, prefix="auto") == first_path
+    assert previous_timing_artifact(tmp_path, first_path, prefix="auto") is None
+
+
+def test_same_second_artifacts_do_not_overwrite(tmp_path) -> None:
+    paths = []
+    for trade_date in ("20261015", "20261016"):
+        profile = RunProfile(label="auto", attrs={"trade_date": trade_date})
+        profile.start()
+        profile.stop()
+        profile.started_at = "2026-10-15T22:00:00"
+        paths.append(write_timing_artifact(profile, tmp_path))
+
+    assert paths[0] != paths[1]
+    assert [load_timing_artifact(path)["attrs"]["trade_date"] for path in paths] == ["20261015", "20261016"]
+
+
+def test_previous_lookup_skips_failed_runs(tmp_path) -> None:
+    (tmp_path / "auto_timing_20261013T220000.json").write_text(json.dumps(_artifact({"auto": 10.0})), encoding="utf-8")
+    (tmp_path / "auto_timing_20261014T220000_1.json").write_text(json.dumps({**_artifact({"auto": 12.0}), "status": "ok"}), encoding="utf-8")
+    (tmp_path / "auto_timing_20261015T220000_2.json").write_text(json.dumps({**_artifact({"auto": 1.0}), "status": "failed"}), encoding="utf-8")
+    (tmp_path / "auto_timing_20261015T230000_3.json").write_text("{", encoding="utf-8")
+    current = tmp_path / "auto_timing_20261016T220000_4.json"
+
+    assert previous_timing_artifact(tmp_path, current, prefix="auto") == tmp_path / "auto_timing_20261014T220000_1.json"
+    # 未记录 status 的旧产物仍可作基线
+    assert previous_timing_artifact(tmp_path, tmp_path / "auto_timing_20261014T220000_1.json", prefix="auto") == tmp_path / "auto_timing_20261013T220000.json"
+
+
+def test_compare_flags_only_relative_and_absolute_regressions() -> None:
+    baseline = _artifact({"auto": 100.0, "auto/score_batch": 40.0, "auto/fuse_batch": 2.0, "auto/gone": 5.0})
+    current = _artifact({"auto": 140.0, "auto/score_batch": 70.0, "auto/fuse_batch": 2.9, "auto/new_stage": 50.0})
+
+    regressions = compare_timing_artifacts(baseline, current, ratio=1.25, min_delta_seconds=1.0)
+
+    # fuse_batch: x1.45 但增量 < 1s; gone / new_stage 只在一侧出现
+    assert [item.path for item in regressions] == ["auto", "auto/score_batch"]
+    assert regressions[1].delta_seconds == pytest.approx(30.0)
+    assert regressions[1].ratio == pytest.approx(1.75)
+
+
+def test_profile_from_env_respects_switches(monkeypatch) -> None:
+    monkeypatch.setenv("AUTO_TIMING_ENABLED", "false")
+    assert profile_from_env("auto") is None
+
+    monkeypatch.setenv("AUTO_TIMING_ENABLED", "true")
+    monkeypatch.setenv("AUTO_PROFILE_ALLOCATIONS", "1")
+    monkeypatch.setenv("AUTO_PROFILE_SAMPLE_MS", "5")
+    profile = profile_from_env("auto", {"trade_date": "20261016"})
+    assert profile is not None
+    assert profile.allocations is True
+    assert profile.sample_interval == pytest.approx(0.005)
+
+
+def test_cli_reports_regressions_as_json(tmp_path, capsys) -> None:
+    (tmp_path / "auto_timing_20261015T220000.json").write_text(json.dumps(_artifact({"auto": 10.0})), encoding="utf-8")
+    (tmp_path / "auto_timing_20261016T220000.json").write_text(json.dumps(_artifact({"auto": 20.0})), encoding="utf-8")
+
+    exit_code = main(["--dir", str(tmp_path), "--json", "--fail-on-regression"])
+    report = json.loads(capsys.readouterr().out)
+
+    assert exit_code == 1
+    assert report["baseline"].endswith("auto_timing_20261015T220000.json")
+    assert [item["path"] for item in report["regressions"]] == ["auto"]